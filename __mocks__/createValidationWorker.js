@@ -0,0 +1,3 @@
+// Jest stand-in for validation/createValidationWorker.js (which uses `import.meta`).
+// No worker: forms validate on the main thread.
+module.exports = { createValidationWorker: () => null };
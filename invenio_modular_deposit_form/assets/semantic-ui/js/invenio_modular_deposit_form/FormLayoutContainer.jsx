@@ -18,6 +18,8 @@ import { FormLeftSidebar } from "./framing_components/FormLeftSidebar";
 import { FormRightSidebar } from "./framing_components/FormRightSidebar";
 import { RecoveryModal } from "./framing_components/RecoveryModal";
 import { focusFirstElement } from "./utils";
+import { getMountedFormPageIds } from "./helpers/mountedFormPages";
+import { usePrefetchNextFormPage } from "./hooks/usePrefetchNextFormPage";
 import { useStickyFooterOverlapFix } from "./hooks/useStickyFooterOverlapFix";
 import { SIDEBAR_DEFAULTS_WIDTHS } from "./constants";
 import { makeFormHeading, makeSelectedCommunityLabel } from "./helpers/depositFormTitleText";
@@ -142,6 +144,22 @@ const FormLayoutContainer = () => {
   const selectedCommunityLabel = makeSelectedCommunityLabel(selectedCommunity);
 
   useStickyFooterOverlapFix();
+  usePrefetchNextFormPage(
+    state.visibleFormPages,
+    state.currentFormPage,
+    config?.componentsRegistry
+  );
+
+  // Only the current page (and, if configured, its neighbours, hidden) is mounted.
+  const mountedFormPages = useMemo(
+    () =>
+      getMountedFormPageIds(
+        state.visibleFormPages,
+        state.currentFormPage,
+        config?.mounted_neighbour_pages
+      ),
+    [state.visibleFormPages, state.currentFormPage, config?.mounted_neighbour_pages]
+  );
 
   return (
     <>
@@ -208,12 +226,15 @@ const FormLayoutContainer = () => {
                   component: _formPageComponent,
                   ...rest
                 } = mergedPage;
+                const active = state.currentFormPage === section;
                 return (
-                  state.currentFormPage === section && (
-                    <div key={section}>
+                  mountedFormPages.has(section) && (
+                    <div key={section} hidden={!active}>
                       <FormPage
+                        active={active}
                         focusFirstElement={focusFirstElement}
                         id={`InvenioAppRdm.Deposit.FormPage.${section}`}
+                        section={section}
                         recoveryAsked={ctx.recoveryAsked}
                         classnames={classnames}
                         subsections={subsections}
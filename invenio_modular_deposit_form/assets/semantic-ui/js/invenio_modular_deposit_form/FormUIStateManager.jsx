@@ -66,9 +66,16 @@ const FormUIStateManager = ({ children }) => {
   // on every re-render (React ignores the second arg after mount, but the expression would still run).
   const [state, dispatch] = useReducer(formUIStateReducer, formPagesCommon, getInitialFormUIState);
 
-  // Keep client and server errors in sync and track which errors to display
+  // Keep client and server errors in sync and track which errors to display. One manager
+  // lives for the whole form so it only reprocesses the Formik state that changed.
+  const errorManagerRef = useRef(null);
   useEffect(() => {
-    new FormErrorManager(formik, store).updateFormErrorState(dispatch);
+    if (errorManagerRef.current) {
+      errorManagerRef.current.sync(formik, store);
+    } else {
+      errorManagerRef.current = new FormErrorManager(formik, store);
+    }
+    errorManagerRef.current.updateFormErrorState(dispatch);
   }, [
     formik.errors,
     formik.touched,
@@ -125,6 +132,7 @@ const FormUIStateManager = ({ children }) => {
       pageTargetInViewport,
       recoveryAsked: recovery.recoveryAsked,
       storageDataPresent: recovery.storageDataPresent,
+      autosaveConflict: recovery.autosaveConflict,
     }),
     [
       navigation,
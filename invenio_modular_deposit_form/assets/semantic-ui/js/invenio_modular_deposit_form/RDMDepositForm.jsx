@@ -19,6 +19,7 @@ import { componentsRegistry } from "./componentsRegistry";
 import { buildFormSections } from "./helpers/buildFormStructure";
 import { FormLayoutContainer } from "./FormLayoutContainer";
 import { FormUIStateManager } from "./FormUIStateManager";
+import { createWorkerValidate } from "./validation/workerValidate";
 
 // Validator module: resolved via webpack alias @js/invenio_modular_deposit_form_validator
 // (package default or entry-point override). Contract: module exports a single value
@@ -129,10 +130,27 @@ export const RDMDepositForm = ({
     configForStore.require_secret_links_expiration = shareBtnRequireLinkExpiration;
   }
 
+  // A schema builder runs in the validation worker when `validate_in_worker` is set; the
+  // page then builds the schema only if it has to fall back (see workerValidate.js).
+  const validateInWorker =
+    config.validate_in_worker !== false && typeof validatorExport === "function";
   const validationSchema = useMemo(() => {
+    if (validateInWorker) return undefined;
     if (typeof validatorExport === "function") return validatorExport(configForStore);
     return validatorExport ?? null;
   }, [config]);
+  const validate = useMemo(
+    () =>
+      validateInWorker
+        ? createWorkerValidate({
+            config: configForStore,
+            buildSchema: () => validatorExport(configForStore),
+            language: i18next.language,
+            incremental: config.incremental_validation === true,
+          })
+        : undefined,
+    [config]
+  );
 
   return (
     <DepositFormApp
@@ -142,6 +160,7 @@ export const RDMDepositForm = ({
       files={files}
       permissions={permissions}
       errors={record.errors}
+      validate={validate}
       validationSchema={validationSchema}
     >
       <FormUIStateManager>
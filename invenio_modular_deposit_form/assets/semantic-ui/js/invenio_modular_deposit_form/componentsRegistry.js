@@ -1,71 +1,6 @@
 import { AccessRightField } from "@js/invenio_rdm_records";
-import { AdditionalDatesAlternateComponent } from "./field_components/alternate/AdditionalDatesAlternateComponent";
-import { PublicationDateAlternateComponent } from "./field_components/alternate/PublicationDateAlternateComponent";
-import { ResourceTypeSelectorComponent } from "./field_components/alternate/ResourceTypeSelectorComponent";
-import {
-  AbstractComponent,
-  AccessRightsComponent,
-  AdditionalDatesComponent,
-  AlternateIdentifiersComponent,
-  CommunitiesComponent,
-  ContributorsComponent,
-  CopyrightsComponent,
-  CreatorsComponent,
-  DeleteComponent,
-  DoiComponent,
-  FileUploadComponent,
-  FormFeedbackComponent,
-  FundingComponent,
-  LanguagesComponent,
-  LicensesComponent,
-  PublisherComponent,
-  PublicationDateComponent,
-  RelatedWorksComponent,
-  ResourceTypeComponent,
-  SubjectsComponent,
-  SubmissionComponent,
-  TitlesComponent,
-  VersionComponent,
-} from "./field_components/field_components";
-import { ContributorsComponentFlat } from "./field_components/alternate/ContributorsComponentFlat";
-import { CreatorsComponentFlat } from "./field_components/alternate/CreatorsComponentFlat";
-import { HorizontalAccessComponent } from "./field_components/alternate/HorizontalAccessComponent";
-import { HorizontalSubmissionComponent } from "./field_components/alternate/HorizontalSubmissionComponent";
-import { SizesComponent } from "./field_components/alternate/SizesComponent";
-import {
-  BookTitleComponent,
-  CodeDevelopmentStatusComponent,
-  CodeProgrammingLanguageComponent,
-  CodeRepositoryComponent,
-  ISBNComponent,
-  JournalISSNComponent,
-  JournalIssueComponent,
-  JournalTitleComponent,
-  JournalVolumeComponent,
-  MeetingAcronymComponent,
-  MeetingDatesComponent,
-  MeetingIdentifiersComponent,
-  MeetingPlaceComponent,
-  MeetingSessionComponent,
-  MeetingSessionPartComponent,
-  MeetingTitleComponent,
-  MeetingURLComponent,
-  PublicationLocationComponent,
-  SectionPagesComponent,
-  ThesisDateDefendedComponent,
-  ThesisDateSubmittedComponent,
-  ThesisDepartmentComponent,
-  ThesisTypeComponent,
-  TotalPagesComponent,
-  UniversityComponent,
-} from "./field_components/custom_field_components";
-import {
-  CombinedDatesComponent,
-  CombinedJournalComponent,
-  CombinedImprintComponent,
-  CombinedMeetingComponent,
-  CombinedThesisComponent,
-} from "./field_components/compound_field_components";
+import { lazyModule } from "./helpers/lazyComponents";
+import lazyComponentChunks from "./lazyComponentChunks.json";
 import { FormRow } from "./framing_components/FieldsContent";
 import { FormTitle } from "./framing_components/FormTitle";
 import { SpacerColumn } from "./framing_components/SpacerColumn";
@@ -73,100 +8,251 @@ import { FormStepper } from "./nav_components/FormStepper";
 import { FormPageNavigationBar } from "./nav_components/FormPageNavigationBar";
 import { FormSidebarPageMenu } from "./nav_components/FormSidebarPageMenu";
 
+// Field components are fetched when a form page first uses them (see helpers/lazyComponents.js),
+// one chunk per group. lazyComponentChunks.json lists the components of each chunk; it decides
+// which loader a registry entry uses and is read by bundle_report.py.
+const chunkLoaders = {
+  "deposit-form-fields": lazyModule(
+    () =>
+      import(
+        /* webpackChunkName: "deposit-form-fields" */
+        "./field_components/field_components"
+      )
+  ),
+  "deposit-form-creatibutors": lazyModule(
+    () =>
+      import(
+        /* webpackChunkName: "deposit-form-creatibutors" */
+        "./field_components/creatibutor_field_components"
+      )
+  ),
+  "deposit-form-funding": lazyModule(
+    () =>
+      import(
+        /* webpackChunkName: "deposit-form-funding" */
+        "./field_components/funding_field_components"
+      )
+  ),
+  "deposit-form-pids": lazyModule(
+    () =>
+      import(
+        /* webpackChunkName: "deposit-form-pids" */
+        "./field_components/pid_field_components"
+      )
+  ),
+  "deposit-form-custom-fields": lazyModule(
+    () =>
+      import(
+        /* webpackChunkName: "deposit-form-custom-fields" */
+        "./field_components/custom_field_components"
+      )
+  ),
+  "deposit-form-compound-fields": lazyModule(
+    () =>
+      import(
+        /* webpackChunkName: "deposit-form-compound-fields" */
+        "./field_components/compound_field_components"
+      )
+  ),
+  // The alternate components are one module each; they are fetched together, as one chunk.
+  "deposit-form-alternate-fields": (name) =>
+    lazyModule(
+      () =>
+        import(
+          /* webpackChunkName: "deposit-form-alternate-fields" */
+          /* webpackMode: "lazy-once" */
+          /* webpackInclude: /alternate\/\w+\.jsx$/ */
+          `./field_components/alternate/${name}.jsx`
+        )
+    )(name),
+};
+
+const chunkOfComponent = Object.fromEntries(
+  Object.entries(lazyComponentChunks).flatMap(([chunk, names]) =>
+    names.map((name) => [name, chunk])
+  )
+);
+
+const lazyComponent = (name) => {
+  const load = chunkLoaders[chunkOfComponent[name]];
+  if (!load) {
+    throw new Error(`${name} has no chunk in lazyComponentChunks.json.`);
+  }
+  return load(name);
+};
+
 const componentsRegistry = {
   AccessComponent: [AccessRightField, ["access"]],
-  AccessRightsComponent: [AccessRightsComponent, ["access"]],
-  AdditionalDatesComponent: [AdditionalDatesComponent, ["metadata.dates"]],
-  AdditionalDatesAlternateComponent: [AdditionalDatesAlternateComponent, ["metadata.dates"]],
-  AlternateIdentifiersComponent: [AlternateIdentifiersComponent, ["metadata.identifiers"]],
-  BookTitleComponent: [BookTitleComponent, ["custom_fields.imprint:imprint.title"]],
-  CommunitiesComponent: [CommunitiesComponent, []],
+  AccessRightsComponent: [lazyComponent("AccessRightsComponent"), ["access"]],
+  AdditionalDatesComponent: [lazyComponent("AdditionalDatesComponent"), ["metadata.dates"]],
+  AdditionalDatesAlternateComponent: [
+    lazyComponent("AdditionalDatesAlternateComponent"),
+    ["metadata.dates"],
+  ],
+  AlternateIdentifiersComponent: [
+    lazyComponent("AlternateIdentifiersComponent"),
+    ["metadata.identifiers"],
+  ],
+  BookTitleComponent: [
+    lazyComponent("BookTitleComponent"),
+    ["custom_fields.imprint:imprint.title"],
+  ],
+  CommunitiesComponent: [lazyComponent("CommunitiesComponent"), []],
   CodeDevelopmentStatusComponent: [
-    CodeDevelopmentStatusComponent,
+    lazyComponent("CodeDevelopmentStatusComponent"),
     ["custom_fields.code:developmentStatus"],
   ],
-  CodeRepositoryComponent: [CodeRepositoryComponent, ["custom_fields.code:codeRepository"]],
+  CodeRepositoryComponent: [
+    lazyComponent("CodeRepositoryComponent"),
+    ["custom_fields.code:codeRepository"],
+  ],
   CodeProgrammingLanguageComponent: [
-    CodeProgrammingLanguageComponent,
+    lazyComponent("CodeProgrammingLanguageComponent"),
     ["custom_fields.code:programmingLanguage"],
   ],
-  ContributorsComponent: [ContributorsComponent, ["metadata.contributors"]],
-  ContributorsComponentFlat: [ContributorsComponentFlat, ["metadata.contributors"]],
-  CopyrightsComponent: [CopyrightsComponent, ["metadata.copyright"]],
-  CreatorsComponent: [CreatorsComponent, ["metadata.creators"]],
-  CreatorsComponentFlat: [CreatorsComponentFlat, ["metadata.creators"]],
-  DoiComponent: [DoiComponent, ["pids.doi"]],
-  FundingComponent: [FundingComponent, ["metadata.funding"]],
-  FormFeedbackComponent: [FormFeedbackComponent, []],
-  ISBNComponent: [ISBNComponent, ["custom_fields.imprint:imprint.isbn"]],
-  JournalISSNComponent: [JournalISSNComponent, ["custom_fields.journal:journal.issn"]],
-  JournalIssueComponent: [JournalIssueComponent, ["custom_fields.journal:journal.issue"]],
-  JournalTitleComponent: [JournalTitleComponent, ["custom_fields.journal:journal.title"]],
-  JournalVolumeComponent: [JournalVolumeComponent, ["custom_fields.journal:journal.volume"]],
-  FileUploadComponent: [FileUploadComponent, ["files"]],
-  LanguagesComponent: [LanguagesComponent, ["metadata.languages"]],
-  LicensesComponent: [LicensesComponent, ["metadata.rights"]],
-  MeetingAcronymComponent: [MeetingAcronymComponent, ["custom_fields.meeting:meeting.acronym"]],
-  MeetingDatesComponent: [MeetingDatesComponent, ["custom_fields.meeting:meeting.dates"]],
-  MeetingPlaceComponent: [MeetingPlaceComponent, ["custom_fields.meeting:meeting.place"]],
-  MeetingSessionComponent: [MeetingSessionComponent, ["custom_fields.meeting:meeting.session"]],
+  ContributorsComponent: [lazyComponent("ContributorsComponent"), ["metadata.contributors"]],
+  ContributorsComponentFlat: [
+    lazyComponent("ContributorsComponentFlat"),
+    ["metadata.contributors"],
+  ],
+  CopyrightsComponent: [lazyComponent("CopyrightsComponent"), ["metadata.copyright"]],
+  CreatorsComponent: [lazyComponent("CreatorsComponent"), ["metadata.creators"]],
+  CreatorsComponentFlat: [lazyComponent("CreatorsComponentFlat"), ["metadata.creators"]],
+  DoiComponent: [lazyComponent("DoiComponent"), ["pids.doi"]],
+  FundingComponent: [lazyComponent("FundingComponent"), ["metadata.funding"]],
+  FormFeedbackComponent: [lazyComponent("FormFeedbackComponent"), []],
+  ISBNComponent: [lazyComponent("ISBNComponent"), ["custom_fields.imprint:imprint.isbn"]],
+  JournalISSNComponent: [
+    lazyComponent("JournalISSNComponent"),
+    ["custom_fields.journal:journal.issn"],
+  ],
+  JournalIssueComponent: [
+    lazyComponent("JournalIssueComponent"),
+    ["custom_fields.journal:journal.issue"],
+  ],
+  JournalTitleComponent: [
+    lazyComponent("JournalTitleComponent"),
+    ["custom_fields.journal:journal.title"],
+  ],
+  JournalVolumeComponent: [
+    lazyComponent("JournalVolumeComponent"),
+    ["custom_fields.journal:journal.volume"],
+  ],
+  FileUploadComponent: [lazyComponent("FileUploadComponent"), ["files"]],
+  LanguagesComponent: [lazyComponent("LanguagesComponent"), ["metadata.languages"]],
+  LicensesComponent: [lazyComponent("LicensesComponent"), ["metadata.rights"]],
+  MeetingAcronymComponent: [
+    lazyComponent("MeetingAcronymComponent"),
+    ["custom_fields.meeting:meeting.acronym"],
+  ],
+  MeetingDatesComponent: [
+    lazyComponent("MeetingDatesComponent"),
+    ["custom_fields.meeting:meeting.dates"],
+  ],
+  MeetingPlaceComponent: [
+    lazyComponent("MeetingPlaceComponent"),
+    ["custom_fields.meeting:meeting.place"],
+  ],
+  MeetingSessionComponent: [
+    lazyComponent("MeetingSessionComponent"),
+    ["custom_fields.meeting:meeting.session"],
+  ],
   MeetingSessionPartComponent: [
-    MeetingSessionPartComponent,
+    lazyComponent("MeetingSessionPartComponent"),
     ["custom_fields.meeting:meeting.session_part"],
   ],
-  MeetingTitleComponent: [MeetingTitleComponent, ["custom_fields.meeting:meeting.title"]],
-  MeetingURLComponent: [MeetingURLComponent, ["custom_fields.meeting:meeting.url"]],
+  MeetingTitleComponent: [
+    lazyComponent("MeetingTitleComponent"),
+    ["custom_fields.meeting:meeting.title"],
+  ],
+  MeetingURLComponent: [
+    lazyComponent("MeetingURLComponent"),
+    ["custom_fields.meeting:meeting.url"],
+  ],
   MeetingIdentifiersComponent: [
-    MeetingIdentifiersComponent,
+    lazyComponent("MeetingIdentifiersComponent"),
     ["custom_fields.meeting:meeting.identifiers"],
   ],
-  PublisherComponent: [PublisherComponent, ["metadata.publisher"]],
-  PublicationDateComponent: [PublicationDateComponent, ["metadata.publication_date"]],
+  PublisherComponent: [lazyComponent("PublisherComponent"), ["metadata.publisher"]],
+  PublicationDateComponent: [
+    lazyComponent("PublicationDateComponent"),
+    ["metadata.publication_date"],
+  ],
   PublicationDateAlternateComponent: [
-    PublicationDateAlternateComponent,
+    lazyComponent("PublicationDateAlternateComponent"),
     ["metadata.publication_date"],
   ],
   PublicationLocationComponent: [
-    PublicationLocationComponent,
+    lazyComponent("PublicationLocationComponent"),
     ["custom_fields.imprint:imprint.place"],
   ],
-  RelatedWorksComponent: [RelatedWorksComponent, ["metadata.related_identifiers"]],
-  ResourceTypeComponent: [ResourceTypeComponent, ["metadata.resource_type"]],
-  ResourceTypeSelectorComponent: [ResourceTypeSelectorComponent, ["metadata.resource_type"]],
-  SectionPagesComponent: [SectionPagesComponent, ["custom_fields.journal:journal.pages"]],
-  SizesComponent: [SizesComponent, ["metadata.sizes"]],
-  SubjectsComponent: [SubjectsComponent, ["metadata.subjects"]],
-  TitlesComponent: [TitlesComponent, ["metadata.title", "metadata.additional_titles"]],
-  TotalPagesComponent: [TotalPagesComponent, ["custom_fields.imprint:imprint.pages"]],
-  UniversityComponent: [UniversityComponent, ["custom_fields.thesis:thesis.university"]],
+  RelatedWorksComponent: [lazyComponent("RelatedWorksComponent"), ["metadata.related_identifiers"]],
+  ResourceTypeComponent: [lazyComponent("ResourceTypeComponent"), ["metadata.resource_type"]],
+  ResourceTypeSelectorComponent: [
+    lazyComponent("ResourceTypeSelectorComponent"),
+    ["metadata.resource_type"],
+  ],
+  SectionPagesComponent: [
+    lazyComponent("SectionPagesComponent"),
+    ["custom_fields.journal:journal.pages"],
+  ],
+  SizesComponent: [lazyComponent("SizesComponent"), ["metadata.sizes"]],
+  SubjectsComponent: [lazyComponent("SubjectsComponent"), ["metadata.subjects"]],
+  TitlesComponent: [
+    lazyComponent("TitlesComponent"),
+    ["metadata.title", "metadata.additional_titles"],
+  ],
+  TotalPagesComponent: [
+    lazyComponent("TotalPagesComponent"),
+    ["custom_fields.imprint:imprint.pages"],
+  ],
+  UniversityComponent: [
+    lazyComponent("UniversityComponent"),
+    ["custom_fields.thesis:thesis.university"],
+  ],
   ThesisDepartmentComponent: [
-    ThesisDepartmentComponent,
+    lazyComponent("ThesisDepartmentComponent"),
     ["custom_fields.thesis:thesis.department"],
   ],
-  ThesisTypeComponent: [ThesisTypeComponent, ["custom_fields.thesis:thesis.type"]],
+  ThesisTypeComponent: [lazyComponent("ThesisTypeComponent"), ["custom_fields.thesis:thesis.type"]],
   ThesisDateSubmittedComponent: [
-    ThesisDateSubmittedComponent,
+    lazyComponent("ThesisDateSubmittedComponent"),
     ["custom_fields.thesis:thesis.date_submitted"],
   ],
   ThesisDateDefendedComponent: [
-    ThesisDateDefendedComponent,
+    lazyComponent("ThesisDateDefendedComponent"),
     ["custom_fields.thesis:thesis.date_defended"],
   ],
-  VersionComponent: [VersionComponent, ["metadata.version"]],
+  VersionComponent: [lazyComponent("VersionComponent"), ["metadata.version"]],
   // below are composite field components
   AbstractComponent: [
-    AbstractComponent,
+    lazyComponent("AbstractComponent"),
     ["metadata.description", "metadata.additional_descriptions"],
   ],
-  CombinedDatesComponent: [CombinedDatesComponent, ["metadata.publication_date", "metadata.dates"]],
-  CombinedJournalComponent: [CombinedJournalComponent, ["custom_fields.journal:journal"]],
-  CombinedImprintComponent: [CombinedImprintComponent, ["custom_fields.imprint:imprint"]],
-  CombinedMeetingComponent: [CombinedMeetingComponent, ["custom_fields.meeting:meeting"]],
-  CombinedThesisComponent: [CombinedThesisComponent, ["custom_fields.thesis:thesis"]],
-  DeleteComponent: [DeleteComponent, []],
-  HorizontalAccessComponent: [HorizontalAccessComponent, ["access"]],
-  HorizontalSubmissionComponent: [HorizontalSubmissionComponent, []],
-  SubmissionComponent: [SubmissionComponent, []],
+  CombinedDatesComponent: [
+    lazyComponent("CombinedDatesComponent"),
+    ["metadata.publication_date", "metadata.dates"],
+  ],
+  CombinedJournalComponent: [
+    lazyComponent("CombinedJournalComponent"),
+    ["custom_fields.journal:journal"],
+  ],
+  CombinedImprintComponent: [
+    lazyComponent("CombinedImprintComponent"),
+    ["custom_fields.imprint:imprint"],
+  ],
+  CombinedMeetingComponent: [
+    lazyComponent("CombinedMeetingComponent"),
+    ["custom_fields.meeting:meeting"],
+  ],
+  CombinedThesisComponent: [
+    lazyComponent("CombinedThesisComponent"),
+    ["custom_fields.thesis:thesis"],
+  ],
+  DeleteComponent: [lazyComponent("DeleteComponent"), []],
+  HorizontalAccessComponent: [lazyComponent("HorizontalAccessComponent"), ["access"]],
+  HorizontalSubmissionComponent: [lazyComponent("HorizontalSubmissionComponent"), []],
+  SubmissionComponent: [lazyComponent("SubmissionComponent"), []],
   // Layout / page navigation (no field paths; registered for config-driven regions)
   FormRow: [FormRow, []],
   FormStepper: [FormStepper, []],
@@ -84,6 +84,9 @@ const CreatibutorsFormBody = ({
   const personorg_scheme_labels = personorg_schemes
     .map((s) => s.title_l10n ?? s.text ?? s.id ?? s.value)
     .filter(Boolean);
+  // Server-side Names + ORCID endpoint (MODULAR_DEPOSIT_FORM_NAMES_SUGGESTIONS_URL). When it
+  // is unset, search /api/names and merge ORCID hits in the browser.
+  const namesSuggestionsUrl = store.getState().deposit.config.names_suggestions_url;
 
   const namesAutocompleteOn = autocompleteNames !== NamesAutocompleteOptions.OFF;
   const namesSearchOnly = autocompleteNames === NamesAutocompleteOptions.SEARCH_ONLY;
@@ -247,9 +250,11 @@ const CreatibutorsFormBody = ({
                     required={!!isCreator}
                     isFocused={isNewItem}
                     restrictOptionsToResults
-                    suggestionAPIUrl="/api/names"
+                    suggestionAPIUrl={namesSuggestionsUrl || "/api/names"}
                     serializeSuggestions={serializeSuggestions}
-                    mergeExtraSource={fetchOrcidPersonSuggestions}
+                    mergeExtraSource={
+                      namesSuggestionsUrl ? undefined : fetchOrcidPersonSuggestions
+                    }
                     onValueChange={onPersonSearchChange}
                     ref={familyNameWidgetRef}
                   />
@@ -8,9 +8,14 @@
 // picker. Used as the `mergeExtraSource` of `RemoteSelectField` so ORCID hits are merged
 // into the local `/api/names` autocomplete results without a backend proxy.
 //
-// Why browser-direct: ORCID's `expanded-search/` endpoint is open (no auth) and serves
-// permissive CORS headers, so a proxy adds latency without value. Anonymous read quota is
-// 25k requests/day per IP and our typical deposit-form traffic is well under that. See
+// Only used when `MODULAR_DEPOSIT_FORM_NAMES_SUGGESTIONS_URL` is unset; by default the family
+// name picker asks the `/api/modular-deposit-form/names/suggestions` endpoint, which does the
+// same lookup and de-dup on the server (`views/names_suggestions.py`) and caches ORCID results.
+//
+// Browser-direct works because ORCID's `expanded-search/` endpoint is open (no auth) and
+// serves permissive CORS headers; it is kept for instances whose servers cannot reach ORCID.
+// Anonymous read quota is 25k requests/day per IP, which the server-side cache keeps the
+// proxy well under. See
 // `docs/.../orcid-integration.md` (TODO) for the full policy / scale analysis.
 //
 // Result mapping: each ORCID hit becomes a Names-vocabulary-shaped record carrying
@@ -25,6 +30,10 @@
 // existing Names id and may carry richer `affiliations` from past sync).
 
 import axios from "axios";
+import {
+  isAbortError,
+  recordAbortedRequest,
+} from "../../../../replacement_components/input_controls/abortTrace";
 
 const ORCID_EXPANDED_SEARCH_URL = "https://pub.orcid.org/v3.0/expanded-search/";
 const MIN_QUERY_LENGTH = 4;
@@ -76,8 +85,9 @@ export function orcidHitToNameRecord(hit) {
 // `RemoteSelectField` `mergeExtraSource` contract: receives a *promise* of local hits and
 // the (preSearchChange-normalized) query, returns a promise of extra hits to merge into the
 // dropdown after local hits have already painted. Soft-fails: any error returns `[]` so the
-// local list is never lost.
-export function fetchOrcidPersonSuggestions(localHitsPromise, query) {
+// local list is never lost. `signal` (from the field's search `AbortController`) cancels the
+// ORCID request once the query is superseded; such aborts are counted in `abortTrace`.
+export function fetchOrcidPersonSuggestions(localHitsPromise, query, { signal } = {}) {
   const q = (query || "").trim();
   if (q.length < MIN_QUERY_LENGTH) return Promise.resolve([]);
 
@@ -85,10 +95,15 @@ export function fetchOrcidPersonSuggestions(localHitsPromise, query) {
     .get(ORCID_EXPANDED_SEARCH_URL, {
       params: { q, rows: ORCID_PAGE_SIZE, start: 0 },
       headers: { Accept: "application/json" },
+      ...(signal ? { signal } : {}),
     })
     .then((resp) => resp?.data?.["expanded-result"] ?? [])
     .catch((e) => {
-      console.warn("ORCID expanded-search failed:", e);
+      if (isAbortError(e)) {
+        recordAbortedRequest("orcid");
+      } else {
+        console.warn("ORCID expanded-search failed:", e);
+      }
       return [];
     });
 
@@ -8,6 +8,10 @@ import {
   fetchOrcidPersonSuggestions,
   orcidHitToNameRecord,
 } from "./orcid";
+import {
+  getAbortedRequestCount,
+  resetAbortedRequestCount,
+} from "../../../../replacement_components/input_controls/abortTrace";
 
 // One canonical ORCID `expanded-result` entry, useful as a base for per-test overrides.
 const baseOrcidHit = {
@@ -247,6 +251,24 @@ describe("fetchOrcidPersonSuggestions", () => {
       expect(result).toEqual([]);
     });
   });
+
+  test("passes the caller's signal to axios and counts an abort instead of warning", async () => {
+    resetAbortedRequestCount();
+    const warnSpy = jest.spyOn(console, "warn").mockImplementation(() => {});
+    const canceled = Object.assign(new Error("canceled"), { name: "CanceledError" });
+    axios.get.mockRejectedValueOnce(canceled);
+    const controller = new AbortController();
+
+    const result = await fetchOrcidPersonSuggestions(Promise.resolve([]), "smith", {
+      signal: controller.signal,
+    });
+
+    expect(result).toEqual([]);
+    expect(axios.get.mock.calls[0][1].signal).toBe(controller.signal);
+    expect(getAbortedRequestCount()).toBe(1);
+    expect(warnSpy).not.toHaveBeenCalled();
+    warnSpy.mockRestore();
+  });
 });
 
 describe("orcidHitToNameRecord", () => {
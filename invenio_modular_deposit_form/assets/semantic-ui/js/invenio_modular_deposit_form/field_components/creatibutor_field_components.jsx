@@ -0,0 +1,81 @@
+// Part of Knowledge Commons Works
+// Copyright (C) 2023-2026 MESH Research
+//
+// Knowledge Commons Works and Invenio App RDM are both free software;
+// you can redistribute them and/or modify them
+// under the terms of the MIT License; see LICENSE file for more details.
+//
+// Creators and contributors. Kept out of field_components.jsx so the creatibutor modal is
+// fetched only for layouts that use these components (see componentsRegistry.js).
+
+import React from "react";
+import { i18next } from "@translations/invenio_modular_deposit_form/i18next";
+import { useStore } from "react-redux";
+import { CreatibutorsField } from "../replacement_components/field_components/CreatibutorsField";
+import { FieldComponentWrapper } from "./FieldComponentWrapper";
+
+/**
+ * Contributors (metadata.contributors). Uses stock CreatibutorsField with schema "contributors".
+ * @overridable InvenioAppRdm.Deposit.ContributorsField.container (via FieldComponentWrapper)
+ */
+const ContributorsComponent = ({ ...extraProps }) => {
+  const config = useStore().getState().deposit.config;
+  const vocabularies = useStore().getState().deposit?.config?.vocabularies ?? { metadata: {} };
+
+  return (
+    <FieldComponentWrapper
+      componentName="ContributorsField"
+      fieldPath="metadata.contributors"
+      label={i18next.t("Contributors")}
+      labelIcon="user plus"
+      {...extraProps}
+    >
+      <CreatibutorsField
+        addButtonLabel={i18next.t("Add contributor")}
+        roleOptions={vocabularies.metadata.contributors.role}
+        schema="contributors"
+        autocompleteNames={config.autocomplete_names}
+        modal={{
+          addLabel: "Add contributor",
+          editLabel: "Edit contributor",
+        }}
+        id="InvenioAppRdm.Deposit.ContributorsField.card"
+      />
+    </FieldComponentWrapper>
+  );
+};
+
+/**
+ * Creators (metadata.creators). Uses stock CreatibutorsField with schema "creators".
+ * @overridable InvenioAppRdm.Deposit.CreatorsField.container (via FieldComponentWrapper)
+ */
+const CreatorsComponent = ({ ...extraProps }) => {
+  const config = useStore().getState().deposit.config;
+  const vocabularies = useStore().getState().deposit?.config?.vocabularies ?? { metadata: {} };
+
+  return (
+    <FieldComponentWrapper
+      componentName="CreatorsField"
+      fieldPath="metadata.creators"
+      label={i18next.t("Creators")}
+      labelIcon="user"
+      description=""
+      {...extraProps}
+    >
+      <CreatibutorsField
+        roleOptions={vocabularies.metadata.creators.role}
+        schema="creators"
+        autocompleteNames={config.autocomplete_names}
+        required
+        config={config}
+        addButtonLabel={i18next.t("Add creator")}
+        modal={{
+          addLabel: i18next.t("Add creator"),
+          editLabel: i18next.t("Edit creator"),
+        }}
+      />
+    </FieldComponentWrapper>
+  );
+};
+
+export { ContributorsComponent, CreatorsComponent };
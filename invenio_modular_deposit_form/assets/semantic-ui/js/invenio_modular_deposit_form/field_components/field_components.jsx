@@ -28,23 +28,21 @@ import {
 } from "@js/invenio_rdm_records";
 import { useFormUIState } from "../FormUIStateManager.jsx";
 import { SyncFilesCountFromRedux } from "../helpers/SyncFilesCountFromRedux";
-import { PIDField as ReplacementPIDField } from "../replacement_components/field_components/PIDField";
+import { vocabularySnapshotUrl } from "../replacement_components/input_controls/vocabularySnapshot";
 import { FormFeedback as ModularFormFeedback } from "./alternate/field_inputs/FormFeedback";
-import {
-  CopyrightsField,
-  CreatibutorsField,
-  DatesField,
-  DescriptionsField,
-  IdentifiersField,
-  LanguagesField,
-  PublisherField,
-  RelatedWorksField,
-  ResourceTypeField,
-  SubjectsField,
-  TitlesField,
-  VersionField,
-} from "../replacement_components/field_components";
-import { FundingField } from "@js/invenio_vocabularies";
+// Each field from its own module: the replacement_components/field_components index would also
+// bring the creatibutor and PID fields into this chunk.
+import { CopyrightsField } from "../replacement_components/field_components/CopyrightsField";
+import { DatesField } from "../replacement_components/field_components/DatesField";
+import { DescriptionsField } from "../replacement_components/field_components/DescriptionsField";
+import { IdentifiersField } from "../replacement_components/field_components/IdentifiersField";
+import { LanguagesField } from "../replacement_components/field_components/LanguagesField";
+import { PublisherField } from "../replacement_components/field_components/PublisherField";
+import { RelatedWorksField } from "../replacement_components/field_components/RelatedWorksField";
+import { ResourceTypeField } from "../replacement_components/field_components/ResourceTypeField";
+import { SubjectsField } from "../replacement_components/field_components/SubjectsField";
+import { TitlesField } from "../replacement_components/field_components/TitlesField";
+import { VersionField } from "../replacement_components/field_components/VersionField";
 import { ShareDraftButton } from "@js/invenio_app_rdm/deposit/ShareDraftButton";
 import { Card, Form, Grid } from "semantic-ui-react";
 import Overridable from "react-overridable";
@@ -182,70 +180,6 @@ const CommunitiesComponent = ({ ...extraProps }) => {
   );
 };
 
-/**
- * Contributors (metadata.contributors). Uses stock CreatibutorsField with schema "contributors".
- * @overridable InvenioAppRdm.Deposit.ContributorsField.container (via FieldComponentWrapper)
- */
-const ContributorsComponent = ({ ...extraProps }) => {
-  const config = useStore().getState().deposit.config;
-  const vocabularies = useStore().getState().deposit?.config?.vocabularies ?? { metadata: {} };
-
-  return (
-    <FieldComponentWrapper
-      componentName="ContributorsField"
-      fieldPath="metadata.contributors"
-      label={i18next.t("Contributors")}
-      labelIcon="user plus"
-      {...extraProps}
-    >
-      <CreatibutorsField
-        addButtonLabel={i18next.t("Add contributor")}
-        roleOptions={vocabularies.metadata.contributors.role}
-        schema="contributors"
-        autocompleteNames={config.autocomplete_names}
-        modal={{
-          addLabel: "Add contributor",
-          editLabel: "Edit contributor",
-        }}
-        id="InvenioAppRdm.Deposit.ContributorsField.card"
-      />
-    </FieldComponentWrapper>
-  );
-};
-
-/**
- * Creators (metadata.creators). Uses stock CreatibutorsField with schema "creators".
- * @overridable InvenioAppRdm.Deposit.CreatorsField.container (via FieldComponentWrapper)
- */
-const CreatorsComponent = ({ ...extraProps }) => {
-  const config = useStore().getState().deposit.config;
-  const vocabularies = useStore().getState().deposit?.config?.vocabularies ?? { metadata: {} };
-
-  return (
-    <FieldComponentWrapper
-      componentName="CreatorsField"
-      fieldPath="metadata.creators"
-      label={i18next.t("Creators")}
-      labelIcon="user"
-      description=""
-      {...extraProps}
-    >
-      <CreatibutorsField
-        roleOptions={vocabularies.metadata.creators.role}
-        schema="creators"
-        autocompleteNames={config.autocomplete_names}
-        required
-        config={config}
-        addButtonLabel={i18next.t("Add creator")}
-        modal={{
-          addLabel: i18next.t("Add creator"),
-          editLabel: i18next.t("Edit creator"),
-        }}
-      />
-    </FieldComponentWrapper>
-  );
-};
-
 /**
  * Publication date (metadata.publication_date). Uses stock `PublicationDateField` from `@js/invenio_rdm_records`.
  * Use in layouts that reference `PublicationDateComponent`. For dropdown-based publication date (and for
@@ -300,49 +234,6 @@ const ShareDraftButtonComponent = () => {
   );
 };
 
-/**
- * DOI field (pids.doi) using replacement PIDField.
- * @overridable InvenioAppRdm.Deposit.PIDField.container (via FieldComponentWrapper)
- */
-const DoiComponent = ({ ...extraProps }) => {
-  const store = useStore();
-  const { config, record } = store.getState().deposit;
-  const pids = Array.isArray(config?.pids) ? config.pids : [];
-  const doiPid = pids.find((pid) => pid?.scheme === "doi");
-
-  if (!doiPid) {
-    return null;
-  }
-
-  return (
-    <FieldComponentWrapper
-      componentName="PIDField"
-      {...extraProps}
-      fieldPath="pids.doi"
-      required={config?.is_doi_required ?? true}
-    >
-      <ReplacementPIDField
-        btnLabelDiscardPID={doiPid.btn_label_discard_pid}
-        btnLabelGetPID={doiPid.btn_label_get_pid}
-        canBeManaged={doiPid.can_be_managed}
-        canBeUnmanaged={doiPid.can_be_unmanaged}
-        doiDefaultSelection={doiPid.default_selected}
-        optionalDOItransitions={doiPid.optional_doi_transitions ?? {}}
-        fieldPath="pids.doi"
-        fieldLabel={doiPid.field_label}
-        isEditingPublishedRecord={record?.is_published === true}
-        managedHelpText={doiPid.managed_help_text}
-        pidLabel={doiPid.pid_label}
-        pidPlaceholder={doiPid.pid_placeholder}
-        pidType={doiPid.scheme}
-        record={record ?? {}}
-        reservedHelpText={doiPid.reserved_help_text}
-        unmanagedHelpText={doiPid.unmanaged_help_text}
-      />
-    </FieldComponentWrapper>
-  );
-};
-
 /**
  * Inner content for FileUploadComponent. Wrapped as a single child so
  * FieldComponentWrapper's React.cloneElement target is a real component
@@ -446,103 +337,17 @@ const FileUploadComponent = ({ ...extraProps }) => {
   );
 };
 
-/**
- * Funding (metadata.funding). Uses FundingField from invenio_vocabularies.
- * Options are not passed in: award/funder choices come from the backend via
- * searchConfig (e.g. /api/awards for award search, /api/funders in custom award form).
- * @overridable InvenioAppRdm.Deposit.FundingField.container (via FieldComponentWrapper)
- */
-const FundingComponent = ({ ...extraProps }) => {
-  return (
-    <FieldComponentWrapper
-      componentName="FundingField"
-      fieldPath="metadata.funding"
-      {...extraProps}
-    >
-      <FundingField
-        searchConfig={{
-          searchApi: {
-            axios: {
-              headers: {
-                Accept: "application/vnd.inveniordm.v1+json",
-              },
-              url: "/api/awards",
-              withCredentials: false,
-            },
-          },
-          initialQueryState: {
-            sortBy: "bestmatch",
-            sortOrder: "asc",
-            layout: "list",
-            page: 1,
-            size: 5,
-          },
-        }}
-        label="Funding"
-        labelIcon="money bill alternate outline"
-        icon="money bill alternate outline"
-        deserializeAward={(award) => {
-          return {
-            title: award.title_l10n,
-            number: award.number,
-            funder: award.funder ?? "",
-            id: award.id,
-            ...(award.identifiers && {
-              identifiers: award.identifiers,
-            }),
-            ...(award.acronym && { acronym: award.acronym }),
-          };
-        }}
-        deserializeFunder={(funder) => {
-          return {
-            id: funder.id,
-            name: funder.name,
-            ...(funder.title_l10n && { title: funder.title_l10n }),
-            ...(funder.pid && { pid: funder.pid }),
-            ...(funder.country && { country: funder.country }),
-            ...(funder.identifiers && {
-              identifiers: funder.identifiers,
-            }),
-          };
-        }}
-        computeFundingContents={(funding) => {
-          let headerContent,
-            descriptionContent,
-            awardOrFunder = "";
-
-          if (funding.funder) {
-            const funderName =
-              funding.funder?.name ?? funding.funder?.title ?? funding.funder?.id ?? "";
-            awardOrFunder = "funder";
-            headerContent = funderName;
-            descriptionContent = "";
-
-            // there cannot be an award without a funder
-            if (funding.award) {
-              awardOrFunder = "award";
-              descriptionContent = funderName;
-              headerContent = funding.award.title;
-            }
-          }
-
-          return { headerContent, descriptionContent, awardOrFunder };
-        }}
-      />
-    </FieldComponentWrapper>
-  );
-};
-
 /**
  * Languages (metadata.languages). Replacement LanguagesField (field_components).
  * Formik stores codes in metadata.languages (strings); RemoteSelectField mirrors { id, title_l10n } to ui.metadata.languages.
+ * Searches a local snapshot of the languages vocabulary when `vocabulary_snapshot_url` is configured.
  * @overridable InvenioAppRdm.Deposit.LanguagesField.container (via FieldComponentWrapper)
  */
 const LanguagesComponent = ({ ...extraProps }) => {
   const { values } = useFormikContext();
+  const depositState = useStore().getState().deposit;
   const depositRecordUiLanguages =
-    useStore()
-      .getState()
-      .deposit.record?.ui?.languages?.filter((lang) => lang !== null) || [];
+    depositState.record?.ui?.languages?.filter((lang) => lang !== null) || [];
   const formikUiLanguages =
     _get(values, "ui.metadata.languages", [])?.filter((lang) => lang !== null) || [];
   /** RemoteSelectField mirrors selected labels to ui.<fieldPath>; prefer that over Redux record UI. */
@@ -581,6 +386,10 @@ const LanguagesComponent = ({ ...extraProps }) => {
           }))
         }
         noQueryMessage={i18next.t("No languages found")}
+        vocabularySnapshotUrl={vocabularySnapshotUrl(
+          depositState.config?.vocabulary_snapshot_url,
+          "languages"
+        )}
         aria-describedby="metadata.languages.helptext"
         multiple={true}
       />
@@ -874,15 +683,11 @@ export {
   AdditionalDatesComponent,
   AlternateIdentifiersComponent,
   CommunitiesComponent,
-  ContributorsComponent,
   CopyrightsComponent,
-  CreatorsComponent,
   PublicationDateComponent,
   DeleteComponent,
-  DoiComponent,
   FileUploadComponent,
   FormFeedbackComponent,
-  FundingComponent,
   LanguagesComponent,
   LicensesComponent,
   PublisherComponent,
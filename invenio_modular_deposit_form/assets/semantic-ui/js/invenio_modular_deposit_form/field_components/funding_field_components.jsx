@@ -0,0 +1,101 @@
+// Part of Knowledge Commons Works
+// Copyright (C) 2023-2026 MESH Research
+//
+// Knowledge Commons Works and Invenio App RDM are both free software;
+// you can redistribute them and/or modify them
+// under the terms of the MIT License; see LICENSE file for more details.
+//
+// Funding. Kept out of field_components.jsx so the award search from invenio_vocabularies is
+// fetched only for layouts that use it (see componentsRegistry.js).
+
+import React from "react";
+import { FundingField } from "@js/invenio_vocabularies";
+import { FieldComponentWrapper } from "./FieldComponentWrapper";
+
+/**
+ * Funding (metadata.funding). Uses FundingField from invenio_vocabularies.
+ * Options are not passed in: award/funder choices come from the backend via
+ * searchConfig (e.g. /api/awards for award search, /api/funders in custom award form).
+ * @overridable InvenioAppRdm.Deposit.FundingField.container (via FieldComponentWrapper)
+ */
+const FundingComponent = ({ ...extraProps }) => {
+  return (
+    <FieldComponentWrapper
+      componentName="FundingField"
+      fieldPath="metadata.funding"
+      {...extraProps}
+    >
+      <FundingField
+        searchConfig={{
+          searchApi: {
+            axios: {
+              headers: {
+                Accept: "application/vnd.inveniordm.v1+json",
+              },
+              url: "/api/awards",
+              withCredentials: false,
+            },
+          },
+          initialQueryState: {
+            sortBy: "bestmatch",
+            sortOrder: "asc",
+            layout: "list",
+            page: 1,
+            size: 5,
+          },
+        }}
+        label="Funding"
+        labelIcon="money bill alternate outline"
+        icon="money bill alternate outline"
+        deserializeAward={(award) => {
+          return {
+            title: award.title_l10n,
+            number: award.number,
+            funder: award.funder ?? "",
+            id: award.id,
+            ...(award.identifiers && {
+              identifiers: award.identifiers,
+            }),
+            ...(award.acronym && { acronym: award.acronym }),
+          };
+        }}
+        deserializeFunder={(funder) => {
+          return {
+            id: funder.id,
+            name: funder.name,
+            ...(funder.title_l10n && { title: funder.title_l10n }),
+            ...(funder.pid && { pid: funder.pid }),
+            ...(funder.country && { country: funder.country }),
+            ...(funder.identifiers && {
+              identifiers: funder.identifiers,
+            }),
+          };
+        }}
+        computeFundingContents={(funding) => {
+          let headerContent,
+            descriptionContent,
+            awardOrFunder = "";
+
+          if (funding.funder) {
+            const funderName =
+              funding.funder?.name ?? funding.funder?.title ?? funding.funder?.id ?? "";
+            awardOrFunder = "funder";
+            headerContent = funderName;
+            descriptionContent = "";
+
+            // there cannot be an award without a funder
+            if (funding.award) {
+              awardOrFunder = "award";
+              descriptionContent = funderName;
+              headerContent = funding.award.title;
+            }
+          }
+
+          return { headerContent, descriptionContent, awardOrFunder };
+        }}
+      />
+    </FieldComponentWrapper>
+  );
+};
+
+export { FundingComponent };
@@ -1,4 +1,7 @@
 export * from "./compound_field_components";
 export * from "./field_components";
+export * from "./creatibutor_field_components";
+export * from "./funding_field_components";
+export * from "./pid_field_components";
 export * from "./custom_field_components";
 
@@ -0,0 +1,59 @@
+// Part of Knowledge Commons Works
+// Copyright (C) 2023-2026 MESH Research
+//
+// Knowledge Commons Works and Invenio App RDM are both free software;
+// you can redistribute them and/or modify them
+// under the terms of the MIT License; see LICENSE file for more details.
+//
+// Persistent identifier fields. Kept out of field_components.jsx so the PIDField fork is
+// fetched only for layouts that use it (see componentsRegistry.js).
+
+import React from "react";
+import { useStore } from "react-redux";
+import { PIDField as ReplacementPIDField } from "../replacement_components/field_components/PIDField";
+import { FieldComponentWrapper } from "./FieldComponentWrapper";
+
+/**
+ * DOI field (pids.doi) using replacement PIDField.
+ * @overridable InvenioAppRdm.Deposit.PIDField.container (via FieldComponentWrapper)
+ */
+const DoiComponent = ({ ...extraProps }) => {
+  const store = useStore();
+  const { config, record } = store.getState().deposit;
+  const pids = Array.isArray(config?.pids) ? config.pids : [];
+  const doiPid = pids.find((pid) => pid?.scheme === "doi");
+
+  if (!doiPid) {
+    return null;
+  }
+
+  return (
+    <FieldComponentWrapper
+      componentName="PIDField"
+      {...extraProps}
+      fieldPath="pids.doi"
+      required={config?.is_doi_required ?? true}
+    >
+      <ReplacementPIDField
+        btnLabelDiscardPID={doiPid.btn_label_discard_pid}
+        btnLabelGetPID={doiPid.btn_label_get_pid}
+        canBeManaged={doiPid.can_be_managed}
+        canBeUnmanaged={doiPid.can_be_unmanaged}
+        doiDefaultSelection={doiPid.default_selected}
+        optionalDOItransitions={doiPid.optional_doi_transitions ?? {}}
+        fieldPath="pids.doi"
+        fieldLabel={doiPid.field_label}
+        isEditingPublishedRecord={record?.is_published === true}
+        managedHelpText={doiPid.managed_help_text}
+        pidLabel={doiPid.pid_label}
+        pidPlaceholder={doiPid.pid_placeholder}
+        pidType={doiPid.scheme}
+        record={record ?? {}}
+        reservedHelpText={doiPid.reserved_help_text}
+        unmanagedHelpText={doiPid.unmanaged_help_text}
+      />
+    </FieldComponentWrapper>
+  );
+};
+
+export { DoiComponent };
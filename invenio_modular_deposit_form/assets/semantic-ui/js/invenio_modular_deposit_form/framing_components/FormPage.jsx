@@ -1,30 +1,37 @@
-import React, { useLayoutEffect } from "react";
+import React, { memo, useLayoutEffect } from "react";
 import Overridable from "react-overridable";
 import { DndProvider } from "react-dnd";
 import { HTML5Backend } from "react-dnd-html5-backend";
-import { useFormUIState } from "../FormUIStateManager.jsx";
 import PropTypes from "prop-types";
 import { SubsectionsRenderer } from "./SubsectionsRenderer";
 import { FieldsContent } from "./FieldsContent";
 
-const FormPage = ({
+/**
+ * One page of the form. Rendered by FormLayoutContainer for the current page and, when
+ * `mounted_neighbour_pages` is set, for the pages next to it, which stay mounted but hidden
+ * (`active` false) so that moving to them does not rebuild their fields.
+ *
+ * Memoized, and reads no form UI context, so that changes to that context (e.g. error counts
+ * while typing) do not re-render the page; its fields follow Formik themselves.
+ */
+const FormPage = memo(function FormPage({
+  active = true,
   focusFirstElement,
   id,
+  section,
   recoveryAsked,
   classnames,
   subsections,
   label,
   ...pageRest
-}) => {
-  const { formUIState } = useFormUIState();
-  const currentFormPage = formUIState?.currentFormPage;
-
+}) {
   useLayoutEffect(() => {
+    if (!active) return undefined;
     const timer = window.setTimeout(() => {
-      focusFirstElement(currentFormPage, recoveryAsked);
+      focusFirstElement(section, recoveryAsked);
     }, 200);
     return () => window.clearTimeout(timer);
-  }, [currentFormPage, recoveryAsked]);
+  }, [active, section, recoveryAsked]);
 
   return (
     <Overridable
@@ -45,11 +52,13 @@ const FormPage = ({
       </DndProvider>
     </Overridable>
   );
-};
+});
 
 FormPage.propTypes = {
+  active: PropTypes.bool,
   focusFirstElement: PropTypes.func.isRequired,
   id: PropTypes.string.isRequired,
+  section: PropTypes.string.isRequired,
   recoveryAsked: PropTypes.bool,
   classnames: PropTypes.string,
   subsections: PropTypes.array.isRequired,
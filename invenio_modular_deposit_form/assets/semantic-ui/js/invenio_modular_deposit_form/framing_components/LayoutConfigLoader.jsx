@@ -0,0 +1,63 @@
+// Part of invenio-modular-deposit-form
+// Copyright (C) 2026, MESH Research
+//
+// invenio-modular-deposit-form is free software; you can redistribute and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+import React, { useEffect, useState } from "react";
+import { Button, Icon, Message } from "semantic-ui-react";
+import { i18next } from "@translations/invenio_modular_deposit_form/i18next";
+import PropTypes from "prop-types";
+import { loadLayoutConfig } from "../helpers/loadLayoutConfig";
+
+/**
+ * Loads the form layout (see loadLayoutConfig.js) and renders `children(config)` once it is
+ * there. When the layout cannot be fetched, an error message with a retry button is shown
+ * instead of an empty form.
+ */
+const LayoutConfigLoader = ({ pageConfig, children }) => {
+  const [attempt, setAttempt] = useState(0);
+  const [state, setState] = useState({ config: null, error: null });
+
+  useEffect(() => {
+    let current = true;
+    setState({ config: null, error: null });
+    loadLayoutConfig(pageConfig).then(
+      (config) => current && setState({ config, error: null }),
+      (error) => current && setState({ config: null, error })
+    );
+    return () => {
+      current = false;
+    };
+  }, [pageConfig, attempt]);
+
+  if (state.config) {
+    return children(state.config);
+  }
+  if (!state.error) {
+    return null;
+  }
+  return (
+    <Message negative icon className="deposit-form-layout-error">
+      <Icon name="warning circle" />
+      <Message.Content>
+        <Message.Header>{i18next.t("The deposit form could not be loaded")}</Message.Header>
+        <p>
+          {i18next.t(
+            "Its layout could not be fetched. Check your connection and try again."
+          )}
+        </p>
+        <Button type="button" onClick={() => setAttempt((n) => n + 1)}>
+          {i18next.t("Try again")}
+        </Button>
+      </Message.Content>
+    </Message>
+  );
+};
+
+LayoutConfigLoader.propTypes = {
+  pageConfig: PropTypes.object.isRequired,
+  children: PropTypes.func.isRequired,
+};
+
+export { LayoutConfigLoader };
@@ -0,0 +1,38 @@
+import React from "react";
+import { render, screen } from "@testing-library/react";
+import userEvent from "@testing-library/user-event";
+import axios from "axios";
+import { LayoutConfigLoader } from "./LayoutConfigLoader";
+
+const pageConfig = { layout_url: "/api/modular-deposit-form/layout?v=abc" };
+const renderForm = (config) => <p>{`Form with ${config.common_fields.length} fields`}</p>;
+
+describe("LayoutConfigLoader", () => {
+  it("renders the form once the layout has loaded", async () => {
+    axios.get.mockResolvedValueOnce({ data: { common_fields: [{}, {}] } });
+
+    render(<LayoutConfigLoader pageConfig={pageConfig}>{renderForm}</LayoutConfigLoader>);
+
+    expect(await screen.findByText("Form with 2 fields")).toBeInTheDocument();
+  });
+
+  it("shows an error with a retry button when the layout cannot be fetched", async () => {
+    jest.spyOn(console, "error").mockImplementation(() => {});
+    axios.get
+      .mockRejectedValueOnce(new Error("offline"))
+      .mockRejectedValueOnce(new Error("offline"))
+      .mockResolvedValueOnce({ data: { common_fields: [{}] } });
+
+    render(<LayoutConfigLoader pageConfig={pageConfig}>{renderForm}</LayoutConfigLoader>);
+
+    expect(await screen.findByText("The deposit form could not be loaded")).toBeInTheDocument();
+    expect(screen.queryByText(/Form with/)).not.toBeInTheDocument();
+    expect(axios.get).toHaveBeenCalledTimes(2);
+
+    userEvent.click(screen.getByRole("button", { name: "Try again" }));
+
+    expect(await screen.findByText("Form with 1 fields")).toBeInTheDocument();
+    expect(screen.queryByText("The deposit form could not be loaded")).not.toBeInTheDocument();
+    expect(axios.get).toHaveBeenCalledTimes(3);
+  });
+});
@@ -1,5 +1,6 @@
-import React from "react";
+import React, { Suspense } from "react";
 import PropTypes from "prop-types";
+import { Loader } from "semantic-ui-react";
 import { FormSection } from "./FormSection";
 import { FieldsContent } from "./FieldsContent";
 
@@ -11,48 +12,52 @@ import { FieldsContent } from "./FieldsContent";
  * When `isFormPagesRegion` is true (FormPage body), top-level non-FormSection rows
  * default to `wrapped` (auto fieldset via FieldsContent → FormSection); set
  * `wrapped: false` on a row to opt out of that auto-wrap.
+ * Most field components are fetched on first use (helpers/lazyComponents.js); a loader
+ * stands in for the subsections until their code has arrived.
  */
 const SubsectionsRenderer = ({ subsections = [], className, id, isFormPagesRegion = false }) => (
   <div className={className} id={id}>
-    {subsections.map(
-      (
-        {
-          section,
-          component,
-          wrapped,
-          subsections: innerSections,
-          ...props
-        },
-        index
-      ) => {
-        const isFormSection =
-          component === "FormSection" || component === "SectionWrapper";
-        return isFormSection ? (
-          <FormSection sectionName={section} key={section} {...props}>
-            {(innerSections ?? []).map(({ component: innerComponent, ...innerProps }, i) => (
-              <FieldsContent
-                key={i}
-                section={section}
-                component={innerComponent}
-                wrapped={wrapped}
-                index={i}
-                {...innerProps}
-                show_heading={innerProps.show_heading ?? props.show_heading}
-              />
-            ))}
-          </FormSection>
-        ) : (
-          <FieldsContent
-            key={section ?? index}
-            section={section}
-            component={component}
-            wrapped={isFormPagesRegion ? wrapped !== false : (wrapped ?? false)}
-            index={index}
-            {...props}
-          />
-        );
-      }
-    )}
+    <Suspense fallback={<Loader active inline="centered" size="small" />}>
+      {subsections.map(
+        (
+          {
+            section,
+            component,
+            wrapped,
+            subsections: innerSections,
+            ...props
+          },
+          index
+        ) => {
+          const isFormSection =
+            component === "FormSection" || component === "SectionWrapper";
+          return isFormSection ? (
+            <FormSection sectionName={section} key={section} {...props}>
+              {(innerSections ?? []).map(({ component: innerComponent, ...innerProps }, i) => (
+                <FieldsContent
+                  key={i}
+                  section={section}
+                  component={innerComponent}
+                  wrapped={wrapped}
+                  index={i}
+                  {...innerProps}
+                  show_heading={innerProps.show_heading ?? props.show_heading}
+                />
+              ))}
+            </FormSection>
+          ) : (
+            <FieldsContent
+              key={section ?? index}
+              section={section}
+              component={component}
+              wrapped={isFormPagesRegion ? wrapped !== false : (wrapped ?? false)}
+              index={index}
+              {...props}
+            />
+          );
+        }
+      )}
+    </Suspense>
   </div>
 );
 
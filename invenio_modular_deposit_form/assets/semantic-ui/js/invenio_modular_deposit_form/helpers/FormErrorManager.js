@@ -24,39 +24,15 @@ function isRecordFieldErrorPath(path) {
  * `includeLeaf`).
  *
  * @param {Object|null|undefined} errorsObj - `errors` or `initialErrors`
- * @param {string} [label] - label for debug logs (e.g. `"errors"` / `"initialErrors"`)
  * @returns {string[]}
  */
-function flattenDefinedRecordErrorPaths(errorsObj, label = "errors") {
-  if (errorsObj == null || typeof errorsObj !== "object") {
-    console.log(
-      "[FormErrorManager] flattenDefinedRecordErrorPaths",
-      label,
-      "stage: skip (null/non-object)"
-    );
-    return [];
-  }
-
+function flattenDefinedRecordErrorPaths(errorsObj) {
+  if (errorsObj == null || typeof errorsObj !== "object") return [];
   const options = {
     descendArrays: true,
     includeLeaf: (v) => v !== undefined,
   };
-
-  const raw = flattenKeysDotJoined(errorsObj, options);
-  console.log(
-    "[FormErrorManager] flattenDefinedRecordErrorPaths",
-    label,
-    "stage: raw keys from flattenKeysDotJoined(record errors options)",
-    raw
-  );
-  const filtered = raw.filter(isRecordFieldErrorPath);
-  console.log(
-    "[FormErrorManager] flattenDefinedRecordErrorPaths",
-    label,
-    "stage: after RECORD_FIELD_ERROR_ROOTS filter",
-    filtered
-  );
-  return filtered;
+  return flattenKeysDotJoined(errorsObj, options).filter(isRecordFieldErrorPath);
 }
 
 /**
@@ -76,26 +52,56 @@ function getSeverityAtPath(errors, path) {
 }
 
 /**
- * Find the section (pageId, sectionId) that owns this field path.
+ * Build a lookup from field path to the section (pageId, sectionId) that owns it.
  * formSectionFields is the full section config (common_fields + fields_by_type for all resource types),
  * so paths are attributed to a section even if that section is not visible for the current type.
  * Matching: path equals a section field, or path is a descendant (path.startsWith(f + ".")), or section field is a descendant of path. Same rule as modular FormFeedbackSummary
  * (`replacement_components/alternate_components/form_feedback_components/FormFeedbackSummary.jsx`).
+ * When several sections match, the first one in formSectionFields wins.
+ *
+ * The section fields are stored in a trie keyed by dot-path segment. Each node keeps the
+ * index of the first section whose field ends there (`own`) and of the first section with a
+ * field at or below it (`first`), so a lookup walks the path's segments once instead of
+ * scanning every section field. Results are memoized per path.
+ *
  * @param {Array<{ pageId, sectionId, fields: string[] }>} formSectionFields
- * @param {string} fieldPath
- * @returns {{ pageId: string, sectionId: string } | null} null if path is not in any section's fields
+ * @returns {function(string): ({ pageId: string, sectionId: string } | null)} lookup returning
+ *   null if the path is not in any section's fields
  */
-function fieldPathToSection(formSectionFields, fieldPath) {
-  if (!Array.isArray(formSectionFields)) return null;
-  for (const entry of formSectionFields) {
-    const fields = entry?.fields ?? [];
-    for (const f of fields) {
-      if (fieldPath === f || fieldPath.startsWith(f + ".") || f.startsWith(fieldPath + ".")) {
-        return { pageId: entry.pageId ?? "", sectionId: entry.sectionId ?? "" };
+function buildSectionPathIndex(formSectionFields) {
+  const entries = Array.isArray(formSectionFields) ? formSectionFields : [];
+  const newNode = () => ({ children: new Map(), own: Infinity, first: Infinity });
+  const root = newNode();
+  entries.forEach((entry, order) => {
+    for (const f of entry?.fields ?? []) {
+      let node = root;
+      for (const segment of f.split(".")) {
+        if (!node.children.has(segment)) node.children.set(segment, newNode());
+        node = node.children.get(segment);
+        node.first = Math.min(node.first, order);
       }
+      node.own = Math.min(node.own, order);
     }
-  }
-  return null;
+  });
+
+  const sections = new Map();
+  return (fieldPath) => {
+    if (sections.has(fieldPath)) return sections.get(fieldPath);
+    let best = Infinity;
+    let node = root;
+    for (const segment of fieldPath.split(".")) {
+      node = node.children.get(segment);
+      if (!node) break;
+      // A section field equal to or above the path.
+      best = Math.min(best, node.own);
+    }
+    // A section field below the path.
+    if (node) best = Math.min(best, node.first);
+    const entry = entries[best];
+    const section = entry ? { pageId: entry.pageId ?? "", sectionId: entry.sectionId ?? "" } : null;
+    sections.set(fieldPath, section);
+    return section;
+  };
 }
 
 /**
@@ -125,19 +131,76 @@ function fieldPathToSection(formSectionFields, fieldPath) {
  * sectionErrorsFlagged: only paths that should be displayed (touched + initial-to-flag). Used for stepper, sidebar, section headers.
  * sectionErrorsAll: any path with an error (client or initial/unchanged). Used for nav guard.
  * Severity comes from the error value at each path ("error"|"warning"|"info"). Paths not in formSectionFields are skipped.
+ *
+ * Incremental updates: FormUIStateManager keeps one instance for the life of the form and calls
+ * {@link FormErrorManager#sync} with the latest Formik context before each update. Every derived
+ * path list is memoized on the identity of the Formik objects it was computed from (as
+ * `useMemo` would), so a keystroke that only replaces `values` does not re-flatten `errors` or
+ * `touched`. The unchanged check for initial error paths is also kept per path and only redone
+ * when the value at that path is a new object (Formik's `setIn` keeps unchanged branches). When
+ * the resulting section lists equal the last dispatched ones, nothing is dispatched.
  */
 class FormErrorManager {
   /**
    * FormErrorManager constructor
-   * @param {Array<{ pageId, sectionId, fields }>} formSectionFields - full section config for path->section lookup (all types)
    * @param {Object} formik - Formik context (errors, touched, initialErrors, initialValues, values, setFieldError, setFieldTouched)
-   * @param {Object} store - Redux store (for reading deposit.actionState)
+   * @param {Object} store - Redux store (for reading deposit.actionState and deposit.config.formSectionFields)
    */
   constructor(formik, store) {
+    this._memo = new Map();
+    this._unchangedByPath = new Map();
+    this._dispatched = {};
+    this.sync(formik, store);
+  }
+
+  /**
+   * Point the manager at the latest Formik context and Redux state. Cached results stay
+   * valid for any Formik object that has not been replaced.
+   *
+   * @param {Object} formik - Formik context
+   * @param {Object} store - Redux store
+   */
+  sync = (formik, store) => {
     this.formik = formik;
     this.store = store.getState();
-    this.formSectionFields = this.store.deposit?.config?.formSectionFields ?? [];
-  }
+    const formSectionFields = this.store.deposit?.config?.formSectionFields ?? [];
+    if (formSectionFields !== this.formSectionFields) {
+      this.formSectionFields = formSectionFields;
+      this._sectionOf = buildSectionPathIndex(formSectionFields);
+    }
+  };
+
+  /**
+   * Return the cached result for `key` if its dependencies are the same objects as last time,
+   * otherwise compute and cache it.
+   *
+   * @param {string} key - cache slot
+   * @param {Array} deps - values compared by identity
+   * @param {function(): *} compute
+   * @returns {*}
+   */
+  _cached = (key, deps, compute) => {
+    const hit = this._memo.get(key);
+    if (hit && hit.deps.length === deps.length && hit.deps.every((d, i) => d === deps[i])) {
+      return hit.value;
+    }
+    const value = compute();
+    this._memo.set(key, { deps, value });
+    return value;
+  };
+
+  /**
+   * @returns {string[]} record field error paths in formik.errors
+   */
+  _errorFields = () => {
+    const { errors } = this.formik;
+    return this._cached("errorFields", [errors], () => {
+      const errorFields = flattenDefinedRecordErrorPaths(errors);
+      // Validation returns a new errors object on every run; keep the array if the paths match.
+      const last = this._memo.get("errorFields")?.value;
+      return last && isEqual(last, errorFields) ? last : errorFields;
+    });
+  };
 
   /**
    * When we have backend validation errors (submit or load), sync touched for all current error
@@ -149,8 +212,8 @@ class FormErrorManager {
     const hasBackendValidationErrors =
       actionState && String(actionState).includes("VALIDATION_ERRORS");
     if (!hasBackendValidationErrors) return;
-    const { errors, touched, setFieldTouched } = this.formik;
-    const errorFields = errors ? flattenDefinedRecordErrorPaths(errors) : [];
+    const { touched, setFieldTouched } = this.formik;
+    const errorFields = this._errorFields();
     if (errorFields.length === 0) return;
     errorFields.forEach((field) => {
       if (!get(touched, field) && !getTouchedParent(touched, field)) {
@@ -159,6 +222,35 @@ class FormErrorManager {
     });
   };
 
+  /**
+   * Initial error paths whose value still equals the initial value. The deep comparison for a
+   * path is only redone when the value (or initial value) at that path is a different object.
+   *
+   * @param {string[]} initialErrorFields
+   * @returns {string[]}
+   */
+  _initialErrorFieldsUnchanged = (initialErrorFields) => {
+    const { values, initialValues } = this.formik;
+    return this._cached("unchanged", [initialErrorFields, values, initialValues], () => {
+      const previous = this._unchangedByPath;
+      this._unchangedByPath = new Map();
+      const unchanged = initialErrorFields.filter((item) => {
+        const value = get(values, item);
+        const initial = get(initialValues, item);
+        const last = previous.get(item);
+        const result =
+          last && last.value === value && last.initial === initial
+            ? last.result
+            : isEqual(value, initial);
+        this._unchangedByPath.set(item, { value, initial, result });
+        return result;
+      });
+      // Keep the previous array when nothing flipped so later steps stay cached.
+      const last = this._memo.get("unchanged")?.value;
+      return last && isEqual(last, unchanged) ? last : unchanged;
+    });
+  };
+
   /**
    * Convert error state object to lists of fields in various states
    *
@@ -175,42 +267,57 @@ class FormErrorManager {
    * - initialErrorFieldsUnflagged: all fields that have initial errors and are not unchanged
    * - initialErrorFieldsToFlag: all fields that have initial errors and are not unchanged or already in client-side error state
    *
+   * Each list is the same array as on the previous call unless one of its inputs changed.
+   *
    * @returns {Object} - the field state object
    */
   errorsToFieldSets = () => {
-    const { errors, touched, initialErrors, initialValues, values } = this.formik;
-    const errorFields = flattenDefinedRecordErrorPaths(errors);
+    const { errors, touched, initialErrors } = this.formik;
+    const errorFields = this._errorFields();
+    const errorSet = this._cached("errorSet", [errorFields], () => new Set(errorFields));
     // Formik may set a leaf to `false` (explicitly untouched); do not count those paths as touched.
-    const touchedFields = flattenKeysDotJoined(touched, {
-      includeLeaf: (value) => value !== false,
-    });
-    const touchedErrorFields = errorFields?.filter(
-      (item) => touchedFields.includes(item) || getTouchedParent(touched, item, true)
+    const touchedSet = this._cached(
+      "touchedSet",
+      [touched],
+      () => new Set(flattenKeysDotJoined(touched, { includeLeaf: (value) => value !== false }))
+    );
+    const touchedErrorFields = this._cached("touchedErrorFields", [errorFields, touchedSet], () =>
+      errorFields.filter((item) => touchedSet.has(item) || getTouchedParent(touched, item, true))
     );
-    const initialErrorFields = flattenDefinedRecordErrorPaths(initialErrors, "initialErrors");
-    const initialErrorFieldsUntouched = initialErrorFields?.filter(
-      (item) => !touchedFields.includes(item)
+    const initialErrorFields = this._cached("initialErrorFields", [initialErrors], () =>
+      flattenDefinedRecordErrorPaths(initialErrors)
     );
-    const initialErrorFieldsUnchanged = initialErrorFields?.filter((item) =>
-      isEqual(get(values, item), get(initialValues, item))
+    const initialErrorFieldsUntouched = this._cached(
+      "initialErrorFieldsUntouched",
+      [initialErrorFields, touchedSet],
+      () => initialErrorFields.filter((item) => !touchedSet.has(item))
     );
-    // const untouchedSet = new Set(initialErrorFieldsUntouched);
-    const unchangedSet = new Set(initialErrorFieldsUnchanged);
-    const initialErrorFieldsUnflagged = initialErrorFields?.filter(
-      (item) => !unchangedSet.has(item)
+    const initialErrorFieldsUnchanged = this._initialErrorFieldsUnchanged(initialErrorFields);
+    const unchangedSet = this._cached(
+      "unchangedSet",
+      [initialErrorFieldsUnchanged],
+      () => new Set(initialErrorFieldsUnchanged)
+    );
+    const initialErrorFieldsUnflagged = this._cached(
+      "initialErrorFieldsUnflagged",
+      [initialErrorFields, unchangedSet],
+      () => initialErrorFields.filter((item) => !unchangedSet.has(item))
     );
 
     // have to account for possibility that frontend and backend error paths
     // are at different levels of specificity
-    const initialErrorFieldsToFlag = [
-      ...new Set(
-        initialErrorFields.filter(
-          (field) =>
-            !initialErrorFieldsUnflagged.includes(field) &&
-            !(errorFields.includes(field) || getErrorParent(errors, field))
-        )
-      ),
-    ];
+    const initialErrorFieldsToFlag = this._cached(
+      "initialErrorFieldsToFlag",
+      [initialErrorFields, unchangedSet, errorSet, errors],
+      () => [
+        ...new Set(
+          initialErrorFields.filter(
+            (field) =>
+              unchangedSet.has(field) && !(errorSet.has(field) || getErrorParent(errors, field))
+          )
+        ),
+      ]
+    );
     return {
       errorFields,
       touchedErrorFields,
@@ -254,7 +361,7 @@ class FormErrorManager {
   /**
    * Build a flat list of section error entries from a set of field paths. Each entry has
    * page, section, error_fields, info_fields, warning_fields (string[] each). Paths that
-   * do not resolve to any section (fieldPathToSection returns null) are skipped.
+   * do not resolve to any section (see buildSectionPathIndex) are skipped.
    * getErrorsForPath(path) returns the errors object to use for severity for that path
    * (formik.errors vs formik.initialErrors depending on whether the path is in the "current"
    * or "initial" set). Severity is read from the error value and paths are bucketed into
@@ -267,7 +374,7 @@ class FormErrorManager {
   _buildSectionErrorList = (fieldPaths, getErrorsForPath) => {
     const byKey = new Map();
     for (const path of fieldPaths) {
-      const section = fieldPathToSection(this.formSectionFields, path);
+      const section = this._sectionOf(path);
       if (!section) continue;
       const key = `${section.pageId}\0${section.sectionId}`;
       if (!byKey.has(key)) {
@@ -305,13 +412,19 @@ class FormErrorManager {
    * @returns {Array<{ page, section, error_fields, info_fields, warning_fields }>}
    */
   getSectionErrorState = (touchedErrorFields, initialErrorFieldsToFlag) => {
-    const paths = [
-      ...new Set([...(touchedErrorFields ?? []), ...(initialErrorFieldsToFlag ?? [])]),
-    ];
-    const touchedSet = new Set(touchedErrorFields ?? []);
     const { errors, initialErrors } = this.formik;
-    return this._buildSectionErrorList(paths, (path) =>
-      touchedSet.has(path) ? errors : initialErrors
+    return this._cached(
+      "sectionErrorsFlagged",
+      [touchedErrorFields, initialErrorFieldsToFlag, errors, initialErrors, this._sectionOf],
+      () => {
+        const paths = [
+          ...new Set([...(touchedErrorFields ?? []), ...(initialErrorFieldsToFlag ?? [])]),
+        ];
+        const touchedSet = new Set(touchedErrorFields ?? []);
+        return this._buildSectionErrorList(paths, (path) =>
+          touchedSet.has(path) ? errors : initialErrors
+        );
+      }
     );
   };
 
@@ -326,11 +439,19 @@ class FormErrorManager {
    * @returns {Array<{ page, section, error_fields, info_fields, warning_fields }>}
    */
   getSectionErrorStateAll = (errorFields, initialErrorFieldsUnchanged) => {
-    const paths = [...new Set([...(errorFields ?? []), ...(initialErrorFieldsUnchanged ?? [])])];
-    const errorSet = new Set(errorFields ?? []);
     const { errors, initialErrors } = this.formik;
-    return this._buildSectionErrorList(paths, (path) =>
-      errorSet.has(path) ? errors : initialErrors
+    return this._cached(
+      "sectionErrorsAll",
+      [errorFields, initialErrorFieldsUnchanged, errors, initialErrors, this._sectionOf],
+      () => {
+        const paths = [
+          ...new Set([...(errorFields ?? []), ...(initialErrorFieldsUnchanged ?? [])]),
+        ];
+        const errorSet = new Set(errorFields ?? []);
+        return this._buildSectionErrorList(paths, (path) =>
+          errorSet.has(path) ? errors : initialErrors
+        );
+      }
     );
   };
 
@@ -346,22 +467,17 @@ class FormErrorManager {
    * it will take precedence over the state of any backend errors.
    *
    * Implementation builds section error lists (sectionErrorsFlagged, sectionErrorsAll) and
-   * dispatches SET_SECTION_ERRORS_FLAGGED and SET_SECTION_ERRORS_ALL.
+   * dispatches SET_SECTION_ERRORS_FLAGGED and SET_SECTION_ERRORS_ALL. A list equal to the one
+   * this instance dispatched last time is not dispatched again, so typing in a field whose
+   * error state does not change does not re-render the form UI context.
    *
    * @param {Function} dispatch - Form UI reducer dispatch (dispatches SET_SECTION_ERRORS_FLAGGED, SET_SECTION_ERRORS_ALL)
    */
   updateFormErrorState = (dispatch) => {
-    console.log("Starting error values:");
-    console.log("values:", this.formik.values);
-    console.log("errors:", this.formik.errors);
-    console.log("touched:", this.formik.touched);
     this.syncTouchedForBackendValidationErrors();
 
     const errorFieldSets = this.errorsToFieldSets();
-    console.log("errorFieldSets", errorFieldSets);
     this.addBackendErrors(errorFieldSets.initialErrorFieldsToFlag);
-    console.log("after addBackendErrors — errors:", this.formik.errors);
-    console.log("after addBackendErrors — touched:", this.formik.touched);
 
     const sectionErrorsFlagged = this.getSectionErrorState(
       errorFieldSets.touchedErrorFields,
@@ -371,11 +487,24 @@ class FormErrorManager {
       errorFieldSets.errorFields,
       errorFieldSets.initialErrorFieldsUnchanged
     );
-    console.log("sectionErrorsFlagged", sectionErrorsFlagged);
-    console.log("sectionErrorsAll", sectionErrorsAll);
-    dispatch({ type: FORM_UI_ACTION.SET_SECTION_ERRORS_FLAGGED, payload: sectionErrorsFlagged });
-    dispatch({ type: FORM_UI_ACTION.SET_SECTION_ERRORS_ALL, payload: sectionErrorsAll });
+    const { SET_SECTION_ERRORS_FLAGGED, SET_SECTION_ERRORS_ALL } = FORM_UI_ACTION;
+    this._dispatchIfChanged(dispatch, SET_SECTION_ERRORS_FLAGGED, sectionErrorsFlagged);
+    this._dispatchIfChanged(dispatch, SET_SECTION_ERRORS_ALL, sectionErrorsAll);
+  };
+
+  /**
+   * Dispatch `payload` unless it equals the payload last dispatched for `type`.
+   *
+   * @param {Function} dispatch - Form UI reducer dispatch
+   * @param {string} type - FORM_UI_ACTION type
+   * @param {Array} payload - section error list
+   */
+  _dispatchIfChanged = (dispatch, type, payload) => {
+    const last = this._dispatched[type];
+    if (last !== undefined && (last === payload || isEqual(last, payload))) return;
+    this._dispatched[type] = payload;
+    dispatch({ type, payload });
   };
 }
 
-export { FormErrorManager };
+export { FormErrorManager, buildSectionPathIndex };
@@ -1,4 +1,4 @@
-import { FormErrorManager } from "./FormErrorManager";
+import { FormErrorManager, buildSectionPathIndex } from "./FormErrorManager";
 import { FORM_UI_ACTION } from "./formUIStateReducer";
 import {
   mockFormikContext,
@@ -459,4 +459,89 @@ describe("FormErrorManager", () => {
       expect(mockSetFieldError).not.toHaveBeenCalledWith("status", expect.anything());
     });
   });
+
+  describe("buildSectionPathIndex", () => {
+    const sectionOf = buildSectionPathIndex([
+      { pageId: "1", sectionId: "titles", fields: ["metadata.title"] },
+      { pageId: "2", sectionId: "creators", fields: ["metadata.creators.0.role", "metadata"] },
+      { pageId: "3", sectionId: "journal", fields: ["custom_fields.journal:journal.title"] },
+    ]);
+
+    it("matches equal, descendant and ancestor paths", () => {
+      expect(sectionOf("metadata.title")).toEqual({ pageId: "1", sectionId: "titles" });
+      expect(sectionOf("custom_fields.journal:journal.title")).toEqual({
+        pageId: "3",
+        sectionId: "journal",
+      });
+      // section field below the path
+      expect(sectionOf("custom_fields")).toEqual({ pageId: "3", sectionId: "journal" });
+      // section field above the path
+      expect(sectionOf("metadata.creators.1.name")).toEqual({ pageId: "2", sectionId: "creators" });
+    });
+
+    it("prefers the first matching section like the linear scan did", () => {
+      // "metadata" (section 2) is above and "metadata.title" (section 1) is equal
+      expect(sectionOf("metadata.title.0")).toEqual({ pageId: "1", sectionId: "titles" });
+      // only section 1 and 2 fields are below "metadata"; section 1 comes first
+      expect(sectionOf("metadata")).toEqual({ pageId: "1", sectionId: "titles" });
+    });
+
+    it("returns null for paths outside every section", () => {
+      expect(sectionOf("access.record")).toBeNull();
+      expect(sectionOf("metadata_extra")).toBeNull();
+    });
+  });
+
+  describe("incremental updates", () => {
+    it("reuses field sets and skips dispatch when an unrelated value changes", () => {
+      const dispatch = jest.fn();
+      const mgr = new FormErrorManager(formikFromStartingState, mockStore);
+      mgr.updateFormErrorState(dispatch);
+      const before = mgr.errorsToFieldSets();
+      expect(dispatch).toHaveBeenCalledTimes(2);
+
+      mgr.sync(
+        {
+          ...formikFromStartingState,
+          values: {
+            ...values,
+            metadata: { ...values.metadata, description: "Edited description" },
+          },
+        },
+        mockStore
+      );
+      mgr.updateFormErrorState(dispatch);
+
+      const after = mgr.errorsToFieldSets();
+      expect(after.initialErrorFieldsUnchanged).toBe(before.initialErrorFieldsUnchanged);
+      expect(after.initialErrorFieldsToFlag).toBe(before.initialErrorFieldsToFlag);
+      expect(dispatch).toHaveBeenCalledTimes(2);
+    });
+
+    it("reprocesses a path whose value changed", () => {
+      const dispatch = jest.fn();
+      const mgr = new FormErrorManager(formikFromStartingState, mockStore);
+      mgr.updateFormErrorState(dispatch);
+
+      mgr.sync(
+        {
+          ...formikFromStartingState,
+          values: { ...values, metadata: { ...values.metadata, publisher: "MSU Press" } },
+        },
+        mockStore
+      );
+      mgr.updateFormErrorState(dispatch);
+
+      expect(mgr.errorsToFieldSets().initialErrorFieldsToFlag).toEqual([
+        "custom_fields.kcr:ai_usage.ai_used",
+      ]);
+      expect(dispatch).toHaveBeenLastCalledWith({
+        type: FORM_UI_ACTION.SET_SECTION_ERRORS_ALL,
+        payload: [
+          { page: "1", section: "main", error_fields: ["metadata.resource_type", "metadata.title"], info_fields: [], warning_fields: [] },
+          { page: "3", section: "main", error_fields: ["custom_fields.kcr:ai_usage.ai_used"], info_fields: [], warning_fields: [] },
+        ],
+      });
+    });
+  });
 });
@@ -0,0 +1,387 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Coordinates the autosave of one draft between the browser tabs that have it open.
+//
+// One tab, the leader, holds a Web Lock named after the draft and is the only one that
+// reads and writes the autosave store (autosaveStore.js). The other tabs send their loads,
+// saves and removals to it over a `BroadcastChannel` and wait for its reply. When the
+// leader's tab closes, its lock is released and a waiting tab takes over. A leader whose tab
+// is hidden or about to be frozen gives the lock up and queues for it again, so that a
+// background tab the browser throttles does not hold up the tab the user is typing in.
+//
+// Every accepted save or removal increments the draft's revision, which the leader
+// announces to all tabs, together with the request that caused it. The leader replies as
+// soon as a request is accepted and writes afterwards. A tab remembers the revision its
+// values descend from: the one it loaded, or the one its own last save or removal created,
+// even when the leader's reply came too late for the request. A save based on an older
+// revision means another tab changed the draft since, and is refused as a conflict instead
+// of overwriting that tab's values.
+//
+// Without `BroadcastChannel` or Web Locks every tab is its own leader and writes directly,
+// as before.
+
+const CHANNEL_PREFIX = "invenio-modular-deposit-form-autosave:";
+// Long enough for the leader to wait for an idle callback and write.
+const REQUEST_TIMEOUT_MS = 10000;
+// Page Lifecycle events after which a tab should not lead.
+const LIFECYCLE_EVENTS = ["visibilitychange", "freeze"];
+
+/**
+ * @returns {string} an id for this tab
+ */
+function randomTabId() {
+  return typeof crypto !== "undefined" && crypto.randomUUID
+    ? crypto.randomUUID()
+    : Math.random().toString(36).slice(2);
+}
+
+class AutosaveCoordinator {
+  /**
+   * @param {Object} options
+   * @param {string} options.key - the draft's storage key
+   * @param {import("./autosaveStore").AutosaveStore} options.store
+   * @param {BroadcastChannel|null} [options.channel] - channel named after the draft
+   * @param {LockManager|null} [options.locks] - `navigator.locks`
+   * @param {Document|null} [options.lifecycle] - target of the tab's `visibilitychange` and
+   *   `freeze` events
+   * @param {string} [options.tabId]
+   * @param {number} [options.requestTimeout] - ms to wait for the leader's reply
+   */
+  constructor({
+    key,
+    store,
+    channel = null,
+    locks = null,
+    lifecycle = null,
+    tabId = randomTabId(),
+    requestTimeout = REQUEST_TIMEOUT_MS,
+  }) {
+    this.key = key;
+    this.store = store;
+    this.channel = channel && locks ? channel : null;
+    this.locks = this.channel ? locks : null;
+    this.lifecycle = this.locks ? lifecycle : null;
+    this.tabId = tabId;
+    this.requestTimeout = requestTimeout;
+    this.lockName = `${CHANNEL_PREFIX}${key}`;
+    this.leader = false;
+    // Leader only: the current revision and the values of the last accepted save.
+    this.revision = 0;
+    this.latestValues = null;
+    // Highest revision announced by any tab, so a new leader continues from it.
+    this.latestRevision = 0;
+    // Revision this tab's values descend from; null until loaded.
+    this.baseRevision = null;
+    this.requests = new Map();
+    this.nextRequestId = 0;
+    this.ready = null;
+    this.leading = null;
+    this.releaseLock = null;
+    this.abortTakeover = null;
+    this.closed = false;
+    this.handleMessage = this.handleMessage.bind(this);
+    this.handleLifecycle = this.handleLifecycle.bind(this);
+    this.channel?.addEventListener("message", this.handleMessage);
+    LIFECYCLE_EVENTS.forEach((type) =>
+      this.lifecycle?.addEventListener(type, this.handleLifecycle)
+    );
+  }
+
+  /**
+   * @returns {boolean} true when this tab reads and writes the store
+   */
+  get isLeader() {
+    return this.leader;
+  }
+
+  /**
+   * Find out whether this tab leads; called by the other methods.
+   *
+   * @returns {Promise<void>}
+   */
+  start() {
+    if (!this.ready) this.ready = this.locks ? this.elect() : this.becomeLeader();
+    return this.ready;
+  }
+
+  /**
+   * @returns {Promise<void>} resolves once this tab leads or knows another tab does
+   */
+  elect() {
+    return new Promise((resolve, reject) => {
+      this.locks
+        .request(this.lockName, { ifAvailable: true }, async (lock) => {
+          if (lock) {
+            await this.becomeLeader();
+            resolve();
+            return this.hold();
+          }
+          resolve();
+          this.queueForLead();
+          return undefined;
+        })
+        .catch(reject);
+    });
+  }
+
+  /**
+   * @returns {Promise<void>} keeps the lock until `releaseLock` is called
+   */
+  hold() {
+    return new Promise((resolve) => {
+      this.releaseLock = resolve;
+    });
+  }
+
+  /** Wait for the lock, and lead once it is granted. */
+  queueForLead() {
+    const controller = new AbortController();
+    this.abortTakeover = () => controller.abort();
+    this.locks
+      .request(this.lockName, { signal: controller.signal }, async () => {
+        if (this.closed) return undefined;
+        await this.becomeLeader();
+        return this.hold();
+      })
+      .catch(() => {});
+  }
+
+  /**
+   * Give up the lead, e.g. while the tab is hidden, and queue for it behind the other tabs.
+   * Writes already accepted still complete.
+   */
+  stepDown() {
+    if (!this.leader || !this.releaseLock || this.closed) return;
+    const release = this.releaseLock;
+    this.leader = false;
+    this.releaseLock = null;
+    release();
+    this.queueForLead();
+  }
+
+  /**
+   * @param {Event} event - `visibilitychange` or `freeze`
+   */
+  handleLifecycle(event) {
+    if (event.type === "freeze" || this.lifecycle.visibilityState === "hidden") {
+      this.stepDown();
+    }
+  }
+
+  /**
+   * @returns {Promise<void>} resolves when the stored revision and values are read
+   */
+  becomeLeader() {
+    this.leader = true;
+    this.leading = this.store
+      .load(this.key)
+      .catch((e) => {
+        console.warn("Could not read the autosaved deposit form values.", e);
+        return null;
+      })
+      .then((values) => {
+        this.latestValues = values;
+        this.revision = Math.max(this.latestRevision, this.store.revision(this.key));
+        // Requests sent while the previous leader's tab was closing (e.g. on reload) got no
+        // reply; carry them out here.
+        this.requests.forEach(({ message, settle }) => {
+          const { result, written } = this.perform({ ...message, from: this.tabId });
+          settle(result);
+          written.catch((e) => console.warn("Could not autosave the deposit form values.", e));
+        });
+      });
+    return this.leading;
+  }
+
+  /**
+   * @param {Object} message
+   */
+  post(message) {
+    this.channel?.postMessage({ ...message, from: this.tabId });
+  }
+
+  /**
+   * Send a request to the leader.
+   *
+   * @param {Object} message - `{type, ...}`
+   * @returns {Promise<Object>} the leader's result
+   * @throws {Error} when no leader replies in time
+   */
+  request(message) {
+    const id = `${this.tabId}:${(this.nextRequestId += 1)}`;
+    return new Promise((resolve, reject) => {
+      const timeout = setTimeout(() => {
+        this.requests.delete(id);
+        reject(new Error("No other tab answered the autosave request."));
+      }, this.requestTimeout);
+      const settle = (result) => {
+        clearTimeout(timeout);
+        this.requests.delete(id);
+        resolve(result);
+      };
+      this.requests.set(id, { message, settle });
+      this.post({ ...message, id });
+    });
+  }
+
+  /**
+   * @param {MessageEvent} event
+   */
+  handleMessage({ data }) {
+    if (!data || this.closed) return;
+    if (data.type === "revision") {
+      this.latestRevision = Math.max(this.latestRevision, data.revision);
+      // This tab's own save or removal was accepted, even if the reply is late or lost.
+      if (data.to === this.tabId) this.adopt(data.revision);
+    } else if (data.type === "reply") {
+      if (data.to === this.tabId) this.requests.get(data.id)?.settle(data.result);
+    } else if (this.leader) {
+      this.leading
+        .then(() => {
+          const { result, written } = this.perform(data);
+          if (result) this.post({ type: "reply", id: data.id, to: data.from, result });
+          return written;
+        })
+        .catch((e) => console.warn("Could not handle an autosave request from another tab.", e));
+    }
+  }
+
+  /**
+   * @param {number} revision - created by this tab's own accepted save or removal
+   */
+  adopt(revision) {
+    if (this.baseRevision === null || revision > this.baseRevision) this.baseRevision = revision;
+  }
+
+  /**
+   * Carry out a request as the leader. The result is known as soon as the request is
+   * accepted; the write to the store follows.
+   *
+   * @param {Object} request - `{type: "load"|"save"|"remove", from, ...}`
+   * @returns {{result: (Object|undefined), written: Promise<void>}} the result (undefined for
+   *   unknown requests) and the pending write
+   */
+  perform(request) {
+    const written = Promise.resolve();
+    if (request.type === "load") {
+      return { result: { values: this.latestValues, revision: this.revision }, written };
+    }
+    if (request.type === "save") {
+      if (request.baseRevision !== null && request.baseRevision !== this.revision) {
+        return { result: { status: "conflict", revision: this.revision }, written };
+      }
+      const revision = this.advance(request.values, request.from);
+      return {
+        result: { status: "saved", revision },
+        written: this.store.save(this.key, request.values, request.meta),
+      };
+    }
+    if (request.type === "remove") {
+      const revision = this.advance(null, request.from);
+      return { result: { revision }, written: this.store.remove(this.key) };
+    }
+    return { result: undefined, written };
+  }
+
+  /**
+   * @param {Object|null} values - the draft's new stored values
+   * @param {string} from - id of the tab whose request this is
+   * @returns {number} the new revision, announced to the other tabs
+   */
+  advance(values, from) {
+    this.revision += 1;
+    this.latestRevision = this.revision;
+    this.latestValues = values;
+    this.post({ type: "revision", revision: this.revision, to: from });
+    return this.revision;
+  }
+
+  /**
+   * @param {Object} request
+   * @returns {Promise<Object>} the result, from this tab or the leader
+   */
+  async run(request) {
+    await this.start();
+    if (!this.leader) return this.request(request);
+    await this.leading;
+    const { result, written } = this.perform({ ...request, from: this.tabId });
+    await written;
+    return result;
+  }
+
+  /**
+   * Read the stored values; later saves are based on their revision.
+   *
+   * @returns {Promise<Object|null>} the values, or null when none are stored
+   */
+  async load() {
+    const { values, revision } = await this.run({ type: "load" });
+    this.baseRevision = revision;
+    return values;
+  }
+
+  /**
+   * Save `values` unless another tab changed the draft since this tab's values were loaded
+   * or saved.
+   *
+   * @param {Object} values
+   * @param {Object} [meta] - see AutosaveStore.save
+   * @returns {Promise<string>} "saved" or "conflict"
+   */
+  async save(values, meta = {}) {
+    const { status, revision } = await this.run({
+      type: "save",
+      baseRevision: this.baseRevision,
+      values,
+      meta,
+    });
+    if (status === "saved") this.baseRevision = revision;
+    return status;
+  }
+
+  /**
+   * Drop the stored values. This tab's values become the base for its next save, and
+   * other tabs' saves conflict.
+   *
+   * @returns {Promise<void>}
+   */
+  async remove() {
+    const { revision } = await this.run({ type: "remove" });
+    this.baseRevision = revision;
+  }
+
+  /** Stop leading or waiting to lead, and stop listening to other tabs. */
+  close() {
+    this.closed = true;
+    this.releaseLock?.();
+    this.abortTakeover?.();
+    LIFECYCLE_EVENTS.forEach((type) =>
+      this.lifecycle?.removeEventListener(type, this.handleLifecycle)
+    );
+    this.channel?.removeEventListener("message", this.handleMessage);
+    this.channel?.close();
+  }
+}
+
+/**
+ * Create the coordinator for the draft stored under `key`.
+ *
+ * @param {string} key
+ * @param {import("./autosaveStore").AutosaveStore} store
+ * @returns {AutosaveCoordinator}
+ */
+function createAutosaveCoordinator(key, store) {
+  const locks = typeof navigator !== "undefined" ? navigator.locks ?? null : null;
+  const channel =
+    locks && typeof BroadcastChannel !== "undefined"
+      ? new BroadcastChannel(`${CHANNEL_PREFIX}${key}`)
+      : null;
+  const lifecycle = typeof document !== "undefined" ? document : null;
+  return new AutosaveCoordinator({ key, store, channel, locks, lifecycle });
+}
+
+export { AutosaveCoordinator, createAutosaveCoordinator };
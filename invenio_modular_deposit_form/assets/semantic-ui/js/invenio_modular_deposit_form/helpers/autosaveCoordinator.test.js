@@ -0,0 +1,231 @@
+import { AutosaveCoordinator } from "./autosaveCoordinator";
+
+const KEY = "rdmDepositFormValues.1.abc";
+
+/**
+ * BroadcastChannel stand-in: messages reach the other open channels, asynchronously and
+ * after `delay` ms.
+ */
+class FakeChannel {
+  constructor(hub) {
+    this.hub = hub;
+    this.delay = 0;
+    this.listeners = new Set();
+    hub.add(this);
+  }
+
+  addEventListener(type, listener) {
+    this.listeners.add(listener);
+  }
+
+  removeEventListener(type, listener) {
+    this.listeners.delete(listener);
+  }
+
+  postMessage(message) {
+    const data = JSON.parse(JSON.stringify(message));
+    this.hub.forEach((channel) => {
+      if (channel === this) return;
+      setTimeout(() => channel.listeners.forEach((listener) => listener({ data })), this.delay);
+    });
+  }
+
+  close() {
+    this.hub.delete(this);
+  }
+}
+
+/** `navigator.locks` stand-in for one lock name, with `ifAvailable` and `signal`. */
+class FakeLocks {
+  constructor() {
+    this.held = false;
+    this.queue = [];
+  }
+
+  request(name, options, callback) {
+    if (options.ifAvailable && (this.held || this.queue.length)) {
+      return Promise.resolve(callback(null));
+    }
+    return new Promise((resolve, reject) => {
+      const entry = { callback, resolve };
+      options.signal?.addEventListener("abort", () => {
+        this.queue = this.queue.filter((queued) => queued !== entry);
+        reject(new Error("AbortError"));
+      });
+      this.queue.push(entry);
+      this.grant();
+    });
+  }
+
+  grant() {
+    if (this.held || !this.queue.length) return;
+    const { callback, resolve } = this.queue.shift();
+    this.held = true;
+    Promise.resolve(callback({})).then((result) => {
+      this.held = false;
+      resolve(result);
+      this.grant();
+    });
+  }
+}
+
+/** One browser profile: a shared database, channel hub and lock manager. */
+const makeBrowser = () => {
+  const db = new Map();
+  const hub = new Set();
+  const locks = new FakeLocks();
+  const openTab = (tabId, options = {}) => {
+    const store = {
+      load: jest.fn(async (key) => db.get(key)?.values ?? null),
+      save: jest.fn(async (key, values) => {
+        db.set(key, { values, seq: (db.get(key)?.seq ?? 0) + 1 });
+      }),
+      remove: jest.fn(async (key) => {
+        db.delete(key);
+      }),
+      revision: (key) => db.get(key)?.seq ?? 0,
+    };
+    const channel = new FakeChannel(hub);
+    const coordinator = new AutosaveCoordinator({
+      key: KEY,
+      store,
+      channel,
+      locks,
+      tabId,
+      ...options,
+    });
+    return { store, channel, coordinator };
+  };
+  return { db, openTab };
+};
+
+const settle = (ms = 10) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/** `document` stand-in for the Page Lifecycle events. */
+const makeLifecycle = () => {
+  const lifecycle = new EventTarget();
+  lifecycle.visibilityState = "visible";
+  return lifecycle;
+};
+
+describe("AutosaveCoordinator", () => {
+  it("lets the first tab write and sends the other tabs' requests to it", async () => {
+    const { db, openTab } = makeBrowser();
+    db.set(KEY, { values: { title: "Stored" }, seq: 3 });
+    const first = openTab("first");
+    const second = openTab("second");
+
+    await expect(first.coordinator.load()).resolves.toEqual({ title: "Stored" });
+    await expect(second.coordinator.load()).resolves.toEqual({ title: "Stored" });
+    expect(first.coordinator.isLeader).toBe(true);
+    expect(second.coordinator.isLeader).toBe(false);
+
+    await expect(second.coordinator.save({ title: "Second" })).resolves.toBe("saved");
+    expect(second.store.save).not.toHaveBeenCalled();
+    expect(first.store.save).toHaveBeenCalledWith(KEY, { title: "Second" }, {});
+    expect(db.get(KEY).values).toEqual({ title: "Second" });
+  });
+
+  it("refuses a save based on values another tab has changed since", async () => {
+    const { openTab } = makeBrowser();
+    const first = openTab("first");
+    const second = openTab("second");
+    await first.coordinator.load();
+    await second.coordinator.load();
+
+    await expect(first.coordinator.save({ title: "First" })).resolves.toBe("saved");
+    await expect(second.coordinator.save({ title: "Second" })).resolves.toBe("conflict");
+    await expect(first.coordinator.save({ title: "First again" })).resolves.toBe("saved");
+    expect(first.store.save).toHaveBeenCalledTimes(2);
+
+    await second.coordinator.remove();
+    await expect(first.coordinator.save({ title: "First" })).resolves.toBe("conflict");
+    await expect(second.coordinator.save({ title: "Second" })).resolves.toBe("saved");
+  });
+
+  it("hands the lead to a waiting tab when the leader's tab closes", async () => {
+    const { db, openTab } = makeBrowser();
+    const first = openTab("first");
+    const second = openTab("second");
+    await first.coordinator.load();
+    await second.coordinator.load();
+    await first.coordinator.save({ title: "First" });
+    await settle();
+
+    first.coordinator.close();
+    await settle();
+    expect(second.coordinator.isLeader).toBe(true);
+    await expect(second.coordinator.save({ title: "Second" })).resolves.toBe("conflict");
+
+    const third = openTab("third");
+    await expect(third.coordinator.load()).resolves.toEqual({ title: "First" });
+    await expect(third.coordinator.save({ title: "Third" })).resolves.toBe("saved");
+    expect(second.store.save).toHaveBeenCalledWith(KEY, { title: "Third" }, {});
+    expect(db.get(KEY).values).toEqual({ title: "Third" });
+  });
+
+  it("replies to a save before the leader's write completes", async () => {
+    const { openTab } = makeBrowser();
+    const first = openTab("first");
+    const second = openTab("second");
+    await first.coordinator.load();
+    await second.coordinator.load();
+    first.store.save.mockImplementation(() => new Promise(() => {}));
+
+    await expect(second.coordinator.save({ title: "Second" })).resolves.toBe("saved");
+    await expect(second.coordinator.save({ title: "Second again" })).resolves.toBe("saved");
+    expect(first.store.save).toHaveBeenCalledTimes(2);
+  });
+
+  it("keeps the revision of a save whose reply arrived after the timeout", async () => {
+    const { openTab } = makeBrowser();
+    const first = openTab("first");
+    const second = openTab("second", { requestTimeout: 20 });
+    await first.coordinator.load();
+    await second.coordinator.load();
+
+    first.channel.delay = 50;
+    await expect(second.coordinator.save({ title: "Second" })).rejects.toThrow(
+      "No other tab answered"
+    );
+    await settle(60);
+    first.channel.delay = 0;
+
+    await expect(second.coordinator.save({ title: "Second again" })).resolves.toBe("saved");
+    expect(first.store.save).toHaveBeenCalledWith(KEY, { title: "Second again" }, {});
+  });
+
+  it("hands the lead to another tab while the leader's tab is hidden", async () => {
+    const { openTab } = makeBrowser();
+    const lifecycle = makeLifecycle();
+    const first = openTab("first", { lifecycle });
+    const second = openTab("second");
+    await first.coordinator.load();
+    await second.coordinator.load();
+
+    lifecycle.visibilityState = "hidden";
+    lifecycle.dispatchEvent(new Event("visibilitychange"));
+    await settle();
+    expect(first.coordinator.isLeader).toBe(false);
+    expect(second.coordinator.isLeader).toBe(true);
+
+    await expect(second.coordinator.save({ title: "Second" })).resolves.toBe("saved");
+    expect(second.store.save).toHaveBeenCalledWith(KEY, { title: "Second" }, {});
+    expect(first.store.save).not.toHaveBeenCalled();
+  });
+
+  it("writes directly without BroadcastChannel or Web Locks", async () => {
+    const store = {
+      load: jest.fn(async () => null),
+      save: jest.fn(async () => {}),
+      remove: jest.fn(async () => {}),
+      revision: () => 0,
+    };
+    const coordinator = new AutosaveCoordinator({ key: KEY, store });
+
+    await expect(coordinator.load()).resolves.toBeNull();
+    expect(coordinator.isLeader).toBe(true);
+    await expect(coordinator.save({ title: "Solo" }, { draftUrl: "/x" })).resolves.toBe("saved");
+    expect(store.save).toHaveBeenCalledWith(KEY, { title: "Solo" }, { draftUrl: "/x" });
+  });
+});
@@ -0,0 +1,499 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Storage for the deposit form's autosaved values (see useLocalStorageRecovery.jsx).
+//
+// Each draft is stored in IndexedDB as a full snapshot followed by JSON Patch deltas
+// (jsonPatch.js). A save writes only the delta from the previously saved values; every
+// `snapshotEvery` saves, or when a delta would be large, the full values are written again
+// and the older deltas dropped. Saves are queued and written in an idle callback, where the
+// latest values for each draft replace any that were not written yet, so typing never waits
+// on serialization or storage. `load` rebuilds the values from the snapshot and its deltas.
+//
+// Without IndexedDB (Jest), or when it cannot be opened (private mode in some browsers,
+// blocked storage), the full values are written to `localStorage` under the draft's key, as
+// before. Values saved there by earlier versions are
+// still loaded, and removed once the draft is saved to IndexedDB.
+//
+// `prune` removes drafts not saved for a long time and drafts that no longer exist on the
+// server (published or deleted), so their values do not pile up.
+
+import { applyPatch, createPatch } from "./jsonPatch";
+
+const DB_NAME = "invenio-modular-deposit-form-autosave";
+const DB_VERSION = 1;
+const SNAPSHOT_EVERY = 20;
+const MAX_DELTA_OPERATIONS = 200;
+const IDLE_TIMEOUT_MS = 2000;
+
+/**
+ * @param {IDBRequest} request
+ * @returns {Promise<*>} the request's result
+ */
+function requestResult(request) {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+/**
+ * @param {IDBTransaction} transaction
+ * @returns {Promise<void>} resolves when the transaction commits
+ */
+function transactionDone(transaction) {
+  return new Promise((resolve, reject) => {
+    transaction.oncomplete = () => resolve();
+    transaction.onerror = () => reject(transaction.error);
+    transaction.onabort = () =>
+      reject(transaction.error ?? new Error("IndexedDB transaction aborted"));
+  });
+}
+
+/**
+ * @param {string} key
+ * @returns {IDBKeyRange} the `[key, seq]` keys of every delta of `key`
+ */
+function deltaRange(key) {
+  return IDBKeyRange.bound([key, 0], [key, Infinity]);
+}
+
+/**
+ * Drafts in IndexedDB: `drafts` holds `{key, savedAt, meta}` for listing, `snapshots` the
+ * full values (`{key, seq, values}`, values as JSON) and `deltas` the patches
+ * (`{key, seq, patch}`, keyed by `[key, seq]`).
+ */
+class IndexedDbAutosaveBackend {
+  /**
+   * @param {IDBFactory} indexedDB
+   */
+  constructor(indexedDB) {
+    this.supportsDeltas = true;
+    this.indexedDB = indexedDB;
+    this.db = null;
+    // Set once opening the database has failed; AutosaveStore then uses its fallback.
+    this.unavailable = false;
+  }
+
+  /**
+   * @returns {Promise<IDBDatabase>}
+   * @throws {Error} when the database cannot be opened; the next call tries again
+   */
+  open() {
+    if (!this.db) {
+      this.db = new Promise((resolve, reject) => {
+        const request = this.indexedDB.open(DB_NAME, DB_VERSION);
+        request.onupgradeneeded = () => {
+          const db = request.result;
+          db.createObjectStore("drafts", { keyPath: "key" });
+          db.createObjectStore("snapshots", { keyPath: "key" });
+          db.createObjectStore("deltas", { keyPath: ["key", "seq"] });
+        };
+        requestResult(request).then(resolve, reject);
+      }).catch((e) => {
+        this.db = null;
+        this.unavailable = true;
+        throw e;
+      });
+    }
+    return this.db;
+  }
+
+  /**
+   * @param {string[]} storeNames
+   * @param {IDBTransactionMode} mode
+   * @returns {Promise<IDBTransaction>}
+   */
+  async transaction(storeNames, mode) {
+    return (await this.open()).transaction(storeNames, mode);
+  }
+
+  /**
+   * @param {string} key
+   * @returns {Promise<Object|null>} `{snapshot, deltas}` with deltas in save order, or null
+   */
+  async read(key) {
+    const transaction = await this.transaction(["snapshots", "deltas"], "readonly");
+    const [snapshot, deltas] = await Promise.all([
+      requestResult(transaction.objectStore("snapshots").get(key)),
+      requestResult(transaction.objectStore("deltas").getAll(deltaRange(key))),
+    ]);
+    if (!snapshot) return null;
+    return { snapshot, deltas: deltas.filter((delta) => delta.seq > snapshot.seq) };
+  }
+
+  /**
+   * Write a snapshot and drop the deltas it replaces.
+   *
+   * @param {Object} record - `{key, seq, savedAt, meta, values}`
+   * @returns {Promise<void>}
+   */
+  async writeSnapshot({ key, seq, savedAt, meta, values }) {
+    const transaction = await this.transaction(["drafts", "snapshots", "deltas"], "readwrite");
+    transaction.objectStore("drafts").put({ key, savedAt, meta });
+    transaction.objectStore("snapshots").put({ key, seq, values });
+    transaction.objectStore("deltas").delete(deltaRange(key));
+    return transactionDone(transaction);
+  }
+
+  /**
+   * @param {Object} record - `{key, seq, savedAt, meta, patch}`
+   * @returns {Promise<void>}
+   */
+  async writeDelta({ key, seq, savedAt, meta, patch }) {
+    const transaction = await this.transaction(["drafts", "deltas"], "readwrite");
+    transaction.objectStore("drafts").put({ key, savedAt, meta });
+    transaction.objectStore("deltas").put({ key, seq, patch });
+    return transactionDone(transaction);
+  }
+
+  /**
+   * @param {string} key
+   * @returns {Promise<void>}
+   */
+  async remove(key) {
+    const transaction = await this.transaction(["drafts", "snapshots", "deltas"], "readwrite");
+    transaction.objectStore("drafts").delete(key);
+    transaction.objectStore("snapshots").delete(key);
+    transaction.objectStore("deltas").delete(deltaRange(key));
+    return transactionDone(transaction);
+  }
+
+  /**
+   * @param {string} prefix
+   * @returns {Promise<Object[]>} `{key, savedAt, meta}` of the drafts whose key starts with it
+   */
+  async list(prefix) {
+    const transaction = await this.transaction(["drafts"], "readonly");
+    const drafts = await requestResult(transaction.objectStore("drafts").getAll());
+    return drafts.filter(({ key }) => key.startsWith(prefix));
+  }
+}
+
+/**
+ * Drafts in `localStorage`: the full values as JSON under the draft's key, without deltas.
+ * This is also the format used before drafts moved to IndexedDB.
+ */
+class LocalStorageAutosaveBackend {
+  /**
+   * @param {Storage} storage
+   */
+  constructor(storage) {
+    this.supportsDeltas = false;
+    this.storage = storage;
+  }
+
+  /**
+   * @param {string} key
+   * @returns {Promise<Object|null>} `{snapshot, deltas}`, or null
+   */
+  async read(key) {
+    const values = this.storage.getItem(key);
+    return values === null ? null : { snapshot: { key, seq: 0, meta: {}, values }, deltas: [] };
+  }
+
+  /**
+   * @param {Object} record - `{key, values}`
+   * @returns {Promise<void>}
+   */
+  async writeSnapshot({ key, values }) {
+    this.storage.setItem(key, values);
+  }
+
+  /**
+   * @param {string} key
+   * @returns {Promise<void>}
+   */
+  async remove(key) {
+    this.storage.removeItem(key);
+  }
+
+  /**
+   * @param {string} prefix
+   * @returns {Promise<Object[]>} `{key, savedAt, meta}`; `savedAt` is unknown (null)
+   */
+  async list(prefix) {
+    const drafts = [];
+    for (let i = 0; i < this.storage.length; i++) {
+      const key = this.storage.key(i);
+      if (key?.startsWith(prefix)) drafts.push({ key, savedAt: null, meta: {} });
+    }
+    return drafts;
+  }
+}
+
+/**
+ * @param {function(): void} callback
+ */
+function scheduleIdle(callback) {
+  if (typeof window !== "undefined" && typeof window.requestIdleCallback === "function") {
+    window.requestIdleCallback(callback, { timeout: IDLE_TIMEOUT_MS });
+  } else {
+    setTimeout(callback, 0);
+  }
+}
+
+class AutosaveStore {
+  /**
+   * @param {Object} options
+   * @param {Object} options.backend - IndexedDbAutosaveBackend or LocalStorageAutosaveBackend
+   * @param {Object|null} [options.legacy] - backend holding values saved by earlier versions;
+   *   used instead of `backend` if that turns out to be unavailable
+   * @param {number} [options.snapshotEvery] - saves between full snapshots
+   * @param {function(function(): void): void} [options.scheduleIdle]
+   */
+  constructor({ backend, legacy = null, snapshotEvery = SNAPSHOT_EVERY, scheduleIdle: idle }) {
+    this.backend = backend;
+    this.legacy = legacy;
+    this.snapshotEvery = snapshotEvery;
+    this.scheduleIdle = idle ?? scheduleIdle;
+    // Per draft: the last saved values, their `seq`, and the deltas written since the
+    // snapshot.
+    this.chains = new Map();
+    this.pending = new Map();
+    this.scheduled = false;
+    this.writing = Promise.resolve();
+  }
+
+  /**
+   * Call a method of the backend. If the backend cannot be opened, switch to the legacy
+   * backend for good and call it there.
+   *
+   * @param {string} method
+   * @param {...*} args
+   * @returns {Promise<*>} the method's result
+   */
+  async call(method, ...args) {
+    try {
+      return await this.backend[method](...args);
+    } catch (e) {
+      if (!this.backend.unavailable || !this.legacy) throw e;
+      console.warn("IndexedDB cannot be opened; autosaving to localStorage instead.", e);
+      this.backend = this.legacy;
+      this.legacy = null;
+      this.chains.clear();
+      return this.backend[method](...args);
+    }
+  }
+
+  /**
+   * Rebuild the stored values of a draft.
+   *
+   * A delta that cannot be applied ends the rebuild there; the next save writes a snapshot.
+   *
+   * @param {string} key
+   * @returns {Promise<Object|null>} the values, or null when none are stored
+   */
+  async load(key) {
+    await this.writing;
+    const stored = await this.call("read", key);
+    if (!stored) {
+      const legacy = await this.legacy?.read(key);
+      return legacy ? JSON.parse(legacy.snapshot.values) : null;
+    }
+    const { snapshot, deltas } = stored;
+    let values = JSON.parse(snapshot.values);
+    let seq = snapshot.seq;
+    let applied = 0;
+    for (const delta of deltas) {
+      try {
+        values = applyPatch(values, JSON.parse(delta.patch));
+      } catch (e) {
+        console.warn(`Autosaved changes to ${key} after #${seq} cannot be applied.`, e);
+        applied = this.snapshotEvery;
+        break;
+      }
+      seq = delta.seq;
+      applied += 1;
+    }
+    this.chains.set(key, { seq, values, deltas: applied });
+    return values;
+  }
+
+  /**
+   * @param {string} key
+   * @returns {number} how many times the draft was written, as far as this store knows
+   *   (after `load` or a save); 0 otherwise
+   */
+  revision(key) {
+    return this.chains.get(key)?.seq ?? 0;
+  }
+
+  /**
+   * Queue `values` to be saved for the draft `key`.
+   *
+   * @param {string} key
+   * @param {Object} values - JSON data; not mutated afterwards
+   * @param {Object} [meta] - stored with the draft's snapshots, e.g. `{draftUrl}`
+   * @returns {Promise<void>} resolves when these (or later) values are written
+   */
+  save(key, values, meta = {}) {
+    return new Promise((resolve, reject) => {
+      const waiters = this.pending.get(key)?.waiters ?? [];
+      waiters.push({ resolve, reject });
+      this.pending.set(key, { values, meta, waiters });
+      if (!this.scheduled) {
+        this.scheduled = true;
+        this.scheduleIdle(() => this.flush());
+      }
+    });
+  }
+
+  /**
+   * Write the queued saves now instead of waiting for an idle callback.
+   *
+   * @returns {Promise<void>} resolves when every queued save is written (or failed)
+   */
+  flush() {
+    this.scheduled = false;
+    const batch = [...this.pending];
+    this.pending.clear();
+    this.writing = this.writing.then(() =>
+      Promise.all(
+        batch.map(([key, entry]) =>
+          this.write(key, entry).then(
+            () => entry.waiters.forEach(({ resolve }) => resolve()),
+            (e) => entry.waiters.forEach(({ reject }) => reject(e))
+          )
+        )
+      )
+    );
+    return this.writing;
+  }
+
+  /**
+   * @param {string} key
+   * @param {Object} entry - `{values, meta}`
+   * @returns {Promise<void>}
+   */
+  async write(key, { values, meta }) {
+    const chain = this.chains.get(key);
+    const seq = (chain?.seq ?? 0) + 1;
+    const savedAt = Date.now();
+    if (chain && this.backend.supportsDeltas && chain.deltas < this.snapshotEvery) {
+      const patch = createPatch(chain.values, values);
+      if (patch.length === 0) return;
+      if (patch.length <= MAX_DELTA_OPERATIONS) {
+        await this.call("writeDelta", { key, seq, savedAt, meta, patch: JSON.stringify(patch) });
+        this.chains.set(key, { seq, values, deltas: chain.deltas + 1 });
+        return;
+      }
+    }
+    await this.call("writeSnapshot", { key, seq, savedAt, meta, values: JSON.stringify(values) });
+    this.chains.set(key, { seq, values, deltas: 0 });
+    if (this.legacy) await this.legacy.remove(key);
+  }
+
+  /**
+   * Drop the stored values of a draft, and any save of it not written yet.
+   *
+   * @param {string} key
+   * @returns {Promise<void>}
+   */
+  async remove(key) {
+    this.pending.get(key)?.waiters.forEach(({ resolve }) => resolve());
+    this.pending.delete(key);
+    this.chains.delete(key);
+    await this.writing;
+    await this.call("remove", key);
+    if (this.legacy) await this.legacy.remove(key);
+  }
+
+  /**
+   * Remove stale drafts whose key starts with `prefix`.
+   *
+   * @param {Object} options
+   * @param {string} options.prefix - e.g. the current user's key prefix
+   * @param {string[]} [options.keep] - keys never removed (the open draft)
+   * @param {number} [options.maxAgeMs] - remove drafts not saved for this long
+   * @param {function(Object): Promise<boolean>} [options.isGone] - given a draft's `meta`,
+   *   whether the draft no longer exists on the server
+   * @param {number} [options.limit] - at most this many `isGone` calls
+   * @returns {Promise<string[]>} the removed keys
+   */
+  async prune({ prefix, keep = [], maxAgeMs = Infinity, isGone = null, limit = 5 }) {
+    const now = Date.now();
+    const removed = [];
+    let checks = 0;
+    for (const { key, savedAt, meta } of await this.call("list", prefix)) {
+      if (keep.includes(key)) continue;
+      let stale = savedAt !== null && now - savedAt > maxAgeMs;
+      if (!stale && isGone && meta?.draftUrl && checks < limit) {
+        checks += 1;
+        stale = await isGone(meta).catch(() => false);
+      }
+      if (stale) {
+        await this.remove(key);
+        removed.push(key);
+      }
+    }
+    return removed;
+  }
+}
+
+/**
+ * @returns {IDBFactory|null}
+ */
+function defaultIndexedDB() {
+  try {
+    return typeof indexedDB !== "undefined" ? indexedDB : null;
+  } catch (e) {
+    return null;
+  }
+}
+
+/**
+ * @returns {Storage|null} `localStorage`, or null when unavailable
+ */
+function defaultStorage() {
+  try {
+    return typeof window !== "undefined" ? window.localStorage : null;
+  } catch (e) {
+    return null;
+  }
+}
+
+/**
+ * Create a store on IndexedDB, or on `localStorage` when IndexedDB is missing or (on first
+ * use) cannot be opened.
+ *
+ * @param {Object} [options]
+ * @param {IDBFactory|null} [options.indexedDB]
+ * @param {Storage|null} [options.storage]
+ * @param {number} [options.snapshotEvery]
+ * @param {function(function(): void): void} [options.scheduleIdle]
+ * @returns {AutosaveStore|null} null when neither storage is available
+ */
+function createAutosaveStore({
+  indexedDB = defaultIndexedDB(),
+  storage = defaultStorage(),
+  ...options
+} = {}) {
+  const legacy = storage ? new LocalStorageAutosaveBackend(storage) : null;
+  if (indexedDB) {
+    const backend = new IndexedDbAutosaveBackend(indexedDB);
+    return new AutosaveStore({ backend, legacy, ...options });
+  }
+  return legacy ? new AutosaveStore({ backend: legacy, ...options }) : null;
+}
+
+let defaultStore;
+
+/**
+ * @returns {AutosaveStore|null} the page's store, created on first use
+ */
+function getAutosaveStore() {
+  if (defaultStore === undefined) defaultStore = createAutosaveStore();
+  return defaultStore;
+}
+
+export {
+  AutosaveStore,
+  IndexedDbAutosaveBackend,
+  LocalStorageAutosaveBackend,
+  createAutosaveStore,
+  getAutosaveStore,
+};
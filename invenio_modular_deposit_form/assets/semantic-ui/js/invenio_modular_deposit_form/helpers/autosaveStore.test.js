@@ -0,0 +1,244 @@
+import {
+  AutosaveStore,
+  IndexedDbAutosaveBackend,
+  LocalStorageAutosaveBackend,
+  createAutosaveStore,
+} from "./autosaveStore";
+
+/** In-memory stand-in for IndexedDbAutosaveBackend, with the same records. */
+class MemoryBackend {
+  constructor() {
+    this.supportsDeltas = true;
+    this.drafts = new Map();
+    this.snapshots = new Map();
+    this.deltas = new Map();
+    this.writes = [];
+  }
+
+  async read(key) {
+    const snapshot = this.snapshots.get(key);
+    if (!snapshot) return null;
+    return { snapshot, deltas: (this.deltas.get(key) ?? []).filter((d) => d.seq > snapshot.seq) };
+  }
+
+  async writeSnapshot({ key, seq, savedAt, meta, values }) {
+    this.writes.push(["snapshot", key, seq]);
+    this.drafts.set(key, { key, savedAt, meta });
+    this.snapshots.set(key, { key, seq, values });
+    this.deltas.set(key, []);
+  }
+
+  async writeDelta({ key, seq, savedAt, meta, patch }) {
+    this.writes.push(["delta", key, seq]);
+    this.drafts.set(key, { key, savedAt, meta });
+    this.deltas.get(key).push({ key, seq, patch });
+  }
+
+  async remove(key) {
+    this.drafts.delete(key);
+    this.snapshots.delete(key);
+    this.deltas.delete(key);
+  }
+
+  async list(prefix) {
+    return [...this.drafts.values()].filter(({ key }) => key.startsWith(prefix));
+  }
+}
+
+const KEY = "rdmDepositFormValues.1.abc";
+
+/** Store whose idle callbacks run only when the test calls `idle()`. */
+const makeStore = (options) => {
+  const callbacks = [];
+  const store = new AutosaveStore({ scheduleIdle: (cb) => callbacks.push(cb), ...options });
+  const idle = () => callbacks.splice(0).forEach((cb) => cb());
+  return { store, idle };
+};
+
+const withCreators = (values, count) => ({
+  ...values,
+  metadata: {
+    ...values.metadata,
+    creators: Array.from({ length: count }, (_, i) => ({ person_or_org: { name: `P${i}` } })),
+  },
+});
+
+beforeEach(() => {
+  window.localStorage.clear();
+});
+
+describe("AutosaveStore", () => {
+  it("writes deltas between snapshots and rebuilds the latest values", async () => {
+    const backend = new MemoryBackend();
+    const { store, idle } = makeStore({ backend, snapshotEvery: 2 });
+    let values = { id: "abc", metadata: { title: "T" } };
+    for (let count = 1; count <= 4; count++) {
+      values = withCreators(values, count);
+      const saved = store.save(KEY, values, { draftUrl: "/api/records/abc/draft" });
+      idle();
+      await saved;
+    }
+
+    expect(backend.writes).toEqual([
+      ["snapshot", KEY, 1],
+      ["delta", KEY, 2],
+      ["delta", KEY, 3],
+      ["snapshot", KEY, 4],
+    ]);
+    expect(backend.drafts.get(KEY).meta).toEqual({ draftUrl: "/api/records/abc/draft" });
+
+    const next = withCreators(values, 5);
+    const saved = store.save(KEY, next);
+    idle();
+    await saved;
+
+    const { store: reloaded } = makeStore({ backend });
+    await expect(reloaded.load(KEY)).resolves.toEqual(next);
+  });
+
+  it("writes only the latest of the saves queued before an idle callback", async () => {
+    const backend = new MemoryBackend();
+    const { store, idle } = makeStore({ backend });
+    const first = store.save(KEY, { id: "abc", metadata: { title: "A" } });
+    const second = store.save(KEY, { id: "abc", metadata: { title: "AB" } });
+    idle();
+    await Promise.all([first, second]);
+
+    expect(backend.writes).toEqual([["snapshot", KEY, 1]]);
+    await expect(store.load(KEY)).resolves.toEqual({ id: "abc", metadata: { title: "AB" } });
+  });
+
+  it("stops at a delta that cannot be applied and snapshots on the next save", async () => {
+    const backend = new MemoryBackend();
+    backend.snapshots.set(KEY, { key: KEY, seq: 1, values: '{"metadata":{"title":"T"}}' });
+    backend.deltas.set(KEY, [
+      { key: KEY, seq: 2, patch: '[{"op":"replace","path":"/metadata/title","value":"U"}]' },
+      { key: KEY, seq: 3, patch: '[{"op":"replace","path":"/files/enabled","value":true}]' },
+    ]);
+    const warn = jest.spyOn(console, "warn").mockImplementation(() => {});
+    const { store, idle } = makeStore({ backend });
+
+    await expect(store.load(KEY)).resolves.toEqual({ metadata: { title: "U" } });
+    expect(warn).toHaveBeenCalled();
+
+    const saved = store.save(KEY, { metadata: { title: "V" } });
+    idle();
+    await saved;
+    expect(backend.writes).toEqual([["snapshot", KEY, 3]]);
+  });
+
+  it("loads values saved to localStorage by earlier versions and then drops them", async () => {
+    window.localStorage.setItem(KEY, JSON.stringify({ id: "abc", metadata: { title: "Old" } }));
+    const backend = new MemoryBackend();
+    const legacy = new LocalStorageAutosaveBackend(window.localStorage);
+    const { store, idle } = makeStore({ backend, legacy });
+
+    await expect(store.load(KEY)).resolves.toEqual({ id: "abc", metadata: { title: "Old" } });
+
+    const saved = store.save(KEY, { id: "abc", metadata: { title: "New" } });
+    idle();
+    await saved;
+    expect(window.localStorage.getItem(KEY)).toBeNull();
+  });
+
+  it("drops queued and stored values on remove", async () => {
+    const backend = new MemoryBackend();
+    const { store, idle } = makeStore({ backend });
+    const saved = store.save(KEY, { id: "abc" });
+    idle();
+    await saved;
+    const queued = store.save(KEY, { id: "abc", metadata: {} });
+    await store.remove(KEY);
+    idle();
+    await queued;
+
+    await expect(store.load(KEY)).resolves.toBeNull();
+  });
+
+  it("prunes old drafts and drafts gone from the server", async () => {
+    const backend = new MemoryBackend();
+    const day = 24 * 60 * 60 * 1000;
+    const drafts = {
+      "rdmDepositFormValues.1.open": Date.now() - 400 * day,
+      "rdmDepositFormValues.1.old": Date.now() - 400 * day,
+      "rdmDepositFormValues.1.published": Date.now(),
+      "rdmDepositFormValues.1.current": Date.now(),
+      "rdmDepositFormValues.2.other-user": Date.now() - 400 * day,
+    };
+    Object.entries(drafts).forEach(([key, savedAt]) =>
+      backend.drafts.set(key, { key, savedAt, meta: { draftUrl: `/api/${key}` } })
+    );
+    const isGone = jest.fn(async ({ draftUrl }) => draftUrl.endsWith("published"));
+    const { store } = makeStore({ backend });
+
+    const removed = await store.prune({
+      prefix: "rdmDepositFormValues.1.",
+      keep: ["rdmDepositFormValues.1.open"],
+      maxAgeMs: 90 * day,
+      isGone,
+    });
+
+    expect(removed).toEqual(["rdmDepositFormValues.1.old", "rdmDepositFormValues.1.published"]);
+    expect(isGone).toHaveBeenCalledTimes(2);
+    expect([...backend.drafts.keys()]).toEqual([
+      "rdmDepositFormValues.1.open",
+      "rdmDepositFormValues.1.current",
+      "rdmDepositFormValues.2.other-user",
+    ]);
+  });
+});
+
+describe("createAutosaveStore", () => {
+  it("keeps full values in localStorage when IndexedDB is unavailable", async () => {
+    const callbacks = [];
+    const store = createAutosaveStore({
+      indexedDB: null,
+      storage: window.localStorage,
+      scheduleIdle: (cb) => callbacks.push(cb),
+    });
+    const values = { id: "abc", metadata: { title: "T" } };
+    const saved = store.save(KEY, values);
+    callbacks.forEach((cb) => cb());
+    await saved;
+
+    expect(JSON.parse(window.localStorage.getItem(KEY))).toEqual(values);
+    await expect(store.load(KEY)).resolves.toEqual(values);
+  });
+
+  it("falls back to localStorage when IndexedDB cannot be opened", async () => {
+    const failingIndexedDB = {
+      open: jest.fn(() => {
+        const request = { error: new Error("The operation is insecure.") };
+        setTimeout(() => request.onerror());
+        return request;
+      }),
+    };
+    jest.spyOn(console, "warn").mockImplementation(() => {});
+    const callbacks = [];
+    const store = createAutosaveStore({
+      indexedDB: failingIndexedDB,
+      storage: window.localStorage,
+      scheduleIdle: (cb) => callbacks.push(cb),
+    });
+    const values = { id: "abc", metadata: { title: "T" } };
+
+    await expect(store.load(KEY)).resolves.toBeNull();
+    const saved = store.save(KEY, values);
+    callbacks.forEach((cb) => cb());
+    await saved;
+
+    expect(JSON.parse(window.localStorage.getItem(KEY))).toEqual(values);
+    await expect(store.load(KEY)).resolves.toEqual(values);
+    expect(failingIndexedDB.open).toHaveBeenCalledTimes(1);
+
+    // Without a fallback, each use tries to open the database again.
+    const backend = new IndexedDbAutosaveBackend(failingIndexedDB);
+    await expect(backend.list("")).rejects.toThrow("insecure");
+    await expect(backend.list("")).rejects.toThrow("insecure");
+    expect(failingIndexedDB.open).toHaveBeenCalledTimes(3);
+  });
+
+  it("returns null without any storage", () => {
+    expect(createAutosaveStore({ indexedDB: null, storage: null })).toBeNull();
+  });
+});
@@ -0,0 +1,161 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Which paths of the Formik values differ from the initial values.
+//
+// Formik never mutates values: an edit copies the objects along its path and keeps every
+// other subtree. `DirtyTracker.update` compares the new values with the previous ones by
+// reference, walks only the subtrees that were replaced, and compares those with the same
+// subtree of the initial values. It keeps the set of changed leaf paths
+// (`metadata.title`, `metadata.creators[3].person_or_org.name`), so `isDirty()` and
+// `changedPaths()` cost nothing and an edit costs the size of the objects along its path,
+// not the size of the record.
+//
+// Values are compared as JSON data: a key holding `undefined` is the same as a missing key,
+// and objects or arrays with equal contents are equal. A path whose value is no longer an
+// object or array in both versions (or is one in only one of them) is a single changed
+// path.
+
+import isPlainObject from "lodash/isPlainObject";
+
+// Stands in for the previous value of a subtree that was not an object or array before, so
+// nothing under it is skipped as unchanged.
+const UNSEEN = Symbol("unseen");
+
+/**
+ * @param {*} a
+ * @param {*} b
+ * @returns {boolean} true when both are arrays or both are plain objects
+ */
+function sameContainerKind(a, b) {
+  return Array.isArray(a) ? Array.isArray(b) : isPlainObject(a) && isPlainObject(b);
+}
+
+const hasOwn = (object, key) => Object.prototype.hasOwnProperty.call(object, key);
+
+/**
+ * @param {string} path
+ * @param {string} key
+ * @returns {string} Formik path of the object property `key`
+ */
+function childPath(path, key) {
+  return path ? `${path}.${key}` : key;
+}
+
+class DirtyTracker {
+  /**
+   * @param {Object} initialValues - Formik initial values
+   * @param {Object} [options]
+   * @param {string[]} [options.ignore] - paths never reported, e.g. `["ui", "links"]`
+   */
+  constructor(initialValues, { ignore = [] } = {}) {
+    this.initialValues = initialValues;
+    this.values = initialValues;
+    this.ignore = new Set(ignore);
+    this.changed = new Set();
+  }
+
+  /**
+   * Record the changes of `values` since the previous call.
+   *
+   * @param {Object} values - Formik values
+   * @returns {DirtyTracker} this tracker
+   */
+  update(values) {
+    this.walk(this.values, values, this.initialValues, "");
+    this.values = values;
+    return this;
+  }
+
+  /**
+   * @returns {boolean} true when the values differ from the initial values
+   */
+  isDirty() {
+    return this.changed.size > 0;
+  }
+
+  /**
+   * @returns {string[]} the changed paths, sorted
+   */
+  changedPaths() {
+    return [...this.changed].sort();
+  }
+
+  /**
+   * @param {string} path
+   */
+  clearBelow(path) {
+    if (path === "") {
+      this.changed.clear();
+      return;
+    }
+    for (const changed of this.changed) {
+      if (changed.startsWith(`${path}.`) || changed.startsWith(`${path}[`)) {
+        this.changed.delete(changed);
+      }
+    }
+  }
+
+  /**
+   * @param {*} previous - value at `path` at the previous update, or UNSEEN
+   * @param {*} value - value at `path` now
+   * @param {*} initial - initial value at `path`
+   * @param {string} path
+   */
+  walk(previous, value, initial, path) {
+    if (previous === value || this.ignore.has(path)) return;
+    // Only a path that held an object or array can have changed paths below it.
+    const wasContainer = Array.isArray(previous) || isPlainObject(previous);
+    const comparable = sameContainerKind(previous, value);
+    if (value === initial || !sameContainerKind(value, initial)) {
+      if (wasContainer) this.clearBelow(path);
+      if (value === initial) this.changed.delete(path);
+      else this.changed.add(path);
+      return;
+    }
+    this.changed.delete(path);
+    if (wasContainer && !comparable) this.clearBelow(path);
+    // Children that are the same object as before are skipped here, without building
+    // their paths.
+    const before = comparable ? previous : null;
+    if (Array.isArray(value)) {
+      const length = Math.max(value.length, initial.length, before?.length ?? 0);
+      for (let i = 0; i < length; i++) {
+        if (before && before[i] === value[i]) continue;
+        this.walk(before ? before[i] : UNSEEN, value[i], initial[i], `${path}[${i}]`);
+      }
+      return;
+    }
+    const walkKey = (key) => {
+      if (before && before[key] === value[key]) return;
+      this.walk(before ? before[key] : UNSEEN, value[key], initial[key], childPath(path, key));
+    };
+    for (const key of Object.keys(value)) walkKey(key);
+    for (const key of Object.keys(initial)) if (!hasOwn(value, key)) walkKey(key);
+    if (before) {
+      for (const key of Object.keys(before)) {
+        if (!hasOwn(value, key) && !hasOwn(initial, key)) walkKey(key);
+      }
+    }
+  }
+}
+
+/**
+ * Return the paths where `values` differ from `initialValues`.
+ *
+ * Walks every subtree the two do not share, so use a {@link DirtyTracker} for repeated
+ * comparisons against the same initial values.
+ *
+ * @param {Object} initialValues
+ * @param {Object} values
+ * @param {Object} [options] - as for {@link DirtyTracker}
+ * @returns {string[]} the changed paths, sorted
+ */
+function changedPaths(initialValues, values, options) {
+  return new DirtyTracker(initialValues, options).update(values).changedPaths();
+}
+
+export { DirtyTracker, changedPaths };
@@ -0,0 +1,147 @@
+import { getIn, setIn } from "formik";
+import { areDeeplyEqual } from "../utils";
+import { DirtyTracker, changedPaths } from "./dirtyTracker";
+
+const initialValues = {
+  metadata: {
+    title: "Title",
+    creators: [
+      { person_or_org: { name: "A", identifiers: [] } },
+      { person_or_org: { name: "B", identifiers: [{ scheme: "orcid" }] } },
+    ],
+  },
+  ui: { open: false },
+};
+
+/**
+ * @param {number} creators
+ * @returns {Object} values with 10 leaves per creator
+ */
+const largeRecord = (creators) => ({
+  metadata: {
+    title: "Title",
+    creators: Array.from({ length: creators }, (_, i) => ({
+      person_or_org: {
+        type: "personal",
+        given_name: `Given ${i}`,
+        family_name: `Family ${i}`,
+        name: `Family ${i}, Given ${i}`,
+        identifiers: [{ scheme: "orcid", identifier: `0000-0002-1825-${i}` }],
+      },
+      role: { id: "author", title: "Author" },
+      affiliations: [{ id: `aff-${i}`, name: `Affiliation ${i}` }],
+    })),
+  },
+  ui: {},
+});
+
+describe("DirtyTracker", () => {
+  it("reports the leaf paths changed since the initial values", () => {
+    const tracker = new DirtyTracker(initialValues, { ignore: ["ui"] });
+    expect(tracker.update(initialValues).isDirty()).toBe(false);
+
+    let values = setIn(initialValues, "metadata.title", "New title");
+    values = setIn(values, "metadata.creators[1].person_or_org.identifiers[0].scheme", "isni");
+    values = setIn(values, "ui.open", true);
+    tracker.update(values);
+
+    expect(tracker.isDirty()).toBe(true);
+    expect(tracker.changedPaths()).toEqual([
+      "metadata.creators[1].person_or_org.identifiers[0].scheme",
+      "metadata.title",
+    ]);
+  });
+
+  it("becomes clean again when edits are undone with new objects", () => {
+    const tracker = new DirtyTracker(initialValues);
+    tracker.update(setIn(initialValues, "metadata.creators[0].person_or_org.name", "Z"));
+    expect(tracker.changedPaths()).toEqual(["metadata.creators[0].person_or_org.name"]);
+
+    tracker.update(JSON.parse(JSON.stringify(initialValues)));
+    expect(tracker.isDirty()).toBe(false);
+  });
+
+  it("reports added, removed and retyped subtrees once", () => {
+    const tracker = new DirtyTracker(initialValues);
+    const creators = initialValues.metadata.creators;
+    tracker.update(
+      setIn(initialValues, "metadata.creators", [creators[1], creators[0], { role: "x" }])
+    );
+    expect(tracker.changedPaths()).toEqual([
+      "metadata.creators[0].person_or_org.identifiers[0]",
+      "metadata.creators[0].person_or_org.name",
+      "metadata.creators[1].person_or_org.identifiers[0]",
+      "metadata.creators[1].person_or_org.name",
+      "metadata.creators[2]",
+    ]);
+
+    tracker.update(setIn(initialValues, "metadata.creators", "none"));
+    expect(tracker.changedPaths()).toEqual(["metadata.creators"]);
+
+    tracker.update({ ...initialValues, metadata: { title: "Title", subjects: undefined } });
+    expect(tracker.changedPaths()).toEqual(["metadata.creators"]);
+  });
+});
+
+const benchmark = process.env.BENCHMARK ? it : it.skip;
+
+/**
+ * Edit a 500-creator record `rounds` times, checking it with both areDeeplyEqual and a
+ * DirtyTracker. Each round edits a creator in the second half of the list and the next round
+ * undoes the edit, so areDeeplyEqual cannot stop early at a difference near the start.
+ *
+ * @param {number} rounds
+ * @param {function(Object): void} [check] - called with `{dirty, equal, round}`
+ * @returns {{deep: number, tracked: number}} ms spent in each
+ */
+const editLargeRecord = (rounds, check = () => {}) => {
+  const initial = largeRecord(500);
+  const tracker = new DirtyTracker(initial, { ignore: ["ui"] });
+  let deep = 0;
+  let tracked = 0;
+  let current = initial;
+  for (let round = 0; round < rounds; round++) {
+    const path = `metadata.creators[${499 - Math.floor(round / 2)}].person_or_org.given_name`;
+    const next = setIn(current, path, round % 2 ? getIn(initial, path) : `Edited ${round}`);
+
+    let start = performance.now();
+    const equal = areDeeplyEqual(initial, next, ["ui"]);
+    deep += performance.now() - start;
+
+    start = performance.now();
+    const dirty = tracker.update(next).isDirty();
+    tracked += performance.now() - start;
+
+    check({ dirty, equal, round });
+    current = next;
+  }
+  return { deep, tracked };
+};
+
+describe("changedPaths", () => {
+  it("compares stored values with the initial values", () => {
+    const stored = JSON.parse(JSON.stringify(initialValues));
+    stored.metadata.title = "Restored";
+    stored.ui = { open: true };
+    expect(changedPaths(initialValues, stored, { ignore: ["ui"] })).toEqual(["metadata.title"]);
+  });
+
+  it("agrees with areDeeplyEqual edit by edit in a 5,000-leaf record", () => {
+    editLargeRecord(20, ({ dirty, equal, round }) => {
+      expect(dirty).toBe(!equal);
+      expect(dirty).toBe(round % 2 === 0);
+    });
+  });
+
+  // Opt-in, as timings vary between machines: `BENCHMARK=1 npm test -- dirtyTracker`.
+  benchmark("is faster than areDeeplyEqual for one edit in a 5,000-leaf record", () => {
+    const rounds = 200;
+    const { deep, tracked } = editLargeRecord(rounds);
+    console.log(
+      `Dirty check after one edit (500 creators, 5,000 leaves): areDeeplyEqual ` +
+        `${((deep / rounds) * 1000).toFixed(0)} µs, DirtyTracker ` +
+        `${((tracked / rounds) * 1000).toFixed(0)} µs (${(deep / tracked).toFixed(0)}x)`
+    );
+    expect(tracked).toBeLessThan(deep);
+  });
+});
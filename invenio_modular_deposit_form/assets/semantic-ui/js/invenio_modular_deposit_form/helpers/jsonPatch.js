@@ -0,0 +1,170 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Minimal JSON Patch (RFC 6902) for autosave deltas: `createPatch` emits `add`, `remove` and
+// `replace` operations, `applyPatch` applies them without mutating the document.
+//
+// Values are treated as JSON data, the way `JSON.stringify` would store them: object keys
+// holding `undefined` count as absent and `undefined` array items as `null`. Formik replaces
+// the objects along the path of each change and keeps the others, so `createPatch` skips
+// every subtree that is the same object in both documents and only walks the edited ones.
+
+/**
+ * @param {*} value
+ * @returns {boolean} true for plain objects (not arrays, not null)
+ */
+function isObject(value) {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+/**
+ * @param {string|number} token - object key or array index
+ * @returns {string} the token escaped for a JSON Pointer
+ */
+function escapeToken(token) {
+  return String(token).replace(/~/g, "~0").replace(/\//g, "~1");
+}
+
+/**
+ * @param {string} pointer - JSON Pointer, e.g. `/metadata/creators/0`
+ * @returns {string[]} the unescaped tokens of `pointer`
+ */
+function parsePointer(pointer) {
+  if (pointer === "") return [];
+  return pointer
+    .slice(1)
+    .split("/")
+    .map((token) => token.replace(/~1/g, "/").replace(/~0/g, "~"));
+}
+
+/**
+ * @param {*} value
+ * @returns {*} `value` as JSON would store it at the top level of an array item
+ */
+function jsonItem(value) {
+  return value === undefined ? null : value;
+}
+
+/**
+ * Append to `ops` the operations turning `from` into `to`.
+ *
+ * @param {*} from
+ * @param {*} to
+ * @param {string} path - JSON Pointer of `from`/`to`
+ * @param {Object[]} ops
+ */
+function diff(from, to, path, ops) {
+  if (from === to) return;
+  if (Array.isArray(from) && Array.isArray(to)) {
+    const common = Math.min(from.length, to.length);
+    for (let i = 0; i < common; i++) {
+      diff(jsonItem(from[i]), jsonItem(to[i]), `${path}/${i}`, ops);
+    }
+    for (let i = from.length - 1; i >= to.length; i--) {
+      ops.push({ op: "remove", path: `${path}/${i}` });
+    }
+    for (let i = from.length; i < to.length; i++) {
+      ops.push({ op: "add", path: `${path}/${i}`, value: jsonItem(to[i]) });
+    }
+    return;
+  }
+  if (isObject(from) && isObject(to)) {
+    for (const key of Object.keys(from)) {
+      if (from[key] !== undefined && to[key] === undefined) {
+        ops.push({ op: "remove", path: `${path}/${escapeToken(key)}` });
+      }
+    }
+    for (const key of Object.keys(to)) {
+      if (to[key] === undefined) continue;
+      const childPath = `${path}/${escapeToken(key)}`;
+      if (from[key] === undefined) {
+        ops.push({ op: "add", path: childPath, value: to[key] });
+      } else {
+        diff(from[key], to[key], childPath, ops);
+      }
+    }
+    return;
+  }
+  ops.push({ op: "replace", path, value: to });
+}
+
+/**
+ * Return the JSON Patch turning `from` into `to`.
+ *
+ * @param {*} from - previously saved values
+ * @param {*} to - current values
+ * @returns {Object[]} operations; empty when the documents are equal as JSON
+ */
+function createPatch(from, to) {
+  const ops = [];
+  diff(from, to, "", ops);
+  return ops;
+}
+
+/**
+ * Return `container` with `token` set to (or, for `undefined`, removed from) `value`.
+ *
+ * @param {Object|Array} container
+ * @param {string} token
+ * @param {*} value
+ * @param {string} op
+ * @returns {Object|Array} a shallow copy of `container`
+ */
+function withChild(container, token, value, op) {
+  if (Array.isArray(container)) {
+    const copy = container.slice();
+    const index = token === "-" ? copy.length : Number(token);
+    if (op === "add") copy.splice(index, 0, value);
+    else if (op === "remove") copy.splice(index, 1);
+    else copy[index] = value;
+    return copy;
+  }
+  const copy = { ...container };
+  if (op === "remove") delete copy[token];
+  else copy[token] = value;
+  return copy;
+}
+
+/**
+ * Apply one operation below `doc`, copying the containers along its path.
+ *
+ * @param {*} doc
+ * @param {string[]} tokens - remaining path tokens
+ * @param {Object} operation
+ * @returns {*} the patched document
+ */
+function applyAt(doc, tokens, operation) {
+  const [token, ...rest] = tokens;
+  if (doc === null || typeof doc !== "object") {
+    throw new Error(`Cannot apply ${operation.op} at ${operation.path}: no such path`);
+  }
+  if (rest.length === 0) return withChild(doc, token, operation.value, operation.op);
+  return withChild(doc, token, applyAt(doc[token], rest, operation), "replace");
+}
+
+/**
+ * Apply `patch` to `doc` without mutating it.
+ *
+ * @param {*} doc
+ * @param {Object[]} patch - operations from {@link createPatch}
+ * @returns {*} the patched document; unchanged subtrees are shared with `doc`
+ * @throws {Error} when an operation is not supported or its path does not exist
+ */
+function applyPatch(doc, patch) {
+  return patch.reduce((current, operation) => {
+    if (!["add", "remove", "replace"].includes(operation.op)) {
+      throw new Error(`Unsupported JSON Patch operation: ${operation.op}`);
+    }
+    const tokens = parsePointer(operation.path);
+    if (tokens.length === 0) {
+      if (operation.op === "remove") throw new Error("Cannot remove the document root");
+      return operation.value;
+    }
+    return applyAt(current, tokens, operation);
+  }, doc);
+}
+
+export { applyPatch, createPatch };
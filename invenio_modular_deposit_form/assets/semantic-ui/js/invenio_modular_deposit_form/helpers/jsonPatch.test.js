@@ -0,0 +1,65 @@
+import { applyPatch, createPatch } from "./jsonPatch";
+
+const asJson = (value) => JSON.parse(JSON.stringify(value));
+
+describe("createPatch", () => {
+  it("skips subtrees shared by both documents", () => {
+    const creators = [{ person_or_org: { name: "A" } }];
+    const from = { metadata: { title: "Old", creators } };
+    const to = { metadata: { title: "New", creators } };
+    expect(createPatch(from, to)).toEqual([
+      { op: "replace", path: "/metadata/title", value: "New" },
+    ]);
+  });
+
+  it("adds, removes and escapes keys, treating undefined as absent", () => {
+    const from = { "a/b": 1, "c~d": 2, gone: 3, unset: undefined };
+    const to = { "a/b": 4, "c~d": 5, unset: undefined, added: undefined, extra: [1] };
+    expect(createPatch(from, to)).toEqual([
+      { op: "remove", path: "/gone" },
+      { op: "replace", path: "/a~1b", value: 4 },
+      { op: "replace", path: "/c~0d", value: 5 },
+      { op: "add", path: "/extra", value: [1] },
+    ]);
+  });
+
+  it("appends and truncates arrays from the end", () => {
+    expect(createPatch({ list: [1, 2, 3] }, { list: [1] })).toEqual([
+      { op: "remove", path: "/list/2" },
+      { op: "remove", path: "/list/1" },
+    ]);
+    expect(createPatch({ list: [1] }, { list: [0, 2, undefined] })).toEqual([
+      { op: "replace", path: "/list/0", value: 0 },
+      { op: "add", path: "/list/1", value: 2 },
+      { op: "add", path: "/list/2", value: null },
+    ]);
+  });
+});
+
+describe("applyPatch", () => {
+  it("rebuilds the target as JSON without mutating the source", () => {
+    const from = {
+      metadata: { title: "T", creators: [{ name: "A" }, { name: "B" }], dates: [] },
+      files: { enabled: true },
+    };
+    const to = {
+      metadata: { title: "T2", creators: [{ name: "B", role: "editor" }], subjects: ["x"] },
+      files: from.files,
+    };
+    const source = asJson(from);
+    const patched = applyPatch(source, asJson(createPatch(from, to)));
+
+    expect(patched).toEqual(asJson(to));
+    expect(source).toEqual(asJson(from));
+    expect(patched.files).toBe(source.files);
+  });
+
+  it("rejects unknown operations and missing paths", () => {
+    expect(() => applyPatch({}, [{ op: "move", from: "/a", path: "/b" }])).toThrow(
+      "Unsupported JSON Patch operation: move"
+    );
+    expect(() => applyPatch({}, [{ op: "replace", path: "/a/b", value: 1 }])).toThrow(
+      "no such path"
+    );
+  });
+});
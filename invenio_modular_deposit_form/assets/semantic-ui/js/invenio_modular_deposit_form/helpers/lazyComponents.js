@@ -0,0 +1,72 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Registry components whose code is fetched the first time they are needed.
+//
+// A componentsRegistry entry is `[Component, fieldPaths]`. For a lazy entry, Component comes
+// from `lazyModule(load)(exportName)`: a `React.lazy` component that imports its module when
+// it first renders (form pages and layout regions render inside a Suspense boundary, see
+// SubsectionsRenderer.jsx), or earlier through its `preload()`. All components of one module
+// share one import. The field paths stay in the registry itself, so per-page field lists and
+// error counts do not wait for any component code.
+//
+// Only the current form page renders, so a page's chunks are fetched when it is first shown;
+// `preloadComponents` fetches them ahead of that (see usePrefetchNextFormPage.js).
+
+import React from "react";
+
+/**
+ * @param {function(): Promise<Object>} load - dynamic import of the module
+ * @returns {function(string): React.LazyExoticComponent} creates the lazy component for one of
+ *   the module's named exports
+ */
+function lazyModule(load) {
+  let loading = null;
+  const preload = () => {
+    if (!loading) {
+      // Let a failed fetch (e.g. offline) be retried by the next render or preload.
+      loading = load().catch((e) => {
+        loading = null;
+        throw e;
+      });
+    }
+    return loading;
+  };
+  return (exportName) => {
+    const Component = React.lazy(() =>
+      preload().then((module) => {
+        if (!module[exportName]) {
+          throw new Error(`${exportName} is not exported by its registry module.`);
+        }
+        return { default: module[exportName] };
+      })
+    );
+    Component.preload = preload;
+    return Component;
+  };
+}
+
+/**
+ * Start fetching the code of the named registry components. Components that are not lazy
+ * are skipped, and each module is imported once.
+ *
+ * @param {Object} componentsRegistry - `{ [name]: [Component, fieldPaths] }`
+ * @param {string[]} names - registry keys, e.g. the components of a form page
+ * @returns {Promise<void>} resolves when the modules are loaded; failures are left to the
+ *   render that needs the component
+ */
+function preloadComponents(componentsRegistry, names) {
+  const preloads = new Set();
+  for (const name of names) {
+    const preload = componentsRegistry[name]?.[0]?.preload;
+    if (typeof preload === "function") preloads.add(preload);
+  }
+  return Promise.all([...preloads].map((preload) => preload().catch(() => undefined))).then(
+    () => undefined
+  );
+}
+
+export { lazyModule, preloadComponents };
@@ -0,0 +1,65 @@
+import React, { Suspense } from "react";
+import { render, screen } from "@testing-library/react";
+import { lazyModule, preloadComponents } from "./lazyComponents";
+
+const Title = ({ label }) => <p>{label}</p>;
+const Abstract = () => <p>Abstract</p>;
+
+describe("lazyModule", () => {
+  it("imports the module once, when a component first renders", async () => {
+    const load = jest.fn(() => Promise.resolve({ Title, Abstract }));
+    const fields = lazyModule(load);
+    const LazyTitle = fields("Title");
+    const LazyAbstract = fields("Abstract");
+    expect(load).not.toHaveBeenCalled();
+
+    render(
+      <Suspense fallback={<p>Loading</p>}>
+        <LazyTitle label="Title" />
+        <LazyAbstract />
+      </Suspense>
+    );
+    expect(screen.getByText("Loading")).toBeInTheDocument();
+
+    expect(await screen.findByText("Title")).toBeInTheDocument();
+    expect(screen.getByText("Abstract")).toBeInTheDocument();
+    expect(load).toHaveBeenCalledTimes(1);
+  });
+
+  it("retries an import that failed", async () => {
+    const load = jest
+      .fn()
+      .mockRejectedValueOnce(new Error("offline"))
+      .mockResolvedValue({ Title });
+    const LazyTitle = lazyModule(load)("Title");
+
+    await expect(LazyTitle.preload()).rejects.toThrow("offline");
+    await expect(LazyTitle.preload()).resolves.toEqual({ Title });
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe("preloadComponents", () => {
+  it("imports each module of the named lazy components once", async () => {
+    const loadFields = jest.fn(() => Promise.resolve({ Title, Abstract }));
+    const loadFunding = jest.fn(() => Promise.reject(new Error("offline")));
+    const fields = lazyModule(loadFields);
+    const registry = {
+      TitlesComponent: [fields("Title"), ["metadata.title"]],
+      AbstractComponent: [fields("Abstract"), ["metadata.description"]],
+      FundingComponent: [lazyModule(loadFunding)("Funding"), ["metadata.funding"]],
+      FormRow: [() => null, []],
+    };
+
+    await preloadComponents(registry, [
+      "TitlesComponent",
+      "AbstractComponent",
+      "FundingComponent",
+      "FormRow",
+      "UnknownComponent",
+    ]);
+
+    expect(loadFields).toHaveBeenCalledTimes(1);
+    expect(loadFunding).toHaveBeenCalledTimes(1);
+  });
+});
@@ -0,0 +1,46 @@
+// Part of invenio-modular-deposit-form
+// Copyright (C) 2026, MESH Research
+//
+// invenio-modular-deposit-form is free software; you can redistribute and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+import axios from "axios";
+
+/**
+ * Fill in the static form layout when the page config only carries a `layout_url`.
+ *
+ * With `MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API` enabled, `deposits-config` omits
+ * `common_fields`, `fields_by_type` and the `*_modifications` maps and instead points at
+ * `/api/modular-deposit-form/layout?locale=..&v=<content hash>`. That response is
+ * served `immutable` for the hashed URL, so repeat visits are answered from the browser
+ * (or CDN) cache without a network round trip.
+ *
+ * Configs without `layout_url` (the inline default) are returned unchanged. A failed fetch is
+ * retried once before giving up.
+ *
+ * @param {object} config - Parsed `deposits-config` payload
+ * @param {object} [options]
+ * @param {number} [options.retries=1] - Further attempts after a failed fetch
+ * @returns {Promise<object>} Config with the layout keys merged in and `layout_url` removed.
+ *   Rejects with the last error when every attempt fails; the form cannot render without its
+ *   layout (see LayoutConfigLoader.jsx).
+ */
+export async function loadLayoutConfig(config, { retries = 1 } = {}) {
+  if (!config?.layout_url) {
+    return config;
+  }
+  const { layout_url: layoutUrl, ...rest } = config;
+  for (let attempt = 0; ; attempt++) {
+    try {
+      const response = await axios.get(layoutUrl, {
+        headers: { Accept: "application/json" },
+      });
+      return { ...rest, ...response.data };
+    } catch (error) {
+      console.error("Failed to load the deposit form layout from", layoutUrl, error);
+      if (attempt >= retries) {
+        throw error;
+      }
+    }
+  }
+}
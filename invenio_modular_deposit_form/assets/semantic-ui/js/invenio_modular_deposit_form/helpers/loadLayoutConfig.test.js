@@ -0,0 +1,55 @@
+import axios from "axios";
+import { loadLayoutConfig } from "./loadLayoutConfig";
+
+describe("loadLayoutConfig", () => {
+  it("returns inline configs unchanged without fetching", async () => {
+    const config = { common_fields: [], fields_by_type: {} };
+    await expect(loadLayoutConfig(config)).resolves.toBe(config);
+    expect(axios.get).not.toHaveBeenCalled();
+  });
+
+  it("fetches the layout and merges it over the page config", async () => {
+    axios.get.mockResolvedValueOnce({
+      data: { common_fields: [{ component: "FormPages" }], label_modifications: {} },
+    });
+    const config = {
+      layout_url: "/api/modular-deposit-form/layout?locale=en&v=abc",
+      vocabularies: { resource_type: [] },
+    };
+
+    const loaded = await loadLayoutConfig(config);
+
+    expect(axios.get).toHaveBeenCalledWith(config.layout_url, {
+      headers: { Accept: "application/json" },
+    });
+    expect(loaded).toEqual({
+      vocabularies: { resource_type: [] },
+      common_fields: [{ component: "FormPages" }],
+      label_modifications: {},
+    });
+  });
+
+  it("retries a failed fetch once", async () => {
+    jest.spyOn(console, "error").mockImplementation(() => {});
+    axios.get
+      .mockRejectedValueOnce(new Error("offline"))
+      .mockResolvedValueOnce({ data: { common_fields: [] } });
+
+    const loaded = await loadLayoutConfig({ layout_url: "/layout", max_title_length: 260 });
+
+    expect(axios.get).toHaveBeenCalledTimes(2);
+    expect(loaded).toEqual({ max_title_length: 260, common_fields: [] });
+  });
+
+  it("logs and rejects when the retry fails too", async () => {
+    const consoleError = jest.spyOn(console, "error").mockImplementation(() => {});
+    const error = new Error("offline");
+    axios.get.mockRejectedValue(error);
+
+    await expect(
+      loadLayoutConfig({ layout_url: "/layout", max_title_length: 260 })
+    ).rejects.toBe(error);
+    expect(axios.get).toHaveBeenCalledTimes(2);
+    expect(consoleError).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,31 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+/**
+ * Ids of the form pages to keep mounted: the current page plus up to `neighbours` visible
+ * pages on either side of it.
+ *
+ * Pages outside this set are not rendered at all. Their values stay in Formik and their field
+ * paths in `formUIState.currentFormPageFields`, so error counts and page navigation do not
+ * depend on a page being mounted.
+ *
+ * @param {Object[]} visibleFormPages - `formUIState.visibleFormPages`
+ * @param {string} currentFormPage - id (`section`) of the current page
+ * @param {number} [neighbours=0] - pages to keep mounted (hidden) on each side of the current one
+ * @returns {Set<string>} page ids
+ */
+function getMountedFormPageIds(visibleFormPages, currentFormPage, neighbours = 0) {
+  const index = visibleFormPages.findIndex(({ section }) => section === currentFormPage);
+  if (index < 0) return new Set([currentFormPage]);
+  const span = Math.max(0, Math.floor(Number(neighbours)) || 0);
+  return new Set(
+    visibleFormPages
+      .slice(Math.max(0, index - span), index + span + 1)
+      .map(({ section }) => section)
+  );
+}
+
+export { getMountedFormPageIds };
@@ -0,0 +1,24 @@
+import { getMountedFormPageIds } from "./mountedFormPages";
+
+const pages = ["1", "2", "3", "4", "5"].map((section) => ({ section }));
+
+describe("getMountedFormPageIds", () => {
+  it("mounts only the current page by default", () => {
+    expect([...getMountedFormPageIds(pages, "3")]).toEqual(["3"]);
+  });
+
+  it("keeps the neighbouring pages mounted, clipped to the visible pages", () => {
+    expect([...getMountedFormPageIds(pages, "3", 1)]).toEqual(["2", "3", "4"]);
+    expect([...getMountedFormPageIds(pages, "1", 2)]).toEqual(["1", "2", "3"]);
+    expect([...getMountedFormPageIds(pages, "5", 1)]).toEqual(["4", "5"]);
+  });
+
+  it("ignores an invalid neighbour count", () => {
+    expect([...getMountedFormPageIds(pages, "2", -1)]).toEqual(["2"]);
+    expect([...getMountedFormPageIds(pages, "2", "many")]).toEqual(["2"]);
+  });
+
+  it("keeps a current page that is not among the visible pages", () => {
+    expect([...getMountedFormPageIds(pages, "hidden", 1)]).toEqual(["hidden"]);
+  });
+});
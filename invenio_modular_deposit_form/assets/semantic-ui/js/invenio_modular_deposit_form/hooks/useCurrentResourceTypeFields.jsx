@@ -12,6 +12,7 @@ import {
   buildComputerPageNavMeta,
   filterVisibleFormPages,
   flattenWrappers,
+  getCompiledFormPages,
   getResolvedFormPages,
 } from "../utils";
 
@@ -61,7 +62,9 @@ function dispatchPerPageFormikFieldPaths({
  * into `formUIState` (useReducer in FormLayoutContainer), then updates resolved/visible pages and
  * per-page field paths for FormErrorManager / nav.
  *
- * Resolves merged layout **once** per effect (`getResolvedFormPages`), stores full list as
+ * Reads the merged layout from the server-compiled `resolved_form_pages` table when it covers the
+ * selected type (`getCompiledFormPages`), else resolves it **once** per effect
+ * (`getResolvedFormPages`). Stores the full list as
  * `resolvedFormPages`, the non-empty subset as `visibleFormPages`, and computer-breakpoint nav
  * metadata (`pageIdsHiddenAtComputer`, `computerVisibleFallbackByPage`) in one dispatch.
  *
@@ -86,10 +89,9 @@ const useCurrentResourceTypeFields = (formik, dispatch, fieldsByType, components
       payload: currentTypePageConfigs,
     });
 
+    const depositConfig = store.getState().deposit?.config;
     const formPages =
-      store
-        .getState()
-        .deposit?.config?.common_fields?.find((item) => item.component === "FormPages")
+      depositConfig?.common_fields?.find((item) => item.component === "FormPages")
         ?.subsections ?? [];
 
     for (const page of formPages) {
@@ -109,12 +111,9 @@ const useCurrentResourceTypeFields = (formik, dispatch, fieldsByType, components
       }
     }
 
-    const resolvedFormPages = getResolvedFormPages(
-      formPages,
-      currentTypePageConfigs,
-      fieldsByType,
-      resourceTypeId
-    );
+    const resolvedFormPages =
+      getCompiledFormPages(depositConfig?.resolved_form_pages, resourceTypeId, formPages) ??
+      getResolvedFormPages(formPages, currentTypePageConfigs, fieldsByType, resourceTypeId);
     const visibleFormPages = filterVisibleFormPages(resolvedFormPages);
     const { pageIdsHiddenAtComputer, computerVisibleFallbackByPage } =
       buildComputerPageNavMeta(visibleFormPages);
@@ -5,12 +5,18 @@
 // under the terms of the MIT License; see LICENSE file for more details.
 
 import React, { useCallback, useEffect, useMemo, useState, useRef } from "react";
+import axios from "axios";
 import { useFormikContext } from "formik";
 import { useStore } from "react-redux";
 
-import { areDeeplyEqual, focusFirstElement } from "../utils";
+import { createAutosaveCoordinator } from "../helpers/autosaveCoordinator";
+import { getAutosaveStore } from "../helpers/autosaveStore";
+import { DirtyTracker, changedPaths } from "../helpers/dirtyTracker";
+import { focusFirstElement } from "../utils";
 
 const AUTOSAVE_DEBOUNCE_MS = 500;
+// Autosaved values of other drafts not saved for this long are dropped on the next visit.
+const AUTOSAVE_MAX_AGE_MS = 90 * 24 * 60 * 60 * 1000;
 
 // Server-managed/computed fields that are part of the Formik deposit schema but
 // are owned by the backend (populated from the API response, not edited by the
@@ -21,6 +27,9 @@ const AUTOSAVE_DEBOUNCE_MS = 500;
 // restored snapshot would otherwise leave them undefined.
 const SERVER_MANAGED_FORMIK_KEYS = ["expanded", "links"];
 
+// Values never compared with the server's: `ui` is transient client-only Formik state.
+const UNTRACKED_FORMIK_KEYS = ["ui", ...SERVER_MANAGED_FORMIK_KEYS];
+
 const stripServerManagedKeys = (values) => {
   if (!values || typeof values !== "object") return values;
   const result = { ...values };
@@ -40,11 +49,28 @@ const overlayServerManagedKeys = (snapshot, record) => {
   return { ...snapshot, ...overlay };
 };
 
+/**
+ * @param {Object} meta - stored autosave meta
+ * @param {string} meta.draftUrl - the draft's API URL (`links.self`)
+ * @returns {Promise<boolean>} true when the draft was published or deleted since
+ */
+const draftIsGone = async ({ draftUrl }) => {
+  const response = await axios.head(draftUrl, { validateStatus: () => true });
+  return response.status === 404 || response.status === 410;
+};
+
 /** Custom hook for recovering form values from local storage
+ *
+ * Values are kept by the autosave store (helpers/autosaveStore.js): in IndexedDB as
+ * snapshots plus deltas, written when the browser is idle, or in localStorage where
+ * IndexedDB is unavailable. When the draft is open in several tabs, one of them writes for
+ * all (helpers/autosaveCoordinator.js); only that tab offers recovery, and a tab whose
+ * values were overtaken by another tab's edits stops autosaving (`autosaveConflict`).
  *
  * @param {Object} currentUserprofile
  * @param {string} currentFormPage - Current form page id
- * @returns {Object} recoveryAsked, confirmModalRef, recoveredStorageValues, storageDataPresent
+ * @returns {Object} recoveryAsked, confirmModalRef, recoveredStorageValues, storageDataPresent,
+ *   autosaveConflict
  */
 function useLocalStorageRecovery(currentUserprofile, currentFormPage) {
   const user = currentUserprofile.id;
@@ -52,11 +78,35 @@ function useLocalStorageRecovery(currentUserprofile, currentFormPage) {
   const confirmModalRef = useRef();
   const [recoveredStorageValues, setRecoveredStorageValues] = useState(null);
   const [storageDataPresent, setStorageDataPresent] = useState(false);
+  const [autosaveConflict, setAutosaveConflict] = useState(false);
   const { values, initialValues, isSubmitting, setValues, setInitialValues, resetForm } =
     useFormikContext();
   const storageValuesKey = `rdmDepositFormValues.${user}.${initialValues?.id}`;
   const autosaveTimeoutRef = useRef(null);
+  const pendingSaveRef = useRef(null);
   const store = useStore();
+  const autosave = getAutosaveStore();
+  // Formik replaces initialValues when the form is reset (recovery, saving the draft).
+  const dirtyTracker = useMemo(
+    () => new DirtyTracker(initialValues, { ignore: UNTRACKED_FORMIK_KEYS }),
+    [initialValues]
+  );
+  const coordinator = useMemo(
+    () => (autosave ? createAutosaveCoordinator(storageValuesKey, autosave) : null),
+    [autosave, storageValuesKey]
+  );
+  useEffect(() => {
+    setAutosaveConflict(false);
+    return () => coordinator?.close();
+  }, [coordinator]);
+  const removeStoredValues = useCallback(
+    () =>
+      coordinator
+        ?.remove()
+        .then(() => setAutosaveConflict(false))
+        .catch((e) => console.warn("Could not remove the autosaved deposit form values.", e)),
+    [coordinator]
+  );
 
   // handler for recoveryAsked
   // focus first element when modal is closed to allow keyboard navigation
@@ -68,27 +118,48 @@ function useLocalStorageRecovery(currentUserprofile, currentFormPage) {
   // keep changed form values in local storage (debounced so rapid edits
   // collapse into a single write once the user pauses). Server-managed keys
   // are ignored here so that fresh server-side updates to e.g. `expanded` or
-  // `links` don't trigger spurious autosaves with no user content change.
+  // `links` don't trigger spurious autosaves with no user content change. The tracker only
+  // compares the subtrees Formik replaced since the previous change. After a conflict
+  // with another tab nothing is saved until this tab's values are saved to the server.
   useEffect(() => {
-    if (!recoveryAsked) return;
-    if (areDeeplyEqual(initialValues, values, ["ui", ...SERVER_MANAGED_FORMIK_KEYS])) return;
-
-    autosaveTimeoutRef.current = setTimeout(() => {
-      window.localStorage.setItem(
-        `rdmDepositFormValues.${currentUserprofile.id}.${values.id}`,
-        JSON.stringify(stripServerManagedKeys(values))
-      );
-      setStorageDataPresent(true);
+    const dirty = dirtyTracker.update(values).isDirty();
+    if (!recoveryAsked || !dirty || autosaveConflict) return;
+
+    pendingSaveRef.current = () => {
       autosaveTimeoutRef.current = null;
-    }, AUTOSAVE_DEBOUNCE_MS);
+      pendingSaveRef.current = null;
+      coordinator
+        ?.save(stripServerManagedKeys(values), { draftUrl: values.links?.self })
+        .then((status) =>
+          status === "conflict" ? setAutosaveConflict(true) : setStorageDataPresent(true)
+        )
+        .catch((e) => console.warn("Could not autosave the deposit form values.", e));
+    };
+    autosaveTimeoutRef.current = setTimeout(pendingSaveRef.current, AUTOSAVE_DEBOUNCE_MS);
 
     return () => {
       if (autosaveTimeoutRef.current) {
         clearTimeout(autosaveTimeoutRef.current);
         autosaveTimeoutRef.current = null;
+        pendingSaveRef.current = null;
+      }
+    };
+  }, [values, recoveryAsked, dirtyTracker, coordinator, autosaveConflict]);
+
+  // Write a debounced save that has not run yet, and any save still waiting for an idle
+  // callback, before the page goes away.
+  useEffect(() => {
+    if (!autosave) return;
+    const handlePageHide = () => {
+      if (autosaveTimeoutRef.current) {
+        clearTimeout(autosaveTimeoutRef.current);
+        pendingSaveRef.current?.();
       }
+      autosave.flush();
     };
-  }, [values, recoveryAsked]);
+    window.addEventListener("pagehide", handlePageHide);
+    return () => window.removeEventListener("pagehide", handlePageHide);
+  }, [autosave]);
 
   // Recover form values from local storage.
   //
@@ -102,31 +173,55 @@ function useLocalStorageRecovery(currentUserprofile, currentFormPage) {
   // of those fields. We ignore `ui` (transient client-only Formik state) and
   // SERVER_MANAGED_FORMIK_KEYS (which we deliberately strip on save and
   // overlay from the live record on restore — see handleStorageData).
+  //
+  // A tab that finds the draft already open in another tab does not offer recovery: the
+  // stored values are that tab's unsaved work.
+  //
+  // Once that is settled, drop the autosaved values of this user's other drafts that were
+  // published or deleted since, or not saved for AUTOSAVE_MAX_AGE_MS.
   useEffect(() => {
-    const storageValues = window.localStorage.getItem(storageValuesKey);
-    const storageValuesObj = JSON.parse(storageValues);
-    if (
-      !recoveryAsked &&
-      !!storageValuesObj &&
-      !areDeeplyEqual(storageValuesObj, initialValues, ["ui", ...SERVER_MANAGED_FORMIK_KEYS])
-    ) {
-      setRecoveredStorageValues(storageValuesObj);
-      setStorageDataPresent(true);
-    } else {
-      setRecoveryAsked(true);
-    }
+    let cancelled = false;
+    const loading = coordinator ? coordinator.load() : Promise.resolve(null);
+    loading
+      .catch((e) => {
+        console.warn("Could not read the autosaved deposit form values.", e);
+        return null;
+      })
+      .then((storageValuesObj) => {
+        if (cancelled) return;
+        if (
+          !!storageValuesObj &&
+          coordinator.isLeader &&
+          changedPaths(initialValues, storageValuesObj, { ignore: UNTRACKED_FORMIK_KEYS }).length
+        ) {
+          setRecoveredStorageValues(storageValuesObj);
+          setStorageDataPresent(true);
+        } else {
+          setRecoveryAsked(true);
+        }
+        if (!coordinator?.isLeader) return undefined;
+        return autosave.prune({
+          prefix: `rdmDepositFormValues.${user}.`,
+          keep: [storageValuesKey],
+          maxAgeMs: AUTOSAVE_MAX_AGE_MS,
+          isGone: draftIsGone,
+        });
+      })
+      .catch((e) => console.warn("Could not prune autosaved deposit form values.", e));
+    return () => {
+      cancelled = true;
+    };
   }, []);
 
-  // clear local storage (and any pending debounced autosave) when form submits
+  // clear stored values (and any pending debounced or idle autosave) when form submits
   useEffect(() => {
     if (!isSubmitting) return;
     if (autosaveTimeoutRef.current) {
       clearTimeout(autosaveTimeoutRef.current);
       autosaveTimeoutRef.current = null;
+      pendingSaveRef.current = null;
     }
-    if (storageDataPresent) {
-      window.localStorage.removeItem(storageValuesKey);
-    }
+    removeStoredValues();
   }, [isSubmitting]);
 
   const handleStorageData = useCallback(
@@ -136,7 +231,7 @@ function useLocalStorageRecovery(currentUserprofile, currentFormPage) {
         // snapshot. The snapshot intentionally omits these (we strip them on
         // save), and pre-existing snapshots saved by older code may have stale
         // copies; either way, the live Redux record is the source of truth.
-        // Keep the snapshot in localStorage on accept so a reload without
+        // Keep the stored snapshot on accept so a reload without
         // further edits can still offer recovery; submit clears it.
         const liveRecord = store.getState().deposit?.record ?? {};
         const merged = overlayServerManagedKeys(recoveredStorageValues, liveRecord);
@@ -148,19 +243,10 @@ function useLocalStorageRecovery(currentUserprofile, currentFormPage) {
         focusFirstElement(currentFormPage, true);
       } else {
         // Decline: drop the snapshot so we don't re-prompt on the next visit.
-        window.localStorage.removeItem(
-          `rdmDepositFormValues.${currentUserprofile.id}.${values.id}`
-        );
+        removeStoredValues();
       }
     },
-    [
-      currentFormPage,
-      currentUserprofile.id,
-      recoveredStorageValues,
-      resetForm,
-      store,
-      values.id,
-    ]
+    [currentFormPage, recoveredStorageValues, removeStoredValues, resetForm, store]
   );
 
   return useMemo(
@@ -170,8 +256,16 @@ function useLocalStorageRecovery(currentUserprofile, currentFormPage) {
       recoveryAsked,
       confirmModalRef,
       handleRecoveryAsked,
+      autosaveConflict,
     }),
-    [handleStorageData, storageDataPresent, recoveryAsked, confirmModalRef, handleRecoveryAsked]
+    [
+      handleStorageData,
+      storageDataPresent,
+      recoveryAsked,
+      confirmModalRef,
+      handleRecoveryAsked,
+      autosaveConflict,
+    ]
   );
 }
 
@@ -0,0 +1,42 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+import { useEffect } from "react";
+import { preloadComponents } from "../helpers/lazyComponents";
+import { flattenWrappers } from "../utils";
+
+// Prefetch within this long even if the browser never goes idle.
+const PREFETCH_TIMEOUT_MS = 3000;
+
+/**
+ * After the current form page has rendered, fetch the component chunks of the next visible
+ * page while the browser is idle, so continuing to it does not wait for the network.
+ *
+ * @param {Object[]} visibleFormPages - `formUIState.visibleFormPages`
+ * @param {string} currentFormPage - id (`section`) of the current page
+ * @param {Object} componentsRegistry - `{ [name]: [Component, fieldPaths] }`
+ */
+function usePrefetchNextFormPage(visibleFormPages, currentFormPage, componentsRegistry) {
+  useEffect(() => {
+    const index = visibleFormPages.findIndex(({ section }) => section === currentFormPage);
+    const nextPage = index >= 0 ? visibleFormPages[index + 1] : undefined;
+    if (!nextPage || !componentsRegistry) return undefined;
+
+    const prefetch = () =>
+      preloadComponents(
+        componentsRegistry,
+        flattenWrappers(nextPage).map(({ component }) => component)
+      );
+    if (typeof window.requestIdleCallback === "function") {
+      const handle = window.requestIdleCallback(prefetch, { timeout: PREFETCH_TIMEOUT_MS });
+      return () => window.cancelIdleCallback(handle);
+    }
+    const timeout = window.setTimeout(prefetch, 0);
+    return () => window.clearTimeout(timeout);
+  }, [visibleFormPages, currentFormPage, componentsRegistry]);
+}
+
+export { usePrefetchNextFormPage };
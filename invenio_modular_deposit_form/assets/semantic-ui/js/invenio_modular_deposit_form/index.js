@@ -14,12 +14,14 @@ import ReactDOM from "react-dom";
 import { getInputFromDOM } from "@js/invenio_rdm_records/";
 import { RDMDepositForm } from "./RDMDepositForm";
 import { OverridableContext, overrideStore } from "react-overridable";
+import { LayoutConfigLoader } from "./framing_components/LayoutConfigLoader";
 
 const overriddenComponents = overrideStore.getAll();
 const formDiv = document.getElementById("deposit-form");
 
-// Single config payload (stock forms_config + extension keys from merge_deposit_config)
-const config = getInputFromDOM("deposits-config") || {};
+// Single config payload (stock forms_config + extension keys from deposit_config_json).
+// The static layout may instead come from a cacheable API response (`layout_url`).
+const pageConfig = getInputFromDOM("deposits-config") || {};
 
 const recordRestrictionGracePeriod = getInputFromDOM("deposits-record-restriction-grace-period");
 const allowRecordRestriction = getInputFromDOM("deposits-allow-record-restriction");
@@ -30,28 +32,36 @@ const fileModification = getInputFromDOM("deposits-file-modification");
 const shareBtnRequireLinkExpiration = getInputFromDOM("deposits-share-btn-require-link-expiration");
 
 ReactDOM.render(
-  <OverridableContext.Provider value={overriddenComponents}>
-    <RDMDepositForm
-      config={config}
-      files={getInputFromDOM("deposits-record-files")}
-      filesLocked={getInputFromDOM("deposits-record-locked-files")}
-      permissions={getInputFromDOM("deposits-record-permissions")}
-      preselectedCommunity={getInputFromDOM("deposits-draft-community")}
-      record={getInputFromDOM("deposits-record")}
-      useUppy={getInputFromDOM("deposits-use-uppy-ui")}
-      recordRestrictionGracePeriod={recordRestrictionGracePeriod}
-      allowRecordRestriction={allowRecordRestriction}
-      groupsEnabled={groupsEnabled}
-      allowEmptyFiles={allowEmptyFiles}
-      recordDeletion={recordDeletion}
-      fileModification={fileModification}
-      shareBtnRequireLinkExpiration={shareBtnRequireLinkExpiration}
-    />
-  </OverridableContext.Provider>,
+  <LayoutConfigLoader pageConfig={pageConfig}>
+    {(config) => (
+      <OverridableContext.Provider value={overriddenComponents}>
+        <RDMDepositForm
+          config={config}
+          files={getInputFromDOM("deposits-record-files")}
+          filesLocked={getInputFromDOM("deposits-record-locked-files")}
+          permissions={getInputFromDOM("deposits-record-permissions")}
+          preselectedCommunity={getInputFromDOM("deposits-draft-community")}
+          record={getInputFromDOM("deposits-record")}
+          useUppy={getInputFromDOM("deposits-use-uppy-ui")}
+          recordRestrictionGracePeriod={recordRestrictionGracePeriod}
+          allowRecordRestriction={allowRecordRestriction}
+          groupsEnabled={groupsEnabled}
+          allowEmptyFiles={allowEmptyFiles}
+          recordDeletion={recordDeletion}
+          fileModification={fileModification}
+          shareBtnRequireLinkExpiration={shareBtnRequireLinkExpiration}
+        />
+      </OverridableContext.Provider>
+    )}
+  </LayoutConfigLoader>,
   formDiv
 );
 
 export * from "./RDMDepositForm";
 export * from "./utils";
-export * from "./field_components";
-export * from "./replacement_components";
+// Field components (and the replacement fields they wrap) are fetched when a form page needs
+// them (componentsRegistry.js), so they are not re-exported from this entry point: import them
+// from `@js/invenio_modular_deposit_form/field_components` or `.../replacement_components`
+// (docs/source/extending.md, "Upgrading: imports from the package entry point").
+export * from "./replacement_components/input_controls";
+export { DepositFormApp, DepositBootstrap } from "./replacement_components/patched_rdm/deposit";
@@ -22,6 +22,7 @@ const FormPageNavigationBar = ({ classnames, ...props }) => {
     nextFormPage,
     handleFormPageChange,
     storageDataPresent,
+    autosaveConflict,
   } = useFormUIState();
   return (
     <div
@@ -47,13 +48,21 @@ const FormPageNavigationBar = ({ classnames, ...props }) => {
             )}
           </Grid.Column>
           <Grid.Column className="nav-bar-message pr-0 pl-0" width={8} textAlign="center">
-            {!!storageDataPresent && (
+            {autosaveConflict ? (
               <span className="nav-bar-message-text">
-                <Trans
-                  defaults="Form values backed up temporarily <0>in this browser</0>."
-                  components={[<i />]}
-                />
+                {i18next.t(
+                  "Changes in this tab are no longer backed up: this draft was changed in another tab."
+                )}
               </span>
+            ) : (
+              !!storageDataPresent && (
+                <span className="nav-bar-message-text">
+                  <Trans
+                    defaults="Form values backed up temporarily <0>in this browser</0>."
+                    components={[<i />]}
+                  />
+                </span>
+              )
             )}
           </Grid.Column>
           <Grid.Column width={4} textAlign="right">
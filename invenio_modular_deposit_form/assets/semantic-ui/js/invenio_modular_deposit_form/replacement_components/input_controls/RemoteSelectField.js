@@ -46,10 +46,15 @@
 //   alongside the local `suggestionAPIUrl` request. Local hits are painted into the dropdown as
 //   soon as they arrive (spinner stays on while extras are pending); extras are merged in via
 //   `mergeOptions` when they resolve. The helper receives a *promise* of local hits so it can
-//   fire its own request in parallel and await the local promise only at de-dup time. Late
-//   responses for queries the user has already typed past are dropped via a `searchQuery`
-//   staleness guard. Errors thrown from `mergeExtraSource` are swallowed (logged) so the local
-//   list is never lost.
+//   fire its own request in parallel and await the local promise only at de-dup time, plus
+//   `{ signal }` (see below). Late responses for queries the user has already typed past are
+//   dropped via a `searchQuery` staleness guard. Errors thrown from `mergeExtraSource` are
+//   swallowed (logged) so the local list is never lost.
+// - Cancellation: each search owns an `AbortController`. It is aborted when a keystroke moves
+//   the query away from the one in flight, when a newer search starts and on unmount. The
+//   signal reaches the local axios request (through the suggestion cache, which only aborts a
+//   request no other field still waits on) and `mergeExtraSource`. Aborted requests are
+//   counted in abortTrace.js. (Stock only ignores late responses.)
 // - `restrictOptionsToResults` (default false): when true, the dropdown menu is sourced solely from
 //   the current remote results (`this.state.suggestions`) rather than the inner `SelectField`'s
 //   accumulating `state.options`. This bypasses both semantic-ui-react's built-in client-side
@@ -59,6 +64,15 @@
 //   `/api/names`) where the server / `mergeExtraSource` already decide relevance and each query's
 //   results should replace the previous menu. Callers pass the flag instead of a custom
 //   `search={(options) => options}` and need no ref into this widget's state.
+// - Suggestion requests go through the page-wide `suggestionCache` (see suggestionCache.js):
+//   repeated queries within its TTL are served without a request, and the same query issued
+//   by several fields at once shares one request. `cacheSuggestions={false}` opts a field out
+//   (stock fetches every time).
+// - `vocabularySnapshotUrl` (optional): for small vocabularies, answer searches from a local
+//   index over a snapshot of the whole vocabulary, downloaded once per page and revalidated
+//   against `localStorage` (see vocabularySnapshot.js). `suggestionAPIUrl` is only called when
+//   the snapshot is unavailable. `suggestionAPIQueryParams` other than `size` are not applied
+//   to local searches, so do not combine it with filtering params.
 // - update `onFocus` logic to respect `searchOnFocus` prop value.
 // - added check for non-zero-length  string to `handleSearchInputChange` so that options menu
 //   immediately opens when user types, instead of brief delay waiting for returned options.
@@ -73,6 +87,9 @@ import React, { Component } from "react";
 import { Message } from "semantic-ui-react";
 import { createOption, mergeOptions } from "react-invenio-forms";
 import { SelectField } from "./SelectField";
+import { isAbortError } from "./abortTrace";
+import { suggestionCache, suggestionCacheKey, uncachedSuggestions } from "./suggestionCache";
+import { loadVocabularySnapshot } from "./vocabularySnapshot";
 
 const DEFAULT_SUGGESTION_SIZE = 20;
 const serializeSuggestions = (suggestions) =>
@@ -82,21 +99,6 @@ const serializeSuggestions = (suggestions) =>
     key: item.id,
   }));
 
-function withCancel(promise) {
-  let canceled = false;
-  return {
-    promise: new Promise((resolve, reject) => {
-      promise.then(
-        (value) => (canceled ? reject(new Error("canceled")) : resolve(value)),
-        (error) => (canceled ? reject(new Error("canceled")) : reject(error))
-      );
-    }),
-    cancel: () => {
-      canceled = true;
-    },
-  };
-}
-
 class RemoteSelectField extends Component {
   constructor(props) {
     super(props);
@@ -105,6 +107,15 @@ class RemoteSelectField extends Component {
     // `state.searchQuery`, which (when `commitSearchOnBlur`) updates on every keystroke so the
     // input stays editable without implying a fetch has started for that string.
     this.lastFetchedQueryRef = { current: undefined };
+    // Controller of the search in flight; aborted once a newer query supersedes it.
+    this.searchController = null;
+
+    this.abortSearch = () => {
+      if (this.searchController) {
+        this.searchController.abort();
+        this.searchController = null;
+      }
+    };
 
     this.onSelectValue = async (event, { options, value }, callbackFunc) => {
       this.latestSearchStringRef.current = "";
@@ -148,7 +159,6 @@ class RemoteSelectField extends Component {
     };
 
     this.runDebouncedSearch = _debounce(async (e, { searchQuery }) => {
-      this.cancellableAction && this.cancellableAction.cancel();
       await this.executeSearch(searchQuery);
     }, this.props.debounceTime);
 
@@ -156,6 +166,14 @@ class RemoteSelectField extends Component {
       const { commitSearchOnBlur, multiple } = this.props;
       const q = data?.searchQuery == null ? "" : String(data.searchQuery);
       this.latestSearchStringRef.current = q;
+      // The in-flight search is stale as soon as the query moves away from it; free its
+      // connection now rather than when the debounce fires. Clearing the fetched query lets
+      // the debounced search re-issue it if the user types back to the same string.
+      const superseded = this.props.preSearchChange(q) !== this.lastFetchedQueryRef.current;
+      if (this.searchController && superseded) {
+        this.abortSearch();
+        this.lastFetchedQueryRef.current = undefined;
+      }
       // When free-text edit mode controls the dropdown `searchQuery`, update display state
       // immediately so each keystroke edits the string. Remote fetch stays debounced below.
       if (commitSearchOnBlur && !multiple) {
@@ -180,22 +198,27 @@ class RemoteSelectField extends Component {
       this.latestSearchStringRef.current =
         searchQuery == null ? "" : String(searchQuery);
 
+      this.abortSearch();
+      const controller = new AbortController();
+      this.searchController = controller;
+      const { signal } = controller;
+
       this.setState({ isFetching: true, searchQuery: query });
 
       // Staleness: prefer the live typed string so mid-debounce keystrokes drop late responses
-      // even before the next `executeSearch` runs.
-      const isStale = () => preSearchChange(this.latestSearchStringRef.current) !== query;
+      // even before the next `executeSearch` runs. An aborted search is always stale.
+      const isStale = () =>
+        signal.aborted || preSearchChange(this.latestSearchStringRef.current) !== query;
 
       // Two-phase render: paint local hits into the dropdown the moment they arrive, then
       // merge in extras (e.g. ORCID) when the extra source resolves. Both round-trips overlap:
       // `mergeExtraSource` receives a *promise* of local hits so it can fire its own request
       // immediately and await `localPromise` only when it needs the data for de-duping.
-      // TODO: pass an AbortSignal to mergeExtraSource for true request cancellation; today
-      // late responses are just dropped via the staleness guard below.
-      const localPromise = this.fetchSuggestions(query);
+      // Both requests get `signal`, so superseding this search cancels them on the wire.
+      const localPromise = this.fetchSuggestions(query, signal);
       const extraPromise = mergeExtraSource
-        ? Promise.resolve(mergeExtraSource(localPromise, query)).catch((e) => {
-            console.warn("RemoteSelectField extra source failed:", e);
+        ? Promise.resolve(mergeExtraSource(localPromise, query, { signal })).catch((e) => {
+            if (!isAbortError(e)) console.warn("RemoteSelectField extra source failed:", e);
             return [];
           })
         : null;
@@ -225,6 +248,7 @@ class RemoteSelectField extends Component {
           isFetching: false,
         }));
       }
+      if (this.searchController === controller) this.searchController = null;
     };
 
     this.searchIfNoSuggestions = async (newSelectedSuggestions) => {
@@ -234,33 +258,53 @@ class RemoteSelectField extends Component {
       }
     };
 
-    this.fetchSuggestions = async (searchQuery) => {
+    this.fetchSuggestions = async (searchQuery, signal = undefined) => {
       const {
         suggestionAPIUrl,
         suggestionAPIQueryParams,
         suggestionAPIHeaders,
         searchQueryParamName,
+        cacheSuggestions,
+        vocabularySnapshotUrl,
       } = this.props;
 
-      this.cancellableAction = withCancel(
+      if (vocabularySnapshotUrl) {
+        const index = await loadVocabularySnapshot(vocabularySnapshotUrl);
+        if (index) {
+          return index.search(
+            searchQuery,
+            suggestionAPIQueryParams?.size ?? DEFAULT_SUGGESTION_SIZE
+          );
+        }
+      }
+
+      const params = {
+        [searchQueryParamName]: searchQuery,
+        size: DEFAULT_SUGGESTION_SIZE,
+        ...suggestionAPIQueryParams,
+      };
+      const load = (requestSignal) =>
         axios.get(suggestionAPIUrl, {
-          params: {
-            [searchQueryParamName]: searchQuery,
-            size: DEFAULT_SUGGESTION_SIZE,
-            ...suggestionAPIQueryParams,
-          },
+          params,
           headers: suggestionAPIHeaders,
+          signal: requestSignal,
           // There is a bug in axios that prevents brackets from being encoded,
           // remove the paramsSerializer when fixed.
           // https://github.com/axios/axios/issues/3316
           paramsSerializer: (params) => queryString.stringify(params, { arrayFormat: "repeat" }),
-        })
-      );
+        });
+      const requests = cacheSuggestions ? suggestionCache : uncachedSuggestions;
       try {
-        const response = await this.cancellableAction.promise;
+        const response = await requests.fetch(
+          suggestionCacheKey(suggestionAPIUrl, params, suggestionAPIHeaders),
+          load,
+          // Keep only the body; the full axios response holds the request object.
+          (response) => (response?.data ? { data: response.data } : undefined),
+          signal
+        );
         return response?.data?.hits?.hits;
       } catch (e) {
-        console.error(e);
+        if (!isAbortError(e)) console.error(e);
       }
     };
 
@@ -393,6 +437,8 @@ class RemoteSelectField extends Component {
         hideAdditionMenuItem,
         mergeExtraSource,
         restrictOptionsToResults,
+        cacheSuggestions,
+        vocabularySnapshotUrl,
         ...uiProps
       } = this.props;
 
@@ -419,6 +465,8 @@ class RemoteSelectField extends Component {
         hideAdditionMenuItem,
         mergeExtraSource,
         restrictOptionsToResults,
+        cacheSuggestions,
+        vocabularySnapshotUrl,
       };
       return { compProps, uiProps };
     };
@@ -496,7 +544,7 @@ class RemoteSelectField extends Component {
   }
 
   componentWillUnmount() {
-    this.cancellableAction && this.cancellableAction.cancel();
+    this.abortSearch();
     if (this.runDebouncedSearch && typeof this.runDebouncedSearch.cancel === "function") {
       this.runDebouncedSearch.cancel();
     }
@@ -617,6 +665,8 @@ RemoteSelectField.defaultProps = {
   hideAdditionMenuItem: false,
   mergeExtraSource: undefined,
   restrictOptionsToResults: false,
+  cacheSuggestions: true,
+  vocabularySnapshotUrl: undefined,
 };
 
 RemoteSelectField.propTypes = {
@@ -648,6 +698,8 @@ RemoteSelectField.propTypes = {
   helpText: PropTypes.oneOfType([PropTypes.string, PropTypes.node]),
   mergeExtraSource: PropTypes.func,
   restrictOptionsToResults: PropTypes.bool,
+  cacheSuggestions: PropTypes.bool,
+  vocabularySnapshotUrl: PropTypes.string,
 };
 
 export { RemoteSelectField };
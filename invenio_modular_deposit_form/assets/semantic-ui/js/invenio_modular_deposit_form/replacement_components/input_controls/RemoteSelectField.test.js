@@ -8,6 +8,8 @@ import React from "react";
 import axios from "axios";
 import { renderWithFormik } from "@custom-test-utils/formik_test_utils";
 import { RemoteSelectField } from "./RemoteSelectField";
+import { suggestionCache } from "./suggestionCache";
+import { clearLoadedVocabularySnapshots } from "./vocabularySnapshot";
 
 // A controlled promise we can resolve/reject from outside, so the test drives the timing
 // of phase 1 (local) and phase 2 (extra source) independently.
@@ -59,6 +61,12 @@ const flush = async () => {
   await Promise.resolve();
 };
 
+// The suggestion cache and loaded snapshots are page-wide; start every test cold.
+beforeEach(() => {
+  suggestionCache.clear();
+  clearLoadedVocabularySnapshots();
+});
+
 describe("RemoteSelectField executeSearch", () => {
   let warnSpy;
 
@@ -297,3 +305,136 @@ describe("RemoteSelectField mid-typeahead on focus", () => {
     }
   });
 });
+
+describe("RemoteSelectField shared suggestion cache", () => {
+  test("fields share cached results for the same URL and params", async () => {
+    axios.get.mockResolvedValueOnce({
+      data: { hits: { hits: [{ id: "local-1" }] } },
+    });
+    const { instance: first } = await mountField();
+    const { instance: second } = await mountField({ fieldPath: "otherField" });
+
+    await first.executeSearch("alice");
+    await second.executeSearch("alice");
+
+    expect(axios.get).toHaveBeenCalledTimes(1);
+    expect(second.state.suggestions.map((s) => s.id)).toEqual(["local-1"]);
+  });
+
+  test("identical in-flight requests from two fields are coalesced", async () => {
+    const response = deferred();
+    axios.get.mockReturnValueOnce(response.promise);
+    const { instance: first } = await mountField();
+    const { instance: second } = await mountField({ fieldPath: "otherField" });
+
+    const firstDone = first.executeSearch("bob");
+    const secondDone = second.executeSearch("bob");
+    response.resolve({ data: { hits: { hits: [{ id: "local-2" }] } } });
+    await Promise.all([firstDone, secondDone]);
+
+    expect(axios.get).toHaveBeenCalledTimes(1);
+    expect(first.state.suggestions.map((s) => s.id)).toEqual(["local-2"]);
+    expect(second.state.suggestions.map((s) => s.id)).toEqual(["local-2"]);
+  });
+
+  test("cacheSuggestions={false} always fetches", async () => {
+    axios.get.mockResolvedValue({ data: { hits: { hits: [{ id: "local-1" }] } } });
+    const { instance: first } = await mountField({ cacheSuggestions: false });
+    const { instance: second } = await mountField({
+      fieldPath: "otherField",
+      cacheSuggestions: false,
+    });
+
+    await first.executeSearch("alice");
+    await second.executeSearch("alice");
+
+    expect(axios.get).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe("RemoteSelectField request cancellation", () => {
+  test("a newer search aborts the local request and the extra source of the previous one", async () => {
+    axios.get
+      .mockReturnValueOnce(new Promise(() => {}))
+      .mockResolvedValueOnce({ data: { hits: { hits: [{ id: "b-local" }] } } });
+    const mergeExtraSource = jest.fn(() => Promise.resolve([]));
+    const { instance } = await mountField({ mergeExtraSource });
+
+    instance.executeSearch("alice");
+    await flush();
+    const firstRequestSignal = axios.get.mock.calls[0][1].signal;
+    const firstExtraSignal = mergeExtraSource.mock.calls[0][2].signal;
+    expect(firstRequestSignal.aborted).toBe(false);
+
+    await instance.executeSearch("alicia");
+
+    expect(firstRequestSignal.aborted).toBe(true);
+    expect(firstExtraSignal.aborted).toBe(true);
+    expect(mergeExtraSource.mock.calls[1][2].signal.aborted).toBe(false);
+    expect(instance.state.suggestions.map((s) => s.id)).toEqual(["b-local"]);
+    expect(instance.state.error).toBe(false);
+  });
+
+  test("typing past the in-flight query aborts it before the debounce fires", async () => {
+    axios.get.mockReturnValueOnce(new Promise(() => {}));
+    const { instance } = await mountField({ debounceTime: 500 });
+
+    instance.executeSearch("ali");
+    await flush();
+    instance.handleSearchInputChange({}, { searchQuery: "alic" });
+
+    expect(axios.get.mock.calls[0][1].signal.aborted).toBe(true);
+    expect(instance.lastFetchedQueryRef.current).toBeUndefined();
+    instance.runDebouncedSearch.cancel();
+  });
+
+  test("unmount aborts the search in flight", async () => {
+    axios.get.mockReturnValueOnce(new Promise(() => {}));
+    const { instance, utils } = await mountField();
+
+    instance.executeSearch("alice");
+    await flush();
+    utils.unmount();
+
+    expect(axios.get.mock.calls[0][1].signal.aborted).toBe(true);
+  });
+});
+
+describe("RemoteSelectField vocabulary snapshot", () => {
+  const snapshotUrl = "/api/modular-deposit-form/vocabularies/languages/snapshot";
+
+  test("answers searches from the snapshot after one download", async () => {
+    axios.get.mockResolvedValueOnce({
+      status: 200,
+      data: {
+        revision: "r1",
+        complete: true,
+        hits: [
+          { id: "pol", title_l10n: "Polish" },
+          { id: "por", title_l10n: "Portuguese" },
+        ],
+      },
+    });
+    const { instance } = await mountField({ vocabularySnapshotUrl: snapshotUrl });
+
+    await instance.executeSearch("pol");
+    await instance.executeSearch("portu");
+
+    expect(axios.get).toHaveBeenCalledTimes(1);
+    expect(axios.get.mock.calls[0][0]).toBe(snapshotUrl);
+    expect(instance.state.suggestions.map((s) => s.id)).toEqual(["por"]);
+  });
+
+  test("falls back to suggestionAPIUrl when the snapshot is unavailable", async () => {
+    jest.spyOn(console, "warn").mockImplementation(() => {});
+    axios.get
+      .mockRejectedValueOnce(new Error("404"))
+      .mockResolvedValueOnce({ data: { hits: { hits: [{ id: "remote-1" }] } } });
+    const { instance } = await mountField({ vocabularySnapshotUrl: snapshotUrl });
+
+    await instance.executeSearch("pol");
+
+    expect(axios.get.mock.calls[1][0]).toBe("/api/test");
+    expect(instance.state.suggestions.map((s) => s.id)).toEqual(["remote-1"]);
+  });
+});
@@ -0,0 +1,87 @@
+// This file is part of Invenio-Modular-Deposit-Form
+// Copyright (C) 2026 Mesh Research
+//
+// Invenio-Modular-Deposit-Form is free software; you can redistribute it and/or modify it
+// under the terms of the MIT License; see the LICENSE file for more details.
+//
+// Counter and trace hook for suggestion requests cancelled with an `AbortController`.
+//
+// `RemoteSelectField` aborts the request for a query as soon as a newer query supersedes it,
+// and passes the same signal to its `mergeExtraSource` (e.g. the ORCID lookup). Each HTTP
+// request that was actually cut off in flight is reported here once, with a short `source`
+// label (the suggestion cache key, or `"orcid"`). Requests that had already finished, or
+// that are still shared with another field, are not counted.
+//
+//   import { onAbortedRequest } from ".../input_controls/abortTrace";
+//   const stop = onAbortedRequest(({ source, count }) => console.debug(source, count));
+
+let abortedCount = 0;
+const listeners = new Set();
+
+/**
+ * Whether `error` is the rejection of an aborted request (fetch, axios or our own).
+ *
+ * @param {*} error
+ * @returns {boolean}
+ */
+function isAbortError(error) {
+  return (
+    error?.name === "AbortError" ||
+    error?.name === "CanceledError" ||
+    error?.code === "ERR_CANCELED"
+  );
+}
+
+/**
+ * @returns {DOMException|Error} the rejection used for a caller whose signal aborted
+ */
+function createAbortError() {
+  if (typeof DOMException === "function") {
+    return new DOMException("The suggestion request was aborted.", "AbortError");
+  }
+  const error = new Error("The suggestion request was aborted.");
+  error.name = "AbortError";
+  return error;
+}
+
+/**
+ * Count one aborted in-flight request and notify listeners.
+ *
+ * @param {string} source - what was aborted (cache key, `"orcid"`, ...)
+ */
+function recordAbortedRequest(source) {
+  abortedCount += 1;
+  listeners.forEach((listener) => listener({ source, count: abortedCount }));
+}
+
+/**
+ * @returns {number} requests aborted in flight since page load (or the last reset)
+ */
+function getAbortedRequestCount() {
+  return abortedCount;
+}
+
+/**
+ * Subscribe to aborted requests.
+ *
+ * @param {function({ source: string, count: number }): void} listener
+ * @returns {function(): void} unsubscribe
+ */
+function onAbortedRequest(listener) {
+  listeners.add(listener);
+  return () => listeners.delete(listener);
+}
+
+/** Reset the counter (tests). Listeners are kept. */
+function resetAbortedRequestCount() {
+  abortedCount = 0;
+}
+
+export {
+  createAbortError,
+  getAbortedRequestCount,
+  isAbortError,
+  onAbortedRequest,
+  recordAbortedRequest,
+  resetAbortedRequestCount,
+};
@@ -0,0 +1,210 @@
+// This file is part of Invenio-Modular-Deposit-Form
+// Copyright (C) 2026 Mesh Research
+//
+// Invenio-Modular-Deposit-Form is free software; you can redistribute it and/or modify it
+// under the terms of the MIT License; see the LICENSE file for more details.
+//
+// Page-wide cache for `RemoteSelectField` suggestion requests.
+//
+// Every `RemoteSelectField` on the page (creator names, affiliations, languages, subjects,
+// ...) shares the `suggestionCache` instance below, keyed on the request URL plus its
+// serialized query params (and headers, when any are set). Entries hold the response body and
+// expire after a short TTL; the least recently used are dropped beyond `maxEntries`. Adding
+// ten creators in a row therefore asks `/api/affiliations` once per distinct query instead of
+// once per field.
+//
+// Identical requests that are still in flight are coalesced: the second caller gets the
+// first caller's promise, so two fields that debounce the same query at the same time share
+// one HTTP request. Failures are never cached; the next caller retries. Callers may pass an
+// `AbortSignal`; the shared request is aborted once every caller waiting on it has aborted
+// (see abortTrace.js for the counter).
+//
+// Cached response bodies are shared between callers and must be treated as read-only.
+
+import queryString from "query-string";
+import { createAbortError, recordAbortedRequest } from "./abortTrace";
+
+const DEFAULT_MAX_ENTRIES = 200;
+const DEFAULT_TTL_MS = 60 * 1000;
+
+/**
+ * Build the cache key for one suggestion request.
+ *
+ * @param {string} url - suggestion endpoint
+ * @param {Object} params - query params (key order does not matter)
+ * @param {Object} [headers] - request headers; part of the key only when non-empty
+ * @returns {string}
+ */
+function suggestionCacheKey(url, params, headers) {
+  const query = queryString.stringify(params ?? {}, { arrayFormat: "repeat" });
+  const headerPart =
+    headers && Object.keys(headers).length > 0
+      ? `#${queryString.stringify(headers)}`
+      : "";
+  return `${url}?${query}${headerPart}`;
+}
+
+class SuggestionCache {
+  /**
+   * @param {Object} [options]
+   * @param {number} [options.maxEntries] - entries kept before the least recently used go
+   * @param {number} [options.ttlMs] - how long an entry is served; `0` disables caching
+   *   (in-flight requests are still coalesced)
+   * @param {function(): number} [options.now] - clock, replaceable in tests
+   */
+  constructor({ maxEntries = DEFAULT_MAX_ENTRIES, ttlMs = DEFAULT_TTL_MS, now = Date.now } = {}) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.now = now;
+    // Map iteration order doubles as recency order (oldest first).
+    this.entries = new Map();
+    this.inFlight = new Map();
+    this.stats = { hits: 0, misses: 0, coalesced: 0, aborted: 0 };
+  }
+
+  /**
+   * Return the cached value for `key`, or `undefined` when absent or expired.
+   *
+   * @param {string} key
+   * @returns {*}
+   */
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    this.entries.delete(key);
+    if (entry.expires <= this.now()) return undefined;
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * Store `value` under `key`, evicting the least recently used entries.
+   *
+   * @param {string} key
+   * @param {*} value
+   */
+  set(key, value) {
+    if (this.ttlMs <= 0 || this.maxEntries <= 0) return;
+    this.entries.delete(key);
+    this.entries.set(key, { value, expires: this.now() + this.ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  /**
+   * Resolve `key` from the cache, from an identical request in flight, or by calling `load`.
+   *
+   * On a miss `load` receives the `AbortSignal` of a controller owned by the cache. A caller
+   * that passes its own `signal` gets an `AbortError` rejection as soon as that signal
+   * aborts; the shared request itself is aborted only once every caller waiting on it has
+   * aborted (a caller without a signal keeps it alive). Its value goes through `toEntry`
+   * before being stored.
+   *
+   * @param {string} key - see {@link suggestionCacheKey}
+   * @param {function(AbortSignal): Promise<*>} load - performs the request
+   * @param {function(*): *} [toEntry] - picks what to keep from the resolved value (e.g. drop
+   *   the request object from an axios response); `undefined` is not stored
+   * @param {AbortSignal} [signal] - aborts this caller's interest in the request
+   * @returns {Promise<*>}
+   */
+  fetch(key, load, toEntry = (value) => value, signal = undefined) {
+    const cached = this.get(key);
+    if (cached !== undefined) {
+      this.stats.hits += 1;
+      return Promise.resolve(cached);
+    }
+    let flight = this.inFlight.get(key);
+    if (flight) {
+      this.stats.coalesced += 1;
+    } else {
+      this.stats.misses += 1;
+      const controller = new AbortController();
+      flight = { controller, waiters: 0, settled: false, promise: load(controller.signal) };
+      this.inFlight.set(key, flight);
+      const done = flight;
+      done.promise.then(
+        (value) => {
+          done.settled = true;
+          if (this.inFlight.get(key) === done) this.inFlight.delete(key);
+          const entry = toEntry(value);
+          if (entry !== undefined) this.set(key, entry);
+        },
+        // Failures are not cached; the caller handles the rejection.
+        () => {
+          done.settled = true;
+          if (this.inFlight.get(key) === done) this.inFlight.delete(key);
+        }
+      );
+    }
+    return this._wait(key, flight, signal);
+  }
+
+  /**
+   * Follow `flight` on behalf of one caller, detaching it when its `signal` aborts.
+   *
+   * @param {string} key
+   * @param {Object} flight - in-flight entry
+   * @param {AbortSignal} [signal]
+   * @returns {Promise<*>}
+   */
+  _wait(key, flight, signal) {
+    if (!signal) {
+      flight.waiters = Infinity;
+      return flight.promise;
+    }
+    if (signal.aborted) {
+      this._release(key, flight);
+      return Promise.reject(createAbortError());
+    }
+    flight.waiters += 1;
+    return new Promise((resolve, reject) => {
+      const onAbort = () => {
+        reject(createAbortError());
+        flight.waiters -= 1;
+        this._release(key, flight);
+      };
+      signal.addEventListener("abort", onAbort, { once: true });
+      flight.promise.then(
+        (value) => {
+          signal.removeEventListener("abort", onAbort);
+          resolve(value);
+        },
+        (error) => {
+          signal.removeEventListener("abort", onAbort);
+          reject(error);
+        }
+      );
+    });
+  }
+
+  /**
+   * Abort the shared request of `flight` once nobody is waiting on it any more.
+   *
+   * @param {string} key
+   * @param {Object} flight - in-flight entry
+   */
+  _release(key, flight) {
+    if (flight.waiters > 0 || flight.settled) return;
+    if (this.inFlight.get(key) === flight) this.inFlight.delete(key);
+    flight.settled = true;
+    flight.controller.abort();
+    this.stats.aborted += 1;
+    recordAbortedRequest(key);
+  }
+
+  /** Drop every cached entry, forget in-flight requests and reset the counters. */
+  clear() {
+    this.entries.clear();
+    this.inFlight.clear();
+    this.stats = { hits: 0, misses: 0, coalesced: 0, aborted: 0 };
+  }
+}
+
+const suggestionCache = new SuggestionCache();
+
+// For fields with `cacheSuggestions={false}`: nothing is stored, but identical concurrent
+// requests are still shared and aborted the same way.
+const uncachedSuggestions = new SuggestionCache({ ttlMs: 0 });
+
+export { SuggestionCache, suggestionCache, suggestionCacheKey, uncachedSuggestions };
@@ -0,0 +1,140 @@
+import { getAbortedRequestCount, resetAbortedRequestCount } from "./abortTrace";
+import { SuggestionCache, suggestionCacheKey } from "./suggestionCache";
+
+const deferred = () => {
+  let resolve;
+  let reject;
+  const promise = new Promise((res, rej) => {
+    resolve = res;
+    reject = rej;
+  });
+  return { promise, resolve, reject };
+};
+
+describe("suggestionCacheKey", () => {
+  it("ignores param order and includes headers only when set", () => {
+    expect(suggestionCacheKey("/api/names", { suggest: "ali", size: 20 })).toBe(
+      suggestionCacheKey("/api/names", { size: 20, suggest: "ali" })
+    );
+    expect(suggestionCacheKey("/api/names", { suggest: "ali" }, {})).toBe(
+      "/api/names?suggest=ali"
+    );
+    expect(suggestionCacheKey("/api/names", { suggest: "ali" }, { Accept: "x" })).not.toBe(
+      "/api/names?suggest=ali"
+    );
+  });
+});
+
+describe("SuggestionCache", () => {
+  it("serves repeated keys from the cache until the TTL passes", async () => {
+    let now = 0;
+    const cache = new SuggestionCache({ ttlMs: 1000, now: () => now });
+    const load = jest.fn(() => Promise.resolve({ hits: ["a"] }));
+
+    await cache.fetch("k", load);
+    await expect(cache.fetch("k", load)).resolves.toEqual({ hits: ["a"] });
+    expect(load).toHaveBeenCalledTimes(1);
+
+    now = 1000;
+    await cache.fetch("k", load);
+    expect(load).toHaveBeenCalledTimes(2);
+    expect(cache.stats).toEqual({ hits: 1, misses: 2, coalesced: 0, aborted: 0 });
+  });
+
+  it("evicts the least recently used entry beyond maxEntries", async () => {
+    const cache = new SuggestionCache({ maxEntries: 2 });
+    const load = jest.fn((v) => Promise.resolve(v));
+
+    await cache.fetch("a", () => load("a"));
+    await cache.fetch("b", () => load("b"));
+    await cache.fetch("a", () => load("a")); // "a" becomes most recent
+    await cache.fetch("c", () => load("c")); // evicts "b"
+
+    expect(cache.get("a")).toBe("a");
+    expect(cache.get("b")).toBeUndefined();
+    expect(cache.get("c")).toBe("c");
+  });
+
+  it("coalesces identical in-flight requests into one load", async () => {
+    const cache = new SuggestionCache();
+    const response = deferred();
+    const load = jest.fn(() => response.promise);
+
+    const first = cache.fetch("k", load);
+    const second = cache.fetch("k", load);
+    expect(second).toBe(first);
+    response.resolve({ data: 1 });
+
+    await expect(second).resolves.toEqual({ data: 1 });
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(cache.stats.coalesced).toBe(1);
+  });
+
+  it("does not cache failures", async () => {
+    const cache = new SuggestionCache();
+    const load = jest
+      .fn()
+      .mockReturnValueOnce(Promise.reject(new Error("500")))
+      .mockReturnValueOnce(Promise.resolve("ok"));
+
+    await expect(cache.fetch("k", load)).rejects.toThrow("500");
+    await expect(cache.fetch("k", load)).resolves.toBe("ok");
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it("stores what toEntry keeps and skips undefined", async () => {
+    const cache = new SuggestionCache();
+    await cache.fetch("k", () => Promise.resolve({ data: 1, request: {} }), (r) => ({
+      data: r.data,
+    }));
+    await cache.fetch("empty", () => Promise.resolve({}), (r) => r.data);
+
+    expect(cache.get("k")).toEqual({ data: 1 });
+    expect(cache.get("empty")).toBeUndefined();
+  });
+
+  describe("abort signals", () => {
+    beforeEach(() => {
+      resetAbortedRequestCount();
+    });
+
+    it("aborts the shared request only when every waiting caller has aborted", async () => {
+      const cache = new SuggestionCache();
+      let requestSignal;
+      const load = jest.fn((signal) => {
+        requestSignal = signal;
+        return new Promise(() => {});
+      });
+      const first = new AbortController();
+      const second = new AbortController();
+
+      const firstDone = cache.fetch("k", load, undefined, first.signal);
+      const secondDone = cache.fetch("k", load, undefined, second.signal);
+      first.abort();
+      await expect(firstDone).rejects.toMatchObject({ name: "AbortError" });
+      expect(requestSignal.aborted).toBe(false);
+
+      second.abort();
+      await expect(secondDone).rejects.toMatchObject({ name: "AbortError" });
+      expect(requestSignal.aborted).toBe(true);
+      expect(cache.stats.aborted).toBe(1);
+      expect(getAbortedRequestCount()).toBe(1);
+
+      // The aborted request is forgotten; the next caller starts a new one.
+      cache.fetch("k", load);
+      expect(load).toHaveBeenCalledTimes(2);
+    });
+
+    it("does not count an abort after the request finished", async () => {
+      const cache = new SuggestionCache();
+      const controller = new AbortController();
+
+      await cache.fetch("k", () => Promise.resolve("ok"), undefined, controller.signal);
+      controller.abort();
+
+      expect(cache.stats.aborted).toBe(0);
+      expect(getAbortedRequestCount()).toBe(0);
+      expect(cache.get("k")).toBe("ok");
+    });
+  });
+});
@@ -0,0 +1,251 @@
+// This file is part of Invenio-Modular-Deposit-Form
+// Copyright (C) 2026 Mesh Research
+//
+// Invenio-Modular-Deposit-Form is free software; you can redistribute it and/or modify it
+// under the terms of the MIT License; see the LICENSE file for more details.
+//
+// Local search over a whole (small) vocabulary for `RemoteSelectField`.
+//
+// A field with `vocabularySnapshotUrl` set downloads every item of its vocabulary once from
+// the `/api/modular-deposit-form/vocabularies/<type>/snapshot` endpoint
+// (views/vocabulary_snapshot.py), and answers each query from an in-memory prefix index
+// instead of calling `/api/vocabularies/<type>` on every keystroke.
+//
+// The snapshot is kept in `localStorage` with its `revision`. On the next page load the
+// stored revision is sent as `If-None-Match`; a `304` reuses the stored copy, so an unchanged
+// vocabulary costs one small request per page. Each URL is loaded at most once per page,
+// shared by every field using it.
+//
+// Loading fails soft: a network error, a `404` (type not enabled on the server) or an
+// incomplete snapshot resolves to `null` and the field keeps using its API.
+//
+// Matching: the query is split into words; each word must be a prefix of some word of the
+// item's id, title or string props ("pol" finds "Polish", "en" finds the item with
+// `props.alpha_2 === "en"`). Case and diacritics are ignored. Exact id/prop matches rank
+// first, then exact titles, then titles starting with the query, then the rest by length.
+
+import axios from "axios";
+
+const STORAGE_PREFIX = "imdf-vocabulary-snapshot:";
+
+/**
+ * Lower-case `text` and strip diacritics.
+ *
+ * @param {*} text
+ * @returns {string}
+ */
+function normalize(text) {
+  return String(text ?? "")
+    .normalize("NFD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase();
+}
+
+/**
+ * @param {string} normalized - output of {@link normalize}
+ * @returns {string[]} the words of `normalized`
+ */
+function words(normalized) {
+  return normalized.split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+}
+
+/**
+ * @param {Object} props - vocabulary item props
+ * @returns {string[]} normalized string values (array values flattened)
+ */
+function propValues(props) {
+  return Object.values(props ?? {})
+    .flat()
+    .filter((value) => typeof value === "string" && value)
+    .map(normalize);
+}
+
+class VocabularySnapshotIndex {
+  /**
+   * @param {Object[]} hits - vocabulary items in the `/api/vocabularies` UI hit shape
+   */
+  constructor(hits) {
+    this.hits = hits;
+    this.titles = hits.map((hit) => normalize(hit.title_l10n));
+    // Exact-match keys per item: id and prop values.
+    this.keys = hits.map((hit) => new Set([normalize(hit.id), ...propValues(hit.props)]));
+    // Word -> positions of the items containing it; the sorted distinct words are
+    // binary-searched for prefixes.
+    this.postings = new Map();
+    hits.forEach((hit, i) => {
+      const tokens = new Set(words(this.titles[i]));
+      this.keys[i].forEach((key) => words(key).forEach((token) => tokens.add(token)));
+      tokens.forEach((token) => {
+        const positions = this.postings.get(token);
+        if (positions) positions.push(i);
+        else this.postings.set(token, [i]);
+      });
+    });
+    this.tokens = [...this.postings.keys()].sort();
+  }
+
+  /**
+   * @param {string} prefix - normalized word
+   * @returns {Set<number>} positions of the items with a word starting with `prefix`
+   */
+  _prefixMatches(prefix) {
+    let lo = 0;
+    let hi = this.tokens.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.tokens[mid] < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+    const found = new Set();
+    for (let i = lo; i < this.tokens.length && this.tokens[i].startsWith(prefix); i++) {
+      this.postings.get(this.tokens[i]).forEach((position) => found.add(position));
+    }
+    return found;
+  }
+
+  /**
+   * @param {number} i - item position
+   * @param {string} query - normalized query
+   * @returns {number} rank bucket, lower is better
+   */
+  _rank(i, query) {
+    if (this.keys[i].has(query)) return 0;
+    if (this.titles[i] === query) return 1;
+    if (this.titles[i].startsWith(query)) return 2;
+    return 3;
+  }
+
+  /**
+   * Return the best `size` items for `query`.
+   *
+   * @param {string} query - raw search text
+   * @param {number} [size]
+   * @returns {Object[]} hits; the first `size` items when the query is empty
+   */
+  search(query, size = 20) {
+    const normalized = normalize(query).trim();
+    const terms = words(normalized);
+    if (terms.length === 0) return this.hits.slice(0, size);
+
+    let matches = null;
+    for (const term of terms) {
+      const found = this._prefixMatches(term);
+      matches = matches ? new Set([...matches].filter((i) => found.has(i))) : found;
+      if (matches.size === 0) return [];
+    }
+    return [...matches]
+      .map((i) => [this._rank(i, normalized), i])
+      .sort(
+        ([rankA, a], [rankB, b]) =>
+          rankA - rankB ||
+          this.titles[a].length - this.titles[b].length ||
+          (this.titles[a] < this.titles[b] ? -1 : this.titles[a] > this.titles[b] ? 1 : 0)
+      )
+      .slice(0, size)
+      .map(([, i]) => this.hits[i]);
+  }
+}
+
+/**
+ * @returns {Storage|null} `localStorage`, or null when unavailable (private mode, SSR)
+ */
+function defaultStorage() {
+  try {
+    return typeof window !== "undefined" ? window.localStorage : null;
+  } catch (e) {
+    return null;
+  }
+}
+
+/**
+ * @param {Storage|null} storage
+ * @param {string} key
+ * @returns {Object|null} the stored snapshot, or null when absent or unreadable
+ */
+function readStored(storage, key) {
+  try {
+    const stored = JSON.parse(storage?.getItem(key) ?? "null");
+    return stored?.revision && Array.isArray(stored.hits) ? stored : null;
+  } catch (e) {
+    return null;
+  }
+}
+
+/**
+ * @param {Storage|null} storage
+ * @param {string} key
+ * @param {Object} snapshot
+ */
+function writeStored(storage, key, snapshot) {
+  try {
+    storage?.setItem(key, JSON.stringify(snapshot));
+  } catch (e) {
+    // Quota exceeded or storage disabled: the snapshot is still used for this page.
+  }
+}
+
+/**
+ * Download (or revalidate the stored copy of) one snapshot and index it.
+ *
+ * @param {string} url
+ * @param {Storage|null} storage
+ * @returns {Promise<VocabularySnapshotIndex|null>}
+ */
+async function fetchSnapshot(url, storage) {
+  const key = `${STORAGE_PREFIX}${url}`;
+  const stored = readStored(storage, key);
+  const response = await axios.get(url, {
+    headers: stored ? { "If-None-Match": `"${stored.revision}"` } : {},
+    validateStatus: (status) => status === 200 || (status === 304 && !!stored),
+  });
+  const snapshot = response.status === 304 ? stored : response.data;
+  if (response.status !== 304) writeStored(storage, key, snapshot);
+  if (!snapshot?.complete || !Array.isArray(snapshot.hits)) return null;
+  return new VocabularySnapshotIndex(snapshot.hits);
+}
+
+const loaded = new Map();
+
+/**
+ * Return the index for the snapshot at `url`, loading it once per page.
+ *
+ * @param {string} url - snapshot endpoint
+ * @param {Object} [options]
+ * @param {Storage|null} [options.storage] - persistent copy; defaults to `localStorage`
+ * @returns {Promise<VocabularySnapshotIndex|null>} null when the snapshot is unavailable
+ */
+function loadVocabularySnapshot(url, { storage = defaultStorage() } = {}) {
+  if (!loaded.has(url)) {
+    loaded.set(
+      url,
+      fetchSnapshot(url, storage).catch((e) => {
+        console.warn(`Vocabulary snapshot ${url} unavailable; searching the API instead.`, e);
+        return null;
+      })
+    );
+  }
+  return loaded.get(url);
+}
+
+/**
+ * Fill the `vocabulary_snapshot_url` template from the deposit config.
+ *
+ * @param {string} [template] - e.g. `/api/.../vocabularies/{vocabulary_id}/snapshot`
+ * @param {string} vocabularyId
+ * @returns {string|undefined} undefined when snapshots are turned off
+ */
+function vocabularySnapshotUrl(template, vocabularyId) {
+  return template ? template.replace("{vocabulary_id}", vocabularyId) : undefined;
+}
+
+/** Forget loaded snapshots (tests). Stored copies are kept. */
+function clearLoadedVocabularySnapshots() {
+  loaded.clear();
+}
+
+export {
+  VocabularySnapshotIndex,
+  clearLoadedVocabularySnapshots,
+  loadVocabularySnapshot,
+  vocabularySnapshotUrl,
+};
@@ -0,0 +1,97 @@
+import axios from "axios";
+import {
+  VocabularySnapshotIndex,
+  clearLoadedVocabularySnapshots,
+  loadVocabularySnapshot,
+  vocabularySnapshotUrl,
+} from "./vocabularySnapshot";
+
+const LANGUAGES = [
+  { id: "fra", title_l10n: "French", props: { alpha_2: "fr" } },
+  { id: "fry", title_l10n: "Western Frisian", props: { alpha_2: "fy" } },
+  { id: "frr", title_l10n: "Northern Frisian" },
+  { id: "pol", title_l10n: "Polish", props: { alpha_2: "pl" } },
+  { id: "eng", title_l10n: "English", props: { alpha_2: "en" } },
+  { id: "enm", title_l10n: "Middle English (1100-1500)" },
+  { id: "nob", title_l10n: "Norwegian Bokmål", props: { alpha_2: "nb" } },
+];
+
+const URL = "/api/modular-deposit-form/vocabularies/languages/snapshot";
+
+const memoryStorage = () => {
+  const items = new Map();
+  return {
+    getItem: (key) => (items.has(key) ? items.get(key) : null),
+    setItem: (key, value) => items.set(key, String(value)),
+  };
+};
+
+describe("VocabularySnapshotIndex", () => {
+  const index = new VocabularySnapshotIndex(LANGUAGES);
+  const ids = (hits) => hits.map((hit) => hit.id);
+
+  it("matches word prefixes of titles, ids and props, ignoring case and accents", () => {
+    expect(ids(index.search("POL"))).toEqual(["pol"]);
+    expect(ids(index.search("frisian"))).toEqual(["fry", "frr"]);
+    expect(ids(index.search("bokmal"))).toEqual(["nob"]);
+    expect(ids(index.search("eng"))).toEqual(["eng", "enm"]);
+  });
+
+  it("ranks exact id and prop matches first and requires every word", () => {
+    expect(ids(index.search("fr"))[0]).toBe("fra");
+    expect(ids(index.search("en"))[0]).toBe("eng");
+    expect(ids(index.search("middle eng"))).toEqual(["enm"]);
+    expect(index.search("middle pol")).toEqual([]);
+  });
+
+  it("returns the first items for an empty query and honours size", () => {
+    expect(ids(index.search("", 2))).toEqual(["fra", "fry"]);
+    expect(index.search("fr", 1)).toHaveLength(1);
+  });
+});
+
+describe("loadVocabularySnapshot", () => {
+  beforeEach(() => clearLoadedVocabularySnapshots());
+
+  it("downloads once per page and revalidates the stored copy on the next", async () => {
+    const storage = memoryStorage();
+    axios.get.mockResolvedValueOnce({
+      status: 200,
+      data: { revision: "r1", complete: true, hits: LANGUAGES },
+    });
+
+    const first = loadVocabularySnapshot(URL, { storage });
+    expect(loadVocabularySnapshot(URL, { storage })).toBe(first);
+    expect((await first).search("polish")[0].id).toBe("pol");
+    expect(axios.get).toHaveBeenCalledTimes(1);
+
+    // Next page load: the stored revision is sent and a 304 reuses the stored hits.
+    clearLoadedVocabularySnapshots();
+    axios.get.mockResolvedValueOnce({ status: 304, data: "" });
+    const index = await loadVocabularySnapshot(URL, { storage });
+
+    expect(axios.get.mock.calls[1][1].headers).toEqual({ "If-None-Match": '"r1"' });
+    expect(index.search("english")[0].id).toBe("eng");
+  });
+
+  it("resolves to null when the snapshot is unavailable or incomplete", async () => {
+    jest.spyOn(console, "warn").mockImplementation(() => {});
+    axios.get.mockRejectedValueOnce(new Error("404"));
+    await expect(loadVocabularySnapshot(URL, { storage: null })).resolves.toBeNull();
+
+    axios.get.mockResolvedValueOnce({
+      status: 200,
+      data: { revision: "r2", complete: false, hits: LANGUAGES },
+    });
+    await expect(loadVocabularySnapshot(`${URL}?2`, { storage: null })).resolves.toBeNull();
+  });
+});
+
+describe("vocabularySnapshotUrl", () => {
+  it("fills the configured template", () => {
+    expect(
+      vocabularySnapshotUrl("/api/x/vocabularies/{vocabulary_id}/snapshot", "languages")
+    ).toBe("/api/x/vocabularies/languages/snapshot");
+    expect(vocabularySnapshotUrl(undefined, "languages")).toBeUndefined();
+  });
+});
@@ -43,6 +43,9 @@ class DepositBootstrapComponent extends Component {
   submitContext = undefined;
 
   setSubmitContext = (actionName, extra = {}) => {
+    // Submit buttons set the context right before submitting: make the validation that
+    // precedes the submit check the whole record (see validation/workerValidate.js).
+    this.props.validate?.requestFullValidation?.();
     this.submitContext = {
       actionName: actionName,
       extra: extra,
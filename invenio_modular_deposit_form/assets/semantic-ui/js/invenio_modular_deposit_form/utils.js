@@ -352,6 +352,28 @@ function getResolvedFormPages(formPages, currentTypePageConfigs, fieldsByType, r
   );
 }
 
+/**
+ * Looks up the server-compiled FormPage rows for one resource type (`resolved_form_pages` from
+ * `invenio_modular_deposit_form.layout_compiler`). Same rows as {@link getResolvedFormPages},
+ * without walking `same_as` chains in the browser.
+ *
+ * Returns `null` when the table is absent, the type was not compiled (e.g. no `fields_by_type`
+ * entry), or the row count does not match `formPages`; callers then resolve at runtime.
+ *
+ * @param {Object|undefined} resolvedFormPagesTable - `{ pages: Object[], by_type: { [typeId]: number[] } }`
+ * @param {string} [resourceTypeId] - Selected resource type id
+ * @param {Array} formPages - FormPages subsection array from common_fields
+ * @returns {Array<Object>|null}
+ */
+function getCompiledFormPages(resolvedFormPagesTable, resourceTypeId, formPages) {
+  const indexes = resolvedFormPagesTable?.by_type?.[resourceTypeId];
+  const pages = resolvedFormPagesTable?.pages;
+  if (!Array.isArray(indexes) || !Array.isArray(pages)) return null;
+  if (indexes.length !== (formPages ?? []).length) return null;
+  const compiled = indexes.map((i) => pages[i]);
+  return compiled.every((page) => page != null && typeof page === "object") ? compiled : null;
+}
+
 /**
  * Keep merged pages that have at least one subsection (stepper, sidebar, main column).
  * Pass the array returned by {@link getResolvedFormPages}; do not resolve inside this helper.
@@ -820,6 +842,7 @@ export {
   flattenKeysDotJoined,
   flattenWrappers,
   focusFirstElement,
+  getCompiledFormPages,
   getComputerVisibleFallbackPage,
   getPageIdsHiddenAtComputer,
   getErrorParent,
@@ -23,6 +23,7 @@ import {
   findPageIdContainingComponent,
   flattenKeysDotJoined,
   focusFirstElement,
+  getCompiledFormPages,
   getComputerVisibleFallbackPage,
   getErrorParent,
   getReadableFields,
@@ -167,6 +168,32 @@ describe('getResolvedFormPages / filterVisibleFormPages', () => {
   });
 });
 
+describe('getCompiledFormPages', () => {
+  const formPages = [{ section: 'page-a' }, { section: 'page-b' }];
+  const table = {
+    pages: [
+      { section: 'page-a', label: 'A', subsections: [] },
+      { section: 'page-b', label: 'B', subsections: [] },
+      { section: 'page-b', label: 'Book B', subsections: [{ component: 'TitlesComponent' }] },
+    ],
+    by_type: { plain: [0, 1], book: [0, 2] },
+  };
+
+  test('indexes the compiled rows for the selected type', () => {
+    expect(getCompiledFormPages(table, 'book', formPages)).toEqual([table.pages[0], table.pages[2]]);
+    expect(getCompiledFormPages(table, 'plain', formPages)[1].label).toBe('B');
+  });
+
+  test('returns null when the table does not cover the type', () => {
+    expect(getCompiledFormPages(undefined, 'book', formPages)).toBe(null);
+    expect(getCompiledFormPages(table, 'other', formPages)).toBe(null);
+    expect(getCompiledFormPages(table, 'book', formPages.slice(1))).toBe(null);
+    expect(getCompiledFormPages({ ...table, by_type: { book: [0, 9] } }, 'book', formPages)).toBe(
+      null
+    );
+  });
+});
+
 describe('resolved + visible form pages (integration)', () => {
   const formPages = [
     {
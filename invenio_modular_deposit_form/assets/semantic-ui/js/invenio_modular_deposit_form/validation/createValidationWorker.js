@@ -0,0 +1,25 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Kept apart from workerValidate.js because `import.meta` only parses in the webpack
+// build; Jest maps this module to __mocks__/createValidationWorker.js.
+
+/**
+ * Start the validation worker.
+ *
+ * @returns {Worker|null} null when the browser cannot run module workers
+ */
+function createValidationWorker() {
+  if (typeof Worker === "undefined") return null;
+  try {
+    return new Worker(new URL("./validationWorker.js", import.meta.url));
+  } catch (e) {
+    console.warn("Could not start the validation worker; validating on the page.", e);
+    return null;
+  }
+}
+
+export { createValidationWorker };
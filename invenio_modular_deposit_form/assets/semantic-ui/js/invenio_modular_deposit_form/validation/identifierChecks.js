@@ -0,0 +1,646 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Compiled identifier checks: one plain function per scheme, looked up in
+// `IDENTIFIER_CHECKS`.
+//
+// Each check takes the raw value and returns null when it is valid, or a frozen failure
+// `{ message, fixed }`. `message` is the scheme's default message. Callers may replace it
+// with their own unless `fixed` is set, which marks messages about the type of the value
+// rather than its content (e.g. "ORCID must be a string"). The yup methods in
+// validatorsForIds.js and the identifier row tests in identifierSchemeValidators.js both
+// dispatch through this table, so a value gets the same result everywhere.
+//
+// Everything a check needs is built once at import time: regexes are module constants,
+// messages are translated once, and the checksum routines (ISNI, ORCID, ISBN, EAN-13,
+// ISSN, ISTC) read character codes in place instead of building cleaned-up copies of
+// the value. A creator list with hundreds of identifiers is therefore checked without
+// building a Yup schema or a throwaway string per row.
+//
+// `validateIdentifiers(batch)` checks many `{ scheme, identifier }` entries in one pass
+// (e.g. a pasted list), with the same scheme rules and messages as the deposit form.
+
+import { i18next } from "@translations/invenio_modular_deposit_form/i18next";
+
+/** Uppercase scheme id for user-visible copy (e.g. `ror` → `ROR`). */
+export function schemeIdLabelUppercase(schemeId) {
+  return String(schemeId ?? "").toUpperCase();
+}
+
+/** Default invalid/required messages using the scheme id in uppercase. */
+export function identifierMessagesForScheme(schemeId) {
+  const scheme = schemeIdLabelUppercase(schemeId);
+  return {
+    invalid: i18next.t("This is not a valid {{scheme}} identifier.", { scheme }),
+    required: i18next.t("You must provide a {{scheme}} identifier or remove this row", { scheme }),
+  };
+}
+
+export function defaultInvalidMessageForScheme(schemeId) {
+  return identifierMessagesForScheme(schemeId).invalid;
+}
+
+export function defaultInvalidMessageForSchemeWithDetail(schemeId, detail) {
+  const scheme = schemeIdLabelUppercase(schemeId);
+  return i18next.t("This is not a valid {{scheme}} identifier ({{detail}}).", {
+    scheme,
+    detail,
+  });
+}
+
+/**
+ * Generic fallback for the parent-scheme Yup `.test` wrapper ({@link validIdentifierForScheme} in identifierSchemeValidators).
+ * Per-scheme validation still uses {@link identifierMessagesForScheme}.
+ */
+export const DEFAULT_GENERIC_IDENTIFIER_INVALID_MESSAGE = i18next.t(
+  "This is not a valid identifier for this scheme."
+);
+
+const DEFAULT_ID_REQUIRED_MSG = i18next.t("Add an identifier or remove this row");
+
+/** Shown when `parent.scheme` is not in the configured `allowedSchemeIds` list. */
+const SCHEME_NOT_ALLOWED_MSG = i18next.t("This identifier scheme is not allowed.");
+
+/**
+ * Order for trying schemes when the UI only has a free-text identifier (creatibutor modal).
+ * Matches common ambiguity resolution (ORCID vs other person/org PIDs).
+ */
+const CREATOR_IDENTIFIER_INFERENCE_ORDER = ["orcid", "isni", "ror", "gnd"];
+
+/**
+ * User-facing message when a non-empty string does not match any allowed creator scheme.
+ *
+ * @param {string[]} allowedSchemeIds
+ * @returns {string}
+ */
+function unrecognizedCreatorIdentifierMessage(allowedSchemeIds) {
+  const labels = (allowedSchemeIds ?? []).map(schemeIdLabelUppercase).join(", ");
+  return i18next.t("This identifier is not valid for any supported scheme ({{schemes}}).", {
+    schemes: labels,
+  });
+}
+
+const failure = (message, fixed = false) => Object.freeze({ message, fixed });
+
+const isEmpty = (value) => value === undefined || value === null || value === "";
+
+// Character codes used by the checksum routines.
+const CODE_0 = 48;
+const CODE_SPACE = 32;
+const CODE_HYPHEN = 45;
+const CODE_X = 88;
+const CODE_LOWER_X = 120;
+
+/** @returns {number} the digit value of a character code, or -1 */
+function digitAt(value, i) {
+  const d = value.charCodeAt(i) - CODE_0;
+  return d >= 0 && d <= 9 ? d : -1;
+}
+
+/** @returns {number} the hex digit value of a character code (either case), or -1 */
+function hexDigitAt(value, i) {
+  const d = digitAt(value, i);
+  if (d >= 0) return d;
+  const code = value.charCodeAt(i) | 0x20;
+  return code >= 97 && code <= 102 ? code - 87 : -1;
+}
+
+/** Hyphens and spaces are ignored by the ISNI, ISSN and ISTC checksums. */
+const isSeparator = (code) => code === CODE_HYPHEN || code === CODE_SPACE;
+
+/** Characters matched by `\s`, which the ISBN checksum ignores along with hyphens. */
+function isWhitespace(code) {
+  return (
+    (code >= 9 && code <= 13) ||
+    code === 32 ||
+    code === 0xa0 ||
+    code === 0x1680 ||
+    (code >= 0x2000 && code <= 0x200a) ||
+    code === 0x2028 ||
+    code === 0x2029 ||
+    code === 0x202f ||
+    code === 0x205f ||
+    code === 0x3000 ||
+    code === 0xfeff
+  );
+}
+
+/** @returns {number} number of characters of `value` not skipped by `skip` */
+function countSignificant(value, skip) {
+  let count = 0;
+  for (let i = 0; i < value.length; i++) {
+    if (!skip(value.charCodeAt(i))) count++;
+  }
+  return count;
+}
+
+/**
+ * ISO 7064 MOD 11-2 over 15 digits followed by a check character (digit or X), skipping
+ * separators. Shared by ISNI and ORCID.
+ *
+ * @returns {boolean}
+ */
+function mod11_2Valid(value, start) {
+  let total = 0;
+  let position = 0;
+  for (let i = start; i < value.length; i++) {
+    const code = value.charCodeAt(i);
+    if (isSeparator(code)) continue;
+    if (position < 15) {
+      const d = digitAt(value, i);
+      if (d < 0) return false;
+      total = (total + d) * 2;
+    } else {
+      const check = code === CODE_X || code === CODE_LOWER_X ? 10 : digitAt(value, i);
+      return check === (12 - (total % 11)) % 11;
+    }
+    position++;
+  }
+  return false;
+}
+
+/** EAN-13 checksum of 13 significant digits from `start`, skipping `skip` characters. */
+function ean13Valid(value, start = 0, skip = () => false) {
+  let total = 0;
+  let position = 0;
+  for (let i = start; i < value.length; i++) {
+    if (skip(value.charCodeAt(i))) continue;
+    const d = digitAt(value, i);
+    if (d < 0) return false;
+    if (position < 12) {
+      total += position % 2 === 0 ? d : d * 3;
+    } else {
+      return d === (10 - (total % 10)) % 10;
+    }
+    position++;
+  }
+  return false;
+}
+
+// See https://ror.org/facts/#core-components.
+const ROR_REGEXP = /^(?:(?:https?:\/\/)?ror.org\/)?(0\w{6}\d{2})$/i;
+const ROR_EMPTY = failure(i18next.t("ROR identifier cannot be empty"), true);
+const ROR_INVALID = failure(defaultInvalidMessageForScheme("ror"));
+
+function checkRor(value) {
+  if (typeof value !== "string") return ROR_EMPTY;
+  return ROR_REGEXP.test(value) ? null : ROR_INVALID;
+}
+
+const ISNI_LENGTH = failure(
+  defaultInvalidMessageForSchemeWithDetail("isni", "it must be 16 characters")
+);
+const ISNI_INVALID = failure(defaultInvalidMessageForScheme("isni"));
+
+function checkIsni(value) {
+  if (typeof value !== "string") return ISNI_INVALID;
+  if (countSignificant(value, isSeparator) !== 16) return ISNI_LENGTH;
+  return mod11_2Valid(value, 0) ? null : ISNI_INVALID;
+}
+
+// Resolver prefixes as stripped by idutils.is_gnd, then `gnd_regexp`:
+// 1. Start with 1 followed by optional 0, 1, or 2, then 7 digits and a check digit (X or number)
+// 2. Start with 4 or 7 followed by 6 digits and a hyphen and a digit
+// 3. Start with 1-9 followed by 0-7 digits and a hyphen and a check digit (X or number)
+// 4. Start with 3 followed by 7 digits and a check digit (X or number)
+const GND_REGEXP =
+  /^(?:(?:https?:\/\/)?d-nb\.info\/gnd\/)?(?:gnd:|GND:)?(1[012]?\d{7}[0-9X]|(?:4|7)\d{6}-\d|(?:[1-9])\d{0,7}-[0-9X]|(?:3)\d{7}[0-9X])$/;
+const GND_EMPTY = failure(i18next.t("GND identifier cannot be empty"), true);
+const GND_INVALID = failure(defaultInvalidMessageForScheme("gnd"));
+
+function checkGnd(value) {
+  if (typeof value !== "string") return GND_EMPTY;
+  return GND_REGEXP.test(value) ? null : GND_INVALID;
+}
+
+// Bare or orcid.org URL form; the four blocks are either all hyphenated or not at all.
+const ORCID_REGEXP =
+  /^(?:(?:https?:\/\/)?orcid\.org\/)?(?:\d{4}-\d{4}-\d{4}-\d{3}|\d{15})[\dX]$/i;
+const ORCID_NOT_STRING = failure(i18next.t("ORCID must be a string"), true);
+const ORCID_INVALID = failure(defaultInvalidMessageForScheme("orcid"));
+
+function checkOrcid(value) {
+  if (typeof value !== "string") return ORCID_NOT_STRING;
+  if (!ORCID_REGEXP.test(value)) return ORCID_INVALID;
+  return mod11_2Valid(value, value.lastIndexOf("/") + 1) ? null : ORCID_INVALID;
+}
+
+const ARK_SUFFIX_REGEXP = /^ark:\/?[0-9bcdfghjkmnpqrstvwxz]+\/.+$/i;
+const ARK_NOT_STRING = failure(i18next.t("ARK must be a string"));
+const ARK_INVALID = failure(i18next.t("This is not a valid ARK identifier."));
+
+function checkArk(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return ARK_NOT_STRING;
+  if (ARK_SUFFIX_REGEXP.test(value)) return null;
+  try {
+    const u = new URL(value);
+    return u.protocol === "http:" && u.hostname && ARK_SUFFIX_REGEXP.test(u.pathname.slice(1))
+      ? null
+      : ARK_INVALID;
+  } catch {
+    return ARK_INVALID;
+  }
+}
+
+const ARXIV_POST_2007_REGEXP = /^(arxiv:)?(\d{4})\.(\d{4,5})(v\d+)?$/i;
+const ARXIV_PRE_2007_REGEXP = /^(arxiv:)?([a-z\-]+)(\.[a-z]{2})?(\/\d{4})(\d+)(v\d+)?$/i;
+const ARXIV_WITH_CLASS_REGEXP =
+  /^(arxiv:)?(?:[a-z\-]+)(?:\.[a-z]{2})?\/(\d{4})\.(\d{4,5})(v\d+)?$/i;
+const ARXIV_NOT_STRING = failure(i18next.t("arXiv must be a string"));
+const ARXIV_INVALID = failure(i18next.t("This is not a valid arXiv identifier."));
+
+function checkArxiv(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return ARXIV_NOT_STRING;
+  const v = value.trim();
+  return ARXIV_POST_2007_REGEXP.test(v) ||
+    ARXIV_PRE_2007_REGEXP.test(v) ||
+    ARXIV_WITH_CLASS_REGEXP.test(v)
+    ? null
+    : ARXIV_INVALID;
+}
+
+const ADS_REGEXP = /^(ads:|ADS:)?(\d{4}[A-Za-z]\S{13}[A-Za-z.:])$/;
+const ADS_NOT_STRING = failure(i18next.t("ADS/Bibcode must be a string"));
+const ADS_INVALID = failure(i18next.t("This is not a valid ADS/Bibcode identifier."));
+
+function checkAds(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return ADS_NOT_STRING;
+  // idutils.is_ads uses unicodedata.normalize("NFKD", val) before matching ads_regexp.
+  return ADS_REGEXP.test(value.normalize("NFKD").trim()) ? null : ADS_INVALID;
+}
+
+const EAN13_INVALID = failure(i18next.t("This is not a valid EAN-13 identifier."));
+
+function checkEan13(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string" || value.length !== 13) return EAN13_INVALID;
+  return ean13Valid(value) ? null : EAN13_INVALID;
+}
+
+const ISSN_INVALID = failure(i18next.t("This is not a valid ISSN."));
+
+// Used for issn, eissn and lissn. As in idutils.is_issn, X counts as 10 in any position.
+function checkIssn(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string" || countSignificant(value, isSeparator) !== 8) {
+    return ISSN_INVALID;
+  }
+  let total = 0;
+  let weight = 8;
+  for (let i = 0; i < value.length; i++) {
+    const code = value.charCodeAt(i);
+    if (isSeparator(code)) continue;
+    const d = code === CODE_X || code === CODE_LOWER_X ? 10 : digitAt(value, i);
+    if (d < 0) return ISSN_INVALID;
+    total += weight * d;
+    weight--;
+  }
+  return total % 11 === 0 ? null : ISSN_INVALID;
+}
+
+const ISBN_INVALID = failure(i18next.t("This is not a valid ISBN."));
+
+const isIsbnSeparator = (code) => code === CODE_HYPHEN || isWhitespace(code);
+
+/** @returns {number} index of the first character not skipped by the ISBN checksum */
+function firstIsbnCharacter(value) {
+  let i = 0;
+  while (i < value.length && isIsbnSeparator(value.charCodeAt(i))) i++;
+  return i;
+}
+
+/** @returns {boolean} whether the significant characters from `start` begin with `prefix` */
+function startsWithSignificant(value, start, prefix) {
+  let position = 0;
+  for (let i = start; i < value.length && position < prefix.length; i++) {
+    const code = value.charCodeAt(i);
+    if (isIsbnSeparator(code)) continue;
+    if (code !== prefix.charCodeAt(position)) return false;
+    position++;
+  }
+  return position === prefix.length;
+}
+
+/** ISBN-10 checksum (weights 10..2, check character digit or X). */
+function isbn10Valid(value, start) {
+  let total = 0;
+  let position = 0;
+  for (let i = start; i < value.length; i++) {
+    const code = value.charCodeAt(i);
+    if (isIsbnSeparator(code)) continue;
+    if (position < 9) {
+      const d = digitAt(value, i);
+      if (d < 0) return false;
+      total += (10 - position) * d;
+    } else {
+      const check = code === CODE_X || code === CODE_LOWER_X ? 10 : digitAt(value, i);
+      return check === (11 - (total % 11)) % 11;
+    }
+    position++;
+  }
+  return false;
+}
+
+// ISBN-10 or ISBN-13. Mirrors idutils.is_isbn (isbnlib).
+function checkIsbn(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return ISBN_INVALID;
+  const length = countSignificant(value, isIsbnSeparator);
+  const start = firstIsbnCharacter(value);
+  if (length === 10) return isbn10Valid(value, start) ? null : ISBN_INVALID;
+  if (
+    length === 13 &&
+    (startsWithSignificant(value, start, "978") || startsWithSignificant(value, start, "979"))
+  ) {
+    return ean13Valid(value, start, isIsbnSeparator) ? null : ISBN_INVALID;
+  }
+  return ISBN_INVALID;
+}
+
+const ISTC_WEIGHTS = [11, 9, 3, 1];
+const ISTC_INVALID = failure(i18next.t("This is not a valid ISTC identifier."));
+
+function checkIstc(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string" || countSignificant(value, isSeparator) !== 16) {
+    return ISTC_INVALID;
+  }
+  let total = 0;
+  let position = 0;
+  for (let i = 0; i < value.length; i++) {
+    if (isSeparator(value.charCodeAt(i))) continue;
+    const d = hexDigitAt(value, i);
+    if (d < 0) return ISTC_INVALID;
+    if (position < 15) {
+      total += d * ISTC_WEIGHTS[position % 4];
+    } else {
+      return d === total % 16 ? null : ISTC_INVALID;
+    }
+    position++;
+  }
+  return ISTC_INVALID;
+}
+
+const HANDLE_REGEXP = /^(hdl:\s*|(?:https?:\/\/)?hdl\.handle\.net\/)?([^/.]+(\.[^/.]+)*\/.*)$/i;
+const HANDLE_NOT_STRING = failure(i18next.t("Handle must be a string"));
+const HANDLE_INVALID = failure(i18next.t("This is not a valid Handle."));
+
+function checkHandle(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return HANDLE_NOT_STRING;
+  return HANDLE_REGEXP.test(value.trim()) ? null : HANDLE_INVALID;
+}
+
+const LSID_REGEXP = /^urn:lsid:[^:]+(:[^:]+){2,3}$/i;
+const LSID_NOT_STRING = failure(i18next.t("LSID must be a string"));
+const LSID_INVALID = failure(i18next.t("This is not a valid LSID identifier."));
+
+function checkLsid(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return LSID_NOT_STRING;
+  if (!LSID_REGEXP.test(value)) return LSID_INVALID;
+  try {
+    const u = new URL(value);
+    return u.protocol === "urn:" && u.hostname === "" && u.pathname ? null : LSID_INVALID;
+  } catch {
+    return null;
+  }
+}
+
+const PMID_REGEXP = /^(pmid:|https?:\/\/pubmed\.ncbi\.nlm\.nih\.gov\/)?(\d+)\/?$/i;
+const PMID_NOT_STRING = failure(i18next.t("PMID must be a string"));
+const PMID_INVALID = failure(i18next.t("This is not a valid PubMed ID."));
+
+function checkPmid(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return PMID_NOT_STRING;
+  return PMID_REGEXP.test(value.trim()) ? null : PMID_INVALID;
+}
+
+const PURL_HOSTS = new Set(["purl.org", "purl.oclc.org", "purl.net", "purl.com", "purl.fdlp.gov"]);
+const PURL_NOT_STRING = failure(i18next.t("PURL must be a string"));
+const PURL_INVALID = failure(i18next.t("This is not a valid PURL."));
+
+function checkPurl(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return PURL_NOT_STRING;
+  try {
+    const u = new URL(value);
+    return (u.protocol === "http:" || u.protocol === "https:") &&
+      PURL_HOSTS.has(u.hostname) &&
+      u.pathname
+      ? null
+      : PURL_INVALID;
+  } catch {
+    return PURL_INVALID;
+  }
+}
+
+const URN_NOT_STRING = failure(i18next.t("URN must be a string"));
+const URN_INVALID = failure(i18next.t("This is not a valid URN."));
+
+function checkUrn(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return URN_NOT_STRING;
+  try {
+    const u = new URL(value);
+    return u.protocol === "urn:" && u.hostname === "" && u.pathname ? null : URN_INVALID;
+  } catch {
+    return URN_INVALID;
+  }
+}
+
+const URL_PROTOCOL_REGEXP = /^[a-z][a-z0-9+.-]*:\/\//i;
+const URL_NOT_STRING = failure(i18next.t("URL must be a string"));
+const URL_NO_PROTOCOL = failure(i18next.t("You must include a protocol like https:// in the URL."));
+const URL_INVALID = failure(i18next.t("This is not a valid URL."));
+
+// Mirrors idutils.is_url (urllib.parse.urlparse: truthy scheme and netloc).
+function checkUrl(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return URL_NOT_STRING;
+  const v = value.trim();
+  if (!URL_PROTOCOL_REGEXP.test(v)) return URL_NO_PROTOCOL;
+  try {
+    const u = new URL(v);
+    return u.protocol && u.hostname ? null : URL_INVALID;
+  } catch {
+    return URL_INVALID;
+  }
+}
+
+// Matches python `idutils.is_doi` via `idutils.validators.doi_regexp`.
+// python: (doi:\s*|(?:https?://)?(?:dx\.)?doi\.org/)?(10\.\d+(\.\d+)*/.+)$
+const DOI_REGEXP = /^(doi:\s*|(?:https?:\/\/)?(?:dx\.)?doi\.org\/)?(10\.\d+(\.\d+)*\/.+)$/i;
+const DOI_NOT_STRING = failure(i18next.t("DOI must be a string"));
+const DOI_INVALID = failure(i18next.t("This is not a valid DOI."));
+
+function checkDoi(value) {
+  if (isEmpty(value)) return null;
+  if (typeof value !== "string") return DOI_NOT_STRING;
+  return DOI_REGEXP.test(value.trim()) ? null : DOI_INVALID;
+}
+
+// Schemes without a format (grid, igsn, upc, w3id, other, crossreffunderid).
+// Mirrors server-side always_valid in invenio-rdm-records config.
+const checkAlwaysValid = () => null;
+
+const check = (name, fn) => Object.freeze({ name, check: fn });
+const ARK = check("ark", checkArk);
+const ALWAYS_VALID = check("always_valid", checkAlwaysValid);
+const ISSN = check("issn", checkIssn);
+
+/**
+ * Map scheme id to `{ name, check }`. Matches invenio-rdm-records config:
+ * RDM_RECORDS_PERSONORG_SCHEMES and RDM_RECORDS_IDENTIFIERS_SCHEMES. `name` is the
+ * Yup test name (shared by schemes with the same check, e.g. `issn` for eissn and lissn).
+ */
+const IDENTIFIER_CHECKS = new Map([
+  // RDM_RECORDS_IDENTIFIERS_SCHEMES
+  ["ark", ARK],
+  ["arxiv", check("arxiv", checkArxiv)],
+  ["ads", check("ads", checkAds)],
+  ["crossreffunderid", ALWAYS_VALID],
+  ["doi", check("doi", checkDoi)],
+  ["ean13", check("ean13", checkEan13)],
+  ["eissn", ISSN],
+  ["grid", ALWAYS_VALID],
+  ["handle", check("handle", checkHandle)],
+  ["igsn", ALWAYS_VALID],
+  ["isbn", check("isbn", checkIsbn)],
+  ["isni", check("isni", checkIsni)],
+  ["issn", ISSN],
+  ["istc", check("istc", checkIstc)],
+  ["lissn", ISSN],
+  ["lsid", check("lsid", checkLsid)],
+  ["pmid", check("pmid", checkPmid)],
+  ["purl", check("purl", checkPurl)],
+  ["upc", ALWAYS_VALID],
+  ["url", check("url", checkUrl)],
+  ["urn", check("urn", checkUrn)],
+  ["w3id", ALWAYS_VALID],
+  ["other", ALWAYS_VALID],
+  // RDM_RECORDS_PERSONORG_SCHEMES
+  ["orcid", check("orcid", checkOrcid)],
+  ["gnd", check("gnd", checkGnd)],
+  ["ror", check("ror", checkRor)],
+]);
+
+/**
+ * Check `value` against one scheme's format.
+ *
+ * @param {string} schemeId
+ * @param {*} value
+ * @returns {{message: string, fixed: boolean}|null} null when valid or the scheme has no
+ *   check
+ */
+function checkIdentifier(schemeId, value) {
+  const entry = IDENTIFIER_CHECKS.get(schemeId);
+  return entry ? entry.check(value) : null;
+}
+
+/**
+ * Build a validator for identifier rows, with the scheme list and messages resolved once.
+ *
+ * The validator applies the rules of the deposit form's identifier rows: a scheme outside
+ * `allowedSchemeIds` is rejected; an empty identifier is "required"; otherwise the
+ * scheme's check decides, reporting its `fixed` message or the scheme's invalid message
+ * from {@link identifierMessagesForScheme}. With
+ * `inferScheme`, a row without a scheme gets the first allowed scheme whose check accepts
+ * the trimmed identifier (ORCID, ISNI, ROR and GND first); a non-empty identifier that no
+ * scheme accepts is rejected. Without it, a row without a scheme passes.
+ *
+ * @param {Object} options
+ * @param {string[]} options.allowedSchemeIds
+ * @param {boolean} [options.inferScheme=false]
+ * @returns {function(*, *): {scheme: (string|null), valid: boolean, message: (string|null)}}
+ *   `(scheme, identifier)` validator
+ */
+function createIdentifierValidator({ allowedSchemeIds, inferScheme = false }) {
+  const allowedIds = Array.isArray(allowedSchemeIds) ? allowedSchemeIds : [];
+  const allowed = new Set(allowedIds);
+  const inferenceOrder = [
+    ...CREATOR_IDENTIFIER_INFERENCE_ORDER.filter((id) => allowed.has(id)),
+    ...allowedIds.filter((id) => !CREATOR_IDENTIFIER_INFERENCE_ORDER.includes(id)),
+  ].filter((id) => IDENTIFIER_CHECKS.has(id));
+  let unrecognized = null;
+  const messages = new Map();
+  const messagesFor = (scheme) => {
+    if (!messages.has(scheme)) {
+      const defaults = identifierMessagesForScheme(scheme);
+      messages.set(scheme, {
+        required: IDENTIFIER_CHECKS.has(scheme) ? defaults.required : DEFAULT_ID_REQUIRED_MSG,
+        invalid: defaults.invalid,
+      });
+    }
+    return messages.get(scheme);
+  };
+
+  const infer = (value) => {
+    const v = value == null ? "" : String(value).trim();
+    if (!v) return null;
+    for (const scheme of inferenceOrder) {
+      if (IDENTIFIER_CHECKS.get(scheme).check(v) === null) return scheme;
+    }
+    return null;
+  };
+
+  const result = (scheme, message = null) => ({ scheme, valid: message === null, message });
+
+  return (rawScheme, value) => {
+    let scheme = rawScheme == null ? "" : String(rawScheme).trim();
+    if (!scheme && inferScheme) {
+      scheme = infer(value) ?? "";
+    }
+    if (!scheme) {
+      if (inferScheme && value != null && String(value).trim() !== "") {
+        if (unrecognized === null) unrecognized = unrecognizedCreatorIdentifierMessage(allowedIds);
+        return result(null, unrecognized);
+      }
+      return result(null);
+    }
+    if (!allowed.has(scheme)) return result(scheme, SCHEME_NOT_ALLOWED_MSG);
+    if (isEmpty(value)) return result(scheme, messagesFor(scheme).required);
+    const failed = checkIdentifier(scheme, value);
+    if (failed === null) return result(scheme);
+    return result(scheme, failed.fixed ? failed.message : messagesFor(scheme).invalid);
+  };
+}
+
+/**
+ * Validate many identifiers in one pass, e.g. a pasted list of creator identifiers.
+ *
+ * @param {Iterable<{scheme?: string, identifier?: string}>} batch
+ * @param {Object} [options]
+ * @param {string[]} [options.allowedSchemeIds] - defaults to every scheme in
+ *   {@link IDENTIFIER_CHECKS}
+ * @param {boolean} [options.inferScheme=false] - find the scheme of entries without one
+ * @returns {Array<{scheme: (string|null), valid: boolean, message: (string|null)}>} one
+ *   result per entry, in order; `scheme` is the inferred scheme where one was inferred
+ */
+function validateIdentifiers(
+  batch,
+  { allowedSchemeIds = [...IDENTIFIER_CHECKS.keys()], inferScheme = false } = {}
+) {
+  const validate = createIdentifierValidator({ allowedSchemeIds, inferScheme });
+  const results = [];
+  for (const entry of batch) {
+    results.push(validate(entry?.scheme, entry?.identifier));
+  }
+  return results;
+}
+
+export {
+  checkIdentifier,
+  createIdentifierValidator,
+  CREATOR_IDENTIFIER_INFERENCE_ORDER,
+  IDENTIFIER_CHECKS,
+  unrecognizedCreatorIdentifierMessage,
+  validateIdentifiers,
+};
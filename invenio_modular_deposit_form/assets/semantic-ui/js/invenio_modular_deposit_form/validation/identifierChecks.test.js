@@ -0,0 +1,42 @@
+import { checkIdentifier, IDENTIFIER_CHECKS, validateIdentifiers } from "./identifierChecks";
+import { SCHEME_ID_TO_VALIDATOR } from "./validatorsForIds";
+// Shared with tests/test_identifiers.py, which holds the Python port to the same corpus.
+import IDENTIFIER_FIXTURES from "@custom-test-utils/identifier_fixtures.json";
+
+const { checks: CHECK_FIXTURES, batches: BATCH_FIXTURES } = IDENTIFIER_FIXTURES;
+
+const isValid = (scheme, value) => checkIdentifier(scheme, value) === null;
+
+describe("IDENTIFIER_CHECKS", () => {
+  it("has a check for every scheme with a Yup method", () => {
+    expect([...IDENTIFIER_CHECKS.keys()].sort()).toEqual(
+      Object.keys(SCHEME_ID_TO_VALIDATOR).sort()
+    );
+  });
+
+  it.each(Object.entries(CHECK_FIXTURES))("checks %s values", (scheme, { valid, invalid }) => {
+    valid.forEach((value) => expect(isValid(scheme, value)).toBe(true));
+    invalid.forEach((value) => expect(isValid(scheme, value)).toBe(false));
+  });
+
+  it("keeps type messages fixed and the others overridable", () => {
+    expect(checkIdentifier("orcid", null)).toEqual({
+      message: "ORCID must be a string",
+      fixed: true,
+    });
+    expect(checkIdentifier("isni", "123")).toEqual({
+      message: "This is not a valid ISNI identifier (it must be 16 characters).",
+      fixed: false,
+    });
+    expect(checkIdentifier("other", "anything")).toBeNull();
+  });
+});
+
+describe("validateIdentifiers", () => {
+  it.each(BATCH_FIXTURES.map((batch) => [batch.description, batch]))(
+    "validates %s",
+    (_description, { entries, options, results }) => {
+      expect(validateIdentifiers(entries, options)).toEqual(results);
+    }
+  );
+});
@@ -0,0 +1,279 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Schema validation shared by the validation Web Worker (validationWorker.js) and the
+// main-thread fallback in workerValidate.js.
+//
+// `runValidation` validates exactly like Formik's `validationSchema` prop (empty strings
+// become undefined, all errors collected, nested error object out), so switching between
+// the worker and the main thread never changes which errors a field shows.
+//
+// `createIncrementalValidation` re-validates only the parts of the record that changed.
+// `changedValidationPaths` compares the new values with the previous ones by reference
+// (Formik copies only the path it updates, so this is cheap) and returns the smallest
+// independently valid units that differ: one array row (`metadata.creators[3]`) when an
+// array kept its length, otherwise one field (`metadata.title`, `metadata.creators`) or,
+// outside `metadata` and `custom_fields`, one top-level value (`access`, `pids`). Only those
+// paths are validated with `schema.validateAt` and their errors replace the matching
+// subtrees of the previous errors. The default validator's tests never look beyond their
+// own row or top-level object, so the merged errors equal those of a full run. The first
+// run, a run after `requestFullValidation` (before submit) and a run with many changed
+// paths validate the whole record.
+//
+// `createValidationRunner` is the worker's message handler:
+//   - `{type: "configure", config, language}` builds the schema. The language is applied
+//     before the validator module is first imported, because validator.js translates its
+//     messages at import time and a worker has no `<html lang>` to detect it from.
+//   - `{type: "validate", id, values, paths}` queues a run; `paths` (null for a full run)
+//     come from `changedValidationPaths`. Runs start on a fresh task, so when several
+//     requests arrive while one is in progress only the newest is validated, together with
+//     the paths of the superseded ones.
+// It posts `{type: "result", id, errors}` or `{type: "failed", id, message}`.
+
+import { getIn, setIn, validateYupSchema, yupToFormErrors } from "formik";
+import isPlainObject from "lodash/isPlainObject";
+import toPath from "lodash/toPath";
+import { reach } from "yup";
+import { i18next } from "@translations/invenio_modular_deposit_form/i18next";
+
+// Top-level values validated field by field; the others (access, files, pids) are
+// validated whole because their tests compare sibling fields.
+const FIELD_SCOPED_KEYS = ["metadata", "custom_fields"];
+
+// With more changed paths than this (e.g. after the form is reinitialised) one full run
+// is cheaper.
+const MAX_INCREMENTAL_PATHS = 20;
+
+/**
+ * Validate `values` against a Yup `schema` the way Formik's `validationSchema` does.
+ *
+ * @param {import("yup").AnySchema} schema
+ * @param {Object} values - Formik values
+ * @returns {Promise<Object>} Formik errors object; `{}` when valid
+ */
+async function runValidation(schema, values) {
+  try {
+    await validateYupSchema(values, schema);
+    return {};
+  } catch (error) {
+    if (error?.name === "ValidationError") return yupToFormErrors(error);
+    throw error;
+  }
+}
+
+/**
+ * @param {Object} [a]
+ * @param {Object} [b]
+ * @returns {string[]} keys of either object
+ */
+function unionKeys(a, b) {
+  return [...new Set([...Object.keys(a ?? {}), ...Object.keys(b ?? {})])];
+}
+
+/**
+ * Paths of the validation units that differ between two sets of Formik values.
+ *
+ * @param {Object|undefined} previous - values of the previous run
+ * @param {Object} values - current values
+ * @returns {string[]|null} changed paths; null when there is nothing to compare with
+ */
+function changedValidationPaths(previous, values) {
+  if (!isPlainObject(previous) || !isPlainObject(values)) return null;
+  const paths = [];
+  for (const key of unionKeys(previous, values)) {
+    const before = previous[key];
+    const after = values[key];
+    if (before === after) continue;
+    if (!FIELD_SCOPED_KEYS.includes(key) || !isPlainObject(before) || !isPlainObject(after)) {
+      paths.push(key);
+      continue;
+    }
+    for (const field of unionKeys(before, after)) {
+      const rowsBefore = before[field];
+      const rowsAfter = after[field];
+      if (rowsBefore === rowsAfter) continue;
+      const path = `${key}.${field}`;
+      if (
+        Array.isArray(rowsBefore) &&
+        Array.isArray(rowsAfter) &&
+        rowsBefore.length === rowsAfter.length
+      ) {
+        rowsAfter.forEach((row, i) => {
+          if (row !== rowsBefore[i]) paths.push(`${path}[${i}]`);
+        });
+      } else {
+        paths.push(path);
+      }
+    }
+  }
+  return paths;
+}
+
+/**
+ * @param {Array<string[]|null>} pathLists
+ * @returns {string[]|null} all paths, or null when any list asks for a full run
+ */
+function mergeValidationPaths(...pathLists) {
+  if (pathLists.some((paths) => paths == null)) return null;
+  return [...new Set(pathLists.flat())];
+}
+
+/**
+ * Replace empty strings with undefined, as Formik does before running a schema.
+ *
+ * @param {*} value
+ * @returns {*} a prepared copy of plain objects and arrays; other values as they are
+ */
+function prepareValue(value) {
+  if (Array.isArray(value)) return value.map(prepareValue);
+  if (isPlainObject(value)) {
+    return Object.fromEntries(Object.entries(value).map(([k, v]) => [k, prepareValue(v)]));
+  }
+  return value === "" ? undefined : value;
+}
+
+/**
+ * Validate the value at `path` in the context of the whole record.
+ *
+ * @param {import("yup").AnySchema} schema
+ * @param {Object} values - Formik values
+ * @param {string} path
+ * @returns {Promise<*>} the errors subtree for `path`; undefined when valid or when the
+ *   schema does not cover `path`
+ */
+async function validatePath(schema, values, path) {
+  try {
+    reach(schema, path, values);
+  } catch (e) {
+    return undefined;
+  }
+  const prepared = setIn(values, path, prepareValue(getIn(values, path)));
+  try {
+    await schema.validateAt(path, prepared, { abortEarly: false });
+    return undefined;
+  } catch (error) {
+    if (error?.name !== "ValidationError") throw error;
+    return getIn(yupToFormErrors(error), path);
+  }
+}
+
+/**
+ * Replace the errors subtree at `path`, dropping containers it leaves empty so that a
+ * valid record still has `{}` as its errors.
+ *
+ * @param {Object} errors
+ * @param {string} path
+ * @param {*} pathErrors
+ * @returns {Object} new errors object; `errors` is not modified
+ */
+function setErrorsAt(errors, path, pathErrors) {
+  let next = setIn(errors, path, pathErrors);
+  const parts = toPath(path);
+  for (let depth = parts.length - 1; depth > 0; depth--) {
+    const container = getIn(next, parts.slice(0, depth));
+    if (container && Object.values(container).some((value) => value !== undefined)) break;
+    next = setIn(next, parts.slice(0, depth), undefined);
+  }
+  return next;
+}
+
+/**
+ * Create a validation function that re-validates only changed paths.
+ *
+ * @param {import("yup").AnySchema} schema
+ * @returns {function(Object, (string[]|null)): Promise<Object>} `(values, paths)` resolving
+ *   to the errors of the whole record; `paths` null means a full run
+ */
+function createIncrementalValidation(schema) {
+  let errors = null;
+  return async (values, paths) => {
+    try {
+      if (errors === null || paths == null || paths.length > MAX_INCREMENTAL_PATHS) {
+        errors = await runValidation(schema, values);
+        return errors;
+      }
+      let next = errors;
+      for (const path of paths) {
+        next = setErrorsAt(next, path, await validatePath(schema, values, path));
+      }
+      errors = next;
+      return errors;
+    } catch (error) {
+      // The changed paths of this run are lost; start over with a full run.
+      errors = null;
+      throw error;
+    }
+  };
+}
+
+/**
+ * Build the worker's message handler.
+ *
+ * @param {Object} options
+ * @param {function(Object): void} options.post - `postMessage` back to the page
+ * @param {function(): Promise<*>} options.loadValidator - imports the validator module
+ * @param {function(function): void} [options.schedule] - runs a callback on a new task
+ * @returns {function(Object): void} handler for `message` event data
+ */
+function createValidationRunner({
+  post,
+  loadValidator,
+  schedule = (callback) => setTimeout(callback, 0),
+}) {
+  let validate = null;
+  let next = null;
+  let scheduled = false;
+  let running = Promise.resolve();
+
+  const configure = async ({ config, language }) => {
+    if (language && i18next.language !== language) {
+      await i18next.changeLanguage(language);
+    }
+    const validatorModule = await loadValidator();
+    const validatorExport = validatorModule?.default ?? validatorModule;
+    return createIncrementalValidation(
+      typeof validatorExport === "function" ? validatorExport(config) : validatorExport
+    );
+  };
+
+  const run = async () => {
+    scheduled = false;
+    const job = next;
+    next = null;
+    try {
+      const errors = await (await validate)(job.values, job.paths ?? null);
+      post({ type: "result", id: job.id, errors });
+    } catch (error) {
+      post({ type: "failed", id: job.id, message: String(error?.message ?? error) });
+    }
+  };
+
+  return (data) => {
+    if (data?.type === "configure") {
+      validate = configure(data);
+      // Reported with the first run; keep it from surfacing as an unhandled rejection.
+      validate.catch(() => {});
+    } else if (data?.type === "validate") {
+      next = next
+        ? { ...data, paths: mergeValidationPaths(next.paths, data.paths ?? null) }
+        : data;
+      if (!scheduled) {
+        scheduled = true;
+        // Runs are chained so that each one starts from the errors of the previous one.
+        schedule(() => {
+          running = running.then(run);
+        });
+      }
+    }
+  };
+}
+
+export {
+  changedValidationPaths,
+  createIncrementalValidation,
+  createValidationRunner,
+  runValidation,
+};
@@ -0,0 +1,147 @@
+import { setIn } from "formik";
+import buildValidationSchema from "./validator";
+import {
+  changedValidationPaths,
+  createIncrementalValidation,
+  runValidation,
+} from "./validationRunner";
+
+const creator = (i) => ({
+  person_or_org: {
+    type: "personal",
+    family_name: `Family ${i}`,
+    given_name: `Given ${i}`,
+    identifiers: [{ scheme: "orcid", identifier: "0000-0002-1825-0097" }],
+  },
+  affiliations: [{ name: `University ${i}` }],
+});
+
+const relatedIdentifier = (i) => ({
+  scheme: "doi",
+  identifier: `10.1234/related.${i}`,
+  relation_type: "iscitedby",
+});
+
+/** Synthetic record with many creators and related identifiers. */
+const largeRecord = (creators = 200, related = 100) => ({
+  access: { files: "public", record: "public" },
+  custom_fields: {},
+  pids: {},
+  metadata: {
+    creators: Array.from({ length: creators }, (_, i) => creator(i)),
+    related_identifiers: Array.from({ length: related }, (_, i) => relatedIdentifier(i)),
+    publication_date: "2023-01-01",
+    title: "A record",
+    resource_type: "dataset",
+  },
+});
+
+describe("changedValidationPaths", () => {
+  const values = largeRecord(3, 1);
+
+  it("returns the changed rows, fields and top-level values", () => {
+    let next = setIn(values, "metadata.creators[1].person_or_org.given_name", "X");
+    next = setIn(next, "metadata.title", "Other");
+    next = setIn(next, "access.record", "restricted");
+    expect(changedValidationPaths(values, next)).toEqual([
+      "access",
+      "metadata.creators[1]",
+      "metadata.title",
+    ]);
+  });
+
+  it("returns the whole array when rows are added or removed", () => {
+    const next = setIn(values, "metadata.creators", values.metadata.creators.slice(1));
+    expect(changedValidationPaths(values, next)).toEqual(["metadata.creators"]);
+    expect(changedValidationPaths(values, values)).toEqual([]);
+    expect(changedValidationPaths(undefined, values)).toBeNull();
+  });
+});
+
+const benchmark = process.env.BENCHMARK ? it : it.skip;
+
+/**
+ * Edit one creator per round of a record with 200 creators and 100 related identifiers,
+ * validating each version both fully and incrementally.
+ *
+ * @param {Object} schema
+ * @param {number} rounds
+ * @param {function(Object): void} [check] - called with `{fullErrors, incrementalErrors}`
+ * @returns {Promise<{full: number, incremental: number}>} ms spent in each
+ */
+const editLargeRecord = async (schema, rounds, check = () => {}) => {
+  const values = largeRecord(200, 100);
+  const validate = createIncrementalValidation(schema);
+  await validate(values, null);
+  let full = 0;
+  let incremental = 0;
+  let current = values;
+  for (let round = 0; round < rounds; round++) {
+    const next = setIn(
+      current,
+      `metadata.creators[${round}].person_or_org.given_name`,
+      `Edited ${round}`
+    );
+    const paths = changedValidationPaths(current, next);
+
+    let start = performance.now();
+    const fullErrors = await runValidation(schema, next);
+    full += performance.now() - start;
+
+    start = performance.now();
+    const incrementalErrors = await validate(next, paths);
+    incremental += performance.now() - start;
+
+    check({ fullErrors, incrementalErrors });
+    current = next;
+  }
+  return { full, incremental };
+};
+
+describe("createIncrementalValidation", () => {
+  const schema = buildValidationSchema({});
+
+  it("merges the errors of changed paths into the previous errors", async () => {
+    const validate = createIncrementalValidation(schema);
+    const steps = [];
+    let values = largeRecord(5, 2);
+    const edit = (path, value) => {
+      const next = setIn(values, path, value);
+      steps.push([changedValidationPaths(values, next), next]);
+      values = next;
+    };
+    edit("metadata.creators[2].person_or_org.family_name", "");
+    edit("metadata.related_identifiers[1].relation_type", "");
+    edit("metadata.creators[2].person_or_org.family_name", "Fixed");
+    edit("metadata.creators", [...values.metadata.creators, { person_or_org: {} }]);
+    edit("metadata.related_identifiers[1].relation_type", "cites");
+    edit("metadata.creators", values.metadata.creators.slice(0, 5));
+
+    expect(await validate(largeRecord(5, 2), null)).toEqual({});
+    for (const [paths, stepValues] of steps) {
+      expect(paths).not.toBeNull();
+      expect(await validate(stepValues, paths)).toEqual(
+        await runValidation(schema, stepValues)
+      );
+    }
+    expect(await validate(values, [])).toEqual({});
+  });
+
+  it("matches a full run after each one-field edit of a large record", async () => {
+    await editLargeRecord(schema, 3, ({ fullErrors, incrementalErrors }) => {
+      expect(incrementalErrors).toEqual(fullErrors);
+    });
+  });
+
+  // Opt-in, as timings vary between machines: `BENCHMARK=1 npm test -- validationRunner`.
+  benchmark("is faster than a full run for a one-field edit", async () => {
+    const rounds = 10;
+    const { full, incremental } = await editLargeRecord(schema, rounds);
+    console.log(
+      `Validation after one edit (200 creators, 100 related identifiers): ` +
+        `full ${(full / rounds).toFixed(1)} ms, incremental ` +
+        `${(incremental / rounds).toFixed(2)} ms (${(full / incremental).toFixed(0)}x)`
+    );
+    expect(incremental).toBeLessThan(full);
+  });
+});
@@ -0,0 +1,19 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Web Worker entry point: runs the deposit form's Yup schema off the main thread.
+// Started by createValidationWorker.js; protocol in validationRunner.js. The validator is
+// resolved through the same webpack alias as on the page, so an instance's validator.js
+// override also runs here.
+
+import { createValidationRunner } from "./validationRunner";
+
+const handleMessage = createValidationRunner({
+  post: (message) => self.postMessage(message),
+  loadValidator: () => import("@js/invenio_modular_deposit_form_validator"),
+});
+
+self.addEventListener("message", (event) => handleMessage(event.data));
@@ -1,40 +1,35 @@
-import { ORCID } from "orcid-utils";
+import { IDENTIFIER_CHECKS } from "./identifierChecks";
 
-import { i18next } from "@translations/invenio_modular_deposit_form/i18next";
-
-/** Uppercase scheme id for user-visible copy (e.g. `ror` → `ROR`). */
-export function schemeIdLabelUppercase(schemeId) {
-  return String(schemeId ?? "").toUpperCase();
-}
-
-/** Default invalid/required messages using the scheme id in uppercase. */
-export function identifierMessagesForScheme(schemeId) {
-  const scheme = schemeIdLabelUppercase(schemeId);
-  return {
-    invalid: i18next.t("This is not a valid {{scheme}} identifier.", { scheme }),
-    required: i18next.t("You must provide a {{scheme}} identifier or remove this row", { scheme }),
-  };
-}
-
-export function defaultInvalidMessageForScheme(schemeId) {
-  return identifierMessagesForScheme(schemeId).invalid;
-}
-
-export function defaultInvalidMessageForSchemeWithDetail(schemeId, detail) {
-  const scheme = schemeIdLabelUppercase(schemeId);
-  return i18next.t("This is not a valid {{scheme}} identifier ({{detail}}).", {
-    scheme,
-    detail,
-  });
-}
+// The checks themselves live in identifierChecks.js; the functions here wrap them as Yup
+// methods. Message helpers are re-exported from here for existing imports.
+export {
+  DEFAULT_GENERIC_IDENTIFIER_INVALID_MESSAGE,
+  defaultInvalidMessageForScheme,
+  defaultInvalidMessageForSchemeWithDetail,
+  identifierMessagesForScheme,
+  schemeIdLabelUppercase,
+} from "./identifierChecks";
 
 /**
- * Generic fallback for the parent-scheme Yup `.test` wrapper ({@link validIdentifierForScheme} in identifierSchemeValidators).
- * Per-scheme validation still uses {@link identifierMessagesForScheme}.
+ * Yup test running the compiled check for `schemeId`. A custom `message` replaces the
+ * check's default message, except for messages about the type of the value.
+ *
+ * @param {import("yup").StringSchema} schema
+ * @param {string} schemeId - key of {@link IDENTIFIER_CHECKS}
+ * @param {string} [message]
+ * @returns {import("yup").StringSchema} `schema` with the test added
  */
-export const DEFAULT_GENERIC_IDENTIFIER_INVALID_MESSAGE = i18next.t(
-  "This is not a valid identifier for this scheme."
-);
+function schemeTest(schema, schemeId, message) {
+  const { name, check } = IDENTIFIER_CHECKS.get(schemeId);
+  return schema.test(name, message, function (val) {
+    const failed = check(val);
+    if (failed === null) return true;
+    return this.createError({
+      path: this.path,
+      message: failed.fixed ? failed.message : message ?? failed.message,
+    });
+  });
+}
 
 /**
  * Test if argument is a Research Organization Registry identifier.
@@ -66,25 +61,7 @@ export const DEFAULT_GENERIC_IDENTIFIER_INVALID_MESSAGE = i18next.t(
  * @returns either true or an error message
  */
 function rorValidator(message) {
-  return this.test("ror", message, function (val) {
-    const { path, createError } = this;
-
-    if (typeof val !== "string") {
-      return createError({ path, message: i18next.t("ROR identifier cannot be empty") });
-    }
-
-    const rorRegexp = new RegExp("^(?:(?:https?://)?ror.org/)?(0\\w{6}\\d{2})$", "i");
-    // See https://ror.org/facts/#core-components.
-
-    if (!rorRegexp.test(val)) {
-      return createError({
-        path,
-        message: message ?? defaultInvalidMessageForScheme("ror"),
-      });
-    }
-
-    return true;
-  });
+  return schemeTest(this, "ror", message);
 }
 
 /**
@@ -119,45 +96,7 @@ function rorValidator(message) {
  * @returns either true or an error message
  */
 function isniValidator(message) {
-  return this.test("isni", message, function (val) {
-    const { path, createError } = this;
-
-    // Test if argument is an International Standard Name Identifier.
-    const convertXTo10 = (x) => {
-      // Convert char to int with X being converted to 10.
-      return x !== "X" ? parseInt(x, 10) : 10;
-    };
-
-    val = val.replace(/-/g, "").replace(/ /g, "").toUpperCase();
-    if (val.length !== 16) {
-      return createError({
-        path,
-        message:
-          message ?? defaultInvalidMessageForSchemeWithDetail("isni", "it must be 16 characters"),
-      });
-    }
-
-    try {
-      let r = 0;
-      for (let x of val.slice(0, -1)) {
-        r = (r + parseInt(x, 10)) * 2;
-      }
-      const ck = (12 - (r % 11)) % 11;
-      if (ck !== convertXTo10(val.slice(-1))) {
-        return createError({
-          path,
-          message: message ?? defaultInvalidMessageForScheme("isni"),
-        });
-      }
-    } catch (error) {
-      return createError({
-        path,
-        message: message ?? defaultInvalidMessageForScheme("isni"),
-      });
-    }
-
-    return true;
-  });
+  return schemeTest(this, "isni", message);
 }
 
 /**
@@ -191,40 +130,7 @@ function isniValidator(message) {
  * @returns either true or an error message
  */
 function gndValidator(message) {
-  return this.test("gnd", message, function (val) {
-    const { path, createError } = this;
-
-    if (typeof val !== "string") {
-      return createError({ path, message: i18next.t("GND identifier cannot be empty") });
-    }
-
-    for (const prefix of ["http://d-nb.info/gnd/", "https://d-nb.info/gnd/", "d-nb.info/gnd/"]) {
-      if (val.startsWith(prefix)) {
-        val = val.slice(prefix.length);
-        break;
-      }
-    }
-
-    // GND must match one of these patterns:
-    // 1. Start with 1 followed by optional 0, 1, or 2, then 7 digits and a check digit (X or number)
-    // 2. Start with 4 or 7 followed by 6 digits and a hyphen and a digit
-    // 3. Start with 1-9 followed by 0-7 digits and a hyphen and a check digit (X or number)
-    // 4. Start with 3 followed by 7 digits and a check digit (X or number)
-    const gndRegexp = new RegExp(
-      "^(?:(?:gnd:|GND:)?)?(" +
-        "1[012]?\\d{7}[0-9X]|" +
-        "(?:4|7)\\d{6}-\\d|" +
-        "(?:[1-9])\\d{0,7}-[0-9X]|" +
-        "(?:3)\\d{7}[0-9X]" +
-        ")$"
-    );
-
-    if (!gndRegexp.test(val)) {
-      return createError({ path, message: message ?? defaultInvalidMessageForScheme("gnd") });
-    }
-
-    return true;
-  });
+  return schemeTest(this, "gnd", message);
 }
 
 /**
@@ -257,17 +163,7 @@ function gndValidator(message) {
  * @returns
  */
 function orcidValidator(message) {
-  return this.test("orcid", message, function (val) {
-    const { path, createError } = this;
-
-    if (typeof val !== "string") {
-      return createError({ path, message: i18next.t("ORCID must be a string") });
-    } else if (!ORCID.isValid(val)) {
-      return createError({ path, message: message ?? defaultInvalidMessageForScheme("orcid") });
-    }
-
-    return true;
-  });
+  return schemeTest(this, "orcid", message);
 }
 
 function sanitizeWPUsername(username, strict = false) {
@@ -301,313 +197,91 @@ function sanitizeWPUsername(username, strict = false) {
  * Mirrors server-side always_valid in invenio-rdm-records config.
  */
 function alwaysValidValidator(message) {
-  return this.test("always_valid", message, function () {
-    return true;
-  });
+  return schemeTest(this, "other", message);
 }
 
 /**
  * Test if argument is a valid ARK. Mirrors idutils.is_ark.
  */
 function arkValidator(message) {
-  return this.test("ark", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("ARK must be a string") });
-    const arkSuffix = /^ark:\/?[0-9bcdfghjkmnpqrstvwxz]+\/.+$/i;
-    try {
-      const u = new URL(val);
-      const match =
-        arkSuffix.test(val) ||
-        (u.protocol === "http:" && u.hostname && arkSuffix.test(u.pathname.slice(1)));
-      if (!match)
-        return createError({
-          path,
-          message: message ?? i18next.t("This is not a valid ARK identifier."),
-        });
-    } catch {
-      if (!arkSuffix.test(val))
-        return createError({
-          path,
-          message: message ?? i18next.t("This is not a valid ARK identifier."),
-        });
-    }
-    return true;
-  });
+  return schemeTest(this, "ark", message);
 }
 
 /**
  * Test if argument is an arXiv ID. Mirrors idutils.is_arxiv (post-2007 and pre-2007).
  */
 function arxivValidator(message) {
-  return this.test("arxiv", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("arXiv must be a string") });
-    const post2007 = /^(arxiv:)?(\d{4})\.(\d{4,5})(v\d+)?$/i;
-    const pre2007 = /^(arxiv:)?([a-z\-]+)(\.[a-z]{2})?(\/\d{4})(\d+)(v\d+)?$/i;
-    const withClass = /^(arxiv:)?(?:[a-z\-]+)(?:\.[a-z]{2})?\/(\d{4})\.(\d{4,5})(v\d+)?$/i;
-    const v = val.trim();
-    if (!post2007.test(v) && !pre2007.test(v) && !withClass.test(v)) {
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid arXiv identifier."),
-      });
-    }
-    return true;
-  });
+  return schemeTest(this, "arxiv", message);
 }
 
 /**
  * Test if argument is an ADS bibliographic code. Mirrors idutils.is_ads.
  */
 function adsValidator(message) {
-  return this.test("ads", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("ADS/Bibcode must be a string") });
-    // idutils.is_ads uses unicodedata.normalize("NFKD", val) before matching ads_regexp.
-    val = val.normalize("NFKD");
-    const ads = /^(ads:|ADS:)?(\d{4}[A-Za-z]\S{13}[A-Za-z.:])$/;
-    if (!ads.test(val.trim()))
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid ADS/Bibcode identifier."),
-      });
-    return true;
-  });
+  return schemeTest(this, "ads", message);
 }
 
 /**
  * Test if argument is EAN-13. Mirrors idutils.is_ean13.
  */
 function ean13Validator(message) {
-  return this.test("ean13", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string" || val.length !== 13)
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid EAN-13 identifier."),
-      });
-    const sequence = [1, 3];
-    let r = 0;
-    for (let i = 0; i < 12; i++) r += parseInt(val[i], 10) * sequence[i % 2];
-    const ck = (10 - (r % 10)) % 10;
-    if (ck !== parseInt(val[12], 10))
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid EAN-13 identifier."),
-      });
-    return true;
-  });
+  return schemeTest(this, "ean13", message);
 }
 
 /**
  * Test if argument is an ISSN. Mirrors idutils.is_issn. Used for issn, eissn, lissn.
  */
 function issnValidator(message) {
-  return this.test("issn", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    const v = val.replace(/-/g, "").replace(/ /g, "").toUpperCase();
-    if (v.length !== 8)
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid ISSN."),
-      });
-    const convertX = (x) => (x === "X" ? 10 : parseInt(x, 10));
-    let r = 0;
-    for (let i = 0; i < 8; i++) r += (8 - i) * convertX(v[i]);
-    if (r % 11 !== 0)
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid ISSN."),
-      });
-    return true;
-  });
+  return schemeTest(this, "issn", message);
 }
 
 /**
  * Test if argument is a Handle. Mirrors idutils.is_handle.
  */
 function handleValidator(message) {
-  return this.test("handle", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("Handle must be a string") });
-    const handle = /^(hdl:\s*|(?:https?:\/\/)?hdl\.handle\.net\/)?([^/.]+(\.[^/.]+)*\/.*)$/i;
-    if (!handle.test(val.trim()))
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid Handle."),
-      });
-    return true;
-  });
+  return schemeTest(this, "handle", message);
 }
 
 /**
  * Test if argument is ISBN-10 or ISBN-13. Mirrors idutils.is_isbn (isbnlib).
  */
 function isbnValidator(message) {
-  return this.test("isbn", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    const v = val.replace(/[\s\-]/g, "");
-    if (v.length === 10) {
-      let r = 0;
-      for (let i = 0; i < 9; i++) r += (10 - i) * parseInt(v[i], 10);
-      r = (11 - (r % 11)) % 11;
-      const ck = v[9].toUpperCase() === "X" ? 10 : parseInt(v[9], 10);
-      if (r !== ck)
-        return createError({
-          path,
-          message: message ?? i18next.t("This is not a valid ISBN."),
-        });
-      return true;
-    }
-    if (v.length === 13 && (v.startsWith("978") || v.startsWith("979"))) {
-      const seq = [1, 3];
-      let r = 0;
-      for (let i = 0; i < 12; i++) r += parseInt(v[i], 10) * seq[i % 2];
-      const ck = (10 - (r % 10)) % 10;
-      if (ck !== parseInt(v[12], 10))
-        return createError({
-          path,
-          message: message ?? i18next.t("This is not a valid ISBN."),
-        });
-      return true;
-    }
-    return createError({
-      path,
-      message: message ?? i18next.t("This is not a valid ISBN."),
-    });
-  });
+  return schemeTest(this, "isbn", message);
 }
 
 /**
  * Test if argument is an ISTC. Mirrors idutils.is_istc.
  */
 function istcValidator(message) {
-  return this.test("istc", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    const v = val.replace(/-/g, "").replace(/ /g, "").toUpperCase();
-    if (v.length !== 16)
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid ISTC identifier."),
-      });
-    const sequence = [11, 9, 3, 1];
-    let r = 0;
-    for (let i = 0; i < 15; i++) r += parseInt(v[i], 16) * sequence[i % 4];
-    const ck = (r % 16).toString(16).toUpperCase();
-    if (ck !== v[15])
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid ISTC identifier."),
-      });
-    return true;
-  });
+  return schemeTest(this, "istc", message);
 }
 
 /**
  * Test if argument is an LSID. Mirrors idutils.is_lsid (URN with lsid pattern).
  */
 function lsidValidator(message) {
-  return this.test("lsid", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("LSID must be a string") });
-    const lsid = /^urn:lsid:[^:]+(:[^:]+){2,3}$/i;
-    try {
-      const u = new URL(val);
-      if (u.protocol !== "urn:" || u.hostname !== "" || !u.pathname)
-        return createError({
-          path,
-          message: message ?? i18next.t("This is not a valid LSID identifier."),
-        });
-      if (!lsid.test(val))
-        return createError({
-          path,
-          message: message ?? i18next.t("This is not a valid LSID identifier."),
-        });
-    } catch {
-      if (!lsid.test(val))
-        return createError({
-          path,
-          message: message ?? i18next.t("This is not a valid LSID identifier."),
-        });
-    }
-    return true;
-  });
+  return schemeTest(this, "lsid", message);
 }
 
 /**
  * Test if argument is a PubMed ID. Mirrors idutils.is_pmid.
  */
 function pmidValidator(message) {
-  return this.test("pmid", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("PMID must be a string") });
-    const pmid = /^(pmid:|https?:\/\/pubmed\.ncbi\.nlm\.nih\.gov\/)?(\d+)\/?$/i;
-    if (!pmid.test(val.trim()))
-      return createError({ path, message: message ?? i18next.t("This is not a valid PubMed ID.") });
-    return true;
-  });
+  return schemeTest(this, "pmid", message);
 }
 
 /**
  * Test if argument is a PURL. Mirrors idutils.is_purl.
  */
 function purlValidator(message) {
-  return this.test("purl", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("PURL must be a string") });
-    try {
-      const u = new URL(val);
-      const purlHosts = ["purl.org", "purl.oclc.org", "purl.net", "purl.com", "purl.fdlp.gov"];
-      if (
-        !["http:", "https:"].includes(u.protocol) ||
-        !purlHosts.includes(u.hostname) ||
-        !u.pathname
-      ) {
-        return createError({ path, message: message ?? i18next.t("This is not a valid PURL.") });
-      }
-    } catch {
-      return createError({ path, message: message ?? i18next.t("This is not a valid PURL.") });
-    }
-    return true;
-  });
+  return schemeTest(this, "purl", message);
 }
 
 /**
  * Test if argument is a URN. Mirrors idutils.is_urn.
  */
 function urnValidator(message) {
-  return this.test("urn", message, function (val) {
-    const { path, createError } = this;
-    if (val === undefined || val === null || val === "") return true;
-    if (typeof val !== "string")
-      return createError({ path, message: message ?? i18next.t("URN must be a string") });
-    try {
-      const u = new URL(val);
-      if (u.protocol !== "urn:" || u.hostname !== "" || !u.pathname)
-        return createError({ path, message: message ?? i18next.t("This is not a valid URN.") });
-    } catch {
-      return createError({ path, message: message ?? i18next.t("This is not a valid URN.") });
-    }
-    return true;
-  });
+  return schemeTest(this, "urn", message);
 }
 
 /**
@@ -615,37 +289,7 @@ function urnValidator(message) {
  * truthy scheme and netloc).
  */
 function urlValidator(message) {
-  return this.test("url", message, function (val) {
-    const { path, createError } = this;
-
-    if (val === undefined || val === null || val === "") {
-      return true;
-    }
-
-    if (typeof val !== "string") {
-      return createError({ path, message: message ?? i18next.t("URL must be a string") });
-    }
-
-    const value = val.trim();
-
-    if (!/^[a-z][a-z0-9+.-]*:\/\//i.test(value)) {
-      return createError({
-        path,
-        message: message ?? i18next.t("You must include a protocol like https:// in the URL."),
-      });
-    }
-
-    try {
-      const u = new URL(value);
-      if (!u.protocol || !u.hostname) {
-        return createError({ path, message: message ?? i18next.t("This is not a valid URL.") });
-      }
-    } catch {
-      return createError({ path, message: message ?? i18next.t("This is not a valid URL.") });
-    }
-
-    return true;
-  });
+  return schemeTest(this, "url", message);
 }
 
 /**
@@ -659,29 +303,7 @@ function urlValidator(message) {
  * @returns either true or an error message
  */
 function doiValidator(message) {
-  return this.test("doi", message, function (val) {
-    const { path, createError } = this;
-
-    if (val === undefined || val === null || val === "") {
-      return true;
-    }
-
-    if (typeof val !== "string") {
-      return createError({ path, message: message ?? i18next.t("DOI must be a string") });
-    }
-
-    // Matches python `idutils.is_doi` via `idutils.validators.doi_regexp`.
-    // python: (doi:\s*|(?:https?://)?(?:dx\.)?doi\.org/)?(10\.\d+(\.\d+)*/.+)$
-    const doiRegexp = /^(doi:\s*|(?:https?:\/\/)?(?:dx\.)?doi\.org\/)?(10\.\d+(\.\d+)*\/.+)$/i;
-    if (!doiRegexp.test(val.trim())) {
-      return createError({
-        path,
-        message: message ?? i18next.t("This is not a valid DOI."),
-      });
-    }
-
-    return true;
-  });
+  return schemeTest(this, "doi", message);
 }
 
 /**
@@ -3,6 +3,10 @@ import * as yup from "yup";
 
 import { makeSchemeBasedIdentifierTest, validIdentifierForScheme } from "./identifierSchemeValidators";
 import { SCHEME_ID_TO_VALIDATOR, VALIDATOR_SCHEME_IDS } from "./validatorsForIds";
+// Shared with tests/test_identifiers.py, which holds the Python port to the same corpus.
+import IDENTIFIER_FIXTURES from "@custom-test-utils/identifier_fixtures.json";
+
+const { checks: CHECK_FIXTURES, rows: ROW_FIXTURES } = IDENTIFIER_FIXTURES;
 
 // Register all scheme validators from the map (mirrors validator.js)
 for (const [schemeId, validatorFn] of Object.entries(SCHEME_ID_TO_VALIDATOR)) {
@@ -18,12 +22,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should validate correct ROR format", async () => {
-      const validRORs = [
-        "0w4pz9h89",
-        "https://ror.org/0w4pz9h89",
-        "http://ror.org/0w4pz9h89",
-        "ror.org/0w4pz9h89",
-      ];
+      const validRORs = CHECK_FIXTURES.ror.valid;
 
       for (const ror of validRORs) {
         await expect(schema.validate({ ror })).resolves.toBeTruthy();
@@ -31,15 +30,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should reject invalid ROR format", async () => {
-      const invalidRORs = [
-        "invalid",
-        "12345678", // too short
-        "0w4pz9h8", // too short
-        "0w4pz9h890", // too long
-        "https://example.com/0w4pz9h89", // wrong domain
-        "https://ror.org/0w4pz9h8", // too short
-        "https://ror.org/0w4pz9h890", // too long
-      ];
+      const invalidRORs = CHECK_FIXTURES.ror.invalid;
 
       for (const ror of invalidRORs) {
         await expect(schema.validate({ ror }))
@@ -63,11 +54,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should validate correct ISNI format", async () => {
-      const validISNIs = [
-        "000000012146438X",
-        "0000-0001-2146-438X",
-        "0000 0001 2146 438X",
-      ];
+      const validISNIs = CHECK_FIXTURES.isni.valid;
 
       for (const isni of validISNIs) {
         await expect(schema.validate({ isni })).resolves.toBeTruthy();
@@ -75,11 +62,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should reject invalid ISNI format", async () => {
-      const invalidISNIs = [
-        "invalid",
-        "1234567890123456",
-        "0000000121464389",
-      ];
+      const invalidISNIs = CHECK_FIXTURES.isni.invalid;
 
       for (const isni of invalidISNIs) {
         await expect(schema.validate({ isni })).rejects.toThrow();
@@ -99,54 +82,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should validate correct GND format", async () => {
-      const validGNDs = [
-        // Pattern 1: Start with 1 followed by optional 0, 1, or 2, then 7 digits and a check digit (X or number)
-        "123456789", // starts with 1, 9 digits total
-        "12345678X", // starts with 1, X check digit
-        "100000000", // starts with 10, 10 digits total
-        "101234567", // starts with 10, example with numbers
-        "10123456X", // starts with 10, X check digit
-        "111234567", // starts with 11, 10 digits total
-        "1270543776", // starts with 12, 10 digits total (real-world example)
-
-        // Pattern 2: Start with 4 or 7 followed by 6 digits and a hyphen and a digit
-        "4000000-0",  // starts with 4
-        "4123456-7",  // starts with 4, example with numbers
-        "7000000-0",  // starts with 7
-        "7123456-7",  // starts with 7, example with numbers
-
-        // Pattern 3: Start with 1-9 followed by 0-7 digits and a hyphen and a check digit (X or number)
-        "2-0",        // starts with 2, minimum length
-        "21-7",       // starts with 2, 1 digit
-        "212-7",      // starts with 2, 2 digits
-        "2123-7",     // starts with 2, 3 digits
-        "21234-7",    // starts with 2, 4 digits
-        "212345-7",   // starts with 2, 5 digits
-        "2123456-7",  // starts with 2, 6 digits
-        "21234567-7", // starts with 2, 7 digits
-        "21234567-X", // starts with 2, X check digit
-        "5-0",        // starts with 5, minimum length
-        "51-7",       // starts with 5, 1 digit
-        "512-7",      // starts with 5, 2 digits
-        "5123-7",     // starts with 5, 3 digits
-        "51234-7",    // starts with 5, 4 digits
-        "512345-7",   // starts with 5, 5 digits
-        "5123456-7",  // starts with 5, 6 digits
-        "51234567-7", // starts with 5, 7 digits
-        "51234567-X", // starts with 5, X check digit
-
-        // Pattern 4: Start with 3 followed by 7 digits and a check digit (X or number)
-        "300000000", // starts with 3
-        "312345678", // starts with 3, example with numbers
-        "30000000X", // starts with 3, X check digit
-        "31234567X", // starts with 3, example with numbers, X check digit
-
-        // With prefixes
-        "http://d-nb.info/gnd/100000000",
-        "https://d-nb.info/gnd/100000000",
-        "GND:100000000",
-        "gnd:100000000",
-      ];
+      const validGNDs = CHECK_FIXTURES.gnd.valid;
 
       for (const gnd of validGNDs) {
         await expect(schema.validate({ gnd })).resolves.toBeTruthy();
@@ -154,16 +90,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should reject invalid GND format", async () => {
-      const invalidGNDs = [
-        "invalid",                    // not a number
-        "12345678",                  // missing hyphen/check digit
-        "12345678-",                 // incomplete check digit
-        "12345678-XX",               // invalid check digit format (two X's)
-        "123456789-0",               // too many digits (8) before hyphen
-        "0123456-7",                 // starts with 0 (not allowed)
-        "4000000",                   // missing hyphen and check digit
-        "https://example.com/100000000", // wrong domain
-      ];
+      const invalidGNDs = CHECK_FIXTURES.gnd.invalid;
 
       for (const gnd of invalidGNDs) {
         await expect(schema.validate({ gnd }))
@@ -187,11 +114,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should validate correct ORCID format", async () => {
-      const validORCIDs = [
-        "0000-0001-2345-6789",
-        "https://orcid.org/0000-0001-2345-6789",
-        "http://orcid.org/0000-0001-2345-6789",
-      ];
+      const validORCIDs = CHECK_FIXTURES.orcid.valid;
 
       for (const orcid of validORCIDs) {
         await expect(schema.validate({ orcid })).resolves.toBeTruthy();
@@ -199,11 +122,7 @@ describe("validatorsForIds", () => {
     });
 
     it("should reject invalid ORCID format", async () => {
-      const invalidORCIDs = [
-        "invalid",
-        "1234-5678-9012-3456",
-        "https://example.com/0000-0001-2345-6789",
-      ];
+      const invalidORCIDs = CHECK_FIXTURES.orcid.invalid;
 
       for (const orcid of invalidORCIDs) {
         await expect(schema.validate({ orcid })).rejects.toThrow();
@@ -233,19 +152,14 @@ describe("validatorsForIds", () => {
     });
 
     it("should validate correct URL format", async () => {
-      const validURLs = [
-        "https://example.com",
-        "http://example.org/path",
-        "https://sub.example.com/foo?q=1",
-        "ftp://example.com/resource",
-      ];
+      const validURLs = CHECK_FIXTURES.url.valid;
       for (const url of validURLs) {
         await expect(schema.validate({ url })).resolves.toBeTruthy();
       }
     });
 
     it("should reject invalid URL format", async () => {
-      const invalidURLs = ["not a url", "javascript:alert(1)"];
+      const invalidURLs = CHECK_FIXTURES.url.invalid;
       for (const url of invalidURLs) {
         await expect(schema.validate({ url })).rejects.toThrow();
       }
@@ -328,63 +242,9 @@ describe("validatorsForIds", () => {
       identifier: yup.string().required().validIdentifierForScheme(VALIDATOR_SCHEME_IDS, true),
     });
 
-    const validPerScheme = {
-      ark: "ark:/12345/x7q84",
-      arxiv: "2101.12345",
-      ads: "2021arXiv210112345A",
-      crossreffunderid: "100000001",
-      doi: "10.1234/example.12345",
-      ean13: "5901234123457",
-      eissn: "2049-3630",
-      grid: "grid.12345.6",
-      handle: "20.1000/100",
-      igsn: "AU1234",
-      isbn: "978-0-262-03293-3",
-      isni: "000000012146438X",
-      issn: "2049-3630",
-      istc: "A02-2009-000004B3-9",
-      lissn: "2049-3630",
-      lsid: "urn:lsid:ubio.org:namebank:11815",
-      pmid: "12345678",
-      purl: "https://purl.org/example",
-      upc: "012345678905",
-      url: "https://example.com",
-      urn: "urn:nbn:de:123",
-      w3id: "https://w3id.org/example",
-      other: "any",
-      orcid: "0000-0001-2345-6789",
-      gnd: "118627813",
-      ror: "0w4pz9h89",
-    };
-
-    const invalidPerScheme = {
-      ark: "not-an-ark",
-      arxiv: "99.9999",
-      ads: "short",
-      crossreffunderid: "", // required fails
-      doi: "not-a-doi",
-      ean13: "123",
-      eissn: "123",
-      grid: "", // required fails
-      handle: "invalid",
-      igsn: "", // required fails
-      isbn: "000",
-      isni: "0000000121464389",
-      issn: "1234",
-      istc: "A02-2009-000004B3-X",
-      lissn: "12",
-      lsid: "urn:invalid:lsid",
-      pmid: "abc",
-      purl: "https://example.com/not-purl",
-      upc: "", // required fails
-      url: "not-a-url",
-      urn: "http://example.com",
-      w3id: "", // required fails
-      other: "", // required fails
-      orcid: "0000-0001-2345-678X",
-      gnd: "invalid",
-      ror: "short",
-    };
+    const validPerScheme = ROW_FIXTURES.valid;
+
+    const invalidPerScheme = ROW_FIXTURES.invalid;
 
     for (const schemeId of VALIDATOR_SCHEME_IDS) {
       it(`${schemeId}: accepts valid identifier`, async () => {
@@ -412,63 +272,9 @@ describe("validatorsForIds", () => {
         .validIdentifierForScheme(VALIDATOR_SCHEME_IDS),
     });
 
-    const validPerScheme = {
-      ark: "ark:/12345/x7q84",
-      arxiv: "2101.12345",
-      ads: "2021arXiv210112345A",
-      crossreffunderid: "100000001",
-      doi: "10.1234/example.12345",
-      ean13: "5901234123457",
-      eissn: "2049-3630",
-      grid: "grid.12345.6",
-      handle: "20.1000/100",
-      igsn: "AU1234",
-      isbn: "978-0-262-03293-3",
-      isni: "000000012146438X",
-      issn: "2049-3630",
-      istc: "A02-2009-000004B3-9",
-      lissn: "2049-3630",
-      lsid: "urn:lsid:ubio.org:namebank:11815",
-      pmid: "12345678",
-      purl: "https://purl.org/example",
-      upc: "012345678905",
-      url: "https://example.com",
-      urn: "urn:nbn:de:123",
-      w3id: "https://w3id.org/example",
-      other: "any",
-      orcid: "0000-0001-2345-6789",
-      gnd: "118627813",
-      ror: "0w4pz9h89",
-    };
-
-    const invalidPerScheme = {
-      ark: "not-an-ark",
-      arxiv: "99.9999",
-      ads: "short",
-      crossreffunderid: "",
-      doi: "not-a-doi",
-      ean13: "123",
-      eissn: "123",
-      grid: "",
-      handle: "invalid",
-      igsn: "",
-      isbn: "000",
-      isni: "0000000121464389",
-      issn: "1234",
-      istc: "A02-2009-000004B3-X",
-      lissn: "12",
-      lsid: "urn:invalid:lsid",
-      pmid: "abc",
-      purl: "https://example.com/not-purl",
-      upc: "",
-      url: "not-a-url",
-      urn: "http://example.com",
-      w3id: "",
-      other: "",
-      orcid: "0000-0001-2345-678X",
-      gnd: "invalid",
-      ror: "short",
-    };
+    const validPerScheme = ROW_FIXTURES.valid;
+
+    const invalidPerScheme = ROW_FIXTURES.invalid;
 
     for (const schemeId of VALIDATOR_SCHEME_IDS) {
       it(`${schemeId}: accepts valid identifier`, async () => {
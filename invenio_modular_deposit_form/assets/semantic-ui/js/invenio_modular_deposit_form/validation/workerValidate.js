@@ -0,0 +1,145 @@
+// This file is part of Invenio Modular Deposit Form
+// Copyright (C) 2026 MESH Research.
+//
+// Invenio Modular Deposit Form is free software; you can redistribute and/or
+// modify it under the terms of the MIT License; see LICENSE file for more details.
+//
+// Formik `validate` function that runs the validation schema in a Web Worker.
+//
+// With 50+ creators each carrying identifiers, running the Yup schema on every change
+// blocks typing. `createWorkerValidate` posts the values to validationWorker.js instead and
+// resolves with the errors it sends back. Only the newest run matters: results of older runs
+// are dropped, and every pending call resolves with the errors of the newest one, so Formik
+// never shows errors for values that have since changed.
+//
+// With `incremental`, each call also sends the paths that changed since the previous call
+// (see `changedValidationPaths` in validationRunner.js) and only those are re-validated.
+// `validate.requestFullValidation()` makes the next call validate the whole record;
+// DepositBootstrap calls it when a submit button sets the submit context.
+//
+// Falls back to validating on the main thread, with the same errors, when no worker can be
+// started (Jest, old browsers), when the config cannot be sent to it, or after the worker
+// fails.
+
+import { createValidationWorker } from "./createValidationWorker";
+import { changedValidationPaths, createIncrementalValidation } from "./validationRunner";
+
+// Config entries holding components and functions; the schema does not read them and they
+// cannot be posted to a worker.
+const NON_SERIALIZABLE_CONFIG_KEYS = ["componentsRegistry", "formSectionFields"];
+
+/**
+ * @param {Object} config - deposit config from RDMDepositForm
+ * @returns {Object} the config without entries that cannot be posted to a worker
+ */
+function serializableValidationConfig(config = {}) {
+  const serializable = { ...config };
+  NON_SERIALIZABLE_CONFIG_KEYS.forEach((key) => delete serializable[key]);
+  return serializable;
+}
+
+/**
+ * Create a Formik `validate` function backed by the validation worker.
+ *
+ * @param {Object} options
+ * @param {Object} options.config - deposit config the schema is built from
+ * @param {function(): import("yup").AnySchema} options.buildSchema - builds the schema on the
+ *   main thread; only called when falling back
+ * @param {string} [options.language] - language for the worker's error messages
+ * @param {boolean} [options.incremental=false] - re-validate only the paths that changed
+ * @param {function(): (Worker|null)} [options.createWorker]
+ * @returns {function(Object): Promise<Object>} `validate(values)` resolving to Formik errors,
+ *   with a `requestFullValidation()` method
+ */
+function createWorkerValidate({
+  config,
+  buildSchema,
+  language,
+  incremental = false,
+  createWorker = createValidationWorker,
+}) {
+  let validateOnPage = null;
+  const onPage = async (values, paths) => {
+    if (!validateOnPage) validateOnPage = createIncrementalValidation(buildSchema());
+    return validateOnPage(values, paths);
+  };
+
+  let previousValues;
+  let fullRunRequested = false;
+  const pathsToValidate = (values) => {
+    const paths =
+      incremental && !fullRunRequested ? changedValidationPaths(previousValues, values) : null;
+    previousValues = values;
+    fullRunRequested = false;
+    return paths;
+  };
+
+  let worker = createWorker();
+  if (worker) {
+    try {
+      worker.postMessage({
+        type: "configure",
+        config: serializableValidationConfig(config),
+        language,
+      });
+    } catch (e) {
+      console.warn("Validation config cannot be sent to the worker; validating on the page.", e);
+      worker.terminate();
+      worker = null;
+    }
+  }
+
+  let lastId = 0;
+  let lastValues;
+  let waiting = [];
+
+  const settle = (settleOne) => {
+    const settled = waiting;
+    waiting = [];
+    settled.forEach(settleOne);
+  };
+
+  const fallBack = (reason) => {
+    console.warn("Validation worker failed; validating on the page.", reason);
+    worker.terminate();
+    worker = null;
+    const result = onPage(lastValues, null);
+    settle(({ resolve }) => resolve(result));
+  };
+
+  if (worker) {
+    worker.addEventListener("message", ({ data }) => {
+      if (data?.id !== lastId) return;
+      if (data.type === "result") {
+        settle(({ resolve }) => resolve(data.errors));
+      } else if (data.type === "failed") {
+        fallBack(data.message);
+      }
+    });
+    worker.addEventListener("error", (event) => {
+      event.preventDefault?.();
+      if (worker) fallBack(event.message ?? event);
+    });
+  }
+
+  const validate = (values) => {
+    const paths = pathsToValidate(values);
+    if (!worker) return onPage(values, paths);
+    lastId += 1;
+    lastValues = values;
+    return new Promise((resolve) => {
+      waiting.push({ resolve });
+      try {
+        worker.postMessage({ type: "validate", id: lastId, values, paths });
+      } catch (e) {
+        fallBack(e);
+      }
+    });
+  };
+  validate.requestFullValidation = () => {
+    fullRunRequested = true;
+  };
+  return validate;
+}
+
+export { createWorkerValidate, serializableValidationConfig };
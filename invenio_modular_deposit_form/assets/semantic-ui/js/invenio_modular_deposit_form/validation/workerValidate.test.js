@@ -0,0 +1,172 @@
+import { object as yupObject, string as yupString } from "yup";
+import { createValidationRunner, runValidation } from "./validationRunner";
+import { createWorkerValidate, serializableValidationConfig } from "./workerValidate";
+
+const buildSchema = (config, onRun = () => {}) =>
+  yupObject().shape({
+    metadata: yupObject().shape({
+      title: yupString()
+        .max(config.max_title_length ?? 100, "Too long")
+        .required("A title is required")
+        .test("count-runs", "unused", () => {
+          onRun();
+          return true;
+        }),
+    }),
+  });
+
+/** In-process stand-in for a Worker running validationWorker.js. */
+class FakeWorker {
+  constructor(loadValidator) {
+    this.listeners = { message: [], error: [] };
+    this.terminated = false;
+    this.handle = createValidationRunner({
+      post: (data) => setTimeout(() => this.emit("message", { data }), 0),
+      loadValidator,
+    });
+  }
+
+  addEventListener(type, listener) {
+    this.listeners[type].push(listener);
+  }
+
+  emit(type, event) {
+    if (!this.terminated) this.listeners[type].forEach((listener) => listener(event));
+  }
+
+  postMessage(data) {
+    const copy = JSON.parse(JSON.stringify(data));
+    setTimeout(() => this.handle(copy), 0);
+  }
+
+  terminate() {
+    this.terminated = true;
+  }
+}
+
+describe("runValidation", () => {
+  it("returns Formik-shaped errors, treating empty strings as missing", async () => {
+    const schema = buildSchema({ max_title_length: 3 });
+    await expect(runValidation(schema, { metadata: { title: "" } })).resolves.toEqual({
+      metadata: { title: "A title is required" },
+    });
+    await expect(runValidation(schema, { metadata: { title: "long" } })).resolves.toEqual({
+      metadata: { title: "Too long" },
+    });
+    await expect(runValidation(schema, { metadata: { title: "ok" } })).resolves.toEqual({});
+  });
+});
+
+describe("createWorkerValidate", () => {
+  it("validates in the worker and resolves superseded runs with the newest errors", async () => {
+    let runs = 0;
+    const builder = jest.fn((config) => buildSchema(config, () => (runs += 1)));
+    const worker = new FakeWorker(async () => ({ default: builder }));
+    const pageBuild = jest.fn();
+    const validate = createWorkerValidate({
+      config: { max_title_length: 5, componentsRegistry: { Title: () => null } },
+      buildSchema: pageBuild,
+      language: "en",
+      createWorker: () => worker,
+    });
+
+    const results = await Promise.all([
+      validate({ metadata: { title: "" } }),
+      validate({ metadata: { title: "too long" } }),
+      validate({ metadata: { title: "ok" } }),
+    ]);
+
+    expect(results).toEqual([{}, {}, {}]);
+    expect(runs).toBe(1);
+    expect(builder).toHaveBeenCalledWith({ max_title_length: 5 });
+    expect(pageBuild).not.toHaveBeenCalled();
+    await expect(validate({ metadata: { title: "" } })).resolves.toEqual({
+      metadata: { title: "A title is required" },
+    });
+  });
+
+  it("falls back to the page when the worker fails or is unavailable", async () => {
+    jest.spyOn(console, "warn").mockImplementation(() => {});
+    const worker = new FakeWorker(async () => {
+      throw new Error("chunk failed to load");
+    });
+    const validate = createWorkerValidate({
+      config: {},
+      buildSchema: () => buildSchema({}),
+      createWorker: () => worker,
+    });
+
+    await expect(validate({ metadata: { title: "" } })).resolves.toEqual({
+      metadata: { title: "A title is required" },
+    });
+    expect(worker.terminated).toBe(true);
+    await expect(validate({ metadata: { title: "ok" } })).resolves.toEqual({});
+
+    const onPage = createWorkerValidate({
+      config: {},
+      buildSchema: () => buildSchema({}),
+      createWorker: () => null,
+    });
+    await expect(onPage({ metadata: {} })).resolves.toEqual({
+      metadata: { title: "A title is required" },
+    });
+  });
+
+  it("sends the changed paths, or null for a requested full run", () => {
+    const posted = [];
+    const worker = {
+      addEventListener: () => {},
+      postMessage: (data) => posted.push(data),
+    };
+    const validate = createWorkerValidate({
+      config: {},
+      buildSchema: () => buildSchema({}),
+      createWorker: () => worker,
+      incremental: true,
+    });
+    const first = { metadata: { title: "a", creators: [] } };
+    const second = { ...first, metadata: { ...first.metadata, title: "b" } };
+
+    validate(first);
+    validate(second);
+    validate.requestFullValidation();
+    validate(second);
+
+    expect(posted.slice(1).map((data) => data.paths)).toEqual([
+      null,
+      ["metadata.title"],
+      null,
+    ]);
+  });
+
+  it("always asks for a full run unless incremental is enabled", () => {
+    const posted = [];
+    const worker = {
+      addEventListener: () => {},
+      postMessage: (data) => posted.push(data),
+    };
+    const validate = createWorkerValidate({
+      config: {},
+      buildSchema: () => buildSchema({}),
+      createWorker: () => worker,
+    });
+    const first = { metadata: { title: "a" } };
+
+    validate(first);
+    validate({ metadata: { title: "b" } });
+
+    expect(posted.slice(1).map((data) => data.paths)).toEqual([null, null]);
+  });
+});
+
+describe("serializableValidationConfig", () => {
+  it("drops the component registry and form sections", () => {
+    expect(
+      serializableValidationConfig({
+        max_title_length: 5,
+        componentsRegistry: {},
+        formSectionFields: {},
+      })
+    ).toEqual({ max_title_length: 5 });
+  });
+});
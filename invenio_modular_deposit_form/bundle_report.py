@@ -0,0 +1,205 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Report how much JavaScript the deposit form downloads for each resource type.
+
+Most field components are fetched from lazy webpack chunks when a form page
+first uses them (``componentsRegistry.js``), so what a depositor downloads
+depends on the layout of the selected resource type. This module reads the
+stats webpack writes for the theme build (``webpack --json``, or the
+``stats.json`` of a stats plugin), resolves every type's form pages with
+:func:`~invenio_modular_deposit_form.layout_compiler.compile_resolved_form_pages`,
+and adds up the entry point and the chunks each page needs.
+
+Run it against a build with::
+
+    python -m invenio_modular_deposit_form.bundle_report stats.json
+
+The layout defaults to this package's configuration; pass ``--config`` with the
+module holding your ``MODULAR_DEPOSIT_FORM_*`` layout settings to report on an
+instance's layout.
+"""
+
+import argparse
+import importlib
+import json
+from pathlib import Path
+
+from .layout_compiler import compile_resolved_form_pages, find_form_pages
+
+ENTRY = "invenio-modular-deposit-form"
+"""Name of the deposit form's webpack entry point (see ``webpack.py``)."""
+
+DEFAULT_TYPE = "(other types)"
+"""Report key for resource types not in ``MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE``."""
+
+CHUNKS_MANIFEST_PATH = (
+    Path(__file__).parent
+    / "assets/semantic-ui/js/invenio_modular_deposit_form/lazyComponentChunks.json"
+)
+"""``{chunk name: [component names]}`` for the lazy entries of
+``componentsRegistry.js``, which builds those entries from it."""
+
+
+def component_chunks(manifest):
+    """Map registry component names to the webpack chunks they are loaded from.
+
+    Args:
+        manifest: Parsed ``lazyComponentChunks.json``, ``{chunk: [components]}``.
+
+    Returns:
+        A dict ``{component name: chunk name}`` for the lazy entries. Components
+        bundled with the entry point are not included.
+    """
+    return {name: chunk for chunk, names in manifest.items() for name in names}
+
+
+def _component_names(node):
+    """Yield the registry component names used in ``node`` and its subsections."""
+    if node.get("component"):
+        yield node["component"]
+    for sub in node.get("subsections") or []:
+        if isinstance(sub, dict):
+            yield from _component_names(sub)
+
+
+def _asset_sizes(stats, group):
+    """Return ``{file name: bytes}`` for a webpack stats chunk group.
+
+    Handles both webpack 5 (assets as ``{"name", "size"}`` dicts) and
+    webpack 4 (assets as file names, sized from the top-level ``assets``) stats.
+    Source maps are skipped.
+    """
+    sizes = {asset["name"]: asset["size"] for asset in stats.get("assets", [])}
+    files = {}
+    for asset in (group or {}).get("assets", []):
+        if isinstance(asset, dict):
+            name, size = asset["name"], asset.get("size", sizes.get(asset["name"], 0))
+        else:
+            name, size = asset, sizes.get(asset, 0)
+        if not name.endswith(".map"):
+            files[name] = size
+    return files
+
+
+def bundle_report(stats, common_fields, fields_by_type, chunks=None, entry=ENTRY):
+    """Add up the deposit form's download size for each resource type.
+
+    Args:
+        stats: Parsed webpack stats JSON for the theme build.
+        common_fields: The ``MODULAR_DEPOSIT_FORM_COMMON_FIELDS`` list.
+        fields_by_type: The ``MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE`` map.
+        chunks: ``{component name: chunk name}``; read from the package's
+            ``lazyComponentChunks.json`` when omitted.
+        entry: Name of the deposit form's entry point.
+
+    Returns:
+        A dict keyed by resource type id, plus :data:`DEFAULT_TYPE` for the
+        types that use the common layout. Each value holds ``initial`` (bytes
+        of the entry point plus the chunks of the first page shown, i.e. what
+        must arrive before the form is usable), ``total`` (bytes once every
+        page has been visited), ``pages`` (``{page id: bytes}``, the chunks
+        each page adds to those of the pages before it) and ``chunks`` (the
+        sorted chunk names the type uses). A file shared by several chunks is
+        counted once.
+    """
+    if chunks is None:
+        chunks = component_chunks(
+            json.loads(CHUNKS_MANIFEST_PATH.read_text(encoding="utf-8"))
+        )
+    groups = stats.get("namedChunkGroups", {})
+    entry_files = _asset_sizes(stats, stats.get("entrypoints", {}).get(entry))
+    # Types without a layout of their own use the common pages.
+    compiled = compile_resolved_form_pages(
+        common_fields, {**(fields_by_type or {}), DEFAULT_TYPE: {}}
+    )
+    page_ids = [
+        page.get("section")
+        for page in find_form_pages(common_fields)
+        if isinstance(page, dict)
+    ]
+
+    report = {}
+    for type_id, indexes in compiled["by_type"].items():
+        loaded = dict(entry_files)
+        used = set()
+        pages = {}
+        initial = None
+        for page_id, index in zip(page_ids, indexes, strict=True):
+            page = compiled["pages"][index]
+            if not page.get("subsections"):
+                continue
+            before = sum(loaded.values())
+            for name in _component_names({"subsections": page["subsections"]}):
+                chunk = chunks.get(name)
+                if chunk and chunk not in used:
+                    used.add(chunk)
+                    loaded.update(_asset_sizes(stats, groups.get(chunk)))
+            pages[page_id] = sum(loaded.values()) - before
+            if initial is None:
+                initial = sum(loaded.values())
+        report[type_id] = {
+            "initial": initial if initial is not None else sum(entry_files.values()),
+            "total": sum(loaded.values()),
+            "pages": pages,
+            "chunks": sorted(used),
+        }
+    return report
+
+
+def format_report(report):
+    """Return ``report`` (from :func:`bundle_report`) as a plain-text table.
+
+    Returns:
+        One line per resource type, largest initial download first, with sizes
+        in KiB.
+    """
+    width = max((len(type_id) for type_id in report), default=13)
+    lines = [f"{'resource type':<{width}}  initial KiB  total KiB  chunks"]
+    for type_id, row in sorted(
+        report.items(), key=lambda item: (-item[1]["initial"], item[0])
+    ):
+        lines.append(
+            f"{type_id:<{width}}  {row['initial'] / 1024:>11.1f}"
+            f"  {row['total'] / 1024:>9.1f}  {', '.join(row['chunks'])}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Print the per-resource-type report for a webpack stats file.
+
+    Returns:
+        The process exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m invenio_modular_deposit_form.bundle_report",
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument("stats", type=Path, help="webpack stats JSON file")
+    parser.add_argument(
+        "--config",
+        default="invenio_modular_deposit_form.config",
+        help="module defining the MODULAR_DEPOSIT_FORM_* layout settings",
+    )
+    parser.add_argument("--entry", default=ENTRY, help="deposit form entry point")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    config = importlib.import_module(args.config)
+    report = bundle_report(
+        json.loads(args.stats.read_text(encoding="utf-8")),
+        config.MODULAR_DEPOSIT_FORM_COMMON_FIELDS,
+        config.MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE,
+        entry=args.entry,
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
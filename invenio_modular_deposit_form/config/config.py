@@ -60,11 +60,156 @@ form field values prior to form submission. Whe False, form errors will
 only be displayed after the form is submitted. (You must rebuild assets 
 for a change in this value to take effect.)"""
 
+MODULAR_DEPOSIT_FORM_VALIDATE_IN_WORKER = True
+"""When True (and client validation is on), the validation schema runs in a 
+Web Worker so that validating a large record does not block typing. The form 
+falls back to validating on the page when a worker cannot be used."""
+
+MODULAR_DEPOSIT_FORM_INCREMENTAL_VALIDATION = False
+"""When True, the validation function used with 
+``MODULAR_DEPOSIT_FORM_VALIDATE_IN_WORKER`` re-validates only the fields and 
+array rows that changed, and the whole record before each submit. Only enable 
+it if your validator.js (the package's own, or a custom one) has no tests that 
+compare values across fields or rows."""
+
 MODULAR_DEPOSIT_FORM_USE_CONFIRM_MODAL = False
 """When True, a confirm modal will be displayed when a user tries to leave a 
 form page with a current error. When False, the errors on the page will be 
 flagged on page exit but no modal confirmation will be required."""
 
+MODULAR_DEPOSIT_FORM_MOUNTED_NEIGHBOUR_PAGES = 0
+"""How many form pages on each side of the current one stay mounted (hidden) in a 
+paged layout. With ``0`` only the current page is rendered, which keeps the first 
+render and typing cheapest; ``1`` or more makes moving to an adjacent page 
+instant at the cost of re-rendering those pages' fields while typing. Values and 
+errors of unmounted pages are kept either way."""
+
+MODULAR_DEPOSIT_FORM_VOCABULARY_OPTIONS_CACHE_TTL = 300
+"""Seconds that the options of a vocabulary custom field (``SafeVocabularyCF``) 
+are reused between deposit form renders, per vocabulary, identity and locale. 
+Changes to a vocabulary drop its entries right away in the process that made 
+them; other processes see them after at most this long. ``0`` disables the 
+cache."""
+
+MODULAR_DEPOSIT_FORM_VOCABULARY_OPTIONS_CACHE_SIZE = 512
+"""Maximum number of cached vocabulary option lists per process; the least 
+recently used are dropped first."""
+
+MODULAR_DEPOSIT_FORM_VOCABULARY_PREFETCH_WORKERS = 4
+"""Threads used to read the options of all vocabulary custom fields in parallel 
+before the deposit form view builds its config, instead of one after the 
+other. ``1`` reads them serially ahead of the view; ``0`` turns prefetching off. 
+Has no effect when ``MODULAR_DEPOSIT_FORM_VOCABULARY_OPTIONS_CACHE_TTL`` is 0."""
+
+MODULAR_DEPOSIT_FORM_VOCABULARY_PREFETCH_ENDPOINTS = (
+    "invenio_app_rdm_records.deposit_create",
+    "invenio_app_rdm_records.deposit_edit",
+    "invenio_app_rdm_records.community_upload",
+)
+"""Endpoints whose requests prefetch the vocabulary custom-field options."""
+
+MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_URL = (
+    "/api/modular-deposit-form/vocabularies/{vocabulary_id}/snapshot"
+)
+"""URL template (``{vocabulary_id}`` is filled in by the browser) of the endpoint 
+serving a whole vocabulary in one response. Remote vocabulary fields that opt in 
+(the languages field does) download it once, keep it in ``localStorage`` and 
+answer searches locally instead of calling ``/api/vocabularies`` on every 
+keystroke. ``None`` turns this off."""
+
+MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_TYPES = (
+    "languages",
+    "contributorsroles",
+    "creatorsroles",
+    "datetypes",
+    "descriptiontypes",
+    "relationtypes",
+    "resourcetypes",
+    "titletypes",
+)
+"""Vocabulary types the snapshot endpoint serves. Keep this to small, rarely 
+changing vocabularies; others answer 404 and their fields keep searching the 
+API."""
+
+MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_MAX_ITEMS = 10000
+"""Most items put in one snapshot. A larger vocabulary is marked incomplete and 
+its fields keep searching the API."""
+
+MODULAR_DEPOSIT_FORM_COMPILE_FORM_PAGES = True
+"""When True, the merged FormPage list for every resource type in 
+``MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE`` (with ``same_as`` resolved) is computed 
+once on the server and sent as ``resolved_form_pages``, so the browser does not 
+re-resolve it on every resource type change. ``same_as`` references are 
+validated at startup either way."""
+
+MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API = False
+"""When True, the static form layout (``common_fields``, ``fields_by_type`` and the 
+label/description/help text/placeholder/icon modifications) is left out of the 
+deposit page HTML. The page instead carries a ``layout_url`` pointing at the 
+``/api/modular-deposit-form/layout`` endpoint, which the React app fetches before 
+rendering. That response has a content-hash ETag and a long-lived Cache-Control 
+header, so browsers and CDNs only download the layout once per config change."""
+
+MODULAR_DEPOSIT_FORM_LAYOUT_API_URL = "/api/modular-deposit-form/layout"
+"""Path (or absolute URL) of the layout endpoint used when 
+``MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API`` is True."""
+
+MODULAR_DEPOSIT_FORM_LAYOUT_MAX_AGE = 31536000
+"""``Cache-Control: max-age`` (seconds) for layout responses requested with the 
+current content hash in the ``v`` query parameter. Requests without a matching 
+hash get a short max-age and must revalidate with the ETag."""
+
+MODULAR_DEPOSIT_FORM_NAMES_SUGGESTIONS_URL = (
+    "/api/modular-deposit-form/names/suggestions"
+)
+"""Path (or absolute URL) the creatibutor modal searches for persons. The endpoint 
+searches the Names vocabulary and the ORCID expanded search concurrently on the 
+server and returns one de-duplicated list. Set to ``None`` to have the browser 
+query ``/api/names`` and ORCID itself, as before."""
+
+MODULAR_DEPOSIT_FORM_ORCID_SEARCH_URL = "https://pub.orcid.org/v3.0/expanded-search/"
+"""ORCID expanded search endpoint queried by the names suggestions endpoint. 
+``None`` leaves ORCID out of the suggestions."""
+
+MODULAR_DEPOSIT_FORM_ORCID_SEARCH_MIN_QUERY_LENGTH = 4
+"""Shortest query (after stripping) that is also sent to ORCID."""
+
+MODULAR_DEPOSIT_FORM_ORCID_SEARCH_ROWS = 10
+"""Number of ORCID results requested per query."""
+
+MODULAR_DEPOSIT_FORM_ORCID_SEARCH_TIMEOUT = 3
+"""Seconds to wait for ORCID before answering with the local hits only."""
+
+MODULAR_DEPOSIT_FORM_ORCID_SEARCH_WORKERS = 4
+"""Threads per process that run ORCID searches, shared by all requests. When 
+all are busy, searches wait for a free thread within the ORCID timeout."""
+
+MODULAR_DEPOSIT_FORM_ORCID_SEARCH_CACHE_TTL = 600
+"""Seconds an ORCID search result is reused per process and query. ``0`` 
+disables the cache."""
+
+MODULAR_DEPOSIT_FORM_ORCID_SEARCH_CACHE_SIZE = 1024
+"""Maximum number of cached ORCID search results per process; the least 
+recently used are dropped first."""
+
+MODULAR_DEPOSIT_FORM_NAMES_SYNC_EXECUTOR = "celery"
+"""Where Names vocabulary syncs queued by the user name API run: ``"celery"`` 
+sends them to a Celery worker; ``"sync"`` runs them in the web process before 
+the response is returned (for tests and setups without workers)."""
+
+MODULAR_DEPOSIT_FORM_NAMES_SYNC_JOB_TTL = 86400
+"""Seconds the status of a queued Names sync stays readable at 
+``/api/modular-deposit-form/users/names/sync/<job_id>``."""
+
+MODULAR_DEPOSIT_FORM_USER_NAMES_BULK_MAX = 500
+"""Most users one ``POST /api/modular-deposit-form/users/names`` request may 
+update."""
+
+MODULAR_DEPOSIT_FORM_USER_NAME_SERVER_TIMING = False
+"""When True, ``POST /api/modular-deposit-form/users/<id>/name`` responses carry 
+a ``Server-Timing`` header with the auth, validate, commit and sync phase 
+durations. They are always logged at debug level."""
+
 MODULAR_DEPOSIT_FORM_PRIORITY_RESOURCE_TYPES: tuple[str, ...] = (
     "publication-article",
     "publication-peerreview",
@@ -0,0 +1,155 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Bounded, expiring cache for vocabulary custom-field options.
+
+:meth:`.safe_vocabulary.SafeVocabularyCF.options` reads every option of a
+vocabulary through ``current_service.read_all`` on each deposit form render.
+The results only change when the vocabulary does, so they are kept here per
+``(vocabulary_id, sort_by, identity needs, locale)``: the identity decides
+which items are visible and the locale which titles are dumped.
+
+Entries expire after ``MODULAR_DEPOSIT_FORM_VOCABULARY_OPTIONS_CACHE_TTL``
+seconds, and the least recently used are evicted beyond
+``MODULAR_DEPOSIT_FORM_VOCABULARY_OPTIONS_CACHE_SIZE`` entries. Creating,
+updating or deleting vocabulary items or types drops that type's entries once
+the database transaction commits (see :func:`register_invalidation_hooks`).
+That only reaches the process that made the change; other workers pick up the
+change when their entries expire.
+
+A vocabulary type that does not exist is cached too (as :data:`MISSING`), so
+a missing fixture costs one query and one log line per TTL, not per render.
+"""
+
+from flask import current_app, has_app_context
+from invenio_db import db
+from invenio_i18n import get_locale
+from invenio_vocabularies.records.models import VocabularyMetadata, VocabularyType
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from ..ttl_cache import TTLCache
+
+MISSING = object()
+"""Cached value for a vocabulary type that is not in the database."""
+
+_PENDING_KEY = "modular_deposit_form_vocabulary_types"
+
+
+class VocabularyOptionsCache(TTLCache):
+    """Options cache whose entries can be dropped per vocabulary.
+
+    Keys are tuples whose first item is the vocabulary id, so all entries of
+    one vocabulary can be dropped together. Values are lists of options or
+    :data:`MISSING`.
+    """
+
+    def invalidate(self, vocabulary_id=None):
+        """Drop the entries of one vocabulary type, or all entries when None."""
+        if vocabulary_id is None:
+            self.clear()
+            return
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == vocabulary_id]:
+                del self._entries[key]
+
+
+def create_vocabulary_options_cache(app):
+    """Build the options cache configured for ``app``.
+
+    Returns:
+        A :class:`VocabularyOptionsCache`.
+    """
+    return VocabularyOptionsCache(
+        maxsize=app.config.get(
+            "MODULAR_DEPOSIT_FORM_VOCABULARY_OPTIONS_CACHE_SIZE", 512
+        ),
+        ttl=app.config.get("MODULAR_DEPOSIT_FORM_VOCABULARY_OPTIONS_CACHE_TTL", 300),
+    )
+
+
+def get_vocabulary_options_cache(app=None):
+    """Return the options cache of the ``invenio-modular-deposit-form`` extension.
+
+    Args:
+        app: The Flask app. Defaults to ``current_app``.
+
+    Returns:
+        The :class:`VocabularyOptionsCache`, or None when the extension is not
+        registered.
+    """
+    app = app or current_app._get_current_object()
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    return ext.vocabulary_options_cache if ext is not None else None
+
+
+def options_cache_key(vocabulary_id, sort_by, identity):
+    """Return the cache key for one ``options()`` call in the active locale.
+
+    Returns:
+        A hashable tuple starting with ``vocabulary_id``.
+    """
+    needs = frozenset(getattr(identity, "provides", None) or ())
+    return (vocabulary_id, repr(sort_by), needs, str(get_locale() or ""))
+
+
+def _pending_types(target):
+    """Return the set of vocabulary types changed since the last commit.
+
+    Kept on the session of ``target``. A rollback leaves the set in place, so
+    the next commit may drop a few entries needlessly but never misses one.
+    """
+    session = object_session(target) or db.session
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _on_metadata_change(mapper, connection, target):
+    """Remember the vocabulary type of a changed vocabulary item."""
+    type_id = ((target.json or {}).get("type") or {}).get("id")
+    # An unknown type drops the whole cache at commit.
+    _pending_types(target).add(type_id)
+
+
+def _on_type_change(mapper, connection, target):
+    """Remember a created or deleted vocabulary type."""
+    _pending_types(target).add(target.id)
+
+
+def _on_commit(session):
+    """Invalidate the cache entries of every vocabulary type changed in the commit."""
+    type_ids = session.info.pop(_PENDING_KEY, None)
+    if not type_ids or not has_app_context():
+        return
+    cache = get_vocabulary_options_cache()
+    if cache is None:
+        return
+    if None in type_ids:
+        cache.invalidate()
+        return
+    for type_id in type_ids:
+        cache.invalidate(type_id)
+
+
+_LISTENERS = (
+    (VocabularyMetadata, "after_insert", _on_metadata_change),
+    (VocabularyMetadata, "after_update", _on_metadata_change),
+    (VocabularyMetadata, "after_delete", _on_metadata_change),
+    (VocabularyType, "after_insert", _on_type_change),
+    (VocabularyType, "after_delete", _on_type_change),
+)
+
+
+def register_invalidation_hooks():
+    """Listen for vocabulary changes so cached options are dropped on commit.
+
+    Safe to call more than once; the listeners are process-wide.
+    """
+    for model, name, listener in _LISTENERS:
+        if not event.contains(model, name, listener):
+            event.listen(model, name, listener)
+    if not event.contains(db.session, "after_commit", _on_commit):
+        event.listen(db.session, "after_commit", _on_commit)
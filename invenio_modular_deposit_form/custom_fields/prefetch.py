@@ -0,0 +1,126 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Fetch the options of every vocabulary custom field concurrently.
+
+The stock deposit view (``invenio_app_rdm``'s ``load_custom_fields``) calls
+``options()`` on each vocabulary custom field one after the other while it
+builds ``forms_config``. :func:`prefetch_vocabulary_options` reads the same
+vocabularies in a small thread pool first and leaves the results in the
+:mod:`.options_cache`, so the view's own calls are cache hits.
+:func:`prefetch_deposit_vocabulary_options` runs it before the deposit
+endpoints listed in ``MODULAR_DEPOSIT_FORM_VOCABULARY_PREFETCH_ENDPOINTS``.
+"""
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import copy_current_request_context, current_app, g, request
+from flask_login import current_user
+from invenio_i18n import force_locale, get_locale
+
+from .options_cache import get_vocabulary_options_cache, options_cache_key
+from .safe_vocabulary import SafeVocabularyCF
+
+
+def collect_vocabulary_fields(config):
+    """Return the vocabulary custom fields the deposit form will ask options for.
+
+    Walks ``RDM_CUSTOM_FIELDS_UI`` like ``load_custom_fields`` does, including
+    its ``props.sort_by`` override. Only :class:`.SafeVocabularyCF` fields with
+    ``dump_options`` are returned, since only those are cached.
+
+    Args:
+        config: The Flask app config.
+
+    Returns:
+        A list of shallow copies of the fields with ``sort_by`` set as the view
+        will set it, one per distinct ``(vocabulary_id, sort_by)``.
+    """
+    backend = {cf.name: cf for cf in config.get("RDM_CUSTOM_FIELDS", [])}
+    fields = {}
+    for section in config.get("RDM_CUSTOM_FIELDS_UI", []):
+        for ui_field in section.get("fields", []):
+            cf = backend.get(ui_field.get("field"))
+            if not isinstance(cf, SafeVocabularyCF) or not cf.dump_options:
+                continue
+            sort_by = (ui_field.get("props") or {}).get("sort_by") or cf.sort_by
+            key = (cf.vocabulary_id, repr(sort_by))
+            if key not in fields:
+                fields[key] = copy.copy(cf)
+                fields[key].sort_by = sort_by
+    return list(fields.values())
+
+
+def prefetch_vocabulary_options(identity, fields, max_workers=4):
+    """Read the options of ``fields`` concurrently into the options cache.
+
+    Must run inside a request context; each worker gets a copy of it and the
+    active locale. Fields already cached are skipped.
+
+    Args:
+        identity: The identity the view will pass to ``options()``.
+        fields: Vocabulary custom fields, e.g. from
+            :func:`collect_vocabulary_fields`.
+        max_workers: Upper bound on threads; ``1`` reads serially.
+
+    Returns:
+        The number of vocabularies read.
+    """
+    cache = get_vocabulary_options_cache()
+    if cache is None or not cache.enabled:
+        return 0
+    pending = [
+        cf
+        for cf in fields
+        if options_cache_key(cf.vocabulary_id, cf.sort_by, identity) not in cache
+    ]
+    if len(pending) < 2 or max_workers < 2:
+        for cf in pending:
+            cf.options(identity)
+        return len(pending)
+
+    locale = str(get_locale() or "")
+
+    def _reader(cf):
+        # Decorated here, in the request thread, so it captures this request.
+        @copy_current_request_context
+        def _read():
+            with force_locale(locale):
+                cf.options(identity)
+
+        return _read
+
+    readers = [_reader(cf) for cf in pending]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(readers))) as pool:
+        # list() re-raises the first worker exception, if any.
+        list(pool.map(lambda read: read(), readers))
+    return len(pending)
+
+
+def prefetch_deposit_vocabulary_options():
+    """``before_app_request`` hook: prefetch options for the deposit endpoints.
+
+    Does nothing for other endpoints, for anonymous users (the deposit views
+    redirect them to log in) or when the configured worker count is ``0``.
+    Failures are logged and left for the view to hit again.
+    """
+    config = current_app.config
+    if request.endpoint not in config.get(
+        "MODULAR_DEPOSIT_FORM_VOCABULARY_PREFETCH_ENDPOINTS", ()
+    ):
+        return
+    workers = config.get("MODULAR_DEPOSIT_FORM_VOCABULARY_PREFETCH_WORKERS", 4)
+    identity = g.get("identity")
+    if not workers or identity is None or not current_user.is_authenticated:
+        return
+    try:
+        prefetch_vocabulary_options(
+            identity, collect_vocabulary_fields(config), max_workers=workers
+        )
+    except Exception:
+        current_app.logger.exception("Prefetching vocabulary options failed.")
@@ -22,6 +22,11 @@ in any obvious way.
 empty options list. The form renders; the dropdown is empty until the
 vocabulary is loaded. All other behavior — schema, mapping, multiplicity,
 sort_by, etc. — is inherited unchanged.
+
+Results, including "vocabulary missing", are kept in the extension's
+:class:`.options_cache.VocabularyOptionsCache`, so repeated renders do not hit
+the database or log the warning again until the entry expires or the
+vocabulary changes.
 """
 
 from typing import Any
@@ -30,6 +35,8 @@ from flask import current_app
 from invenio_vocabularies.services.custom_fields import VocabularyCF
 from sqlalchemy.exc import NoResultFound
 
+from .options_cache import MISSING, get_vocabulary_options_cache, options_cache_key
+
 
 class SafeVocabularyCF(VocabularyCF):
     """VocabularyCF that returns an empty options list when the vocab is missing.
@@ -49,15 +56,36 @@ class SafeVocabularyCF(VocabularyCF):
         Returns:
             A list of UI-serialized vocabulary items, or an empty list when
             the vocabulary type referenced by ``vocabulary_id`` is not
-            present in the database.
+            present in the database. Cached lists are returned as copies.
+        """
+        cache = get_vocabulary_options_cache() if self.dump_options else None
+        if cache is None or not cache.enabled:
+            return self._read_options(identity)
+
+        key = options_cache_key(self.vocabulary_id, self.sort_by, identity)
+        cached = cache.get(key)
+        if cached is None:
+            cached = self._read_options(identity, missing=MISSING)
+            cache.set(key, cached)
+        return [] if cached is MISSING else list(cached)
+
+    def _read_options(self, identity: Any, missing: Any = None) -> Any:
+        """Read the options from the vocabulary service, logging a missing type.
+
+        Args:
+            identity: The Flask-Principal identity passed by the caller.
+            missing: Value to return when the vocabulary type does not exist;
+                ``None`` means an empty list.
+
+        Returns:
+            The options list from ``VocabularyCF.options``, or ``missing``.
         """
         try:
             return super().options(identity)
         except NoResultFound:
             current_app.logger.warning(
-                "Vocabulary %s not loaded; rendering empty options "
-                "for custom field %s",
+                "Vocabulary %s not loaded; rendering empty options for custom field %s",
                 self.vocabulary_id,
                 self.name,
             )
-            return []
+            return [] if missing is None else missing
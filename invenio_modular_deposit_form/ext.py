@@ -11,11 +11,24 @@ from flask import Blueprint
 from invenio_i18n import gettext as _
 
 from . import config
+from .custom_fields.options_cache import (
+    create_vocabulary_options_cache,
+    register_invalidation_hooks,
+)
+from .custom_fields.prefetch import prefetch_deposit_vocabulary_options
 from .filters import (
     current_user_profile_dict,
+    deposit_config_json,
     merge_deposit_config,
     previewable_extensions,
 )
+from .filters.deposit_config_json import warm_static_deposit_config_json
+from .filters.merge_deposit_config import warm_static_deposit_config
+from .filters.previewable_extensions import warm_previewable_extensions
+from .views.names_suggestions import (
+    create_orcid_search_cache,
+    create_orcid_search_executor,
+)
 
 
 def create_blueprint(app):
@@ -26,6 +39,7 @@ def create_blueprint(app):
         template_folder="templates",
         static_folder="static",
     )
+    blueprint.before_app_request(prefetch_deposit_vocabulary_options)
 
     return blueprint
 
@@ -45,13 +59,25 @@ def finalize_app(app):
 
     If something left ``RDM_CUSTOM_FIELDS*`` as ``[]``, apply this package's defaults.
     Non-empty values from ``invenio.cfg`` are left unchanged.
+
+    Also builds the static half of the ``deposits-config`` payload (and its
+    pre-serialized JSON) for each configured locale, now that the config stack
+    is final, and resolves the previewable file extensions.
     """
     _apply_package_custom_fields_if_still_empty(app)
+    warm_static_deposit_config(app)
+    warm_static_deposit_config_json(app)
+    warm_previewable_extensions(app)
 
 
 def api_finalize_app(app):
-    """Same hook for the API Flask application."""
+    """Same hook for the API Flask application.
+
+    The API app serves the layout endpoint, so it warms the same caches.
+    """
     _apply_package_custom_fields_if_still_empty(app)
+    warm_static_deposit_config(app)
+    warm_static_deposit_config_json(app)
 
 
 class InvenioModularDepositForm:
@@ -59,6 +85,28 @@ class InvenioModularDepositForm:
 
     def __init__(self, app=None):
         """Extension initialization."""
+        # Locale -> static deposits-config payload; see
+        # ``filters.merge_deposit_config.get_static_deposit_config``.
+        self.static_deposit_config = {}
+        # Locale -> pre-serialized JSON fragments of that payload; see
+        # ``filters.deposit_config_json``.
+        self.static_deposit_config_json = {}
+        # Locale -> (JSON body, content hash) served by the layout API view.
+        self.layout_json = {}
+        # ACCOUNTS_USER_PROFILE_SCHEMA field names; see
+        # ``filters.current_user_profile_dict.profile_fields``.
+        self.profile_fields = None
+        # Sorted tuple of previewable file extensions, set at finalize_app; see
+        # ``filters.previewable_extensions``.
+        self.previewable_extensions = None
+        # Cached SafeVocabularyCF options; see ``custom_fields.options_cache``.
+        self.vocabulary_options_cache = None
+        # Cached ORCID expanded-search results; see
+        # ``views.names_suggestions``.
+        self.orcid_search_cache = None
+        # Worker pool the ORCID expanded searches run on, shared by all
+        # requests; see ``views.names_suggestions``.
+        self.orcid_search_executor = None
         # TODO: This is an example of translation string with comment. Please
         # remove it.
         # NOTE: This is a note to a translator.
@@ -69,9 +117,14 @@ class InvenioModularDepositForm:
     def init_app(self, app):
         """Flask application initialization."""
         self.init_config(app)
+        self.vocabulary_options_cache = create_vocabulary_options_cache(app)
+        register_invalidation_hooks()
+        self.orcid_search_cache = create_orcid_search_cache(app)
+        self.orcid_search_executor = create_orcid_search_executor(app)
         app.add_template_filter(previewable_extensions)
         app.add_template_filter(current_user_profile_dict)
         app.add_template_filter(merge_deposit_config)
+        app.add_template_filter(deposit_config_json)
         app.extensions["invenio-modular-deposit-form"] = self
 
     def init_config(self, app):
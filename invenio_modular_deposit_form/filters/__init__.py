@@ -8,11 +8,13 @@
 """Template filters for invenio-modular-deposit-form."""
 
 from .current_user_profile_dict import current_user_profile_dict
+from .deposit_config_json import deposit_config_json
 from .merge_deposit_config import merge_deposit_config
 from .previewable_extensions import previewable_extensions
 
 __all__ = (
     "current_user_profile_dict",
+    "deposit_config_json",
     "merge_deposit_config",
     "previewable_extensions",
 )
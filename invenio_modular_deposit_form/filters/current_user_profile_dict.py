@@ -7,38 +7,104 @@
 
 """Jinja filter that returns the current user's profile as a dict for the deposit template.
 
-Uses invenio_userprofiles.api.current_userprofile (core InvenioRDM). For anonymous
-users or when the profile has no user_profile data, returns a dict with id and
-schema fields set to empty string.
+Reads ``user_profile`` from the logged-in user (``flask_login.current_user``, the
+replacement for the deprecated ``invenio_userprofiles.api.current_userprofile``).
+For anonymous users or when the profile has no user_profile data, returns a dict
+with id and schema fields set to empty string.
+
+The profile field names are read from ``ACCOUNTS_USER_PROFILE_SCHEMA`` once per
+app, and the dict is memoized on ``flask.g`` so repeated uses within a request
+share one lookup. :func:`user_profile_dicts` builds the same dicts for many
+users with a single query.
 
 Use in templates like: {{ "" | current_user_profile_dict }}
 """
 
-from flask import current_app
-from invenio_userprofiles.api import current_userprofile
+from flask import current_app, g
+from flask_login import current_user
+from invenio_accounts.models import User
 
+_G_ATTR = "_modular_deposit_form_user_profile"
 
-def current_user_profile_dict(value):
-    """Return the current user profile as a dict (id + ACCOUNTS_USER_PROFILE_SCHEMA fields).
 
-    The value argument is unused but required for Jinja filter syntax.
-    For anonymous users or when profile data is missing, returns a dict with
-    id "" and empty strings for each profile field.
+def profile_fields(app=None):
+    """Return the ``ACCOUNTS_USER_PROFILE_SCHEMA`` field names as a tuple.
+
+    Cached on the ``invenio-modular-deposit-form`` extension after the first
+    call; computed on every call when the extension is not registered.
+
+    Args:
+        app: The Flask app. Defaults to ``current_app``.
+
+    Returns:
+        A tuple of field name strings (empty when no schema is configured).
     """
-    result = {"id": ""}
-    schema = current_app.config.get("ACCOUNTS_USER_PROFILE_SCHEMA")
-    if schema and getattr(schema, "fields", None):
-        for field in schema.fields.keys():
-            result[field] = ""
+    app = app or current_app._get_current_object()
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    fields = ext.profile_fields if ext is not None else None
+    if fields is None:
+        schema = app.config.get("ACCOUNTS_USER_PROFILE_SCHEMA")
+        fields = tuple(getattr(schema, "fields", None) or ())
+        if ext is not None:
+            ext.profile_fields = fields
+    return fields
 
-    profile = current_userprofile
-    if profile is None:
+
+def _profile_dict(user, fields):
+    """Build the profile dict for ``user`` (a ``User``, anonymous user or None).
+
+    Returns:
+        A dict with ``id`` and one string value per name in ``fields``.
+    """
+    result = {"id": "", **dict.fromkeys(fields, "")}
+    if user is None:
         return result
-    result["id"] = str(profile.id) if getattr(profile, "id", None) else ""
-    user_profile_data = getattr(profile, "user_profile", None)
+    user_id = getattr(user, "id", None)
+    result["id"] = str(user_id) if user_id else ""
+    user_profile_data = getattr(user, "user_profile", None)
     if not user_profile_data:
         return result
-    if schema and getattr(schema, "fields", None):
-        for field in schema.fields.keys():
-            result[field] = user_profile_data.get(field, "") or ""
+    for field in fields:
+        result[field] = user_profile_data.get(field, "") or ""
     return result
+
+
+def current_user_profile_dict(value):
+    """Return the current user profile as a dict (id + ACCOUNTS_USER_PROFILE_SCHEMA fields).
+
+    The value argument is unused but required for Jinja filter syntax.
+    For anonymous users or when profile data is missing, returns a dict with
+    id "" and empty strings for each profile field. The dict is shared by every
+    call in the same request; treat it as read-only.
+    """
+    user = current_user._get_current_object()
+    # Keyed by user id: ``g`` outlives a request when one app context serves
+    # several of them (e.g. rendering pages for more than one user in a script).
+    memo = g.setdefault(_G_ATTR, {})
+    key = user.get_id() if user is not None else None
+    profile = memo.get(key)
+    if profile is None:
+        profile = memo[key] = _profile_dict(user, profile_fields())
+    return profile
+
+
+def user_profile_dicts(user_ids):
+    """Return profile dicts for several users, loaded with one query.
+
+    Meant for tooling that renders deposit pages on behalf of other users (e.g.
+    admin prerendering); the dicts have the same shape as
+    :func:`current_user_profile_dict`.
+
+    Args:
+        user_ids: An iterable of user ids (ints or numeric strings).
+
+    Returns:
+        A dict mapping each found user's int id to its profile dict. Ids with
+        no matching user are left out.
+    """
+    ids = {int(user_id) for user_id in user_ids}
+    if not ids:
+        return {}
+    fields = profile_fields()
+    users = User.query.filter(User.id.in_(ids)).all()
+    return {user.id: _profile_dict(user, fields) for user in users}
@@ -0,0 +1,228 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Jinja filter that renders the deposits-config payload straight to JSON.
+
+Equivalent to ``forms_config | merge_deposit_config(extra) | tojson``, but the
+large config-derived keys (``common_fields``, ``fields_by_type``, the
+``*_modifications`` maps, ...) are serialized once per locale and kept as
+already-escaped ``"key": value`` fragments on the extension. Each request only
+serializes the small per-request pieces (``forms_config``, the identifier-scheme
+vocabularies, ``current_user_profile``, ``previewable_extensions``) and splices
+them together with the cached fragments.
+
+With ``MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API`` set, the layout keys
+(:data:`.merge_deposit_config.LAYOUT_KEYS`) are replaced by a single
+``layout_url`` carrying the layout's content hash; :func:`get_layout_json`
+provides the matching body for the API endpoint.
+
+Use in templates like::
+
+    value='{{ (forms_config or {}) | deposit_config_json(_extra) }}'
+"""
+
+import hashlib
+from urllib.parse import urlencode
+
+from flask import current_app
+from invenio_i18n import force_locale
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
+
+from .merge_deposit_config import (
+    LAYOUT_KEYS,
+    _current_locale_key,
+    apply_vocabulary_overlays,
+    get_static_deposit_config,
+)
+
+
+def _json_policies(app):
+    """Return the JSON policies Jinja's ``tojson`` filter uses for ``app``.
+
+    Returns:
+        A ``(dumps, kwargs)`` tuple; Flask points ``dumps`` at ``app.json.dumps``.
+    """
+    policies = app.jinja_env.policies
+    return policies["json.dumps_function"], policies["json.dumps_kwargs"]
+
+
+def _member(key, value, dumps, kwargs):
+    """Serialize one ``"key": value`` object member, HTML-escaped like ``tojson``.
+
+    Returns:
+        The member text, without a trailing separator.
+    """
+    key_separator = (kwargs.get("separators") or (", ", ": "))[1]
+    return str(htmlsafe_json_dumps(key, dumps=dumps, **kwargs)) + (
+        key_separator + str(htmlsafe_json_dumps(value, dumps=dumps, **kwargs))
+    )
+
+
+def build_layout_json(app):
+    """Serialize the static layout keys for the active locale.
+
+    Args:
+        app: The Flask app.
+
+    Returns:
+        A tuple ``(body, content_hash)``: the JSON text of the layout keys and a
+        short SHA-256 hex digest of it, used as ETag and cache-busting version.
+    """
+    fields, _overlays = get_static_deposit_config(app)
+    body = app.json.dumps({key: fields[key] for key in LAYOUT_KEYS if key in fields})
+    return body, hashlib.sha256(body.encode("utf-8")).hexdigest()[:20]
+
+
+def get_layout_json(app, locale):
+    """Return the cached ``(body, content_hash)`` layout JSON for ``locale``.
+
+    Built on first use when not warmed. When the extension is not registered on
+    ``app`` the layout is serialized on every call.
+
+    Args:
+        app: The Flask app.
+        locale: A locale code string; the caller decides which ones are valid.
+
+    Returns:
+        The tuple from :func:`build_layout_json`.
+    """
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    layout = ext.layout_json.get(locale) if ext is not None else None
+    if layout is None:
+        with force_locale(locale):
+            layout = build_layout_json(app)
+        if ext is not None:
+            ext.layout_json[locale] = layout
+    return layout
+
+
+def build_static_deposit_config_json(app):
+    """Serialize each static deposits-config key for the active locale.
+
+    Args:
+        app: The Flask app.
+
+    Returns:
+        A dict mapping payload keys to escaped ``"key": value`` JSON fragments.
+    """
+    dumps, kwargs = _json_policies(app)
+    fields, _overlays = get_static_deposit_config(app)
+    if not app.config.get("MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API"):
+        return {
+            key: _member(key, value, dumps, kwargs) for key, value in fields.items()
+        }
+
+    locale = _current_locale_key(app)
+    _body, content_hash = get_layout_json(app, locale)
+    layout_url = "{}?{}".format(
+        app.config.get(
+            "MODULAR_DEPOSIT_FORM_LAYOUT_API_URL", "/api/modular-deposit-form/layout"
+        ),
+        urlencode({"locale": locale, "v": content_hash}),
+    )
+    fragments = {
+        key: _member(key, value, dumps, kwargs)
+        for key, value in fields.items()
+        if key not in LAYOUT_KEYS
+    }
+    fragments["layout_url"] = _member("layout_url", layout_url, dumps, kwargs)
+    return fragments
+
+
+def get_static_deposit_config_json(app=None):
+    """Return the cached static JSON fragments for the active locale.
+
+    Locales not warmed by :func:`warm_static_deposit_config_json` are built on
+    first use. When the extension is not registered on ``app`` the fragments
+    are built on every call.
+
+    Args:
+        app: The Flask app. Defaults to ``current_app``.
+
+    Returns:
+        The dict from :func:`build_static_deposit_config_json`.
+    """
+    app = app or current_app._get_current_object()
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    if ext is None:
+        return build_static_deposit_config_json(app)
+
+    locale_key = _current_locale_key(app)
+    fragments = ext.static_deposit_config_json.get(locale_key)
+    if fragments is None:
+        fragments = build_static_deposit_config_json(app)
+        ext.static_deposit_config_json[locale_key] = fragments
+    return fragments
+
+
+def warm_static_deposit_config_json(app):
+    """Serialize the static JSON fragments for every locale already in the dict cache.
+
+    Run after :func:`.merge_deposit_config.warm_static_deposit_config`, which
+    decides the set of configured locales. Replaces any cached fragments and
+    layout bodies.
+
+    Args:
+        app: The Flask app whose extension cache should be filled.
+    """
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    if ext is None:
+        return
+    ext.static_deposit_config_json.clear()
+    ext.layout_json.clear()
+    with app.app_context():
+        for locale in list(ext.static_deposit_config):
+            with force_locale(locale):
+                ext.layout_json[locale] = build_layout_json(app)
+                ext.static_deposit_config_json[locale] = (
+                    build_static_deposit_config_json(app)
+                )
+
+
+def deposit_config_json(forms_config, extra=None):
+    """Render the merged deposits-config payload as HTML-safe JSON.
+
+    Produces the same text as ``merge_deposit_config(forms_config, extra) |
+    tojson`` (including key order when the JSON provider sorts keys), without
+    re-serializing the static layout on every request.
+
+    Args:
+        forms_config: The dict from the view (get_form_config(...)), or None.
+        extra: Optional dict with keys to merge last, e.g. current_user_profile,
+               previewable_extensions.
+
+    Returns:
+        A :class:`markupsafe.Markup` JSON object string, safe for a single-quoted
+        HTML attribute.
+    """
+    app = current_app._get_current_object()
+    fields, vocabulary_overlays = get_static_deposit_config(app)
+    fragments = get_static_deposit_config_json(app)
+
+    # Per-request keys: static keys win over forms_config, extra wins over both.
+    dynamic = {
+        key: value for key, value in (forms_config or {}).items() if key not in fields
+    }
+    apply_vocabulary_overlays(dynamic, vocabulary_overlays)
+    if extra:
+        dynamic.update(extra)
+
+    dumps, kwargs = _json_policies(app)
+    members = [
+        (key, fragment) for key, fragment in fragments.items() if key not in dynamic
+    ]
+    members.extend(
+        (key, _member(key, value, dumps, kwargs)) for key, value in dynamic.items()
+    )
+    if kwargs.get("sort_keys", getattr(app.json, "sort_keys", False)):
+        members.sort(key=lambda member: member[0])
+
+    item_separator = (kwargs.get("separators") or (", ", ": "))[0]
+    return Markup(
+        "{" + item_separator.join(fragment for _key, fragment in members) + "}"
+    )
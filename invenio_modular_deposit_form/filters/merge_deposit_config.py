@@ -9,10 +9,16 @@
 
 Use in templates so the single hidden input name=\"deposits-config\" carries both
 the view's forms_config and our MODULAR_DEPOSIT_FORM_* (and related) keys.
+
+The config-derived half of the payload does not change between requests, so it
+is built once per app and locale (warmed from ``finalize_app``) and cached on the
+extension; each request only merges it with the view's ``forms_config``.
 """
 
 from flask import current_app
+from invenio_i18n import force_locale, get_locale
 
+from ..layout_compiler import compile_resolved_form_pages
 
 # Map Flask config key -> key in merged JSON (snake_case for React unpacking)
 _CONFIG_KEYS = [
@@ -26,7 +32,10 @@ _CONFIG_KEYS = [
     ("MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE", "fields_by_type"),
     ("MODULAR_DEPOSIT_FORM_HELP_TEXT_MODIFICATIONS", "help_text_modifications"),
     ("MODULAR_DEPOSIT_FORM_ICON_MODIFICATIONS", "icon_modifications"),
+    ("MODULAR_DEPOSIT_FORM_INCREMENTAL_VALIDATION", "incremental_validation"),
     ("MODULAR_DEPOSIT_FORM_LABEL_MODIFICATIONS", "label_modifications"),
+    ("MODULAR_DEPOSIT_FORM_MOUNTED_NEIGHBOUR_PAGES", "mounted_neighbour_pages"),
+    ("MODULAR_DEPOSIT_FORM_NAMES_SUGGESTIONS_URL", "names_suggestions_url"),
     ("MODULAR_DEPOSIT_FORM_PIDS_OVERRIDES", "pids_config_overrides"),
     (
         "MODULAR_DEPOSIT_FORM_PLACEHOLDER_MODIFICATIONS",
@@ -42,9 +51,24 @@ _CONFIG_KEYS = [
         "show_community_banner_at_top",
     ),
     ("MODULAR_DEPOSIT_FORM_USE_CONFIRM_MODAL", "use_confirm_modal"),
+    ("MODULAR_DEPOSIT_FORM_VALIDATE_IN_WORKER", "validate_in_worker"),
+    ("MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_URL", "vocabulary_snapshot_url"),
     ("RDM_RECORDS_PERMISSIONS_PER_FIELD", "permissions_per_field"),
 ]
 
+# Payload keys that make up the static form layout (served separately by the
+# layout API endpoint when MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API is set).
+LAYOUT_KEYS = (
+    "common_fields",
+    "description_modifications",
+    "fields_by_type",
+    "help_text_modifications",
+    "icon_modifications",
+    "label_modifications",
+    "placeholder_modifications",
+    "resolved_form_pages",
+)
+
 
 def _scheme_entry(key, value):
     """Serialize one identifier-scheme entry with both shape conventions.
@@ -67,57 +91,202 @@ def _scheme_entry(key, value):
     }
 
 
-def merge_deposit_config(forms_config, extra=None):
-    """Merge stock forms_config with this extension's config for the deposits-config payload.
+def build_static_deposit_config(config):
+    """Build the config-derived half of the deposits-config payload.
+
+    Nothing here depends on the request: the values come from ``config`` and the
+    identifier-scheme labels are resolved in whatever locale is active when this
+    runs. Callers should go through :func:`get_static_deposit_config`, which
+    caches the result per app and per locale. Raises
+    :class:`~invenio_modular_deposit_form.layout_compiler.LayoutConfigError`
+    if a ``same_as`` reference in ``MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE`` cannot
+    be resolved.
 
     Args:
-        forms_config: The dict from the view (get_form_config(...)), or None.
-        extra: Optional dict with keys to merge last, e.g. current_user_profile,
-               previewable_extensions (so they can be injected from template filters).
+        config: The Flask app config (or any mapping with the same keys).
 
     Returns:
-        A single dict suitable for the hidden input name=\"deposits-config\".
+        A tuple ``(fields, vocabulary_overlays)``. ``fields`` maps payload keys
+        to values that replace top-level keys of ``forms_config``.
+        ``vocabulary_overlays`` is a tuple of ``(path, value)`` pairs, where
+        ``path`` is a tuple of keys below ``forms_config["vocabularies"]``.
     """
-    base = dict(forms_config) if forms_config else {}
+    fields = {}
     for config_key, payload_key in _CONFIG_KEYS:
-        value = current_app.config.get(config_key)
+        value = config.get(config_key)
         if value is not None:
-            base[payload_key] = value
+            fields[payload_key] = value
 
-    # Validation: max title length and identifier schemes for dynamic schema
-    base["max_title_length"] = current_app.config.get(
-        "RDM_RECORDS_MAX_TITLE_LENGTH", 260
+    # Resolve same_as chains for every resource type up front; this also fails
+    # fast (LayoutConfigError) on broken references when warmed at finalize_app.
+    resolved_form_pages = compile_resolved_form_pages(
+        fields.get("common_fields"), fields.get("fields_by_type")
     )
-    personorg_schemes = current_app.config.get("RDM_RECORDS_PERSONORG_SCHEMES", {})
+    if config.get("MODULAR_DEPOSIT_FORM_COMPILE_FORM_PAGES", True):
+        fields["resolved_form_pages"] = resolved_form_pages
+
+    # Validation: max title length and identifier schemes for dynamic schema
+    fields["max_title_length"] = config.get("RDM_RECORDS_MAX_TITLE_LENGTH", 260)
+
+    overlays = []
+    personorg_schemes = config.get("RDM_RECORDS_PERSONORG_SCHEMES", {})
     if personorg_schemes:
-        base.setdefault("vocabularies", {})
-        base["vocabularies"].setdefault("creators", {})
-        base["vocabularies"]["creators"]["identifiers"] = {
-            "scheme": [_scheme_entry(k, v) for k, v in personorg_schemes.items()]
-        }
-        base["vocabularies"].setdefault("contributors", {})
-        base["vocabularies"]["contributors"]["identifiers"] = {
-            "scheme": [_scheme_entry(k, v) for k, v in personorg_schemes.items()]
-        }
-    record_identifiers_schemes = current_app.config.get(
-        "RDM_RECORDS_IDENTIFIERS_SCHEMES", {}
-    )
+        personorg_entries = [_scheme_entry(k, v) for k, v in personorg_schemes.items()]
+        overlays.append((("creators", "identifiers"), {"scheme": personorg_entries}))
+        overlays.append(
+            (("contributors", "identifiers"), {"scheme": personorg_entries})
+        )
+
+    record_identifiers_schemes = config.get("RDM_RECORDS_IDENTIFIERS_SCHEMES", {})
     if record_identifiers_schemes:
-        base.setdefault("vocabularies", {})
-        base["vocabularies"].setdefault("identifiers", {})
-        base["vocabularies"]["identifiers"]["scheme"] = [
-            _scheme_entry(k, v) for k, v in record_identifiers_schemes.items()
-        ]
+        overlays.append(
+            (
+                ("identifiers", "scheme"),
+                [_scheme_entry(k, v) for k, v in record_identifiers_schemes.items()],
+            )
+        )
 
-    record_location_schemes = current_app.config.get("RDM_RECORDS_LOCATION_SCHEMES", {})
+    record_location_schemes = config.get("RDM_RECORDS_LOCATION_SCHEMES", {})
     if record_location_schemes:
-        base.setdefault("vocabularies", {})
-        base["vocabularies"].setdefault("locations", {})
-        base["vocabularies"]["locations"].setdefault("identifiers", {})
-        base["vocabularies"]["locations"]["identifiers"]["scheme"] = [
-            _scheme_entry(k, v) for k, v in record_location_schemes.items()
-        ]
+        overlays.append(
+            (
+                ("locations", "identifiers", "scheme"),
+                [_scheme_entry(k, v) for k, v in record_location_schemes.items()],
+            )
+        )
+
+    return fields, tuple(overlays)
+
+
+def configured_locales(app):
+    """Return the locale codes to cache: ``BABEL_DEFAULT_LOCALE`` then ``I18N_LANGUAGES``.
+
+    Args:
+        app: The Flask app.
+
+    Returns:
+        A list of locale code strings, default locale first, without duplicates.
+    """
+    locales = [str(app.config.get("BABEL_DEFAULT_LOCALE", "en"))]
+    locales.extend(
+        str(lang)
+        for lang, _title in app.config.get("I18N_LANGUAGES", [])
+        if str(lang) not in locales
+    )
+    return locales
+
+
+def _current_locale_key(app):
+    """Return the cache key for the active locale (default locale outside requests)."""
+    locale = get_locale()
+    if locale is None:
+        return str(app.config.get("BABEL_DEFAULT_LOCALE", "en"))
+    return str(locale)
+
+
+def get_static_deposit_config(app=None):
+    """Return the cached static deposits-config payload for the active locale.
+
+    The cache lives on the ``invenio-modular-deposit-form`` extension and is
+    filled by :func:`warm_static_deposit_config` at ``finalize_app`` time;
+    locales that were not warmed are built on first use. When the extension is
+    not registered on ``app`` the payload is built on every call.
+
+    Args:
+        app: The Flask app. Defaults to ``current_app``.
+
+    Returns:
+        The ``(fields, vocabulary_overlays)`` tuple from
+        :func:`build_static_deposit_config`. Treat it as read-only: the same
+        objects are shared by every request in that locale.
+    """
+    app = app or current_app._get_current_object()
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    if ext is None:
+        return build_static_deposit_config(app.config)
+
+    locale_key = _current_locale_key(app)
+    static = ext.static_deposit_config.get(locale_key)
+    if static is None:
+        static = build_static_deposit_config(app.config)
+        ext.static_deposit_config[locale_key] = static
+    return static
+
+
+def warm_static_deposit_config(app):
+    """Build the static deposits-config payload for every configured locale.
+
+    Covers ``BABEL_DEFAULT_LOCALE`` plus the languages in ``I18N_LANGUAGES``.
+    Any cached entries are replaced, so this also serves to refresh the cache
+    after config changes (e.g. in tests).
+
+    Args:
+        app: The Flask app whose extension cache should be filled.
+    """
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    if ext is None:
+        return
+    ext.static_deposit_config.clear()
+    with app.app_context():
+        for locale in configured_locales(app):
+            with force_locale(locale):
+                ext.static_deposit_config[locale] = build_static_deposit_config(
+                    app.config
+                )
 
+
+def _with_path(mapping, path, value):
+    """Return a shallow copy of ``mapping`` with ``value`` set at ``path``.
+
+    Only the dicts along ``path`` are copied; sibling subtrees are shared with
+    ``mapping`` so the view's ``forms_config`` is never mutated.
+    """
+    if not path:
+        return value
+    head, *rest = path
+    out = dict(mapping) if isinstance(mapping, dict) else {}
+    out[head] = _with_path(out.get(head), rest, value)
+    return out
+
+
+def apply_vocabulary_overlays(base, vocabulary_overlays):
+    """Set the identifier-scheme overlays on ``base["vocabularies"]`` in place.
+
+    ``base`` itself is modified, but the ``vocabularies`` dict it points to (and
+    the nested dicts along each overlay path) are replaced by copies.
+
+    Args:
+        base: The payload dict being built for the current request.
+        vocabulary_overlays: The overlays from :func:`build_static_deposit_config`.
+    """
+    if not vocabulary_overlays:
+        return
+    vocabularies = base.get("vocabularies")
+    vocabularies = dict(vocabularies) if isinstance(vocabularies, dict) else {}
+    for (head, *rest), value in vocabulary_overlays:
+        vocabularies[head] = _with_path(vocabularies.get(head), rest, value)
+    base["vocabularies"] = vocabularies
+
+
+def merge_deposit_config(forms_config, extra=None):
+    """Merge stock forms_config with this extension's config for the deposits-config payload.
+
+    The config-derived keys come from :func:`get_static_deposit_config`, so the
+    per-request work is a shallow copy of ``forms_config`` plus copies of the few
+    ``vocabularies`` dicts that receive identifier schemes.
+
+    Args:
+        forms_config: The dict from the view (get_form_config(...)), or None.
+        extra: Optional dict with keys to merge last, e.g. current_user_profile,
+               previewable_extensions (so they can be injected from template filters).
+
+    Returns:
+        A single dict suitable for the hidden input name=\"deposits-config\".
+    """
+    fields, vocabulary_overlays = get_static_deposit_config()
+    base = dict(forms_config) if forms_config else {}
+    base.update(fields)
+    apply_vocabulary_overlays(base, vocabulary_overlays)
     if extra:
         base.update(extra)
     return base
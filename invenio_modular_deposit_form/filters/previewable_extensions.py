@@ -5,20 +5,83 @@
 # and/or modify it under the terms of the MIT License; see LICENSE file for
 # more details.
 
-"""Jinja filter for previewable file extensions (used by the deposit template)."""
+"""Jinja filter for previewable file extensions (used by the deposit template).
+
+Previewers are registered at startup and do not change at runtime, so the
+extensions are resolved once (from ``finalize_app``) and kept on the
+``invenio-modular-deposit-form`` extension as a tuple.
+"""
+
+from flask import current_app
+
+
+def resolve_previewable_extensions(app):
+    """Return the file extensions ``invenio_previewer`` can preview on ``app``.
+
+    A missing or failing previewer is logged (once per call, i.e. once per app
+    when going through :func:`get_previewable_extensions`) and yields no
+    extensions.
+
+    Args:
+        app: The Flask app.
+
+    Returns:
+        A sorted tuple of extension strings.
+    """
+    previewer = app.extensions.get("invenio-previewer")
+    if previewer is None:
+        app.logger.warning(
+            "invenio-previewer is not registered; no file previews in the deposit form."
+        )
+        return ()
+    try:
+        with app.app_context():
+            return tuple(sorted(previewer.previewable_extensions))
+    except Exception:
+        app.logger.exception("Could not load the previewable file extensions.")
+        return ()
+
+
+def get_previewable_extensions(app=None):
+    """Return the cached previewable extensions for ``app``.
+
+    Filled by :func:`warm_previewable_extensions` at ``finalize_app`` time and
+    resolved on first use otherwise. When the extension is not registered on
+    ``app`` they are resolved on every call.
+
+    Args:
+        app: The Flask app. Defaults to ``current_app``.
+
+    Returns:
+        The tuple from :func:`resolve_previewable_extensions`.
+    """
+    app = app or current_app._get_current_object()
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    if ext is None:
+        return resolve_previewable_extensions(app)
+    if ext.previewable_extensions is None:
+        ext.previewable_extensions = resolve_previewable_extensions(app)
+    return ext.previewable_extensions
+
+
+def warm_previewable_extensions(app):
+    """Resolve the previewable extensions and store them on the extension.
+
+    Args:
+        app: The Flask app whose extension should be filled.
+    """
+    ext = app.extensions.get("invenio-modular-deposit-form")
+    if ext is None:
+        return
+    ext.previewable_extensions = resolve_previewable_extensions(app)
 
 
 def previewable_extensions(value):
-    """Return the list of previewable file extensions for use in templates.
+    """Return the previewable file extensions for use in templates.
 
     Uses invenio_previewer when available (provided by invenio-app-rdm).
     The value argument is unused but required for Jinja filter syntax.
 
     Use in templates like: {{ "" | previewable_extensions }}
     """
-    try:
-        from invenio_previewer.proxies import current_previewer
-
-        return list(current_previewer.previewable_extensions)
-    except Exception:
-        return []
+    return get_previewable_extensions()
@@ -0,0 +1,725 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+r"""Server-side port of the deposit form's identifier checks.
+
+Mirrors ``validation/identifierChecks.js``, so that imported drafts can be
+checked in bulk jobs with exactly the rules (and messages) the deposit form
+applies in the browser: :data:`IDENTIFIER_CHECKS` maps each scheme id to a
+check that returns ``None`` for a valid value or an :class:`IdentifierFailure`.
+
+The batch functions resolve everything once per call and then only run the
+checks: :func:`check_identifiers` checks many values against one scheme, and
+:func:`validate_identifiers` checks ``{"scheme", "identifier"}`` rows with the
+deposit form's row rules (allowed schemes, required values, scheme inference).
+
+Regular expressions are written to match the JavaScript ones, not Python's
+defaults: ``\d`` and ``\w`` are ASCII-only, whitespace is the JavaScript
+``\s`` set, ``.`` stops at every JavaScript line terminator and patterns must
+match the whole value. The checks that parse a URL in the browser (ARK, LSID,
+PURL, URN and URL) use ``idutils`` instead, the validators InvenioRDM applies
+when a record is published; ``urllib.parse`` and ``new URL()`` disagree on
+some malformed URLs (see ``tests/test_identifiers.py``). The fixtures in
+``tests/js/identifier_fixtures.json`` are shared with the Jest tests and keep
+both implementations in step.
+"""
+
+import re
+import unicodedata
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+import idutils
+from invenio_i18n import lazy_gettext as _
+
+
+class IdentifierFailure(NamedTuple):
+    """A failed identifier check.
+
+    ``message`` is the scheme's default message. Callers may replace it with
+    their own unless ``fixed`` is set, which marks messages about the type of
+    the value rather than its content (e.g. "ORCID must be a string").
+    """
+
+    message: str
+    fixed: bool = False
+
+
+def scheme_id_label_uppercase(scheme_id):
+    """Return the scheme id in uppercase for user-visible copy (``ror`` → ``ROR``)."""
+    return str(scheme_id if scheme_id is not None else "").upper()
+
+
+def identifier_messages_for_scheme(scheme_id):
+    """Return the default invalid/required messages for ``scheme_id``.
+
+    Returns:
+        A dict with lazy ``invalid`` and ``required`` messages.
+    """
+    scheme = scheme_id_label_uppercase(scheme_id)
+    return {
+        "invalid": _("This is not a valid %(scheme)s identifier.", scheme=scheme),
+        "required": _(
+            "You must provide a %(scheme)s identifier or remove this row",
+            scheme=scheme,
+        ),
+    }
+
+
+DEFAULT_ID_REQUIRED_MSG = _("Add an identifier or remove this row")
+
+SCHEME_NOT_ALLOWED_MSG = _("This identifier scheme is not allowed.")
+
+CREATOR_IDENTIFIER_INFERENCE_ORDER = ("orcid", "isni", "ror", "gnd")
+"""Schemes tried first when a creator identifier has no scheme."""
+
+
+def unrecognized_creator_identifier_message(allowed_scheme_ids):
+    """Return the message for a value no allowed scheme accepts.
+
+    Returns:
+        The lazy message listing the allowed schemes.
+    """
+    labels = ", ".join(scheme_id_label_uppercase(s) for s in allowed_scheme_ids or [])
+    return _(
+        "This identifier is not valid for any supported scheme (%(schemes)s).",
+        schemes=labels,
+    )
+
+
+# The characters JavaScript's ``\s`` and ``String.prototype.trim`` treat as
+# whitespace.
+_JS_WHITESPACE = (
+    "\t\n\x0b\x0c\r \xa0\u1680"
+    + "".join(chr(c) for c in range(0x2000, 0x200B))
+    + "\u2028\u2029\u202f\u205f\u3000\ufeff"
+)
+_WS = "[" + re.escape(_JS_WHITESPACE) + "]"
+_NON_WS = "[^" + re.escape(_JS_WHITESPACE) + "]"
+# JavaScript's ``.``: anything but a line terminator.
+_ANY = "[^\n\r\u2028\u2029]"
+
+_ASCII_I = re.ASCII | re.IGNORECASE
+
+
+def _is_empty(value):
+    return value is None or value == ""
+
+
+def _js_trim(value):
+    return value.strip(_JS_WHITESPACE)
+
+
+def _significant(value, skip):
+    """Return the characters of ``value`` not in ``skip``, as a string."""
+    return "".join(c for c in value if c not in skip)
+
+
+def _mod11_2_valid(digits):
+    """ISO 7064 MOD 11-2 over 15 digits and a check character (digit or X).
+
+    Shared by ISNI and ORCID.
+
+    Returns:
+        Whether ``digits`` (16 characters, separators removed) is valid.
+    """
+    total = 0
+    for c in digits[:15]:
+        if not "0" <= c <= "9":
+            return False
+        total = (total + ord(c) - 48) * 2
+    check = digits[15]
+    if check in "Xx":
+        value = 10
+    elif "0" <= check <= "9":
+        value = ord(check) - 48
+    else:
+        return False
+    return value == (12 - total % 11) % 11
+
+
+def _ean13_valid(digits):
+    """Return whether 13 characters carry a valid EAN-13 checksum."""
+    if any(not "0" <= c <= "9" for c in digits):
+        return False
+    total = sum((ord(c) - 48) * (3 if i % 2 else 1) for i, c in enumerate(digits[:12]))
+    return ord(digits[12]) - 48 == (10 - total % 10) % 10
+
+
+def _idutils_valid(validator, value):
+    """Run an ``idutils`` validator on ``value``.
+
+    Returns:
+        Whether it passed; a value ``urllib.parse`` cannot split (such as an
+        unclosed ``[``) does not.
+    """
+    try:
+        return bool(validator(value))
+    except ValueError:
+        return False
+
+
+# See https://ror.org/facts/#core-components.
+_ROR = re.compile(rf"(?:(?:https?://)?ror{_ANY}org/)?(0\w{{6}}\d{{2}})", _ASCII_I)
+_ROR_EMPTY = IdentifierFailure(_("ROR identifier cannot be empty"), True)
+_ROR_INVALID = IdentifierFailure(identifier_messages_for_scheme("ror")["invalid"])
+
+
+def check_ror(value):
+    """Check a Research Organization Registry identifier (bare or URL).
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if not isinstance(value, str):
+        return _ROR_EMPTY
+    return None if _ROR.fullmatch(value) else _ROR_INVALID
+
+
+_ISNI_LENGTH = IdentifierFailure(
+    _(
+        "This is not a valid %(scheme)s identifier (%(detail)s).",
+        scheme="ISNI",
+        detail="it must be 16 characters",
+    )
+)
+_ISNI_INVALID = IdentifierFailure(identifier_messages_for_scheme("isni")["invalid"])
+
+
+def check_isni(value):
+    """Check an ISNI: 16 characters, hyphens and spaces ignored, MOD 11-2.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if not isinstance(value, str):
+        return _ISNI_INVALID
+    digits = _significant(value, "- ")
+    if len(digits) != 16:
+        return _ISNI_LENGTH
+    return None if _mod11_2_valid(digits) else _ISNI_INVALID
+
+
+# Resolver prefixes as stripped by idutils.is_gnd, then ``gnd_regexp``.
+_GND = re.compile(
+    r"(?:(?:https?://)?d-nb\.info/gnd/)?(?:gnd:|GND:)?"
+    r"(1[012]?\d{7}[0-9X]|(?:4|7)\d{6}-\d|(?:[1-9])\d{0,7}-[0-9X]|(?:3)\d{7}[0-9X])",
+    re.ASCII,
+)
+_GND_EMPTY = IdentifierFailure(_("GND identifier cannot be empty"), True)
+_GND_INVALID = IdentifierFailure(identifier_messages_for_scheme("gnd")["invalid"])
+
+
+def check_gnd(value):
+    """Check a Gemeinsame Normdatei identifier, with optional resolver prefix.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if not isinstance(value, str):
+        return _GND_EMPTY
+    return None if _GND.fullmatch(value) else _GND_INVALID
+
+
+# Bare or orcid.org URL form; the four blocks are either all hyphenated or not.
+_ORCID = re.compile(
+    r"(?:(?:https?://)?orcid\.org/)?(?:\d{4}-\d{4}-\d{4}-\d{3}|\d{15})[\dX]", _ASCII_I
+)
+_ORCID_NOT_STRING = IdentifierFailure(_("ORCID must be a string"), True)
+_ORCID_INVALID = IdentifierFailure(identifier_messages_for_scheme("orcid")["invalid"])
+
+
+def check_orcid(value):
+    """Check an ORCID iD (bare or orcid.org URL) and its MOD 11-2 check digit.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if not isinstance(value, str):
+        return _ORCID_NOT_STRING
+    if not _ORCID.fullmatch(value):
+        return _ORCID_INVALID
+    digits = _significant(value[value.rfind("/") + 1 :], "-")
+    return None if _mod11_2_valid(digits) else _ORCID_INVALID
+
+
+_ARK_NOT_STRING = IdentifierFailure(_("ARK must be a string"))
+_ARK_INVALID = IdentifierFailure(_("This is not a valid ARK identifier."))
+
+
+def check_ark(value):
+    """Check an ARK, bare or behind an ``http`` resolver. Uses idutils.is_ark.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _ARK_NOT_STRING
+    return None if _idutils_valid(idutils.is_ark, value) else _ARK_INVALID
+
+
+_ARXIV_POST_2007 = re.compile(r"(arxiv:)?(\d{4})\.(\d{4,5})(v\d+)?", _ASCII_I)
+_ARXIV_PRE_2007 = re.compile(
+    r"(arxiv:)?([a-z\-]+)(\.[a-z]{2})?(/\d{4})(\d+)(v\d+)?", _ASCII_I
+)
+_ARXIV_WITH_CLASS = re.compile(
+    r"(arxiv:)?(?:[a-z\-]+)(?:\.[a-z]{2})?/(\d{4})\.(\d{4,5})(v\d+)?", _ASCII_I
+)
+_ARXIV_NOT_STRING = IdentifierFailure(_("arXiv must be a string"))
+_ARXIV_INVALID = IdentifierFailure(_("This is not a valid arXiv identifier."))
+
+
+def check_arxiv(value):
+    """Check an arXiv id (post-2007 and pre-2007). Mirrors idutils.is_arxiv.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _ARXIV_NOT_STRING
+    v = _js_trim(value)
+    if (
+        _ARXIV_POST_2007.fullmatch(v)
+        or _ARXIV_PRE_2007.fullmatch(v)
+        or _ARXIV_WITH_CLASS.fullmatch(v)
+    ):
+        return None
+    return _ARXIV_INVALID
+
+
+_ADS = re.compile(rf"(ads:|ADS:)?(\d{{4}}[A-Za-z]{_NON_WS}{{13}}[A-Za-z.:])", re.ASCII)
+_ADS_NOT_STRING = IdentifierFailure(_("ADS/Bibcode must be a string"))
+_ADS_INVALID = IdentifierFailure(_("This is not a valid ADS/Bibcode identifier."))
+
+
+def check_ads(value):
+    """Check an ADS bibliographic code after NFKD. Mirrors idutils.is_ads.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _ADS_NOT_STRING
+    normalized = _js_trim(unicodedata.normalize("NFKD", value))
+    return None if _ADS.fullmatch(normalized) else _ADS_INVALID
+
+
+_EAN13_INVALID = IdentifierFailure(_("This is not a valid EAN-13 identifier."))
+
+
+def check_ean13(value):
+    """Check an EAN-13. Mirrors idutils.is_ean13.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str) or len(value) != 13:
+        return _EAN13_INVALID
+    return None if _ean13_valid(value) else _EAN13_INVALID
+
+
+_ISSN_INVALID = IdentifierFailure(_("This is not a valid ISSN."))
+
+
+def check_issn(value):
+    """Check an ISSN; used for issn, eissn and lissn. Mirrors idutils.is_issn.
+
+    As in idutils, X counts as 10 in any position.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _ISSN_INVALID
+    digits = _significant(value, "- ")
+    if len(digits) != 8:
+        return _ISSN_INVALID
+    total = 0
+    for i, c in enumerate(digits):
+        if c in "Xx":
+            d = 10
+        elif "0" <= c <= "9":
+            d = ord(c) - 48
+        else:
+            return _ISSN_INVALID
+        total += (8 - i) * d
+    return None if total % 11 == 0 else _ISSN_INVALID
+
+
+_ISBN_SKIP = frozenset(_JS_WHITESPACE + "-")
+_ISBN_INVALID = IdentifierFailure(_("This is not a valid ISBN."))
+
+
+def check_isbn(value):
+    """Check an ISBN-10 or ISBN-13. Mirrors idutils.is_isbn (isbnlib).
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _ISBN_INVALID
+    v = _significant(value, _ISBN_SKIP)
+    if len(v) == 10:
+        if not v[:9].isascii() or not v[:9].isdigit():
+            return _ISBN_INVALID
+        total = sum((10 - i) * int(c) for i, c in enumerate(v[:9]))
+        if v[9] in "Xx":
+            check = 10
+        elif "0" <= v[9] <= "9":
+            check = int(v[9])
+        else:
+            return _ISBN_INVALID
+        return None if check == (11 - total % 11) % 11 else _ISBN_INVALID
+    if len(v) == 13 and v[:3] in ("978", "979"):
+        return None if _ean13_valid(v) else _ISBN_INVALID
+    return _ISBN_INVALID
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_ISTC_WEIGHTS = (11, 9, 3, 1)
+_ISTC_INVALID = IdentifierFailure(_("This is not a valid ISTC identifier."))
+
+
+def check_istc(value):
+    """Check an ISTC (hex digits, weighted checksum). Mirrors idutils.is_istc.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _ISTC_INVALID
+    v = _significant(value, "- ")
+    if len(v) != 16 or any(c not in _HEX_DIGITS for c in v):
+        return _ISTC_INVALID
+    digits = [int(c, 16) for c in v]
+    total = sum(d * _ISTC_WEIGHTS[i % 4] for i, d in enumerate(digits[:15]))
+    return None if digits[15] == total % 16 else _ISTC_INVALID
+
+
+_HANDLE = re.compile(
+    rf"(hdl:{_WS}*|(?:https?://)?hdl\.handle\.net/)?([^/.]+(\.[^/.]+)*/{_ANY}*)",
+    re.IGNORECASE,
+)
+_HANDLE_NOT_STRING = IdentifierFailure(_("Handle must be a string"))
+_HANDLE_INVALID = IdentifierFailure(_("This is not a valid Handle."))
+
+
+def check_handle(value):
+    """Check a Handle. Mirrors idutils.is_handle.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _HANDLE_NOT_STRING
+    return None if _HANDLE.fullmatch(_js_trim(value)) else _HANDLE_INVALID
+
+
+_LSID_NOT_STRING = IdentifierFailure(_("LSID must be a string"))
+_LSID_INVALID = IdentifierFailure(_("This is not a valid LSID identifier."))
+
+
+def check_lsid(value):
+    """Check an LSID (URN with the lsid pattern). Uses idutils.is_lsid.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _LSID_NOT_STRING
+    return None if _idutils_valid(idutils.is_lsid, value) else _LSID_INVALID
+
+
+_PMID = re.compile(r"(pmid:|https?://pubmed\.ncbi\.nlm\.nih\.gov/)?(\d+)/?", _ASCII_I)
+_PMID_NOT_STRING = IdentifierFailure(_("PMID must be a string"))
+_PMID_INVALID = IdentifierFailure(_("This is not a valid PubMed ID."))
+
+
+def check_pmid(value):
+    """Check a PubMed ID. Mirrors idutils.is_pmid.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _PMID_NOT_STRING
+    return None if _PMID.fullmatch(_js_trim(value)) else _PMID_INVALID
+
+
+_PURL_NOT_STRING = IdentifierFailure(_("PURL must be a string"))
+_PURL_INVALID = IdentifierFailure(_("This is not a valid PURL."))
+
+
+def check_purl(value):
+    """Check a PURL: an http(s) URL on a PURL resolver. Uses idutils.is_purl.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _PURL_NOT_STRING
+    return None if _idutils_valid(idutils.is_purl, value) else _PURL_INVALID
+
+
+_URN_NOT_STRING = IdentifierFailure(_("URN must be a string"))
+_URN_INVALID = IdentifierFailure(_("This is not a valid URN."))
+
+
+def check_urn(value):
+    """Check a URN. Uses idutils.is_urn.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _URN_NOT_STRING
+    return None if _idutils_valid(idutils.is_urn, value) else _URN_INVALID
+
+
+_URL_PROTOCOL = re.compile(r"[a-z][a-z0-9+.-]*://", _ASCII_I)
+_URL_NOT_STRING = IdentifierFailure(_("URL must be a string"))
+_URL_NO_PROTOCOL = IdentifierFailure(
+    _("You must include a protocol like https:// in the URL.")
+)
+_URL_INVALID = IdentifierFailure(_("This is not a valid URL."))
+
+
+def check_url(value):
+    """Check a URL with a scheme and a host. Uses idutils.is_url.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _URL_NOT_STRING
+    v = _js_trim(value)
+    if not _URL_PROTOCOL.match(v):
+        return _URL_NO_PROTOCOL
+    return None if _idutils_valid(idutils.is_url, v) else _URL_INVALID
+
+
+# Matches python ``idutils.is_doi`` via ``idutils.validators.doi_regexp``.
+_DOI = re.compile(
+    rf"(doi:{_WS}*|(?:https?://)?(?:dx\.)?doi\.org/)?(10\.\d+(\.\d+)*/{_ANY}+)",
+    _ASCII_I,
+)
+_DOI_NOT_STRING = IdentifierFailure(_("DOI must be a string"))
+_DOI_INVALID = IdentifierFailure(_("This is not a valid DOI."))
+
+
+def check_doi(value):
+    """Check a DOI, bare or with a ``doi:`` or doi.org prefix.
+
+    Returns:
+        ``None`` when valid, else an :class:`IdentifierFailure`.
+    """
+    if _is_empty(value):
+        return None
+    if not isinstance(value, str):
+        return _DOI_NOT_STRING
+    return None if _DOI.fullmatch(_js_trim(value)) else _DOI_INVALID
+
+
+def check_always_valid(value):
+    """Accept any value (grid, igsn, upc, w3id, other, crossreffunderid).
+
+    Mirrors server-side always_valid in invenio-rdm-records config.
+
+    Returns:
+        Always ``None``.
+    """
+    return None
+
+
+IDENTIFIER_CHECKS: dict[str, Callable[[object], IdentifierFailure | None]] = {
+    # RDM_RECORDS_IDENTIFIERS_SCHEMES
+    "ark": check_ark,
+    "arxiv": check_arxiv,
+    "ads": check_ads,
+    "crossreffunderid": check_always_valid,
+    "doi": check_doi,
+    "ean13": check_ean13,
+    "eissn": check_issn,
+    "grid": check_always_valid,
+    "handle": check_handle,
+    "igsn": check_always_valid,
+    "isbn": check_isbn,
+    "isni": check_isni,
+    "issn": check_issn,
+    "istc": check_istc,
+    "lissn": check_issn,
+    "lsid": check_lsid,
+    "pmid": check_pmid,
+    "purl": check_purl,
+    "upc": check_always_valid,
+    "url": check_url,
+    "urn": check_urn,
+    "w3id": check_always_valid,
+    "other": check_always_valid,
+    # RDM_RECORDS_PERSONORG_SCHEMES
+    "orcid": check_orcid,
+    "gnd": check_gnd,
+    "ror": check_ror,
+}
+"""Scheme id to check, as ``IDENTIFIER_CHECKS`` in ``identifierChecks.js``."""
+
+
+def check_identifier(scheme_id, value):
+    """Check ``value`` against one scheme's format.
+
+    Returns:
+        ``None`` when valid or when the scheme has no check, else an
+        :class:`IdentifierFailure`.
+    """
+    check = IDENTIFIER_CHECKS.get(scheme_id)
+    return check(value) if check else None
+
+
+def check_identifiers(scheme_id, values):
+    """Check many values against one scheme's format.
+
+    Args:
+        scheme_id: The scheme every value is checked against.
+        values: An iterable of identifier values.
+
+    Returns:
+        A list with ``None`` or an :class:`IdentifierFailure` per value.
+    """
+    check = IDENTIFIER_CHECKS.get(scheme_id, check_always_valid)
+    return [check(value) for value in values]
+
+
+def make_identifier_validator(allowed_scheme_ids, infer_scheme=False):
+    """Build a validator for identifier rows, resolving schemes and messages once.
+
+    Applies the rules of ``createIdentifierValidator`` in ``identifierChecks.js``:
+    a scheme outside ``allowed_scheme_ids`` is rejected, an empty identifier is
+    "required", otherwise the scheme's check decides. With ``infer_scheme``, a
+    row without a scheme gets the first allowed scheme whose check accepts the
+    trimmed identifier (ORCID, ISNI, ROR and GND first), and a non-empty
+    identifier no scheme accepts is rejected; without it, such rows pass.
+
+    Args:
+        allowed_scheme_ids: The scheme ids rows may use.
+        infer_scheme: Whether to infer the scheme of rows without one.
+
+    Returns:
+        A ``validate(scheme, identifier)`` function returning a
+        ``{"scheme", "valid", "message"}`` dict. ``message`` is a string in the
+        current locale, or ``None`` when valid.
+    """
+    allowed_ids = list(allowed_scheme_ids or [])
+    allowed = frozenset(allowed_ids)
+    inference_order = [
+        scheme
+        for scheme in [
+            *(s for s in CREATOR_IDENTIFIER_INFERENCE_ORDER if s in allowed),
+            *(s for s in allowed_ids if s not in CREATOR_IDENTIFIER_INFERENCE_ORDER),
+        ]
+        if scheme in IDENTIFIER_CHECKS
+    ]
+    messages = {}
+
+    def messages_for(scheme):
+        if scheme not in messages:
+            defaults = identifier_messages_for_scheme(scheme)
+            messages[scheme] = {
+                "required": str(
+                    defaults["required"]
+                    if scheme in IDENTIFIER_CHECKS
+                    else DEFAULT_ID_REQUIRED_MSG
+                ),
+                "invalid": str(defaults["invalid"]),
+            }
+        return messages[scheme]
+
+    def infer(value):
+        v = "" if value is None else _js_trim(str(value))
+        if not v:
+            return None
+        for scheme in inference_order:
+            if IDENTIFIER_CHECKS[scheme](v) is None:
+                return scheme
+        return None
+
+    def result(scheme, message=None):
+        return {"scheme": scheme, "valid": message is None, "message": message}
+
+    def validate(raw_scheme, value):
+        scheme = "" if raw_scheme is None else _js_trim(str(raw_scheme))
+        if not scheme and infer_scheme:
+            scheme = infer(value) or ""
+        if not scheme:
+            if infer_scheme and value is not None and _js_trim(str(value)) != "":
+                return result(
+                    None, str(unrecognized_creator_identifier_message(allowed_ids))
+                )
+            return result(None)
+        if scheme not in allowed:
+            return result(scheme, str(SCHEME_NOT_ALLOWED_MSG))
+        if _is_empty(value):
+            return result(scheme, messages_for(scheme)["required"])
+        failure = check_identifier(scheme, value)
+        if failure is None:
+            return result(scheme)
+        if failure.fixed:
+            return result(scheme, str(failure.message))
+        return result(scheme, messages_for(scheme)["invalid"])
+
+    return validate
+
+
+def validate_identifiers(
+    batch: Iterable[dict], allowed_scheme_ids=None, infer_scheme=False
+) -> list[dict]:
+    """Validate many identifier rows in one pass, as the deposit form would.
+
+    Args:
+        batch: An iterable of ``{"scheme", "identifier"}`` dicts (either key
+            may be missing).
+        allowed_scheme_ids: The scheme ids rows may use; defaults to every
+            scheme in :data:`IDENTIFIER_CHECKS`.
+        infer_scheme: Whether to infer the scheme of rows without one.
+
+    Returns:
+        One ``{"scheme", "valid", "message"}`` dict per row, in order.
+        ``scheme`` is the inferred scheme where one was inferred.
+    """
+    validate = make_identifier_validator(
+        IDENTIFIER_CHECKS.keys() if allowed_scheme_ids is None else allowed_scheme_ids,
+        infer_scheme=infer_scheme,
+    )
+    return [
+        validate((entry or {}).get("scheme"), (entry or {}).get("identifier"))
+        for entry in batch
+    ]
@@ -0,0 +1,211 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Resolve the per-resource-type form page layouts once, on the server.
+
+The browser used to merge ``MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE`` into the
+common ``FormPages`` every time the resource type changed, walking ``same_as``
+chains as it went (``getResolvedFormPages`` in ``utils.js``). This module does
+the same merge for every configured type when the static deposits-config
+payload is built (at ``finalize_app`` time), so the client only has to look the
+selected type up in ``resolved_form_pages``.
+
+Broken ``same_as`` references (unknown types, pages missing on the target type,
+cycles) raise :class:`LayoutConfigError` here instead of silently producing an
+empty page in the browser.
+"""
+
+from flask_babel.speaklater import LazyString
+
+
+class LayoutConfigError(ValueError):
+    """Raised when ``MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE`` cannot be resolved."""
+
+
+def _is_page(value):
+    """Return whether ``value`` is a page layout dict (not a bare list or None)."""
+    return isinstance(value, dict)
+
+
+def _same_as(page):
+    """Return the page's ``same_as`` target type id, or None."""
+    target = page.get("same_as")
+    if isinstance(target, str) and target.strip():
+        return target
+    return None
+
+
+def _label(value):
+    """Return ``value`` if it is a non-blank (plain or lazy) string, else None.
+
+    Matches the client's ``typeof label === "string" && label.trim() !== ""``
+    check; lazy strings count because they are serialized as strings.
+    """
+    if isinstance(value, (str, LazyString)) and str(value).strip():
+        return value
+    return None
+
+
+def find_form_pages(common_fields):
+    """Return the ``FormPages`` subsections from ``common_fields``.
+
+    Args:
+        common_fields: The ``MODULAR_DEPOSIT_FORM_COMMON_FIELDS`` list.
+
+    Returns:
+        The list of FormPage dicts, or an empty list when there is no
+        ``FormPages`` component.
+    """
+    for item in common_fields or []:
+        if isinstance(item, dict) and item.get("component") == "FormPages":
+            return item.get("subsections") or []
+    return []
+
+
+def _resolve_inherited_page(page_id, type_id, fields_by_type, resolved, chain=()):
+    """Resolve ``fields_by_type[type_id][page_id]`` with its ``same_as`` chain.
+
+    Mirrors ``_resolveInheritedPageLayout``/``_mergeSameAsLayout`` in
+    ``utils.js``: the base type's page is resolved first, then this type's keys
+    (other than ``same_as``) are applied on top. ``subsections`` come from the
+    base unless this type sets them.
+
+    Args:
+        page_id: The FormPage ``section`` id.
+        type_id: The resource type id whose page is resolved.
+        fields_by_type: The full ``fields_by_type`` map.
+        resolved: Memo dict keyed by ``(type_id, page_id)``, shared across calls.
+        chain: Type ids already on this ``same_as`` chain, for cycle detection.
+
+    Returns:
+        The resolved page dict, without ``same_as``.
+
+    Raises:
+        LayoutConfigError: If a ``same_as`` target type or its page is missing,
+            or the chain loops back on itself.
+    """
+    key = (type_id, page_id)
+    if key in resolved:
+        return resolved[key]
+    if type_id in chain:
+        raise LayoutConfigError(
+            "same_as cycle on page {!r}: {}".format(
+                page_id, " -> ".join((*chain, type_id))
+            )
+        )
+
+    page = fields_by_type[type_id][page_id]
+    target = _same_as(page)
+    if target is None:
+        result = dict(page)
+    else:
+        source = f"{type_id}[{page_id!r}]"
+        if target not in fields_by_type:
+            raise LayoutConfigError(
+                f"{source} has same_as {target!r}, which is not a configured "
+                "resource type"
+            )
+        if not _is_page(fields_by_type[target].get(page_id)):
+            raise LayoutConfigError(
+                f"{source} has same_as {target!r}, which has no page {page_id!r}"
+            )
+        base = _resolve_inherited_page(
+            page_id, target, fields_by_type, resolved, (*chain, type_id)
+        )
+        overrides = {k: v for k, v in page.items() if k != "same_as"}
+        base_subs = base.get("subsections")
+        result = {
+            **base,
+            **overrides,
+            "subsections": overrides.get(
+                "subsections", base_subs if isinstance(base_subs, list) else []
+            ),
+        }
+    result.pop("same_as", None)
+    resolved[key] = result
+    return result
+
+
+def _merge_form_page(common_page, type_page):
+    """Merge one common FormPage with the (already resolved) type page.
+
+    Mirrors ``_resolveMergedFormPageConfig`` in ``utils.js``.
+
+    Returns:
+        The merged FormPage dict with ``subsections`` and ``label`` set.
+    """
+    page_id = common_page.get("section")
+    common_subs = common_page.get("subsections")
+    if not isinstance(common_subs, list):
+        common_subs = []
+    # ``commonPage?.label ?? pageId ?? ""``: only a missing label falls through.
+    fallback_label = common_page.get("label")
+    if fallback_label is None:
+        fallback_label = page_id if page_id is not None else ""
+
+    if type_page is None:
+        return {**common_page, "subsections": common_subs, "label": fallback_label}
+
+    subsections = type_page.get("subsections")
+    label = _label(type_page.get("label"))
+    return {
+        **common_page,
+        **type_page,
+        "subsections": subsections if isinstance(subsections, list) else common_subs,
+        "label": label if label is not None else fallback_label,
+    }
+
+
+def compile_resolved_form_pages(common_fields, fields_by_type):
+    """Resolve the merged FormPage list for every resource type.
+
+    Most types only override one or two pages, so the merged pages are stored
+    once in ``pages`` and each type lists indexes into it; the page for type
+    ``t`` at FormPages position ``i`` is ``pages[by_type[t][i]]``.
+
+    Args:
+        common_fields: The ``MODULAR_DEPOSIT_FORM_COMMON_FIELDS`` list.
+        fields_by_type: The ``MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE`` map.
+
+    Returns:
+        A dict ``{"pages": [...], "by_type": {type_id: [index, ...]}}`` with an
+        entry in ``by_type`` for each resource type in ``fields_by_type``, in
+        ``FormPages`` order. Pages are included even when their ``subsections``
+        are empty, like ``getResolvedFormPages``. Nested subsection lists are
+        shared with the config, not copied.
+
+    Raises :class:`LayoutConfigError` if any ``same_as`` reference cannot be
+    resolved.
+    """
+    form_pages = [page for page in find_form_pages(common_fields) if _is_page(page)]
+    fields_by_type = {
+        type_id: pages
+        for type_id, pages in (fields_by_type or {}).items()
+        if isinstance(pages, dict)
+    }
+    resolved = {}
+    pages = []
+    page_indexes = {}
+    by_type = {}
+    for type_id, type_pages in fields_by_type.items():
+        # Resolve every configured page, not only those in FormPages, so broken
+        # same_as references fail here rather than on a page added later.
+        for page_id, page in type_pages.items():
+            if _is_page(page):
+                _resolve_inherited_page(page_id, type_id, fields_by_type, resolved)
+
+        indexes = []
+        for position, common_page in enumerate(form_pages):
+            type_page = resolved.get((type_id, common_page.get("section")))
+            # Resolved type pages are memoized, so identity is a safe dedupe key.
+            key = (position, id(type_page) if type_page is not None else None)
+            if key not in page_indexes:
+                page_indexes[key] = len(pages)
+                pages.append(_merge_form_page(common_page, type_page))
+            indexes.append(page_indexes[key])
+        by_type[type_id] = indexes
+    return {"pages": pages, "by_type": by_type}
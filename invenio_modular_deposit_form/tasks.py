@@ -0,0 +1,169 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Background Names vocabulary sync after user name updates.
+
+The user name API views write ``name_parts_local`` and then need
+``current_names_sync_service.upsert_name_for_user`` for each user, which
+writes to the Names index. :func:`enqueue_names_sync` moves that work out of
+the request: it records a job in ``invenio_cache`` and hands the user ids to
+the :func:`sync_user_names` Celery task, which updates the job as it goes.
+Callers poll :func:`get_names_sync_job` (exposed as
+``GET /users/names/sync/<job_id>``).
+
+``MODULAR_DEPOSIT_FORM_NAMES_SYNC_EXECUTOR`` selects where the work runs:
+``"celery"`` (the default) queues the task; ``"sync"`` runs it in the calling
+process before returning, which tests and single-process setups use.
+
+Each user's Names sync is marked pending from the moment it is requested until
+an upsert for them succeeds (:func:`is_names_sync_pending`), so the single-user
+view can tell a finished sync from one that failed or has not run yet.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from celery import shared_task
+from flask import current_app
+from invenio_accounts.models import User
+from invenio_cache import current_cache
+from invenio_remote_user_data_kcworks.proxies import current_names_sync_service
+
+_JOB_KEY_PREFIX = "modular_deposit_form:names_sync:"
+
+# Set from the moment a user's Names sync is requested until it succeeds.
+_SYNC_PENDING_KEY = "modular_deposit_form:names_sync_pending:{}"
+
+# Job progress is written back to the cache after this many users.
+_PROGRESS_EVERY = 25
+
+
+def _save_job(job: dict) -> None:
+    """Write ``job`` to the cache for ``MODULAR_DEPOSIT_FORM_NAMES_SYNC_JOB_TTL``."""
+    current_cache.set(
+        f"{_JOB_KEY_PREFIX}{job['job_id']}",
+        job,
+        timeout=current_app.config.get(
+            "MODULAR_DEPOSIT_FORM_NAMES_SYNC_JOB_TTL", 86400
+        ),
+    )
+
+
+def mark_names_sync_pending(user_ids: list[int]) -> None:
+    """Record that the Names records of ``user_ids`` still need a sync."""
+    current_cache.set_many(
+        {_SYNC_PENDING_KEY.format(user_id): True for user_id in user_ids},
+        timeout=0,
+    )
+
+
+def clear_names_sync_pending(user_id: int) -> None:
+    """Record that the Names record of ``user_id`` is up to date."""
+    current_cache.delete(_SYNC_PENDING_KEY.format(user_id))
+
+
+def is_names_sync_pending(user_id: int) -> bool:
+    """Whether a Names sync for ``user_id`` was requested and has not succeeded.
+
+    Returns:
+        True while the sync is queued, running or failed.
+    """
+    return bool(current_cache.get(_SYNC_PENDING_KEY.format(user_id)))
+
+
+def get_names_sync_job(job_id: str) -> dict | None:
+    """Return the status of a Names sync job.
+
+    Returns:
+        A dict with ``job_id``, ``status`` (``"queued"``, ``"running"``,
+        ``"done"`` or ``"failed"``), ``total``, ``synced`` and ``skipped``
+        counts, the ``failed`` user ids and ``requested_by``; or None when the
+        job is unknown or expired.
+    """
+    return current_cache.get(f"{_JOB_KEY_PREFIX}{job_id}")
+
+
+def sync_names_for_users(job_id: str, user_ids: list[int]) -> dict:
+    """Upsert the Names vocabulary record of each user, tracking progress.
+
+    A failure for one user is logged and recorded, and leaves their sync
+    pending; the others still run.
+
+    Args:
+        job_id: Job created by :func:`enqueue_names_sync`.
+        user_ids: Users to sync, in order.
+
+    Returns:
+        The final job status.
+    """
+    job = get_names_sync_job(job_id) or {
+        "job_id": job_id,
+        "total": len(user_ids),
+        "requested_by": None,
+    }
+    job.update(status="running", synced=0, skipped=0, failed=[])
+    _save_job(job)
+
+    users = {user.id: user for user in User.query.filter(User.id.in_(user_ids))}
+    for done, user_id in enumerate(user_ids, start=1):
+        user = users.get(user_id)
+        try:
+            record = (
+                current_names_sync_service.upsert_name_for_user(user)
+                if user is not None
+                else None
+            )
+        except Exception:
+            current_app.logger.exception(
+                "Names sync failed for user %s (job %s)", user_id, job_id
+            )
+            job["failed"].append(user_id)
+        else:
+            clear_names_sync_pending(user_id)
+            job["synced" if record is not None else "skipped"] += 1
+        if done % _PROGRESS_EVERY == 0:
+            _save_job(job)
+
+    job["status"] = "failed" if job["failed"] else "done"
+    _save_job(job)
+    return job
+
+
+@shared_task(ignore_result=True)
+def sync_user_names(job_id, user_ids):
+    """Celery task running :func:`sync_names_for_users`."""
+    sync_names_for_users(job_id, user_ids)
+
+
+def enqueue_names_sync(user_ids: list[int], requested_by: int | None = None) -> dict:
+    """Create a Names sync job for ``user_ids`` and start it.
+
+    Args:
+        user_ids: Users whose Names records should be upserted.
+        requested_by: Id of the user who asked; they may read the job status.
+
+    Returns:
+        The job status right after queueing (or, with the ``"sync"`` executor,
+        after it finished).
+    """
+    job = {
+        "job_id": uuid.uuid4().hex,
+        "status": "queued",
+        "total": len(user_ids),
+        "synced": 0,
+        "skipped": 0,
+        "failed": [],
+        "requested_by": requested_by,
+    }
+    _save_job(job)
+    mark_names_sync_pending(user_ids)
+    executor = current_app.config.get("MODULAR_DEPOSIT_FORM_NAMES_SYNC_EXECUTOR")
+    if executor == "sync":
+        return sync_names_for_users(job["job_id"], list(user_ids))
+    sync_user_names.delay(job["job_id"], list(user_ids))
+    return job
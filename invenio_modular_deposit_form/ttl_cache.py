@@ -0,0 +1,100 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Bounded, expiring in-process cache.
+
+Used for the vocabulary options of custom fields
+(:class:`.custom_fields.options_cache.VocabularyOptionsCache`) and for ORCID
+search responses (:mod:`.views.names_suggestions`). Each process keeps its own
+entries.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry and hit/miss counters."""
+
+    def __init__(self, maxsize=512, ttl=300, clock=time.monotonic):
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Seconds an entry stays valid. ``0`` disables caching.
+            clock: Monotonic time source, replaceable in tests.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """Whether entries are stored at all."""
+        return self.ttl > 0 and self.maxsize > 0
+
+    def __contains__(self, key):
+        """Check for an unexpired entry without counting a hit or miss.
+
+        Returns:
+            True if ``key`` is cached and not expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > self._clock()
+
+    def get(self, key):
+        """Return the cached value for ``key``, or None when absent or expired.
+
+        Counts a hit or a miss.
+
+        Returns:
+            The stored value, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        """Store ``value`` under ``key``, evicting the least recently used entries."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the hit/miss counters and the current size.
+
+        Returns:
+            A dict with ``hits``, ``misses`` and ``size``.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
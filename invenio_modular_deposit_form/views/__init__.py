@@ -7,6 +7,6 @@
 
 """Views package for Invenio Modular Deposit Form."""
 
-from .users_name import create_api_blueprint
+from .api import create_api_blueprint
 
 __all__ = ("create_api_blueprint",)
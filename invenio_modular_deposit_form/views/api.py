@@ -0,0 +1,70 @@
+#
+# Copyright (C) 2023-2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""API blueprint for Invenio Modular Deposit Form."""
+
+from __future__ import annotations
+
+from flask import Blueprint, Flask
+
+from .layout import DepositLayoutView
+from .names_suggestions import NamesSuggestionsView
+from .users_name import UserNamesBulkView, UserNamesSyncStatusView, UserNameView
+from .vocabulary_snapshot import VocabularySnapshotView
+
+
+def create_api_blueprint(app: Flask) -> Blueprint:
+    """Create the modular-deposit-form API blueprint.
+
+    Mounted by ``invenio_base.api_blueprints``; the API app prepends
+    ``/api`` so the effective URL is ``/api/modular-deposit-form/...``.
+
+    Args:
+        app: The Flask app the blueprint will be registered on (unused, but
+            required by the ``invenio_base.api_blueprints`` factory contract).
+
+    Returns:
+        The configured :class:`flask.Blueprint`.
+    """
+    blueprint = Blueprint(
+        "invenio_modular_deposit_form_api",
+        __name__,
+        url_prefix="/modular-deposit-form",
+    )
+
+    blueprint.add_url_rule(
+        "/users/<int:user_id>/name",
+        view_func=UserNameView.as_view(UserNameView.view_name),
+        methods=["POST"],
+    )
+    blueprint.add_url_rule(
+        "/users/names",
+        view_func=UserNamesBulkView.as_view(UserNamesBulkView.view_name),
+        methods=["POST"],
+    )
+    blueprint.add_url_rule(
+        "/users/names/sync/<job_id>",
+        view_func=UserNamesSyncStatusView.as_view(UserNamesSyncStatusView.view_name),
+        methods=["GET"],
+    )
+    blueprint.add_url_rule(
+        "/layout",
+        view_func=DepositLayoutView.as_view(DepositLayoutView.view_name),
+        methods=["GET"],
+    )
+    blueprint.add_url_rule(
+        "/names/suggestions",
+        view_func=NamesSuggestionsView.as_view(NamesSuggestionsView.view_name),
+        methods=["GET"],
+    )
+    blueprint.add_url_rule(
+        "/vocabularies/<vocabulary_id>/snapshot",
+        view_func=VocabularySnapshotView.as_view(VocabularySnapshotView.view_name),
+        methods=["GET"],
+    )
+
+    return blueprint
@@ -0,0 +1,71 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""API view serving the static deposit form layout as cacheable JSON.
+
+Returns the layout keys of the ``deposits-config`` payload (``common_fields``,
+``fields_by_type`` and the label/description/help text/placeholder/icon
+modifications) for one locale. Used by the React app when
+``MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API`` is set, in place of inlining
+the layout into every deposit page.
+
+The body is serialized once per locale and cached on the extension. Responses
+carry a content-hash ETag. When the ``v`` query parameter matches that hash
+(as in the ``layout_url`` the deposit page embeds) the response is marked
+``public, immutable`` with ``MODULAR_DEPOSIT_FORM_LAYOUT_MAX_AGE``; otherwise
+clients get a short max-age and revalidate with the ETag.
+
+The layout is public configuration, so no authentication is required.
+"""
+
+from __future__ import annotations
+
+from flask import current_app, request
+from flask.views import MethodView
+
+from ..filters.deposit_config_json import get_layout_json
+from ..filters.merge_deposit_config import configured_locales
+
+# Max-age for responses requested without (or with a stale) content hash.
+REVALIDATE_MAX_AGE = 300
+
+
+class DepositLayoutView(MethodView):
+    """Serve the static deposit form layout for one locale."""
+
+    view_name = "modular_deposit_form_layout"
+
+    def get(self):
+        """Handle ``GET /layout?locale=<code>&v=<hash>``.
+
+        Unknown or missing ``locale`` values fall back to
+        ``BABEL_DEFAULT_LOCALE`` so arbitrary query strings cannot grow the
+        cache.
+
+        Returns:
+            A JSON :class:`flask.Response` (or ``304 Not Modified`` when the
+            request's ``If-None-Match`` matches the ETag).
+        """
+        app = current_app._get_current_object()
+        locales = configured_locales(app)
+        locale = request.args.get("locale", "")
+        if locale not in locales:
+            locale = locales[0]
+
+        body, content_hash = get_layout_json(app, locale)
+        response = app.response_class(body, mimetype="application/json")
+        response.set_etag(content_hash)
+        response.vary.add("Accept-Encoding")
+        response.cache_control.public = True
+        if request.args.get("v") == content_hash:
+            response.cache_control.max_age = app.config.get(
+                "MODULAR_DEPOSIT_FORM_LAYOUT_MAX_AGE", 31536000
+            )
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.max_age = REVALIDATE_MAX_AGE
+        return response.make_conditional(request)
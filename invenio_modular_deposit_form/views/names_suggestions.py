@@ -0,0 +1,332 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""API view serving person suggestions from the Names vocabulary and ORCID.
+
+The creatibutor modal used to ask ``/api/names`` for local hits and, in the
+browser, the public ORCID expanded search for more, then merge the two. This
+view does both on the server: the ORCID request runs on the extension's
+shared worker pool (``MODULAR_DEPOSIT_FORM_ORCID_SEARCH_WORKERS`` threads)
+while the Names vocabulary is searched in the request thread, ORCID hits whose
+iD is already in the local results are dropped, and one list is returned in
+the ``{"hits": {"hits": [...]}}`` shape of ``/api/names``, so
+``RemoteSelectField`` consumes it unchanged. The list is ranked by how well
+each name matches the query (see :func:`merge_suggestions`).
+
+ORCID responses are cached per process for
+``MODULAR_DEPOSIT_FORM_ORCID_SEARCH_CACHE_TTL`` seconds, keyed on the
+normalized query. An ORCID failure or timeout is logged and leaves only the
+local hits; it is not cached.
+"""
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+import requests
+from flask import abort, current_app, g, request
+from flask.views import MethodView
+from flask_login import current_user
+from invenio_records_resources.proxies import current_service_registry
+
+from ..ttl_cache import TTLCache
+
+DEFAULT_SIZE = 20
+MAX_SIZE = 100
+
+_ORCID_URL_PREFIX = re.compile(r"^https?://(sandbox\.)?orcid\.org/", re.IGNORECASE)
+
+
+def normalize_orcid(value: Any) -> str:
+    """Return the bare ORCID iD of ``value``, without an ``orcid.org`` URL prefix.
+
+    Returns:
+        The stripped iD, or ``""`` for an empty or non-string value.
+    """
+    if not isinstance(value, str):
+        return ""
+    return _ORCID_URL_PREFIX.sub("", value.strip())
+
+
+def orcid_hit_to_name_record(hit: dict) -> dict | None:
+    """Map one ORCID ``expanded-result`` item to a Names vocabulary hit.
+
+    Mirrors ``orcidHitToNameRecord`` in the creatibutor modal's ``orcid.js``.
+
+    Returns:
+        A dict shaped like a ``/api/names`` hit, or None when ``hit`` has no
+        ORCID iD.
+    """
+    orcid = normalize_orcid(hit.get("orcid-id"))
+    if not orcid:
+        return None
+    given = (hit.get("given-names") or "").strip()
+    family = (hit.get("family-names") or "").strip()
+    credit = (hit.get("credit-name") or "").strip()
+    if credit:
+        name = credit
+    elif family and given:
+        name = f"{family}, {given}"
+    else:
+        name = family or given or orcid
+    institutions = hit.get("institution-name") or []
+    if isinstance(institutions, str):
+        institutions = [institutions]
+    return {
+        "id": f"orcid:{orcid}",
+        "name": name,
+        "given_name": given,
+        "family_name": family,
+        "identifiers": [{"scheme": "orcid", "identifier": orcid}],
+        "affiliations": [
+            {"name": inst.strip()}
+            for inst in institutions
+            if isinstance(inst, str) and inst.strip()
+        ],
+    }
+
+
+def _hit_orcids(hit: dict) -> set[str]:
+    """Return the ORCID iDs listed in the identifiers of a Names hit.
+
+    Returns:
+        A set of bare iDs.
+    """
+    return {
+        normalize_orcid(identifier.get("identifier"))
+        for identifier in hit.get("identifiers") or []
+        if (identifier.get("scheme") or "").lower() == "orcid"
+    } - {""}
+
+
+def _normalize_name(value: str) -> str:
+    """Casefold ``value`` and collapse commas and whitespace to single spaces.
+
+    Returns:
+        The normalized name.
+    """
+    return " ".join(value.replace(",", " ").casefold().split())
+
+
+def name_match_rank(hit: dict, query: str) -> int:
+    """Rank how well the name of ``hit`` matches ``query``.
+
+    The name is compared as displayed and as "given family", so "Josiah
+    Carberry" and "Carberry, Josiah" both match "Carberry, Josiah" exactly.
+
+    Returns:
+        ``0`` for an exact match, ``1`` when a name form or one of its words
+        starts with the query, ``2`` otherwise (and for an empty query).
+    """
+    query = _normalize_name(query)
+    if not query:
+        return 2
+    given = hit.get("given_name") or ""
+    family = hit.get("family_name") or ""
+    forms = {
+        _normalize_name(hit.get("name") or ""),
+        _normalize_name(f"{given} {family}"),
+    } - {""}
+    if query in forms:
+        return 0
+    words = {word for form in forms for word in form.split()}
+    if any(text.startswith(query) for text in forms | words):
+        return 1
+    return 2
+
+
+def merge_suggestions(
+    local_hits: list[dict], orcid_hits: list[dict], query: str = ""
+) -> list[dict]:
+    """Merge local Names hits with ORCID hits into one ranked list.
+
+    ORCID hits whose iD a local hit (or an earlier ORCID hit) already carries
+    are dropped. The rest are ranked by :func:`name_match_rank` against
+    ``query``; within a rank, local hits come first in their search-score
+    order, then ORCID hits in ORCID's order. So an exact ORCID match outranks
+    a local hit that only partly matches.
+
+    Returns:
+        The merged list of hits.
+    """
+    seen = set()
+    for hit in local_hits:
+        seen |= _hit_orcids(hit)
+    merged = list(local_hits)
+    for hit in orcid_hits:
+        orcid = hit["identifiers"][0]["identifier"]
+        if orcid in seen:
+            continue
+        seen.add(orcid)
+        merged.append(hit)
+    # sorted() is stable, so each rank keeps the source order.
+    return sorted(merged, key=lambda hit: name_match_rank(hit, query))
+
+
+def fetch_orcid_hits(url: str, query: str, rows: int, timeout: float) -> list[dict]:
+    """Query the ORCID expanded search and map its results.
+
+    Needs no application context, so it can run in a worker thread.
+
+    Returns:
+        A list of Names-shaped hits.
+
+    Raises:
+        requests.RequestException: On connection errors, timeouts and non-2xx
+            responses.
+    """
+    response = requests.get(
+        url,
+        params={"q": query, "rows": rows, "start": 0},
+        headers={"Accept": "application/json"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    results = (response.json() or {}).get("expanded-result") or []
+    return [rec for rec in map(orcid_hit_to_name_record, results) if rec]
+
+
+def create_orcid_search_cache(app) -> TTLCache:
+    """Build the ORCID response cache configured for ``app``.
+
+    Keys are ``("orcid", query, rows)`` tuples.
+
+    Returns:
+        A :class:`.TTLCache`.
+    """
+    return TTLCache(
+        maxsize=app.config.get("MODULAR_DEPOSIT_FORM_ORCID_SEARCH_CACHE_SIZE", 1024),
+        ttl=app.config.get("MODULAR_DEPOSIT_FORM_ORCID_SEARCH_CACHE_TTL", 600),
+    )
+
+
+def create_orcid_search_executor(app) -> ThreadPoolExecutor:
+    """Build the worker pool ORCID searches run on, shared by all requests.
+
+    Returns:
+        A :class:`~concurrent.futures.ThreadPoolExecutor` with
+        ``MODULAR_DEPOSIT_FORM_ORCID_SEARCH_WORKERS`` threads.
+    """
+    return ThreadPoolExecutor(
+        max_workers=app.config.get("MODULAR_DEPOSIT_FORM_ORCID_SEARCH_WORKERS", 4),
+        thread_name_prefix="orcid-search",
+    )
+
+
+def _names_service():
+    """Return the Names vocabulary service.
+
+    Returns:
+        The service registered as ``names``.
+    """
+    return current_service_registry.get("names")
+
+
+def _parse_size(raw: str | None) -> int:
+    """Parse the ``size`` query parameter.
+
+    Returns:
+        An int between 1 and :data:`MAX_SIZE`.
+
+    Raises:
+        werkzeug.exceptions.BadRequest: If ``raw`` is not a positive integer.
+    """
+    if raw is None:
+        return DEFAULT_SIZE
+    try:
+        size = int(raw)
+    except ValueError:
+        size = 0
+    if size < 1:
+        abort(400, description="'size' must be a positive integer.")
+    return min(size, MAX_SIZE)
+
+
+class NamesSuggestionsView(MethodView):
+    """Serve merged Names vocabulary and ORCID person suggestions."""
+
+    view_name = "modular_deposit_form_names_suggestions"
+
+    def get(self):
+        """Handle ``GET /names/suggestions?suggest=<query>&size=<n>``.
+
+        Returns:
+            A dict ``{"hits": {"hits": [...], "total": <int>}, "sources":
+            {"names": <int>, "orcid": <int>, "orcid_status": <str>}}``
+            (Flask serializes it as JSON 200). ``orcid_status`` is one of
+            ``"fetched"``, ``"cached"``, ``"skipped"`` (query too short or
+            ORCID disabled) and ``"error"``.
+
+        Raises:
+            werkzeug.exceptions.HTTPException: Via ``abort()`` for anonymous
+                callers (401) and an invalid ``size`` (400).
+        """
+        if not current_user.is_authenticated:
+            abort(401)
+
+        config = current_app.config
+        query = (request.args.get("suggest") or "").strip()
+        size = _parse_size(request.args.get("size"))
+
+        url = config.get("MODULAR_DEPOSIT_FORM_ORCID_SEARCH_URL")
+        rows = config.get("MODULAR_DEPOSIT_FORM_ORCID_SEARCH_ROWS", 10)
+        min_length = config.get(
+            "MODULAR_DEPOSIT_FORM_ORCID_SEARCH_MIN_QUERY_LENGTH",
+            4,
+        )
+        ext = current_app.extensions["invenio-modular-deposit-form"]
+        cache = ext.orcid_search_cache
+        cache_key = ("orcid", query.casefold(), rows)
+
+        timeout = config.get("MODULAR_DEPOSIT_FORM_ORCID_SEARCH_TIMEOUT", 3)
+        orcid_hits = []
+        orcid_status = "skipped"
+        future = None
+        if url and rows and len(query) >= min_length:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                orcid_hits, orcid_status = cached, "cached"
+            else:
+                future = ext.orcid_search_executor.submit(
+                    fetch_orcid_hits, url, query, rows, timeout
+                )
+
+        local_hits = (
+            _names_service()
+            .search(g.identity, params={"suggest": query, "size": size})
+            .to_dict()["hits"]["hits"]
+        )
+
+        if future is not None:
+            try:
+                # The requests timeout only bounds each socket read, and the
+                # search may wait for a free worker, so bound the wait here too.
+                orcid_hits = future.result(timeout=timeout)
+            except (requests.RequestException, ValueError, FutureTimeoutError) as exc:
+                future.cancel()
+                # The query is a person's name and request errors repeat it in
+                # the URL, so only the kind of failure is logged.
+                current_app.logger.warning(
+                    "ORCID expanded search failed: %s", type(exc).__name__
+                )
+                orcid_status = "error"
+            else:
+                cache.set(cache_key, orcid_hits)
+                orcid_status = "fetched"
+
+        merged = merge_suggestions(local_hits, orcid_hits, query)
+        return {
+            "hits": {"hits": merged, "total": len(merged)},
+            "sources": {
+                "names": len(local_hits),
+                "orcid": len(merged) - len(local_hits),
+                "orcid_status": orcid_status,
+            },
+        }
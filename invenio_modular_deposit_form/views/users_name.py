@@ -17,11 +17,24 @@ given/family split across remote re-syncs.
 After the profile write commits, this view also runs a **synchronous** Names
 vocabulary upsert via ``current_names_sync_service`` so creator lookup
 reflects the new split immediately. ``NamesSyncService`` already prefers
-``name_parts_local`` over ``name_parts``.
+``name_parts_local`` over ``name_parts``. With ``?async=true`` the upsert is
+queued instead (see :mod:`..tasks`) and the response carries the job status.
+
+Re-posting the stored split is a no-op: when ``name_parts_local`` already
+holds the submitted names (and no Names sync for the user is pending, i.e.
+queued or failed), nothing is written or synced and the response says
+``"unchanged"``.
+Each request's auth, validate, commit and sync phases are timed and logged at
+debug level; with ``MODULAR_DEPOSIT_FORM_USER_NAME_SERVER_TIMING`` they are
+also sent as a ``Server-Timing`` header.
 
 Authorization: the caller must either be the target user or hold the
 ``administration-access`` action.
 
+:class:`UserNamesBulkView` updates many users in one request and one
+transaction, for administrators only, and always queues the Names sync;
+:class:`UserNamesSyncStatusView` reports on a queued sync.
+
 CSRF: relies on Invenio's global ``CSRFProtectMiddleware``; no per-view
 exemption.
 
@@ -32,19 +45,52 @@ turn those into JSON ``{"status", "message"}`` bodies.
 from __future__ import annotations
 
 import json
+import time
 from typing import Any
 
-from flask import Blueprint, Flask, abort, current_app, request
+from flask import abort, current_app, request
 from flask.views import MethodView
 from flask_login import current_user
 from invenio_access.utils import get_identity
+from invenio_accounts.models import User
 from invenio_accounts.proxies import current_accounts
 from invenio_administration.permissions import administration_permission
 from invenio_remote_user_data_kcworks.proxies import current_names_sync_service
 
+from ..tasks import (
+    clear_names_sync_pending,
+    enqueue_names_sync,
+    get_names_sync_job,
+    is_names_sync_pending,
+    mark_names_sync_pending,
+)
+
 MAX_NAME_PART_LENGTH = 255
 
 
+class _PhaseTimings:
+    """Wall-clock milliseconds spent in each phase of a request."""
+
+    def __init__(self):
+        """Start timing the first phase."""
+        self.phases: dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """End ``phase`` now and start timing the next one."""
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._started) * 1000, 2)
+        self._started = now
+
+    def header(self) -> str:
+        """Format the phases as a ``Server-Timing`` header value.
+
+        Returns:
+            E.g. ``"auth;dur=0.41, validate;dur=1.2"``.
+        """
+        return ", ".join(f"{phase};dur={ms}" for phase, ms in self.phases.items())
+
+
 def _coerce_name_part(raw: Any, *, field: str, allow_empty: bool) -> str:
     """Validate and normalize a single name-part string.
 
@@ -76,6 +122,67 @@ def _coerce_name_part(raw: Any, *, field: str, allow_empty: bool) -> str:
     return value
 
 
+def _get_name_parts_local(user: Any) -> dict | None:
+    """Return the ``name_parts_local`` stored on ``user``.
+
+    Args:
+        user: The ORM user.
+
+    Returns:
+        The stored ``{"first", "last"}`` dict, or None when it is missing or
+        unreadable.
+    """
+    try:
+        raw = (user.user_profile or {}).get("name_parts_local")
+        parts = json.loads(raw) if raw else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return parts if isinstance(parts, dict) else None
+
+
+def _set_name_parts_local(user: Any, given: str, family: str) -> dict:
+    """Set ``user_profile["name_parts_local"]`` on ``user`` (not committed).
+
+    Args:
+        user: The ORM user.
+        given: Given name.
+        family: Family name.
+
+    Returns:
+        The ``{"first": given, "last": family}`` dict that was stored.
+    """
+    try:
+        profile = dict(user.user_profile or {})
+    except (TypeError, ValueError):
+        current_app.logger.warning(
+            "user_profile for user %s was not a mapping; resetting.",
+            user.id,
+        )
+        profile = {}
+    new_parts = {"first": given, "last": family}
+    profile["name_parts_local"] = json.dumps(new_parts)
+    user.user_profile = profile
+    return new_parts
+
+
+def _wants_async() -> bool:
+    """Whether the request asked for the Names sync to be queued.
+
+    Returns:
+        True for ``?async=true`` (or ``1``/``yes``).
+    """
+    return request.args.get("async", "").lower() in ("1", "true", "yes")
+
+
+def _is_admin() -> bool:
+    """Whether the current user holds ``administration-access``.
+
+    Returns:
+        True for administrators.
+    """
+    return administration_permission.allows(get_identity(current_user))
+
+
 class UserNameView(MethodView):
     """Update ``user_profile['name_parts_local']`` for a given user."""
 
@@ -90,23 +197,26 @@ class UserNameView(MethodView):
             user_id: ID of the user whose ``name_parts_local`` will be set.
 
         Returns:
-            A dict ``{"name_parts_local": {"first": <given>, "last": <family>},
-            "names_synced": <bool>}`` (Flask serializes it as JSON 200).
-            ``names_synced`` is ``True`` when a Names vocabulary record was
-            created or updated; ``False`` when sync was skipped (e.g.
-            insufficient profile data).
+            A ``(body, status, headers)`` tuple. The body is
+            ``{"name_parts_local": {"first": <given>, "last": <family>},
+            "names_synced": <bool>}`` (status 200). ``names_synced`` is
+            ``True`` when a Names vocabulary record was created or updated;
+            ``False`` when sync was skipped (e.g. insufficient profile data).
+            With ``?async=true``, a 202 response whose ``names_sync`` holds
+            the queued job status replaces ``names_synced``. When the names
+            were already stored, ``"unchanged": True`` replaces both.
 
         Raises:
             werkzeug.exceptions.HTTPException: Via ``abort()`` for auth,
                 validation, not-found, and Names-sync failures. Invenio-REST
                 serializes these as JSON error responses.
         """
+        timings = _PhaseTimings()
         if not current_user.is_authenticated:
             abort(401)
 
-        is_self = int(current_user.id) == int(user_id)
-        is_admin = administration_permission.allows(get_identity(current_user))
-        if not (is_self or is_admin):
+        # Self-edits need no permission evaluation.
+        if not (int(current_user.id) == int(user_id) or _is_admin()):
             abort(
                 403,
                 description=(
@@ -114,6 +224,7 @@ class UserNameView(MethodView):
                     "administrator."
                 ),
             )
+        timings.mark("auth")
 
         body = request.get_json(silent=True)
         if not isinstance(body, dict):
@@ -129,27 +240,37 @@ class UserNameView(MethodView):
         target_user = current_accounts.datastore.get_user_by_id(user_id)
         if target_user is None:
             abort(404, description=f"User {user_id} not found.")
+        timings.mark("validate")
 
-        try:
-            existing_profile = dict(target_user.user_profile or {})
-        except (TypeError, ValueError):
-            current_app.logger.warning(
-                "user_profile for user %s was not a mapping; resetting.",
-                user_id,
+        new_parts = {"first": given, "last": family}
+        # A pending (queued or failed) sync is retried even for unchanged names.
+        unchanged = _get_name_parts_local(target_user) == new_parts
+        if unchanged and not is_names_sync_pending(target_user.id):
+            return self._respond(
+                user_id, timings, {"name_parts_local": new_parts, "unchanged": True}
             )
-            existing_profile = {}
 
-        new_parts = {"first": given, "last": family}
-        existing_profile["name_parts_local"] = json.dumps(new_parts)
-        target_user.user_profile = existing_profile
+        _set_name_parts_local(target_user, given, family)
         current_accounts.datastore.commit()
+        timings.mark("commit")
 
-        # Re-read so Names sync sees the committed profile blob.
-        synced_user = current_accounts.datastore.get_user_by_id(user_id) or target_user
-        try:
-            names_record = current_names_sync_service.upsert_name_for_user(
-                synced_user
+        if _wants_async():
+            job = enqueue_names_sync(
+                [target_user.id], requested_by=int(current_user.id)
             )
+            timings.mark("sync")
+            return self._respond(
+                user_id,
+                timings,
+                {"name_parts_local": new_parts, "names_sync": job},
+                202,
+            )
+
+        # The commit expired ``target_user``; Names sync reloads the committed
+        # profile through it, so no second lookup is needed.
+        mark_names_sync_pending([target_user.id])
+        try:
+            names_record = current_names_sync_service.upsert_name_for_user(target_user)
         except Exception:
             current_app.logger.exception(
                 "Names sync failed after name_parts_local update for user %s",
@@ -163,36 +284,137 @@ class UserNameView(MethodView):
                     "an administrator."
                 ),
             )
+        clear_names_sync_pending(target_user.id)
+        timings.mark("sync")
+
+        return self._respond(
+            user_id,
+            timings,
+            {
+                "name_parts_local": new_parts,
+                "names_synced": names_record is not None,
+            },
+        )
 
-        return {
-            "name_parts_local": new_parts,
-            "names_synced": names_record is not None,
-        }
+    @staticmethod
+    def _respond(user_id: int, timings: _PhaseTimings, body: dict, status=200):
+        """Log the phase timings and attach them as ``Server-Timing`` if enabled.
 
+        Args:
+            user_id: Target user, for the log line.
+            timings: Phases measured so far.
+            body: Response body.
+            status: Response status code.
 
-def create_api_blueprint(app: Flask) -> Blueprint:
-    """Create the modular-deposit-form API blueprint.
+        Returns:
+            A Flask ``(body, status, headers)`` response tuple.
+        """
+        header = timings.header()
+        current_app.logger.debug("UserNameView user %s: %s", user_id, header)
+        headers = {}
+        if current_app.config.get("MODULAR_DEPOSIT_FORM_USER_NAME_SERVER_TIMING"):
+            headers["Server-Timing"] = header
+        return body, status, headers
 
-    Mounted by ``invenio_base.api_blueprints``; the API app prepends
-    ``/api`` so the effective URL is ``/api/modular-deposit-form/...``.
 
-    Args:
-        app: The Flask app the blueprint will be registered on (unused, but
-            required by the ``invenio_base.api_blueprints`` factory contract).
+class UserNamesBulkView(MethodView):
+    """Update ``name_parts_local`` for many users and queue their Names sync."""
 
-    Returns:
-        The configured :class:`flask.Blueprint`.
-    """
-    blueprint = Blueprint(
-        "invenio_modular_deposit_form_api",
-        __name__,
-        url_prefix="/modular-deposit-form",
-    )
-
-    blueprint.add_url_rule(
-        "/users/<int:user_id>/name",
-        view_func=UserNameView.as_view(UserNameView.view_name),
-        methods=["POST"],
-    )
-
-    return blueprint
+    view_name = "modular_deposit_form_user_names_bulk"
+
+    def post(self):
+        """Handle ``POST /users/names``.
+
+        Body: ``{"users": [{"user_id": int, "family_name": str, "given_name":
+        str}, ...]}``, at most ``MODULAR_DEPOSIT_FORM_USER_NAMES_BULK_MAX``
+        entries. Every entry is validated before anything is written; all
+        profiles are then committed in one transaction.
+
+        Returns:
+            A ``(dict, 202)`` tuple; the dict is ``{"updated": <int>,
+            "names_sync": <job status>}``.
+
+        Raises:
+            werkzeug.exceptions.HTTPException: Via ``abort()`` for auth (401,
+                403), validation (400) and unknown users (404).
+        """
+        if not current_user.is_authenticated:
+            abort(401)
+        if not _is_admin():
+            abort(403, description="Bulk name updates require administrator access.")
+
+        body = request.get_json(silent=True)
+        entries = body.get("users") if isinstance(body, dict) else None
+        if not isinstance(entries, list) or not entries:
+            abort(400, description="'users' must be a non-empty list.")
+        max_entries = current_app.config.get(
+            "MODULAR_DEPOSIT_FORM_USER_NAMES_BULK_MAX", 500
+        )
+        if len(entries) > max_entries:
+            abort(
+                400,
+                description=f"At most {max_entries} users can be updated at once.",
+            )
+
+        updates = {}
+        for i, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                abort(400, description=f"'users[{i}]' must be an object.")
+            user_id = entry.get("user_id")
+            if not isinstance(user_id, int) or isinstance(user_id, bool):
+                abort(400, description=f"'users[{i}].user_id' must be an integer.")
+            if user_id in updates:
+                abort(400, description=f"User {user_id} is listed more than once.")
+            updates[user_id] = (
+                _coerce_name_part(
+                    entry.get("given_name", ""),
+                    field=f"users[{i}].given_name",
+                    allow_empty=True,
+                ),
+                _coerce_name_part(
+                    entry.get("family_name", ""),
+                    field=f"users[{i}].family_name",
+                    allow_empty=False,
+                ),
+            )
+
+        users = User.query.filter(User.id.in_(list(updates))).all()
+        missing = sorted(set(updates) - {user.id for user in users})
+        if missing:
+            abort(404, description=f"Users not found: {missing}.")
+
+        for user in users:
+            _set_name_parts_local(user, *updates[user.id])
+        current_accounts.datastore.commit()
+
+        job = enqueue_names_sync(list(updates), requested_by=int(current_user.id))
+        return {"updated": len(users), "names_sync": job}, 202
+
+
+class UserNamesSyncStatusView(MethodView):
+    """Report the status of a queued Names sync."""
+
+    view_name = "modular_deposit_form_user_names_sync_status"
+
+    def get(self, job_id: str):
+        """Handle ``GET /users/names/sync/<job_id>``.
+
+        Args:
+            job_id: Id returned in ``names_sync.job_id``.
+
+        Returns:
+            The job status dict; see :func:`..tasks.get_names_sync_job`.
+
+        Raises:
+            werkzeug.exceptions.HTTPException: Via ``abort()`` for anonymous
+                callers (401) and for unknown or expired jobs, or jobs started
+                by someone else when the caller is not an administrator (404).
+        """
+        if not current_user.is_authenticated:
+            abort(401)
+        job = get_names_sync_job(job_id)
+        if job is None or (
+            job.get("requested_by") != int(current_user.id) and not _is_admin()
+        ):
+            abort(404)
+        return job
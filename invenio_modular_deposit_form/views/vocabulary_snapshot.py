@@ -0,0 +1,164 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""API view serving a whole small vocabulary as one versioned JSON snapshot.
+
+``RemoteSelectField`` normally asks ``/api/vocabularies/<type>`` for
+suggestions on every debounced keystroke. For small, static vocabularies
+(languages, title types, roles, ...) the browser can instead download every
+item once, keep it in ``localStorage`` and search it locally (see
+``vocabularySnapshot.js``).
+
+The snapshot holds the items in the ``/api/vocabularies`` UI hit shape
+(``id``, ``title_l10n``, ``props``, ...) for the request's locale, plus a
+``revision`` hash of that content which is also the ETag. Clients send the
+revision they hold in ``If-None-Match`` and get ``304 Not Modified`` while
+it is current.
+
+Only types listed in ``MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_TYPES`` are
+served. Built snapshots are kept in the extension's vocabulary options cache,
+so vocabulary changes drop them like the custom-field options (see
+:mod:`..custom_fields.options_cache`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from flask import abort, current_app, g, request
+from flask.views import MethodView
+from invenio_i18n import get_locale
+from invenio_vocabularies.proxies import current_service as vocabulary_service
+from invenio_vocabularies.resources.serializer import VocabularyL10NItemSchema
+from sqlalchemy.exc import NoResultFound
+
+from ..custom_fields.options_cache import get_vocabulary_options_cache
+
+# Distinct from the field list ``VocabularyCF.options`` reads with, because
+# ``read_all`` keys its own cache on the type and fields but not on the size.
+SNAPSHOT_FIELDS = ["id", "title", "props", "icon"]
+
+
+def _snapshot_cache_key(vocabulary_id, identity):
+    """Return the options-cache key for one vocabulary snapshot.
+
+    Returns:
+        A hashable tuple starting with ``vocabulary_id``.
+    """
+    needs = frozenset(getattr(identity, "provides", None) or ())
+    return (vocabulary_id, "snapshot", needs, str(get_locale() or ""))
+
+
+def build_vocabulary_snapshot(vocabulary_id, identity, max_items):
+    """Read every item of a vocabulary and serialize the snapshot.
+
+    Args:
+        vocabulary_id: The vocabulary type, e.g. ``"languages"``.
+        identity: The identity to search with.
+        max_items: Upper bound on items read. A vocabulary with more items is
+            served with ``"complete": false`` so clients keep searching the
+            API.
+
+    Returns:
+        A ``(body, revision)`` tuple: the JSON text and its content hash.
+
+    Raises:
+        NoResultFound: If the vocabulary type does not exist.
+    """
+    results = vocabulary_service.read_all(
+        identity,
+        fields=SNAPSHOT_FIELDS,
+        type=vocabulary_id,
+        cache=False,
+        max_records=max_items,
+    )
+    schema = VocabularyL10NItemSchema()
+    hits = [
+        {key: value for key, value in schema.dump(item).items() if value}
+        for item in results
+    ]
+    total = getattr(results, "total", None)
+    complete = len(hits) < max_items or (total is not None and total <= max_items)
+    locale = str(get_locale() or "")
+    revision = hashlib.sha256(
+        json.dumps([locale, complete, hits], sort_keys=True).encode()
+    ).hexdigest()[:16]
+    body = json.dumps(
+        {
+            "vocabulary": vocabulary_id,
+            "revision": revision,
+            "locale": locale,
+            "complete": complete,
+            "hits": hits,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return body, revision
+
+
+def get_vocabulary_snapshot(vocabulary_id, identity):
+    """Return the cached snapshot of a vocabulary, building it on a miss.
+
+    Returns:
+        A ``(body, revision)`` tuple, see :func:`build_vocabulary_snapshot`.
+
+    Raises:
+        NoResultFound: If the vocabulary type does not exist.
+    """
+    max_items = current_app.config.get(
+        "MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_MAX_ITEMS", 10000
+    )
+    cache = get_vocabulary_options_cache()
+    if cache is None or not cache.enabled:
+        return build_vocabulary_snapshot(vocabulary_id, identity, max_items)
+    key = _snapshot_cache_key(vocabulary_id, identity)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_vocabulary_snapshot(vocabulary_id, identity, max_items)
+        cache.set(key, snapshot)
+    return snapshot
+
+
+class VocabularySnapshotView(MethodView):
+    """Serve every item of one small vocabulary with a revision ETag."""
+
+    view_name = "modular_deposit_form_vocabulary_snapshot"
+
+    def get(self, vocabulary_id: str):
+        """Handle ``GET /vocabularies/<vocabulary_id>/snapshot``.
+
+        Args:
+            vocabulary_id: The vocabulary type.
+
+        Returns:
+            A JSON :class:`flask.Response` (or ``304 Not Modified`` when the
+            request's ``If-None-Match`` matches the revision).
+
+        Raises:
+            werkzeug.exceptions.NotFound: Via ``abort()`` when the type is not
+                enabled for snapshots or does not exist.
+        """
+        app = current_app._get_current_object()
+        if vocabulary_id not in app.config.get(
+            "MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_TYPES", ()
+        ):
+            abort(404)
+        try:
+            body, revision = get_vocabulary_snapshot(vocabulary_id, g.identity)
+        except NoResultFound:
+            abort(404)
+
+        response = app.response_class(body, mimetype="application/json")
+        response.set_etag(revision)
+        response.vary.add("Accept-Encoding")
+        response.vary.add("Accept-Language")
+        # Per identity; the browser keeps it but must revalidate each time.
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
@@ -9,50 +9,70 @@
 
 Used by webpack.py to set webpack aliases so validator.js and componentsRegistry.js
 are loaded from instance-provided paths when entry points are registered.
+
+The three entry point groups are scanned in a single ``importlib.metadata`` pass
+and the loaded paths are memoized for the life of the process, so building the
+aliases (and :func:`resolved_asset_overrides`) costs one scan however often the
+getters are called. Call :func:`clear_entry_point_cache` after installing a
+package that adds an entry point in a running process.
 """
 
-import json
-import os
-from pathlib import Path
-from time import time
+from functools import cache
+from importlib.metadata import entry_points
 
 from flask import current_app
 
 _GROUP_VALIDATOR = "invenio_modular_deposit_form.validator"
 _GROUP_COMPONENTS_REGISTRY = "invenio_modular_deposit_form.components_registry"
 _GROUP_TRANSFORMATIONS = "invenio_modular_deposit_form.transformations"
+_GROUPS = (_GROUP_VALIDATOR, _GROUP_COMPONENTS_REGISTRY, _GROUP_TRANSFORMATIONS)
 _STUBS_PATH = "./js/invenio_modular_deposit_form/stubs"
 
 
-def _resolve_path(group):
-    """Return the absolute path from the first entry point in group, or None."""
-    try:
-        from importlib.metadata import entry_points
-
-        eps = entry_points(group=group)
-    except (ImportError, TypeError):
-        # Python < 3.10 or entry_points() doesn't accept group=; fall back to pkg_resources.
-        # Prefer importlib.metadata when available (pkg_resources is being deprecated).
-        try:
-            import pkg_resources
-
-            eps = list(pkg_resources.iter_entry_points(group))
-        except Exception:
-            return None
-    else:
-        eps = list(eps)
-
-    if not eps:
-        return None
-    first = next(iter(eps), None)
-    if not first:
-        return None
+@cache
+def _scan_entry_points():
+    """Return the first entry point of each of the three groups, or None.
+
+    Scans the installed distributions once; all three groups are picked out
+    of the same result.
+
+    Returns:
+        A dict mapping each group name to its first ``EntryPoint``, or None.
+    """
+    found = dict.fromkeys(_GROUPS)
+    for ep in entry_points():
+        if ep.group in found and found[ep.group] is None:
+            found[ep.group] = ep
+    return found
+
+
+@cache
+def _load_override(group):
+    """Load the first entry point in ``group`` and call it.
+
+    Returns:
+        A ``(entry_point, path, error)`` tuple. ``path`` is None when the group
+        has no entry point or loading it failed; ``error`` then describes why.
+    """
+    ep = _scan_entry_points()[group]
+    if ep is None:
+        return None, None, None
     try:
-        get_path = first.load()
-        path = get_path()
-    except Exception:
-        return None
-    return path
+        path = ep.load()()
+    except Exception as exc:
+        return ep, None, f"{type(exc).__name__}: {exc}"
+    return ep, path or None, None
+
+
+def _resolve_path(group):
+    """Return the path from the first entry point in group, or None."""
+    return _load_override(group)[1]
+
+
+def clear_entry_point_cache():
+    """Forget the scanned entry points and loaded paths."""
+    _load_override.cache_clear()
+    _scan_entry_points.cache_clear()
 
 
 def get_validator_path() -> str:
@@ -97,3 +117,32 @@ def get_transformations_path() -> str:
         _resolve_path(_GROUP_TRANSFORMATIONS)
         or _STUBS_PATH + "/transformations.js"
     )
+
+
+def resolved_asset_overrides():
+    """Report which webpack alias each entry point group resolved to.
+
+    Useful for checking an instance's overrides without running a build, e.g.
+    from ``invenio shell``. Needs an app context for the validator flag.
+
+    Returns:
+        A dict keyed by entry point group. Each value has the ``entry_point``
+        (``"name = module:attr"``, or None), the ``path`` it returned (None when
+        absent or failed), the ``error`` raised while loading it (or None) and
+        the ``alias`` webpack will use.
+    """
+    aliases = {
+        _GROUP_VALIDATOR: get_validator_path(),
+        _GROUP_COMPONENTS_REGISTRY: get_components_registry_path(),
+        _GROUP_TRANSFORMATIONS: get_transformations_path(),
+    }
+    report = {}
+    for group in _GROUPS:
+        ep, path, error = _load_override(group)
+        report[group] = {
+            "entry_point": f"{ep.name} = {ep.value}" if ep is not None else None,
+            "path": path,
+            "error": error,
+            "alias": aliases[group],
+        }
+    return report
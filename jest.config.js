@@ -26,6 +26,7 @@ module.exports = {
     "^@js/invenio_vocabularies$": "<rootDir>/__mocks__/invenio_vocabularies_stub.js",
     "^@js/invenio_app_rdm/deposit/ShareDraftButton$":
       "<rootDir>/__mocks__/ShareDraftButton_stub.js",
+    "^\\./createValidationWorker$": "<rootDir>/__mocks__/createValidationWorker.js",
   },
   setupFilesAfterEnv: ["<rootDir>/jest.setup.js"],
   transform: {
@@ -11,8 +11,32 @@ See https://pytest-invenio.readthedocs.io/ for documentation on which test
 fixtures are available.
 """
 
+import time
+
 import pytest
+from flask import Flask
+from flask_babel import Babel
 from invenio_app.factory import create_app as _create_app
+from invenio_db import InvenioDB, db
+from invenio_i18n import InvenioI18N
+from invenio_rdm_records.config import (
+    RDM_RECORDS_IDENTIFIERS_SCHEMES,
+    RDM_RECORDS_LOCATION_SCHEMES,
+    RDM_RECORDS_PERSONORG_SCHEMES,
+)
+from sqlalchemy.exc import NoResultFound
+
+from invenio_modular_deposit_form import InvenioModularDepositForm
+from invenio_modular_deposit_form.config.alternate_paged import (
+    COMMON_FIELDS_ALTERNATE_PAGED,
+    FIELDS_BY_TYPE_ALTERNATE_PAGED,
+)
+from invenio_modular_deposit_form.filters.deposit_config_json import (
+    warm_static_deposit_config_json,
+)
+from invenio_modular_deposit_form.filters.merge_deposit_config import (
+    warm_static_deposit_config,
+)
 
 
 @pytest.fixture(scope="module")
@@ -27,3 +51,116 @@ def app_config(app_config):
 def create_app(instance_path):
     """Application factory fixture."""
     return _create_app
+
+
+@pytest.fixture()
+def deposit_app():
+    """Minimal app with the shipped alternate paged layouts and RDM schemes.
+
+    Returns:
+        A Flask app with Babel and the extension registered and the static
+        deposits-config caches warmed.
+    """
+    app = Flask("testapp")
+    app.config.update(
+        BABEL_DEFAULT_LOCALE="en",
+        I18N_LANGUAGES=[("de", "German")],
+        RDM_RECORDS_PERSONORG_SCHEMES=RDM_RECORDS_PERSONORG_SCHEMES,
+        RDM_RECORDS_IDENTIFIERS_SCHEMES=RDM_RECORDS_IDENTIFIERS_SCHEMES,
+        RDM_RECORDS_LOCATION_SCHEMES=RDM_RECORDS_LOCATION_SCHEMES,
+        MODULAR_DEPOSIT_FORM_COMMON_FIELDS=COMMON_FIELDS_ALTERNATE_PAGED,
+        MODULAR_DEPOSIT_FORM_FIELDS_BY_TYPE=FIELDS_BY_TYPE_ALTERNATE_PAGED,
+    )
+    Babel(app)
+    InvenioModularDepositForm(app)
+    warm_static_deposit_config(app)
+    warm_static_deposit_config_json(app)
+    return app
+
+
+@pytest.fixture()
+def forms_config_factory():
+    """Factory for a stand-in of the deposit view's ``forms_config``.
+
+    Returns:
+        A callable returning a fresh dict on every call, so tests can compare
+        against the original after merging.
+    """
+
+    def _forms_config():
+        return {
+            "current_locale": "en",
+            "vocabularies": {
+                "resource_type": [{"id": "dataset"}],
+                "creators": {"role": [{"id": "author"}]},
+                "identifiers": {"relation_type": [{"id": "cites"}]},
+            },
+        }
+
+    return _forms_config
+
+
+class FakeVocabularyService:
+    """Stand-in for the vocabularies service that counts ``read_all`` calls."""
+
+    def __init__(self, known_types, barrier=None, delay=0.0):
+        """Serve one item per type in ``known_types``.
+
+        Args:
+            known_types: Vocabulary types that exist.
+            barrier: Optional ``threading.Barrier`` each call waits at, so a
+                test can require that several calls run at the same time.
+            delay: Seconds each call sleeps, standing in for a search round
+                trip in benchmarks.
+        """
+        self.known_types = known_types
+        self.barrier = barrier
+        self.delay = delay
+        self.calls = []
+
+    def read_all(self, identity, fields, type, sort=None, **kwargs):
+        """Return the items of ``type`` or raise like the real service.
+
+        Returns:
+            A list of vocabulary item dicts.
+
+        Raises:
+            NoResultFound: If ``type`` is not a known vocabulary type.
+        """
+        self.calls.append(type)
+        if self.barrier:
+            self.barrier.wait()
+        if self.delay:
+            time.sleep(self.delay)
+        if type not in self.known_types:
+            raise NoResultFound()
+        return [{"id": "x", "title": {"en": "English", "de": "Deutsch"}}]
+
+
+@pytest.fixture()
+def vocab_app(monkeypatch):
+    """App with the extension, i18n, an in-memory database and a fake service.
+
+    Yields:
+        A ``(app, service)`` tuple, inside an app context. ``service`` knows
+        the ``languages`` and ``licenses`` types and answers immediately.
+    """
+    app = Flask("testapp")
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        BABEL_DEFAULT_LOCALE="en",
+        I18N_LANGUAGES=[("de", "German")],
+    )
+    InvenioI18N(app)
+    InvenioDB(app)
+    InvenioModularDepositForm(app)
+    service = FakeVocabularyService({"languages", "licenses"})
+    monkeypatch.setattr(
+        "invenio_vocabularies.services.custom_fields.vocabulary.current_service",
+        service,
+    )
+    with app.app_context():
+        db.create_all()
+        yield app, service
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,146 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the per-resource-type bundle-size report."""
+
+import json
+import re
+
+from invenio_modular_deposit_form.bundle_report import (
+    CHUNKS_MANIFEST_PATH,
+    DEFAULT_TYPE,
+    ENTRY,
+    bundle_report,
+    component_chunks,
+    format_report,
+    main,
+)
+
+_COMMON_FIELDS = [
+    {"component": "FormTitle"},
+    {
+        "component": "FormPages",
+        "subsections": [
+            {
+                "section": "1",
+                "subsections": [
+                    {"section": "t", "component": "TitlesComponent"},
+                    {
+                        "component": "FormRow",
+                        "subsections": [{"component": "CreatorsComponent"}],
+                    },
+                ],
+            },
+            {"section": "2", "subsections": [{"component": "FundingComponent"}]},
+            {"section": "3", "subsections": []},
+        ],
+    },
+]
+
+_FIELDS_BY_TYPE = {
+    "publication-thesis": {
+        "2": {"subsections": [{"component": "CombinedThesisComponent"}]},
+    },
+}
+
+_CHUNKS = {
+    "TitlesComponent": "fields",
+    "CreatorsComponent": "creatibutors",
+    "FundingComponent": "funding",
+    "CombinedThesisComponent": "custom",
+}
+
+
+def _asset(name, size):
+    return {"name": name, "size": size}
+
+
+_STATS = {
+    "entrypoints": {
+        ENTRY: {"assets": [_asset("main.js", 1000), _asset("main.js.map", 9999)]}
+    },
+    "namedChunkGroups": {
+        "fields": {"assets": [_asset("fields.js", 300), _asset("vendor.js", 50)]},
+        "creatibutors": {"assets": [_asset("creatibutors.js", 200)]},
+        "funding": {"assets": [_asset("funding.js", 400), _asset("vendor.js", 50)]},
+        "custom": {"assets": [_asset("custom.js", 20)]},
+    },
+}
+
+
+def test_component_chunks_reads_the_manifest():
+    """Lazy entries map to their chunk; entry-point components are left out."""
+    chunks = component_chunks(
+        json.loads(CHUNKS_MANIFEST_PATH.read_text(encoding="utf-8"))
+    )
+
+    assert chunks["TitlesComponent"] == "deposit-form-fields"
+    assert chunks["CreatorsComponent"] == "deposit-form-creatibutors"
+    assert chunks["FundingComponent"] == "deposit-form-funding"
+    assert chunks["DoiComponent"] == "deposit-form-pids"
+    assert chunks["CombinedThesisComponent"] == "deposit-form-compound-fields"
+    assert chunks["SizesComponent"] == "deposit-form-alternate-fields"
+    assert "AccessComponent" not in chunks
+    assert "FormStepper" not in chunks
+
+
+def test_manifest_chunks_are_the_registry_chunks():
+    """Every chunk in the manifest is a chunk the registry loads, and back."""
+    manifest = json.loads(CHUNKS_MANIFEST_PATH.read_text(encoding="utf-8"))
+    registry = (CHUNKS_MANIFEST_PATH.parent / "componentsRegistry.js").read_text(
+        encoding="utf-8"
+    )
+
+    assert set(manifest) == set(re.findall(r'webpackChunkName: "([^"]+)"', registry))
+
+
+def test_bundle_report_adds_up_each_type_page_by_page():
+    """Shared files count once and each page lists what it adds."""
+    report = bundle_report(_STATS, _COMMON_FIELDS, _FIELDS_BY_TYPE, chunks=_CHUNKS)
+
+    assert report[DEFAULT_TYPE] == {
+        "initial": 1550,
+        "total": 1950,
+        "pages": {"1": 550, "2": 400},
+        "chunks": ["creatibutors", "fields", "funding"],
+    }
+    assert report["publication-thesis"] == {
+        "initial": 1550,
+        "total": 1570,
+        "pages": {"1": 550, "2": 20},
+        "chunks": ["creatibutors", "custom", "fields"],
+    }
+
+
+def test_bundle_report_sizes_webpack_4_asset_names():
+    """Webpack 4 stats list file names and size them in ``assets``."""
+    stats = {
+        "assets": [_asset("main.js", 1000), _asset("fields.js", 300)],
+        "entrypoints": {ENTRY: {"assets": ["main.js"]}},
+        "namedChunkGroups": {"fields": {"assets": ["fields.js"]}},
+    }
+    report = bundle_report(
+        stats, _COMMON_FIELDS, {}, chunks={"TitlesComponent": "fields"}
+    )
+
+    assert report[DEFAULT_TYPE]["initial"] == 1300
+
+
+def test_main_prints_the_report(tmp_path, capsys):
+    """The command line reads a stats file and prints one row per type."""
+    stats_path = tmp_path / "stats.json"
+    stats_path.write_text(json.dumps(_STATS), encoding="utf-8")
+
+    assert main([str(stats_path), "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert DEFAULT_TYPE in report
+    assert report[DEFAULT_TYPE]["initial"] >= 1000
+
+    table = format_report(
+        bundle_report(_STATS, _COMMON_FIELDS, _FIELDS_BY_TYPE, chunks=_CHUNKS)
+    )
+    assert table.splitlines()[1].startswith(DEFAULT_TYPE)
@@ -0,0 +1,101 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the current_user_profile_dict filter and its bulk variant."""
+
+import pytest
+from flask import Flask
+from flask_login import login_user
+from invenio_accounts import InvenioAccounts
+from invenio_accounts.models import User
+from invenio_db import InvenioDB, db
+from invenio_i18n import InvenioI18N
+from sqlalchemy import event
+
+from invenio_modular_deposit_form import InvenioModularDepositForm
+from invenio_modular_deposit_form.filters.current_user_profile_dict import (
+    current_user_profile_dict,
+    user_profile_dicts,
+)
+
+
+@pytest.fixture()
+def accounts_app():
+    """App with accounts on an in-memory database and two users.
+
+    Yields:
+        The Flask app, inside an app context.
+    """
+    app = Flask("testapp")
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SECRET_KEY="test-secret",
+        SECURITY_PASSWORD_SALT="test-salt",
+    )
+    InvenioI18N(app)
+    InvenioDB(app)
+    InvenioAccounts(app)
+    InvenioModularDepositForm(app)
+    with app.app_context():
+        db.create_all()
+        for email, name in [("ann@example.org", "Ann"), ("bo@example.org", None)]:
+            profile = {"full_name": name} if name else {}
+            db.session.add(User(email=email, active=True, user_profile=profile))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def test_anonymous_user_gets_empty_fields(accounts_app):
+    """Anonymous users get an empty id and every schema field as ``""``."""
+    with accounts_app.test_request_context():
+        assert current_user_profile_dict("") == {
+            "id": "",
+            "full_name": "",
+            "affiliations": "",
+        }
+
+
+def test_profile_is_memoized_per_request(accounts_app):
+    """Repeated filter calls in one request reuse the same dict."""
+    ann = User.query.filter_by(email="ann@example.org").one()
+    bo = User.query.filter_by(email="bo@example.org").one()
+    with accounts_app.test_request_context():
+        login_user(ann)
+        first = current_user_profile_dict("")
+        assert current_user_profile_dict("") is first
+        assert first == {"id": str(ann.id), "full_name": "Ann", "affiliations": ""}
+
+        # A different user in the same app context does not see Ann's dict.
+        login_user(bo)
+        assert current_user_profile_dict("")["id"] == str(bo.id)
+
+    ext = accounts_app.extensions["invenio-modular-deposit-form"]
+    assert ext.profile_fields == ("full_name", "affiliations")
+
+
+def test_user_profile_dicts_uses_one_query(accounts_app):
+    """The bulk variant loads all requested users in a single SELECT."""
+    ids = [user.id for user in User.query.order_by(User.id)]
+    statements = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        profiles = user_profile_dicts([*ids, str(ids[0]), 999])
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 1
+    assert profiles == {
+        ids[0]: {"id": str(ids[0]), "full_name": "Ann", "affiliations": ""},
+        ids[1]: {"id": str(ids[1]), "full_name": "", "affiliations": ""},
+    }
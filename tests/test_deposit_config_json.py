@@ -0,0 +1,88 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the deposit_config_json filter."""
+
+import importlib
+import json
+
+from flask import render_template_string
+from invenio_i18n import force_locale
+
+from invenio_modular_deposit_form.filters.deposit_config_json import (
+    deposit_config_json,
+)
+
+_TOJSON = "{{ forms_config | merge_deposit_config(extra) | tojson }}"
+_SPLICED = "{{ forms_config | deposit_config_json(extra) }}"
+
+# ``filters`` re-exports the filter functions under their module names.
+json_module = importlib.import_module(
+    "invenio_modular_deposit_form.filters.deposit_config_json"
+)
+
+
+def _extra():
+    """Per-request extras like the ones deposit.html passes.
+
+    Returns:
+        A dict with HTML-sensitive characters to exercise the escaping.
+    """
+    return {
+        "current_user_profile": {"id": "1", "full_name": "O'Brien <Ann> & co"},
+        "previewable_extensions": ["pdf", "png"],
+    }
+
+
+def test_matches_merge_then_tojson(deposit_app, forms_config_factory):
+    """The spliced output is byte-identical to ``merge_deposit_config | tojson``."""
+    context = {"forms_config": forms_config_factory(), "extra": _extra()}
+    with deposit_app.test_request_context():
+        expected = render_template_string(_TOJSON, **context)
+        assert render_template_string(_SPLICED, **context) == expected
+        with force_locale("de"):
+            expected_de = render_template_string(_TOJSON, **context)
+            assert render_template_string(_SPLICED, **context) == expected_de
+
+    assert "'" not in expected
+    assert json.loads(expected)["current_user_profile"]["full_name"] == (
+        "O'Brien <Ann> & co"
+    )
+
+
+def test_override_precedence(deposit_app, forms_config_factory):
+    """Static keys beat forms_config; extra beats both, with no duplicate keys."""
+    forms_config = {**forms_config_factory(), "use_confirm_modal": "from view"}
+    extra = {"show_community_banner_at_top": "from extra"}
+    with deposit_app.test_request_context():
+        text = str(deposit_config_json(forms_config, extra))
+
+    payload = json.loads(text)
+    assert payload["use_confirm_modal"] is False
+    assert payload["show_community_banner_at_top"] == "from extra"
+    assert text.count('"show_community_banner_at_top"') == 1
+    assert payload["vocabularies"]["resource_type"] == [{"id": "dataset"}]
+
+
+def test_static_fragments_serialized_once(deposit_app, forms_config_factory, mocker):
+    """Requests reuse the static JSON fragments and serialize only their own keys."""
+    ext = deposit_app.extensions["invenio-modular-deposit-form"]
+    ext.static_deposit_config_json.clear()
+    build = mocker.spy(json_module, "build_static_deposit_config_json")
+    context = {"forms_config": forms_config_factory(), "extra": _extra()}
+
+    with deposit_app.test_request_context():
+        template = deposit_app.jinja_env.from_string(_SPLICED)
+        template.render(**context)
+        member = mocker.spy(json_module, "_member")
+        template.render(**context)
+        template.render(**context)
+
+    assert build.call_count == 1
+    serialized = {call.args[0] for call in member.call_args_list}
+    assert serialized <= set(context["forms_config"]) | set(context["extra"])
+    assert "common_fields" not in serialized
@@ -0,0 +1,120 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Parity tests for the Python port of the identifier checks.
+
+The fixtures are the ones the Jest tests of ``validatorsForIds.js`` and
+``identifierChecks.js`` use, so both implementations are held to the same
+corpus. The URL-based checks use ``idutils`` rather than the browser's URL
+parser; the cases where the two disagree are listed in :data:`_URL_DIVERGENCES`.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from invenio_modular_deposit_form.identifiers import (
+    IDENTIFIER_CHECKS,
+    IdentifierFailure,
+    check_identifier,
+    check_identifiers,
+    validate_identifiers,
+)
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "js" / "identifier_fixtures.json").read_text("utf-8")
+)
+
+_CHECK_CASES = [
+    (scheme, value, expected)
+    for scheme, cases in FIXTURES["checks"].items()
+    for expected in ("valid", "invalid")
+    for value in cases[expected]
+]
+
+
+@pytest.mark.parametrize("scheme,value,expected", _CHECK_CASES)
+def test_check_matches_fixture(scheme, value, expected):
+    """Each fixture value gets the same verdict as in the JS tests."""
+    assert (check_identifier(scheme, value) is None) == (expected == "valid")
+
+
+# Values ``idutils`` (``urllib.parse``) judges differently from ``new URL()`` in
+# the form: ``(scheme, value, valid in the browser, why)``.
+_URL_DIVERGENCES = [
+    ("url", "http://exa mple.org", False, "urlparse accepts a space in the host"),
+    ("url", "http://example.org:99999", False, "urlparse does not check the port"),
+    ("url", "http://256.256.256.256", False, "urlparse does not check IPv4 hosts"),
+    ("url", "http://%zz.org", False, "urlparse does not decode the host"),
+    ("url", "https:///x", True, "new URL takes x as the host"),
+    ("ark", "http://n2t.net:99999/ark:/13030/x", False, "port not checked"),
+    ("ark", "http://n2t.net/ark:/13030/x;p", True, "idutils rejects ;params"),
+    ("purl", "https://PURL.ORG/x", True, "urlparse keeps the host's case"),
+    ("purl", "http://purl.org:80/x", True, "idutils compares host and port"),
+    ("purl", "http://purl.org", True, "new URL adds the / path"),
+]
+
+
+@pytest.mark.parametrize(
+    "scheme,value,browser_valid",
+    [
+        pytest.param(
+            scheme, value, valid, marks=pytest.mark.xfail(strict=True, reason=why)
+        )
+        for scheme, value, valid, why in _URL_DIVERGENCES
+    ],
+)
+def test_url_divergences_from_the_browser(scheme, value, browser_valid):
+    """Known cases where the server-side check disagrees with the form."""
+    assert (check_identifier(scheme, value) is None) == browser_valid
+
+
+@pytest.mark.parametrize("expected", ["valid", "invalid"])
+def test_rows_match_fixture(expected):
+    """Every scheme accepts its valid row value and rejects its invalid one."""
+    rows = FIXTURES["rows"][expected]
+    assert set(rows) == set(IDENTIFIER_CHECKS)
+    results = validate_identifiers(
+        [{"scheme": scheme, "identifier": value} for scheme, value in rows.items()]
+    )
+    assert [r["scheme"] for r in results] == list(rows)
+    assert {r["valid"] for r in results} == {expected == "valid"}
+
+
+@pytest.mark.parametrize(
+    "batch", FIXTURES["batches"], ids=[b["description"] for b in FIXTURES["batches"]]
+)
+def test_batches_match_fixture(batch):
+    """Batch results, messages included, equal those of ``validateIdentifiers``."""
+    options = batch["options"]
+    assert (
+        validate_identifiers(
+            batch["entries"],
+            allowed_scheme_ids=options.get("allowedSchemeIds"),
+            infer_scheme=options.get("inferScheme", False),
+        )
+        == batch["results"]
+    )
+
+
+def test_check_identifiers_and_messages():
+    """The single-scheme batch and the fixed/overridable failure messages."""
+    assert check_identifiers("isbn", ["0-306-40615-2", "", "0-306-40615-3"]) == [
+        None,
+        None,
+        IdentifierFailure(check_identifier("isbn", "0")[0]),
+    ]
+    assert check_identifiers("unknown", ["x"]) == [None]
+
+    failure = check_identifier("orcid", None)
+    assert (str(failure.message), failure.fixed) == ("ORCID must be a string", True)
+    failure = check_identifier("isni", "123")
+    assert str(failure.message) == (
+        "This is not a valid ISNI identifier (it must be 16 characters)."
+    )
+    assert failure.fixed is False
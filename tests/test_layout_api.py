@@ -0,0 +1,91 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the cacheable layout API endpoint and the deposit page's layout_url."""
+
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from invenio_modular_deposit_form.config.alternate_paged import (
+    COMMON_FIELDS_ALTERNATE_PAGED,
+)
+from invenio_modular_deposit_form.filters.deposit_config_json import (
+    deposit_config_json,
+    warm_static_deposit_config_json,
+)
+from invenio_modular_deposit_form.filters.merge_deposit_config import LAYOUT_KEYS
+from invenio_modular_deposit_form.views import create_api_blueprint
+
+
+@pytest.fixture()
+def layout_client(deposit_app):
+    """Test client for an app with the API blueprint registered.
+
+    Returns:
+        A Flask test client.
+    """
+    deposit_app.register_blueprint(create_api_blueprint(deposit_app))
+    return deposit_app.test_client()
+
+
+def test_layout_endpoint_serves_layout_keys(layout_client):
+    """The body holds exactly the layout keys, with an ETag and short max-age."""
+    res = layout_client.get("/modular-deposit-form/layout?locale=en")
+
+    assert res.status_code == 200
+    assert set(res.json) == set(LAYOUT_KEYS)
+    assert res.json["common_fields"] == json.loads(
+        json.dumps(COMMON_FIELDS_ALTERNATE_PAGED, default=str)
+    )
+    etag, _weak = res.get_etag()
+    assert etag
+    assert res.cache_control.public
+    assert res.cache_control.max_age == 300
+
+
+def test_layout_endpoint_versioned_request_is_immutable(layout_client):
+    """A request carrying the current content hash is cacheable for a long time."""
+    etag, _weak = layout_client.get("/modular-deposit-form/layout").get_etag()
+    res = layout_client.get(f"/modular-deposit-form/layout?locale=en&v={etag}")
+
+    assert res.cache_control.max_age == 31536000
+    assert res.cache_control.immutable
+
+    not_modified = layout_client.get(
+        "/modular-deposit-form/layout?locale=en",
+        headers={"If-None-Match": f'"{etag}"'},
+    )
+    assert not_modified.status_code == 304
+
+
+def test_layout_endpoint_unknown_locale_uses_default(layout_client, deposit_app):
+    """Unknown locales are served the default locale and do not grow the cache."""
+    default = layout_client.get("/modular-deposit-form/layout?locale=en")
+    unknown = layout_client.get("/modular-deposit-form/layout?locale=xx")
+
+    assert unknown.get_etag() == default.get_etag()
+    ext = deposit_app.extensions["invenio-modular-deposit-form"]
+    assert "xx" not in ext.layout_json
+
+
+def test_deposit_page_gets_layout_url(deposit_app, forms_config_factory):
+    """With the flag set, the page payload swaps layout keys for ``layout_url``."""
+    deposit_app.config["MODULAR_DEPOSIT_FORM_SERVE_LAYOUT_FROM_API"] = True
+    warm_static_deposit_config_json(deposit_app)
+    with deposit_app.test_request_context():
+        payload = json.loads(str(deposit_config_json(forms_config_factory())))
+
+    assert not set(LAYOUT_KEYS) & set(payload)
+    assert "use_confirm_modal" in payload
+    assert payload["mounted_neighbour_pages"] == 0
+    url = urlsplit(payload["layout_url"])
+    assert url.path == "/api/modular-deposit-form/layout"
+    query = parse_qs(url.query)
+    ext = deposit_app.extensions["invenio-modular-deposit-form"]
+    assert query == {"locale": ["en"], "v": [ext.layout_json["en"][1]]}
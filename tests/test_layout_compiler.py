@@ -0,0 +1,129 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the server-side resolution of per-resource-type form pages."""
+
+import pytest
+from invenio_i18n import force_locale
+
+from invenio_modular_deposit_form.config.alternate_paged import (
+    FIELDS_BY_TYPE_ALTERNATE_PAGED,
+)
+from invenio_modular_deposit_form.filters.merge_deposit_config import (
+    get_static_deposit_config,
+)
+from invenio_modular_deposit_form.layout_compiler import (
+    LayoutConfigError,
+    compile_resolved_form_pages,
+)
+
+_TITLES = {"section": "t", "component": "TitlesComponent"}
+_ABSTRACT = {"section": "a", "component": "AbstractComponent"}
+
+_COMMON_FIELDS = [
+    {"component": "FormTitle"},
+    {
+        "component": "FormPages",
+        "subsections": [
+            {"section": "1", "label": "Basics", "subsections": [_TITLES]},
+            {"section": "2", "label": "Details", "classnames": "c", "subsections": []},
+        ],
+    },
+]
+
+
+def _pages_for(compiled, type_id):
+    """Return the merged FormPage rows for ``type_id``.
+
+    Returns:
+        The list of page dicts, as the client's lookup would return them.
+    """
+    return [compiled["pages"][i] for i in compiled["by_type"][type_id]]
+
+
+def test_resolves_same_as_chains():
+    """Multi-hop same_as chains merge base first; labels and subsections override."""
+    compiled = compile_resolved_form_pages(
+        _COMMON_FIELDS,
+        {
+            "book": {"2": {"label": "Book details", "subsections": [_ABSTRACT]}},
+            "section": {"2": {"same_as": "book", "label": "Section details"}},
+            "chapter": {"2": {"same_as": "section", "classnames": "x"}},
+            "plain": {},
+        },
+    )
+
+    basics, chapter = _pages_for(compiled, "chapter")
+    assert basics == {"section": "1", "label": "Basics", "subsections": [_TITLES]}
+    assert chapter == {
+        "section": "2",
+        "label": "Section details",
+        "classnames": "x",
+        "subsections": [_ABSTRACT],
+    }
+    assert _pages_for(compiled, "plain")[1]["subsections"] == []
+    # Unchanged common pages are shared between types rather than repeated.
+    assert compiled["by_type"]["plain"][0] == compiled["by_type"]["book"][0]
+
+
+def test_labels_resolve_like_the_client():
+    """Blank common labels are kept; non-string type labels are ignored."""
+    compiled = compile_resolved_form_pages(
+        [
+            {
+                "component": "FormPages",
+                "subsections": [
+                    {"section": "1", "label": "", "subsections": []},
+                    {"section": "2", "label": "  ", "subsections": []},
+                    {"section": "3", "subsections": []},
+                ],
+            }
+        ],
+        {
+            "plain": {},
+            "odd": {
+                "1": {"label": 5},
+                "2": {"label": {"en": "Details"}},
+                "3": {"label": " "},
+            },
+        },
+    )
+
+    for type_id in ("plain", "odd"):
+        labels = [page["label"] for page in _pages_for(compiled, type_id)]
+        assert labels == ["", "  ", "3"]
+
+
+@pytest.mark.parametrize(
+    "fields_by_type, message",
+    [
+        ({"a": {"2": {"same_as": "missing"}}}, "not a configured resource type"),
+        ({"a": {"2": {"same_as": "b"}}, "b": {}}, "has no page '2'"),
+        (
+            {"a": {"2": {"same_as": "b"}}, "b": {"2": {"same_as": "a"}}},
+            "same_as cycle on page '2': a -> b -> a",
+        ),
+    ],
+)
+def test_rejects_broken_same_as(fields_by_type, message):
+    """Missing targets and cycles are reported up front."""
+    with pytest.raises(LayoutConfigError, match=message):
+        compile_resolved_form_pages(_COMMON_FIELDS, fields_by_type)
+
+
+def test_static_payload_carries_compiled_pages(deposit_app):
+    """The cached payload has a per-locale table covering every configured type."""
+    with deposit_app.test_request_context(), force_locale("en"):
+        fields, _overlays = get_static_deposit_config(deposit_app)
+        table = fields["resolved_form_pages"]
+        event_details = _pages_for(table, "event")[3]
+
+    conference_paper = FIELDS_BY_TYPE_ALTERNATE_PAGED["publication-conferencepaper"]
+    assert set(table["by_type"]) == set(FIELDS_BY_TYPE_ALTERNATE_PAGED)
+    assert str(event_details["label"]) == "Event Details"
+    assert event_details["subsections"] == conference_paper["4"]["subsections"]
+    assert "same_as" not in event_details
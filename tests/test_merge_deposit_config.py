@@ -0,0 +1,142 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests (and an opt-in benchmark) for the merge_deposit_config filter."""
+
+import importlib
+import os
+import timeit
+
+import pytest
+from invenio_i18n import force_locale
+from invenio_rdm_records.config import (
+    RDM_RECORDS_IDENTIFIERS_SCHEMES,
+    RDM_RECORDS_LOCATION_SCHEMES,
+    RDM_RECORDS_PERSONORG_SCHEMES,
+)
+
+from invenio_modular_deposit_form.config.alternate_paged import (
+    COMMON_FIELDS_ALTERNATE_PAGED,
+)
+from invenio_modular_deposit_form.filters.merge_deposit_config import (
+    build_static_deposit_config,
+    get_static_deposit_config,
+    merge_deposit_config,
+)
+
+# ``filters`` re-exports the filter functions under their module names.
+merge_module = importlib.import_module(
+    "invenio_modular_deposit_form.filters.merge_deposit_config"
+)
+
+# Opt-in, as timings vary between machines: ``BENCHMARK=1 pytest -s -k benchmark``.
+benchmark = pytest.mark.skipif(
+    not os.environ.get("BENCHMARK"), reason="set BENCHMARK=1 to run benchmarks"
+)
+
+
+def test_merge_matches_uncached_payload(deposit_app, forms_config_factory):
+    """The cached merge produces the same payload as a fresh build."""
+    forms_config = forms_config_factory()
+    with deposit_app.test_request_context():
+        merged = merge_deposit_config(forms_config, {"previewable_extensions": []})
+        fields, _overlays = build_static_deposit_config(deposit_app.config)
+
+    for key, value in fields.items():
+        assert merged[key] == value
+    assert merged["common_fields"] is COMMON_FIELDS_ALTERNATE_PAGED
+    assert merged["previewable_extensions"] == []
+
+    vocabularies = merged["vocabularies"]
+    assert vocabularies["resource_type"] == [{"id": "dataset"}]
+    assert vocabularies["creators"]["role"] == [{"id": "author"}]
+    scheme_ids = [e["id"] for e in vocabularies["creators"]["identifiers"]["scheme"]]
+    assert scheme_ids == list(RDM_RECORDS_PERSONORG_SCHEMES)
+    assert vocabularies["identifiers"]["relation_type"] == [{"id": "cites"}]
+    assert [e["value"] for e in vocabularies["identifiers"]["scheme"]] == list(
+        RDM_RECORDS_IDENTIFIERS_SCHEMES
+    )
+    assert [
+        e["id"] for e in vocabularies["locations"]["identifiers"]["scheme"]
+    ] == list(RDM_RECORDS_LOCATION_SCHEMES)
+
+
+def test_merge_does_not_mutate_forms_config(deposit_app, forms_config_factory):
+    """The view's forms_config (and its nested vocabularies) are left untouched."""
+    forms_config = forms_config_factory()
+    with deposit_app.test_request_context():
+        merge_deposit_config(forms_config)
+
+    assert forms_config == forms_config_factory()
+
+
+def test_static_payload_cached_per_locale(deposit_app, forms_config_factory):
+    """Each warmed locale gets its own entry, reused across requests."""
+    ext = deposit_app.extensions["invenio-modular-deposit-form"]
+    assert set(ext.static_deposit_config) == {"en", "de"}
+
+    with deposit_app.test_request_context():
+        first = get_static_deposit_config()
+        assert get_static_deposit_config() is first
+        with force_locale("de"):
+            assert get_static_deposit_config() is ext.static_deposit_config["de"]
+
+    ext.static_deposit_config.clear()
+    with deposit_app.test_request_context():
+        rebuilt = get_static_deposit_config()
+    assert rebuilt is ext.static_deposit_config["en"]
+    assert rebuilt is not first
+
+
+def test_static_payload_built_once_per_locale(
+    deposit_app, forms_config_factory, mocker
+):
+    """Requests reuse the static payload instead of rebuilding it each time."""
+    ext = deposit_app.extensions["invenio-modular-deposit-form"]
+    ext.static_deposit_config.clear()
+    build = mocker.spy(merge_module, "build_static_deposit_config")
+    extra = {"current_user_profile": {"id": ""}, "previewable_extensions": []}
+
+    with deposit_app.test_request_context():
+        for _ in range(3):
+            merge_deposit_config(forms_config_factory(), extra)
+        with force_locale("de"):
+            for _ in range(3):
+                merge_deposit_config(forms_config_factory(), extra)
+
+    assert build.call_count == 2
+
+
+@benchmark
+def test_merge_deposit_config_benchmark(deposit_app, forms_config_factory):
+    """Per-request merge time with a cold (old behaviour) vs. warm cache.
+
+    Uses the shipped ``COMMON_FIELDS_ALTERNATE_PAGED`` layouts of ``deposit_app``.
+    Run with ``-s`` to see the timings.
+    """
+    ext = deposit_app.extensions["invenio-modular-deposit-form"]
+    forms_config = forms_config_factory()
+    extra = {"current_user_profile": {"id": ""}, "previewable_extensions": []}
+    number = 200
+
+    def cold():
+        ext.static_deposit_config.clear()
+        merge_deposit_config(forms_config, extra)
+
+    def warm():
+        merge_deposit_config(forms_config, extra)
+
+    with deposit_app.test_request_context():
+        cold_s = min(timeit.repeat(cold, number=number, repeat=5)) / number
+        warm_s = min(timeit.repeat(warm, number=number, repeat=5)) / number
+
+    print(
+        f"\nmerge_deposit_config per request: "
+        f"uncached {cold_s * 1e6:.1f} us, cached {warm_s * 1e6:.1f} us "
+        f"({cold_s / warm_s:.1f}x)"
+    )
+    assert warm_s < cold_s
@@ -0,0 +1,237 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the Names + ORCID suggestions endpoint, with a stand-in ORCID."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from flask import g
+from flask_login import LoginManager, UserMixin
+from flask_principal import Identity
+
+from invenio_modular_deposit_form.views import create_api_blueprint, names_suggestions
+
+URL = "/modular-deposit-form/names/suggestions"
+
+ORCID_RESULTS = [
+    {
+        "orcid-id": "0000-0002-1825-0097",
+        "given-names": "Josiah",
+        "family-names": "Carberry",
+        "institution-name": ["Brown University"],
+    },
+    {
+        "orcid-id": "https://orcid.org/0000-0001-5109-3700",
+        "given-names": "Jane",
+        "family-names": "Carberry",
+        "credit-name": "J. Carberry",
+        "institution-name": "Wesleyan University",
+    },
+]
+
+
+class _OrcidHandler(BaseHTTPRequestHandler):
+    """Answer every GET with :data:`ORCID_RESULTS` and record the query."""
+
+    def do_GET(self):  # noqa: N802
+        """Serve an ``expanded-search`` response."""
+        self.server.queries.append(parse_qs(urlsplit(self.path).query))
+        if self.server.fail:
+            self.send_error(503)
+            return
+        body = json.dumps({"expanded-result": ORCID_RESULTS}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+@pytest.fixture()
+def orcid_server():
+    """Local HTTP server standing in for the ORCID expanded search.
+
+    Yields:
+        The server; ``queries`` lists the parsed query strings it received and
+        setting ``fail`` makes it answer 503.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OrcidHandler)
+    server.queries = []
+    server.fail = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class FakeNamesService:
+    """Stand-in for the Names vocabulary service returning one local hit."""
+
+    def __init__(self):
+        """Start with no recorded searches."""
+        self.searches = []
+
+    def search(self, identity, params=None, **kwargs):
+        """Record ``params`` and return a result with one ORCID-bearing hit.
+
+        Returns:
+            An object whose ``to_dict()`` has the ``/api/names`` shape.
+        """
+        self.searches.append(params)
+        hit = {
+            "id": "local-1",
+            "name": "Carberry, Josiah",
+            "identifiers": [{"scheme": "orcid", "identifier": "0000-0002-1825-0097"}],
+        }
+
+        class _Result:
+            def to_dict(self):
+                return {"hits": {"hits": [hit], "total": 1}}
+
+        return _Result()
+
+
+class _User(UserMixin):
+    id = 1
+
+
+@pytest.fixture()
+def names_client(deposit_app, orcid_server, monkeypatch):
+    """Test client with a stand-in ORCID, a fake Names service and test logins.
+
+    Requests carrying an ``X-Test-User`` header are authenticated.
+
+    Returns:
+        A ``(client, names_service)`` tuple.
+    """
+    host, port = orcid_server.server_address
+    deposit_app.config["MODULAR_DEPOSIT_FORM_ORCID_SEARCH_URL"] = (
+        f"http://{host}:{port}/v3.0/expanded-search/"
+    )
+    login_manager = LoginManager(deposit_app)
+    login_manager.request_loader(
+        lambda req: _User() if req.headers.get("X-Test-User") else None
+    )
+    deposit_app.before_request(lambda: setattr(g, "identity", Identity(1)))
+    deposit_app.register_blueprint(create_api_blueprint(deposit_app))
+    service = FakeNamesService()
+    monkeypatch.setattr(names_suggestions, "_names_service", lambda: service)
+    return deposit_app.test_client(), service
+
+
+def _get(client, query, **params):
+    return client.get(
+        URL, query_string={"suggest": query, **params}, headers={"X-Test-User": "1"}
+    )
+
+
+def test_merges_local_and_orcid_hits(names_client, orcid_server):
+    """Local hits come first; the ORCID hit for the same iD is dropped."""
+    client, service = names_client
+    res = _get(client, "Carberry", size=5)
+
+    assert res.status_code == 200
+    hits = res.json["hits"]["hits"]
+    assert [hit["id"] for hit in hits] == ["local-1", "orcid:0000-0001-5109-3700"]
+    assert hits[1]["name"] == "J. Carberry"
+    assert hits[1]["affiliations"] == [{"name": "Wesleyan University"}]
+    assert res.json["sources"] == {"names": 1, "orcid": 1, "orcid_status": "fetched"}
+    assert service.searches == [{"suggest": "Carberry", "size": 5}]
+    assert orcid_server.queries == [{"q": ["Carberry"], "rows": ["10"], "start": ["0"]}]
+
+
+def test_exact_orcid_match_outranks_partial_local_match(names_client):
+    """An ORCID hit whose name equals the query comes before a weaker local hit."""
+    client, _service = names_client
+    res = _get(client, "Jane Carberry")
+
+    assert [hit["id"] for hit in res.json["hits"]["hits"]] == [
+        "orcid:0000-0001-5109-3700",
+        "local-1",
+    ]
+    assert res.json["sources"]["names"] == 1
+
+
+def test_name_match_rank():
+    """Exact matches (in either name order) rank before prefixes, then the rest."""
+    hit = {
+        "name": "Carberry, Josiah",
+        "given_name": "Josiah",
+        "family_name": "Carberry",
+    }
+    assert names_suggestions.name_match_rank(hit, "josiah  carberry") == 0
+    assert names_suggestions.name_match_rank(hit, "Carberry, Josiah") == 0
+    assert names_suggestions.name_match_rank(hit, "Jos") == 1
+    assert names_suggestions.name_match_rank(hit, "Jane") == 2
+    assert names_suggestions.name_match_rank(hit, "") == 2
+
+
+def test_orcid_results_are_cached(names_client, orcid_server):
+    """A repeated query (any case) is answered from the cache."""
+    client, service = names_client
+    _get(client, "Carberry")
+    res = _get(client, "carberry ")
+
+    assert res.json["sources"]["orcid_status"] == "cached"
+    assert len(res.json["hits"]["hits"]) == 2
+    assert len(orcid_server.queries) == 1
+    assert len(service.searches) == 2
+
+
+def test_short_query_and_orcid_failure(names_client, orcid_server, caplog):
+    """Short queries skip ORCID; an ORCID error leaves the local hits, uncached."""
+    client, _service = names_client
+    assert _get(client, "Car").json["sources"]["orcid_status"] == "skipped"
+    assert orcid_server.queries == []
+
+    orcid_server.fail = True
+    res = _get(client, "Carberry")
+    assert res.status_code == 200
+    assert res.json["sources"]["orcid_status"] == "error"
+    assert [hit["id"] for hit in res.json["hits"]["hits"]] == ["local-1"]
+    warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+    assert warnings == ["ORCID expanded search failed: HTTPError"]
+
+    orcid_server.fail = False
+    assert _get(client, "Carberry").json["sources"]["orcid_status"] == "fetched"
+
+
+def test_orcid_searches_share_the_extension_pool(
+    deposit_app, names_client, orcid_server, mocker
+):
+    """Every ORCID search is submitted to the one executor on the extension."""
+    client, _service = names_client
+    executor = deposit_app.extensions[
+        "invenio-modular-deposit-form"
+    ].orcid_search_executor
+    submit = mocker.spy(executor, "submit")
+
+    _get(client, "Carberry")
+    _get(client, "Josiah")
+
+    assert submit.call_count == 2
+    assert len(orcid_server.queries) == 2
+    assert (
+        deposit_app.extensions["invenio-modular-deposit-form"].orcid_search_executor
+        is executor
+    )
+
+
+def test_requires_login_and_valid_size(names_client):
+    """Anonymous callers get 401 and a bad ``size`` 400."""
+    client, service = names_client
+    assert client.get(URL, query_string={"suggest": "Carberry"}).status_code == 401
+    assert _get(client, "Carberry", size="lots").status_code == 400
+    assert service.searches == []
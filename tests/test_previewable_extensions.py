@@ -0,0 +1,48 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the per-app cache behind the previewable_extensions filter."""
+
+import logging
+from types import SimpleNamespace
+
+from flask import Flask
+from invenio_previewer import InvenioPreviewer
+
+from invenio_modular_deposit_form import InvenioModularDepositForm
+from invenio_modular_deposit_form.filters.previewable_extensions import (
+    previewable_extensions,
+    warm_previewable_extensions,
+)
+
+
+def test_extensions_resolved_once_at_finalize():
+    """Warming stores a sorted tuple that the filter returns as is."""
+    app = Flask("testapp")
+    previewer = InvenioPreviewer(app, entry_point_group=None)
+    previewer.register_previewer(
+        "images", SimpleNamespace(previewable_extensions=["png", "jpg"])
+    )
+    previewer.register_previewer("pdf", SimpleNamespace(previewable_extensions=["pdf"]))
+    ext = InvenioModularDepositForm(app)
+    warm_previewable_extensions(app)
+
+    assert ext.previewable_extensions == ("jpg", "pdf", "png")
+    with app.app_context():
+        assert previewable_extensions("") is ext.previewable_extensions
+
+
+def test_missing_previewer_is_logged_once(caplog):
+    """Without invenio-previewer the filter yields nothing and warns only once."""
+    app = Flask("testapp")
+    InvenioModularDepositForm(app)
+
+    with caplog.at_level(logging.WARNING), app.app_context():
+        assert previewable_extensions("") == ()
+        assert previewable_extensions("") == ()
+
+    assert len([r for r in caplog.records if "invenio-previewer" in r.message]) == 1
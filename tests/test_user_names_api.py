@@ -0,0 +1,244 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the bulk user names endpoint and the queued Names sync."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from invenio_accounts import InvenioAccounts
+from invenio_accounts.models import User
+from invenio_accounts.profiles.schemas import UserProfileSchema
+from invenio_cache import InvenioCache
+from invenio_db import InvenioDB, db
+from invenio_i18n import InvenioI18N
+from marshmallow import fields
+
+from invenio_modular_deposit_form import InvenioModularDepositForm, tasks
+from invenio_modular_deposit_form.views import create_api_blueprint, users_name
+
+BULK_URL = "/modular-deposit-form/users/names"
+
+
+class NamePartsProfileSchema(UserProfileSchema):
+    """Profile schema with the ``name_parts_local`` field KCWorks adds."""
+
+    name_parts_local = fields.String()
+
+
+class FakeNamesSyncService:
+    """Records upserts; fails for users whose family name is ``"Broken"``."""
+
+    def __init__(self):
+        """Start with no recorded upserts."""
+        self.upserted = []
+
+    def upsert_name_for_user(self, user):
+        """Record ``user`` and return a stand-in Names record.
+
+        Returns:
+            A dict standing in for the Names record.
+
+        Raises:
+            RuntimeError: For users whose local family name is ``"Broken"``.
+        """
+        parts = json.loads(user.user_profile["name_parts_local"])
+        if parts["last"] == "Broken":
+            raise RuntimeError("index unavailable")
+        self.upserted.append((user.id, parts))
+        return {"id": f"name-{user.id}"}
+
+
+@pytest.fixture()
+def names_api(monkeypatch):
+    """App with accounts, a simple cache, three users and the ``sync`` executor.
+
+    The caller is user 1; ``state.admin`` decides whether they are an
+    administrator.
+
+    Yields:
+        A ``(client, state)`` tuple; ``state.sync`` is the fake Names sync
+        service.
+    """
+    app = Flask("testapp")
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SECRET_KEY="test-secret",
+        SECURITY_PASSWORD_SALT="test-salt",
+        CACHE_TYPE="simple",
+        MODULAR_DEPOSIT_FORM_NAMES_SYNC_EXECUTOR="sync",
+        ACCOUNTS_USER_PROFILE_SCHEMA=NamePartsProfileSchema(),
+    )
+    InvenioI18N(app)
+    InvenioDB(app)
+    InvenioAccounts(app)
+    InvenioCache(app)
+    InvenioModularDepositForm(app)
+    app.register_blueprint(create_api_blueprint(app))
+
+    state = SimpleNamespace(admin=True, sync=FakeNamesSyncService())
+    monkeypatch.setattr(
+        users_name, "current_user", SimpleNamespace(is_authenticated=True, id=1)
+    )
+    monkeypatch.setattr(users_name, "get_identity", lambda user: user)
+    monkeypatch.setattr(
+        users_name,
+        "administration_permission",
+        SimpleNamespace(allows=lambda identity: state.admin),
+    )
+    monkeypatch.setattr(tasks, "current_names_sync_service", state.sync)
+    monkeypatch.setattr(users_name, "current_names_sync_service", state.sync)
+
+    with app.app_context():
+        db.create_all()
+        for i in range(1, 4):
+            db.session.add(User(email=f"u{i}@example.org", active=True))
+        db.session.commit()
+        yield app.test_client(), state
+        db.session.remove()
+        db.drop_all()
+
+
+def _entry(user_id, family, given="Ann"):
+    return {"user_id": user_id, "family_name": family, "given_name": given}
+
+
+def test_bulk_update_writes_profiles_and_syncs(names_api):
+    """All profiles are written and the queued job reports per-user results."""
+    client, state = names_api
+    res = client.post(
+        BULK_URL,
+        json={"users": [_entry(2, " Smith "), _entry(3, "Broken", given="")]},
+    )
+
+    assert res.status_code == 202
+    assert res.json["updated"] == 2
+    job = res.json["names_sync"]
+    assert job["status"] == "failed"
+    assert (job["total"], job["synced"], job["failed"]) == (2, 1, [3])
+    assert state.sync.upserted == [(2, {"first": "Ann", "last": "Smith"})]
+    assert json.loads(db.session.get(User, 3).user_profile["name_parts_local"]) == {
+        "first": "",
+        "last": "Broken",
+    }
+
+    status = client.get(f"{BULK_URL}/sync/{job['job_id']}")
+    assert status.status_code == 200
+    assert status.json == job
+
+
+def test_bulk_update_validates_before_writing(names_api):
+    """One bad entry rejects the whole batch; unknown users are 404."""
+    client, state = names_api
+    res = client.post(BULK_URL, json={"users": [_entry(2, "Smith"), _entry(3, " ")]})
+    assert res.status_code == 400
+    assert "users[1].family_name" in res.get_data(as_text=True)
+    assert client.post(BULK_URL, json={"users": [_entry(9, "Nobody")]}).status_code == (
+        404
+    )
+    assert "name_parts_local" not in (db.session.get(User, 2).user_profile or {})
+    assert state.sync.upserted == []
+
+
+def test_bulk_update_and_job_status_need_admin(names_api):
+    """Non-admins cannot bulk update or read another user's job."""
+    client, state = names_api
+    job_id = client.post(BULK_URL, json={"users": [_entry(2, "Smith")]}).json[
+        "names_sync"
+    ]["job_id"]
+
+    state.admin = False
+    assert client.post(BULK_URL, json={"users": [_entry(2, "Smith")]}).status_code == (
+        403
+    )
+    # The requester (user 1) may still read their own job.
+    assert client.get(f"{BULK_URL}/sync/{job_id}").status_code == 200
+    tasks._save_job({**tasks.get_names_sync_job(job_id), "requested_by": 2})
+    assert client.get(f"{BULK_URL}/sync/{job_id}").status_code == 404
+
+
+def test_single_update_async_mode(names_api):
+    """``?async=true`` queues the sync and answers 202 with the job."""
+    client, state = names_api
+    res = client.post(
+        "/modular-deposit-form/users/1/name?async=true",
+        json={"family_name": "Doe", "given_name": "Jo"},
+    )
+
+    assert res.status_code == 202
+    assert res.json["name_parts_local"] == {"first": "Jo", "last": "Doe"}
+    assert res.json["names_sync"]["status"] == "done"
+    assert state.sync.upserted == [(1, {"first": "Jo", "last": "Doe"})]
+
+
+def test_single_update_fast_path(names_api, monkeypatch):
+    """Self-edits skip the admin check and re-posting the same names is a no-op."""
+    client, state = names_api
+    monkeypatch.setattr(
+        users_name,
+        "administration_permission",
+        SimpleNamespace(allows=pytest.fail),
+    )
+    url = "/modular-deposit-form/users/1/name"
+    body = {"family_name": "Doe", "given_name": "Jo"}
+
+    first = client.post(url, json=body)
+    assert first.json == {
+        "name_parts_local": {"first": "Jo", "last": "Doe"},
+        "names_synced": True,
+    }
+    again = client.post(url, json=body)
+    assert again.status_code == 200
+    assert again.json["unchanged"] is True
+    assert len(state.sync.upserted) == 1
+
+
+def test_single_update_retries_failed_sync(names_api):
+    """After a failed Names sync, the same names are synced again."""
+    client, state = names_api
+    url = "/modular-deposit-form/users/2/name"
+
+    assert client.post(url, json={"family_name": "Broken"}).status_code == 500
+    state.sync.upsert_name_for_user = lambda user: {"id": "name-2"}
+    retry = client.post(url, json={"family_name": "Broken"})
+    assert retry.json["names_synced"] is True
+    assert client.post(url, json={"family_name": "Broken"}).json["unchanged"]
+
+
+def test_single_update_retries_failed_async_sync(names_api):
+    """A queued sync that failed is retried when the same names are posted."""
+    client, state = names_api
+    url = "/modular-deposit-form/users/2/name?async=true"
+
+    failed = client.post(url, json={"family_name": "Broken"})
+    assert failed.json["names_sync"]["status"] == "failed"
+    assert tasks.is_names_sync_pending(2)
+
+    state.sync.upsert_name_for_user = lambda user: {"id": "name-2"}
+    retry = client.post(url, json={"family_name": "Broken"})
+    assert retry.status_code == 202
+    assert retry.json["names_sync"]["status"] == "done"
+    assert not tasks.is_names_sync_pending(2)
+    assert client.post(url, json={"family_name": "Broken"}).json["unchanged"]
+
+
+def test_single_update_server_timing(names_api):
+    """Phase durations are sent as ``Server-Timing`` when enabled."""
+    client, _state = names_api
+    url = "/modular-deposit-form/users/1/name"
+    assert "Server-Timing" not in client.post(url, json={"family_name": "A"}).headers
+
+    client.application.config["MODULAR_DEPOSIT_FORM_USER_NAME_SERVER_TIMING"] = True
+    timing = client.post(url, json={"family_name": "B"}).headers["Server-Timing"]
+    assert [part.split(";")[0] for part in timing.split(", ")] == [
+        "auth",
+        "validate",
+        "commit",
+        "sync",
+    ]
@@ -0,0 +1,114 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the SafeVocabularyCF options cache."""
+
+import logging
+from types import SimpleNamespace
+
+from flask_principal import Identity, UserNeed
+from invenio_db import db
+from invenio_i18n import force_locale
+from invenio_vocabularies.records.models import VocabularyType
+
+from invenio_modular_deposit_form.custom_fields.options_cache import (
+    VocabularyOptionsCache,
+)
+from invenio_modular_deposit_form.custom_fields.safe_vocabulary import (
+    SafeVocabularyCF,
+)
+
+
+def _identity(user_id=1):
+    """Build an identity providing one user need.
+
+    Returns:
+        A Flask-Principal identity.
+    """
+    identity = Identity(user_id)
+    identity.provides.add(UserNeed(user_id))
+    return identity
+
+
+def test_lru_and_ttl():
+    """Entries expire after the TTL and the least recently used go first."""
+    clock = SimpleNamespace(now=0.0)
+    cache = VocabularyOptionsCache(maxsize=2, ttl=10, clock=lambda: clock.now)
+    cache.set(("a",), [1])
+    cache.set(("b",), [2])
+    assert cache.get(("a",)) == [1]
+    cache.set(("c",), [3])  # evicts "b", the least recently used
+
+    assert cache.get(("b",)) is None
+    clock.now = 11
+    assert cache.get(("a",)) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_options_cached_per_identity_and_locale(vocab_app):
+    """One read per (vocabulary, identity needs, locale); results are copies."""
+    app, service = vocab_app
+    cf = SafeVocabularyCF("journal:language", vocabulary_id="languages")
+
+    with app.test_request_context():
+        first = cf.options(_identity())
+        first.append("mutated")
+        assert cf.options(_identity()) == [
+            {"id": "x", "title_l10n": "English"},
+        ]
+        cf.options(_identity(2))
+        with force_locale("de"):
+            assert cf.options(_identity())[0]["title_l10n"] == "Deutsch"
+
+    assert service.calls == ["languages"] * 3
+    cache = app.extensions["invenio-modular-deposit-form"].vocabulary_options_cache
+    assert cache.stats()["hits"] == 1
+
+
+def test_missing_vocabulary_is_negative_cached(vocab_app, caplog):
+    """A missing vocabulary is read and logged once, then served as []."""
+    app, service = vocab_app
+    cf = SafeVocabularyCF("meeting:type", vocabulary_id="meetingtypes")
+
+    with caplog.at_level(logging.WARNING), app.test_request_context():
+        assert cf.options(_identity()) == []
+        assert cf.options(_identity()) == []
+
+    assert service.calls == ["meetingtypes"]
+    assert len([r for r in caplog.records if "meetingtypes" in r.message]) == 1
+
+
+def test_commit_of_vocabulary_type_invalidates(vocab_app):
+    """Creating a vocabulary type drops that type's entries after commit."""
+    app, service = vocab_app
+    languages = SafeVocabularyCF("a", vocabulary_id="languages")
+    licenses = SafeVocabularyCF("b", vocabulary_id="licenses")
+
+    with app.test_request_context():
+        languages.options(_identity())
+        licenses.options(_identity())
+        db.session.add(VocabularyType(id="languages", pid_type="lng"))
+        db.session.flush()
+        languages.options(_identity())  # not committed yet: still cached
+        db.session.commit()
+        languages.options(_identity())
+        licenses.options(_identity())
+
+    assert service.calls == ["languages", "licenses", "languages"]
+
+
+def test_ttl_zero_disables_cache(vocab_app):
+    """With a TTL of 0 every call reaches the service."""
+    app, service = vocab_app
+    app.extensions["invenio-modular-deposit-form"].vocabulary_options_cache.ttl = 0
+    cf = SafeVocabularyCF("a", vocabulary_id="languages")
+
+    with app.test_request_context():
+        cf.options(_identity())
+        cf.options(_identity())
+
+    assert service.calls == ["languages", "languages"]
@@ -0,0 +1,184 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests (and an opt-in render benchmark) for the vocabulary options prefetch."""
+
+import os
+import threading
+import time
+
+import pytest
+from flask import g
+from flask_login import LoginManager, UserMixin
+from flask_principal import Identity, UserNeed
+from invenio_app_rdm.records_ui.views.deposits import load_custom_fields
+from invenio_i18n import force_locale
+
+from invenio_modular_deposit_form.custom_fields.options_cache import (
+    options_cache_key,
+)
+from invenio_modular_deposit_form.custom_fields.prefetch import (
+    collect_vocabulary_fields,
+    prefetch_vocabulary_options,
+)
+from invenio_modular_deposit_form.custom_fields.safe_vocabulary import (
+    SafeVocabularyCF,
+)
+from invenio_modular_deposit_form.ext import create_blueprint
+
+# Opt-in, as timings vary between machines: ``BENCHMARK=1 pytest -s -k benchmark``.
+benchmark = pytest.mark.skipif(
+    not os.environ.get("BENCHMARK"), reason="set BENCHMARK=1 to run benchmarks"
+)
+
+
+def _configure_fields(app, service, count):
+    """Declare ``count`` vocabulary custom fields, each on its own vocabulary.
+
+    Returns:
+        The list of declared custom fields.
+    """
+    fields = [
+        SafeVocabularyCF(f"ns:field{i}", vocabulary_id=f"vocab{i}")
+        for i in range(count)
+    ]
+    service.known_types = {cf.vocabulary_id for cf in fields}
+    app.config["RDM_CUSTOM_FIELDS"] = fields
+    app.config["RDM_CUSTOM_FIELDS_UI"] = [
+        {
+            "section": "Section",
+            "fields": [{"field": cf.name, "props": {}} for cf in fields],
+        }
+    ]
+    return fields
+
+
+def _identity():
+    """Build an identity providing one user need.
+
+    Returns:
+        A Flask-Principal identity.
+    """
+    identity = Identity(1)
+    identity.provides.add(UserNeed(1))
+    return identity
+
+
+def test_collect_applies_ui_sort_by_and_dedupes(vocab_app):
+    """Fields are copied with the UI ``sort_by``, once per vocabulary and sort."""
+    app, _service = vocab_app
+    cf = SafeVocabularyCF("ns:lang", vocabulary_id="languages")
+    app.config["RDM_CUSTOM_FIELDS"] = [cf]
+    app.config["RDM_CUSTOM_FIELDS_UI"] = [
+        {"fields": [{"field": "ns:lang", "props": {"sort_by": "title"}}]},
+        {"fields": [{"field": "ns:lang", "props": {"sort_by": "title"}}]},
+        {"fields": [{"field": "ns:other"}]},
+    ]
+
+    (collected,) = collect_vocabulary_fields(app.config)
+    assert collected.vocabulary_id == "languages"
+    assert collected.sort_by == "title"
+    assert cf.sort_by is None
+
+
+def test_prefetch_fills_cache_for_view(vocab_app):
+    """After a concurrent prefetch the view's own options() calls are hits."""
+    app, service = vocab_app
+    fields = _configure_fields(app, service, 5)
+    identity = _identity()
+
+    with app.test_request_context(), force_locale("de"):
+        read = prefetch_vocabulary_options(
+            identity, collect_vocabulary_fields(app.config), max_workers=4
+        )
+        cache = app.extensions["invenio-modular-deposit-form"].vocabulary_options_cache
+        assert all(
+            options_cache_key(cf.vocabulary_id, None, identity) in cache
+            for cf in fields
+        )
+        assert fields[0].options(identity)[0]["title_l10n"] == "Deutsch"
+        assert prefetch_vocabulary_options(identity, fields) == 0
+
+    assert read == 5
+    assert sorted(service.calls) == sorted(cf.vocabulary_id for cf in fields)
+
+
+def test_prefetch_reads_concurrently_before_render(vocab_app):
+    """The prefetch reads vocabularies in parallel; the render then reads none.
+
+    Every fake ``read_all`` waits at a barrier for four parties, so the prefetch
+    only completes if four reads are in flight at the same time.
+    """
+    app, service = vocab_app
+    fields = _configure_fields(app, service, 8)
+    service.barrier = threading.Barrier(4, timeout=5)
+
+    with app.test_request_context():
+        g.identity = _identity()
+        read = prefetch_vocabulary_options(
+            g.identity, collect_vocabulary_fields(app.config), max_workers=4
+        )
+        service.barrier = None
+        service.calls.clear()
+        load_custom_fields()
+
+    assert read == len(fields)
+    assert service.calls == []
+
+
+class _User(UserMixin):
+    id = 1
+
+
+@benchmark
+def test_prefetch_render_benchmark(vocab_app):
+    """Deposit view latency with 12 vocabulary custom fields, cold cache.
+
+    A stand-in deposit view on a prefetch endpoint renders the custom fields
+    with ``load_custom_fields``; each fake ``read_all`` sleeps 20 ms, standing
+    in for a search round trip. Requests go through the ``before_app_request``
+    hook with prefetching off (``0`` workers) and on (``4``). Run with ``-s``
+    to see the timings.
+    """
+    app, service = vocab_app
+    fields = _configure_fields(app, service, 12)
+    service.delay = 0.02
+    cache = app.extensions["invenio-modular-deposit-form"].vocabulary_options_cache
+
+    login_manager = LoginManager(app)
+    login_manager.request_loader(lambda req: _User())
+    app.before_request(lambda: setattr(g, "identity", _identity()))
+    app.register_blueprint(create_blueprint(app))
+    app.add_url_rule(
+        "/uploads/new",
+        "deposit_create",
+        lambda: {"vocabularies": len(load_custom_fields()["vocabularies"])},
+    )
+    app.config["MODULAR_DEPOSIT_FORM_VOCABULARY_PREFETCH_ENDPOINTS"] = (
+        "deposit_create",
+    )
+    client = app.test_client()
+
+    def _render(workers):
+        app.config["MODULAR_DEPOSIT_FORM_VOCABULARY_PREFETCH_WORKERS"] = workers
+        cache.invalidate()
+        start = time.perf_counter()
+        response = client.get("/uploads/new")
+        elapsed = time.perf_counter() - start
+        assert response.json == {"vocabularies": len(fields)}
+        return elapsed
+
+    serial_s = min(_render(0) for _ in range(3))
+    prefetched_s = min(_render(4) for _ in range(3))
+
+    print(
+        f"\ndeposit view with {len(fields)} vocabulary CFs: "
+        f"without prefetch {serial_s * 1e3:.1f} ms, "
+        f"with prefetch {prefetched_s * 1e3:.1f} ms "
+        f"({serial_s / prefetched_s:.1f}x)"
+    )
+    assert prefetched_s < serial_s / 2
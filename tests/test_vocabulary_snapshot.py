@@ -0,0 +1,73 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the versioned vocabulary snapshot endpoint."""
+
+import pytest
+from flask import g
+from flask_principal import Identity
+
+from invenio_modular_deposit_form.views import create_api_blueprint, vocabulary_snapshot
+
+URL = "/modular-deposit-form/vocabularies/{}/snapshot"
+
+
+@pytest.fixture()
+def snapshot_client(vocab_app, monkeypatch):
+    """Test client for the API blueprint, reading from the fake service.
+
+    Returns:
+        A ``(client, app, service)`` tuple.
+    """
+    app, service = vocab_app
+    monkeypatch.setattr(vocabulary_snapshot, "vocabulary_service", service)
+    app.before_request(lambda: setattr(g, "identity", Identity(1)))
+    app.register_blueprint(create_api_blueprint(app))
+    return app.test_client(), app, service
+
+
+def test_snapshot_body_and_revalidation(snapshot_client):
+    """The snapshot carries UI hits and a revision that answers 304 when current."""
+    client, _app, service = snapshot_client
+    res = client.get(URL.format("languages"), headers={"Accept-Language": "de"})
+
+    assert res.status_code == 200
+    assert res.json["hits"] == [{"id": "x", "title_l10n": "Deutsch"}]
+    assert res.json["complete"] is True
+    etag, _weak = res.get_etag()
+    assert etag == res.json["revision"]
+    assert "private" in res.headers["Cache-Control"]
+
+    again = client.get(
+        URL.format("languages"),
+        headers={"Accept-Language": "de", "If-None-Match": f'"{etag}"'},
+    )
+    assert again.status_code == 304
+    assert service.calls == ["languages"]
+
+
+def test_snapshot_dropped_with_vocabulary_cache(snapshot_client):
+    """Invalidating the vocabulary's cached options rebuilds the snapshot."""
+    client, app, service = snapshot_client
+    client.get(URL.format("languages"))
+    app.extensions["invenio-modular-deposit-form"].vocabulary_options_cache.invalidate(
+        "languages"
+    )
+    client.get(URL.format("languages"))
+
+    assert service.calls == ["languages", "languages"]
+
+
+def test_snapshot_types_and_size_limit(snapshot_client):
+    """Unlisted and missing types are 404; an oversized vocabulary is incomplete."""
+    client, app, service = snapshot_client
+    assert client.get(URL.format("names")).status_code == 404
+    assert client.get(URL.format("titletypes")).status_code == 404
+    assert service.calls == ["titletypes"]
+
+    app.config["MODULAR_DEPOSIT_FORM_VOCABULARY_SNAPSHOT_MAX_ITEMS"] = 1
+    assert client.get(URL.format("languages")).json["complete"] is False
@@ -0,0 +1,100 @@
+#
+# Copyright (C) 2026 Mesh Research.
+#
+# Invenio Modular Deposit Form is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""Tests for the memoized entry point resolution in webpack_extras."""
+
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from invenio_modular_deposit_form import webpack_extras
+
+
+def _entry_point(group, name, path=None, error=None):
+    """Build a stand-in for an ``importlib.metadata.EntryPoint``.
+
+    Returns:
+        An object with ``group``, ``name``, ``value`` and ``load()``.
+    """
+
+    def get_path():
+        if error is not None:
+            raise error
+        return path
+
+    return SimpleNamespace(
+        group=group, name=name, value=f"{name}.extras:get_path", load=lambda: get_path
+    )
+
+
+@pytest.fixture
+def fake_entry_points(monkeypatch):
+    """Replace the entry point scan with a counted, configurable list.
+
+    Yields:
+        A namespace whose ``eps`` list is served and whose ``scans`` counts calls.
+    """
+    state = SimpleNamespace(eps=[], scans=0)
+
+    def entry_points():
+        state.scans += 1
+        return list(state.eps)
+
+    monkeypatch.setattr(webpack_extras, "entry_points", entry_points)
+    webpack_extras.clear_entry_point_cache()
+    yield state
+    webpack_extras.clear_entry_point_cache()
+
+
+def test_single_scan_for_all_groups(fake_entry_points):
+    """All three getters share one scan; the first entry point per group wins."""
+    fake_entry_points.eps = [
+        _entry_point("console_scripts", "other", "x"),
+        _entry_point(webpack_extras._GROUP_COMPONENTS_REGISTRY, "a", "js/a/reg.js"),
+        _entry_point(webpack_extras._GROUP_COMPONENTS_REGISTRY, "b", "js/b/reg.js"),
+    ]
+    app = Flask("testapp")
+    app.config["MODULAR_DEPOSIT_FORM_USE_CLIENT_VALIDATION"] = True
+
+    with app.app_context():
+        for _ in range(2):
+            assert webpack_extras.get_components_registry_path() == "js/a/reg.js"
+            assert webpack_extras.get_transformations_path().endswith(
+                "stubs/transformations.js"
+            )
+            assert webpack_extras.get_validator_path().endswith(
+                "validation/validator.js"
+            )
+
+    assert fake_entry_points.scans == 1
+
+
+def test_resolved_asset_overrides_reports_failures(fake_entry_points):
+    """A failing entry point falls back to the stub and its error is reported."""
+    fake_entry_points.eps = [
+        _entry_point(webpack_extras._GROUP_TRANSFORMATIONS, "t", "js/t/tr.js"),
+        _entry_point(
+            webpack_extras._GROUP_COMPONENTS_REGISTRY, "r", error=ImportError("boom")
+        ),
+    ]
+    app = Flask("testapp")
+
+    with app.app_context():
+        report = webpack_extras.resolved_asset_overrides()
+
+    assert report[webpack_extras._GROUP_TRANSFORMATIONS] == {
+        "entry_point": "t = t.extras:get_path",
+        "path": "js/t/tr.js",
+        "error": None,
+        "alias": "js/t/tr.js",
+    }
+    registry = report[webpack_extras._GROUP_COMPONENTS_REGISTRY]
+    assert registry["path"] is None
+    assert registry["error"] == "ImportError: boom"
+    assert registry["alias"].endswith("stubs/componentsRegistry.js")
+    assert report[webpack_extras._GROUP_VALIDATOR]["entry_point"] is None